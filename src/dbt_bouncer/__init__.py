@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,6 +16,10 @@ if TYPE_CHECKING:
     from dbt_bouncer.enums import ModelAccess as ModelAccess
     from dbt_bouncer.enums import ResourceType as ResourceType
 
+# The time origin of `--trace-file` traces: import time is the earliest point of
+# a run that dbt-bouncer sees.
+_IMPORTED_AT_NS = time.perf_counter_ns()
+
 _ENUM_NAMES = frozenset(
     {
         "CheckCategory",
@@ -0,0 +1,253 @@
+"""A compact, integer-indexed view of the dependency graph between resources.
+
+The manifest describes the DAG as string lists: ``parent_map``/``child_map``,
+and each resource's ``depends_on.nodes``. Walking those goes through a proxy
+and a dict lookup per edge. A :class:`DependencyGraph` interns every unique ID
+to a row number once and stores the edges CSR-style: the parents of row ``i``
+are ``parent_rows[parent_offsets[i]:parent_offsets[i + 1]]``, and likewise for
+children. Traversals then walk integer arrays.
+
+A run builds one graph of the manifest, shared by the selectors (see
+:class:`~dbt_bouncer.selectors.SelectorIndex`) and the lineage checks (see
+:class:`~dbt_bouncer.check_framework.context.CheckContext`, which builds one
+over its resource lists when given none).
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ["DependencyGraph", "build_dependency_graph", "graph_from_manifest"]
+
+
+@dataclass(frozen=True, slots=True)
+class DependencyGraph:
+    """Parent and child adjacency of resources, indexed by row.
+
+    Row ``i`` is ``unique_ids[i]``. Each resource's parents keep the order they
+    were given in, without duplicates. ``topological_order`` lists every row
+    after all of its parents; rows on a cycle come last, in row order.
+    """
+
+    unique_ids: list[str]
+    parent_offsets: array
+    parent_rows: array
+    child_offsets: array
+    child_rows: array
+    topological_order: list[int]
+
+    row_by_unique_id: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index the rows by unique ID."""
+        object.__setattr__(
+            self,
+            "row_by_unique_id",
+            {uid: i for i, uid in enumerate(self.unique_ids)},
+        )
+
+    def __len__(self) -> int:
+        """Return the number of resources.
+
+        Returns:
+            int: Number of rows.
+
+        """
+        return len(self.unique_ids)
+
+    def parent_rows_of(self, row: int) -> array:
+        """Return the rows of the parents of ``row``.
+
+        Returns:
+            array: Parent rows, in ``depends_on`` order.
+
+        """
+        return self.parent_rows[self.parent_offsets[row] : self.parent_offsets[row + 1]]
+
+    def child_rows_of(self, row: int) -> array:
+        """Return the rows of the children of ``row``.
+
+        Returns:
+            array: Child rows, in row order.
+
+        """
+        return self.child_rows[self.child_offsets[row] : self.child_offsets[row + 1]]
+
+    def parents(self, unique_id: str) -> list[str]:
+        """Return the unique IDs ``unique_id`` depends on.
+
+        Returns:
+            list[str]: Its parents; empty if it is not in the graph.
+
+        """
+        row = self.row_by_unique_id.get(unique_id)
+        if row is None:
+            return []
+        return [self.unique_ids[r] for r in self.parent_rows_of(row)]
+
+    def children(self, unique_id: str) -> list[str]:
+        """Return the unique IDs that depend on ``unique_id``.
+
+        Returns:
+            list[str]: Its children; empty if it is not in the graph.
+
+        """
+        row = self.row_by_unique_id.get(unique_id)
+        if row is None:
+            return []
+        return [self.unique_ids[r] for r in self.child_rows_of(row)]
+
+    def closure(
+        self, seed_ids: Iterable[str], upstream: bool, degree: int | None = None
+    ) -> set[str]:
+        """Return everything reachable from ``seed_ids``, walking level by level.
+
+        Args:
+            seed_ids: The starting unique IDs. Those not in the graph reach
+                nothing.
+            upstream: Walk to parents (ancestors) rather than children
+                (descendants).
+            degree: The maximum number of hops to walk, or None for an
+                unbounded walk.
+
+        Returns:
+            set[str]: Every unique ID reached within ``degree`` hops of the
+            seeds, excluding the seeds themselves.
+
+        """
+        offsets, rows = (
+            (self.parent_offsets, self.parent_rows)
+            if upstream
+            else (self.child_offsets, self.child_rows)
+        )
+        seen = bytearray(len(self.unique_ids))
+        frontier = []
+        for uid in seed_ids:
+            row = self.row_by_unique_id.get(uid)
+            if row is not None and not seen[row]:
+                seen[row] = 1
+                frontier.append(row)
+        reached: list[int] = []
+        hops = 0
+        while frontier and (degree is None or hops < degree):
+            hops += 1
+            next_frontier = []
+            for row in frontier:
+                for neighbour in rows[offsets[row] : offsets[row + 1]]:
+                    if not seen[neighbour]:
+                        seen[neighbour] = 1
+                        next_frontier.append(neighbour)
+            reached.extend(next_frontier)
+            frontier = next_frontier
+        return {self.unique_ids[r] for r in reached}
+
+
+def _csr(adjacency: list[list[int]]) -> tuple[array, array]:
+    """Flatten per-row neighbour lists into offset and neighbour arrays.
+
+    Returns:
+        tuple[array, array]: ``offsets`` (one more than there are rows) and
+        the concatenated neighbours.
+
+    """
+    offsets = array("l", [0])
+    flat = array("l")
+    for neighbours in adjacency:
+        flat.extend(neighbours)
+        offsets.append(len(flat))
+    return offsets, flat
+
+
+def build_dependency_graph(
+    parents_by_unique_id: Iterable[tuple[Any, Iterable[Any] | None]],
+) -> DependencyGraph:
+    """Build the graph of resources and the unique IDs they depend on.
+
+    Args:
+        parents_by_unique_id: ``(unique_id, parent unique IDs)`` pairs, as
+            read from artifact proxies: IDs are converted with ``str`` and
+            ``None`` parents count as none. Parents that are not listed
+            themselves are added without parents. A unique ID listed twice
+            gets the parents of both.
+
+    Returns:
+        DependencyGraph: The graph.
+
+    """
+    unique_ids: list[str] = []
+    row_by_unique_id: dict[str, int] = {}
+    parents: list[list[int]] = []
+
+    def _row(uid: str) -> int:
+        row = row_by_unique_id.get(uid)
+        if row is None:
+            row = row_by_unique_id[uid] = len(unique_ids)
+            unique_ids.append(uid)
+            parents.append([])
+        return row
+
+    for uid, parent_ids in parents_by_unique_id:
+        row = _row(str(uid))
+        row_parents = parents[row]
+        for parent_id in parent_ids or ():
+            parent_row = _row(str(parent_id))
+            if parent_row not in row_parents:
+                row_parents.append(parent_row)
+
+    children: list[list[int]] = [[] for _ in unique_ids]
+    for row, row_parents in enumerate(parents):
+        for parent_row in row_parents:
+            children[parent_row].append(row)
+
+    # Kahn's algorithm: a row is ready once all of its parents are placed.
+    waiting = [len(row_parents) for row_parents in parents]
+    order = [row for row, count in enumerate(waiting) if count == 0]
+    placed_count = 0
+    while placed_count < len(order):
+        for child in children[order[placed_count]]:
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                order.append(child)
+        placed_count += 1
+    if len(order) < len(unique_ids):
+        placed = set(order)
+        order.extend(row for row in range(len(unique_ids)) if row not in placed)
+
+    parent_offsets, parent_rows = _csr(parents)
+    child_offsets, child_rows = _csr(children)
+    return DependencyGraph(
+        unique_ids=unique_ids,
+        parent_offsets=parent_offsets,
+        parent_rows=parent_rows,
+        child_offsets=child_offsets,
+        child_rows=child_rows,
+        topological_order=order,
+    )
+
+
+def graph_from_manifest(manifest: Any) -> DependencyGraph:
+    """Build the graph a manifest's ``parent_map`` describes.
+
+    Manifests without a ``parent_map`` fall back to inverting ``child_map``.
+
+    Args:
+        manifest: The parsed ``manifest.json`` object.
+
+    Returns:
+        DependencyGraph: The graph.
+
+    """
+    parent_map = getattr(manifest, "parent_map", None)
+    if parent_map:
+        return build_dependency_graph(parent_map.items())
+    parents: dict[str, list[str]] = {}
+    for uid, child_ids in (getattr(manifest, "child_map", None) or {}).items():
+        parents.setdefault(str(uid), [])
+        for child_id in child_ids or ():
+            parents.setdefault(str(child_id), []).append(str(uid))
+    return build_dependency_graph(parents.items())
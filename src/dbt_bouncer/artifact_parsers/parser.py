@@ -7,23 +7,41 @@ and dict/list operations.
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
 
 import orjson
 
+from dbt_bouncer.artifact_parsers.sections import ArtifactSections, map_artifact
+from dbt_bouncer.artifact_parsers.snapshot import (
+    artifact_cache_enabled,
+    fingerprint_artifact,
+    load_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+from dbt_bouncer.artifact_parsers.streaming import load_package_manifest
 from dbt_bouncer.exceptions import DbtBouncerArtifactError
+from dbt_bouncer.tracing import annotate, span
 from dbt_bouncer.utils import clean_path_str, get_package_version_number
 
 if TYPE_CHECKING:
+    import mmap
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
+    from dbt_bouncer.artifact_parsers.snapshot import ArtifactSnapshot
     from dbt_bouncer.configuration_file.parser import DbtBouncerConfBase
 
 
 class ProxyStr(str):
     """String subclass with .value for Pydantic enum compatibility."""
 
+    __slots__ = ()
+
     @property
     def value(self) -> str:
         """The string value (mimics Pydantic enum .value access).
@@ -36,7 +54,15 @@ class ProxyStr(str):
 
 
 class DictProxy(dict):
-    """Dict subclass with attribute access and lazy proxy wrapping."""
+    """Dict subclass with attribute access and lazy proxy wrapping.
+
+    A child is wrapped on first access and stored back in place of the raw
+    value, so later reads of the same key return the same proxy instead of
+    allocating a new one. Proxies are ``dict``/``list``/``str`` subclasses, so
+    the dict still compares, iterates and serialises (orjson) as plain data.
+    """
+
+    __slots__ = ()
 
     def __getattr__(self, name: str) -> Any:
         """Look up *name* as a dict key, falling back to underscore-stripped alias.
@@ -49,17 +75,26 @@ class DictProxy(dict):
 
         """
         try:
-            return _wrap_value(dict.__getitem__(self, name))
+            value = dict.__getitem__(self, name)
         except KeyError:
             # Trailing underscore alias (e.g. schema_ -> schema)
             stripped = name.rstrip("_")
-            if stripped != name:
-                try:
-                    return _wrap_value(dict.__getitem__(self, stripped))
-                except KeyError:
-                    pass
-        # Missing keys return None (matches Pydantic optional field defaults)
-        return None
+            if stripped == name:
+                # Missing keys return None (matches Pydantic optional field defaults)
+                return None
+            try:
+                value = dict.__getitem__(self, stripped)
+            except KeyError:
+                return None
+            name = stripped
+        # The memoisation is inlined in the accessors: this is the hottest call
+        # site in the codebase and a helper call would double its cost.
+        wrapper = _WRAPPERS.get(value.__class__)
+        if wrapper is None:
+            return value
+        wrapped = wrapper(value)
+        dict.__setitem__(self, name, wrapped)
+        return wrapped
 
     def __getitem__(self, key: Any) -> Any:
         """Return a proxy-wrapped value for *key*.
@@ -68,7 +103,13 @@ class DictProxy(dict):
             Any: Proxy-wrapped value.
 
         """
-        return _wrap_value(dict.__getitem__(self, key))
+        value = dict.__getitem__(self, key)
+        wrapper = _WRAPPERS.get(value.__class__)
+        if wrapper is None:
+            return value
+        wrapped = wrapper(value)
+        dict.__setitem__(self, key, wrapped)
+        return wrapped
 
     def items(self) -> Any:
         """Yield (key, wrapped_value) pairs.
@@ -77,8 +118,8 @@ class DictProxy(dict):
             tuple[str, Any]: Key and proxy-wrapped value.
 
         """
-        for k, v in dict.items(self):
-            yield k, _wrap_value(v)
+        for k in dict.keys(self):
+            yield k, self[k]
 
     def values(self) -> Any:
         """Yield proxy-wrapped values.
@@ -87,8 +128,8 @@ class DictProxy(dict):
             Any: Proxy-wrapped value.
 
         """
-        for v in dict.values(self):
-            yield _wrap_value(v)
+        for k in dict.keys(self):
+            yield self[k]
 
     def get(self, key: Any, default: Any = None) -> Any:
         """Get a wrapped value by key, or *default* if missing.
@@ -98,13 +139,184 @@ class DictProxy(dict):
 
         """
         try:
-            return _wrap_value(dict.__getitem__(self, key))
+            value = dict.__getitem__(self, key)
         except KeyError:
             return default
+        wrapper = _WRAPPERS.get(value.__class__)
+        if wrapper is None:
+            return value
+        wrapped = wrapper(value)
+        dict.__setitem__(self, key, wrapped)
+        return wrapped
+
+
+class LazySectionProxy(DictProxy):
+    """DictProxy whose top-level values are produced by loaders on first access.
+
+    Used for a manifest served from a snapshot or a memory-mapped file: a run
+    whose checks never read ``child_map`` or ``macros`` never pays to decode
+    them. Keyed lookups load just the requested section; anything that needs
+    every key (iteration, ``len``, equality) loads them all first. Note that
+    orjson reads dict subclasses directly, so call :meth:`load_all` before
+    serialising one.
+    """
+
+    def __init__(self, loaders: dict[str, Callable[[], Any]]) -> None:
+        """Defer every key in *loaders* until it is first accessed."""
+        super().__init__()
+        self._key_order = list(loaders)
+        self._loaders = dict(loaders)
+
+    def _load(self, key: Any) -> None:
+        loaders = self.__dict__.get("_loaders")
+        loader = loaders.pop(key, None) if loaders else None
+        if loader is not None:
+            with span("decode_section", section=str(key)):
+                dict.__setitem__(self, key, loader())
+
+    def section(self, key: Any) -> Any:
+        """Load *key* and return its raw (unwrapped) value.
+
+        Returns:
+            Any: The decoded value.
+
+        """
+        self._load(key)
+        return dict.__getitem__(self, key)
+
+    def load_all(self) -> None:
+        """Load every deferred section, keeping the original key order."""
+        if not self.__dict__.get("_loaders"):
+            return
+        for key in list(self._loaders):
+            self._load(key)
+        loaded = {k: dict.pop(self, k) for k in self._key_order if k in self}
+        dict.update(self, loaded)
+
+    def __getattr__(self, name: str) -> Any:
+        """Load *name* (or its underscore-stripped alias) before looking it up.
+
+        Returns:
+            Any: Proxy-wrapped value, or ``None`` if the key is absent.
+
+        """
+        self._load(name)
+        self._load(name.rstrip("_"))
+        return super().__getattr__(name)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Load *key* before returning its proxy-wrapped value.
+
+        Returns:
+            Any: Proxy-wrapped value.
+
+        """
+        self._load(key)
+        return super().__getitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Load *key* before getting its wrapped value, or *default* if missing.
+
+        Returns:
+            Any: Proxy-wrapped value or *default*.
+
+        """
+        self._load(key)
+        return super().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether *key* is present, loaded or not.
+
+        Returns:
+            bool: ``True`` if the key exists.
+
+        """
+        loaders = self.__dict__.get("_loaders")
+        return dict.__contains__(self, key) or bool(loaders and key in loaders)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over all keys, loading every section first.
+
+        Returns:
+            Iterator[Any]: Key iterator.
+
+        """
+        self.load_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        """Count all keys, loaded or not.
+
+        Returns:
+            int: Number of keys.
+
+        """
+        loaders = self.__dict__.get("_loaders")
+        return dict.__len__(self) + (len(loaders) if loaders else 0)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare as a plain dict once every section is loaded.
+
+        Returns:
+            bool: ``True`` if the contents are equal.
+
+        """
+        self.load_all()
+        if isinstance(other, LazySectionProxy):
+            other.load_all()
+        return dict.__eq__(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Represent as a plain dict once every section is loaded.
+
+        Returns:
+            str: The dict representation.
+
+        """
+        self.load_all()
+        return dict.__repr__(self)
+
+    def keys(self) -> Any:
+        """Return all keys, loading every section first.
+
+        Returns:
+            Any: The dict keys view.
+
+        """
+        self.load_all()
+        return dict.keys(self)
+
+    def items(self) -> Any:
+        """Yield (key, wrapped_value) pairs, loading every section first.
+
+        Returns:
+            Any: Generator of key and proxy-wrapped value pairs.
+
+        """
+        self.load_all()
+        return super().items()
+
+    def values(self) -> Any:
+        """Yield proxy-wrapped values, loading every section first.
+
+        Returns:
+            Any: Generator of proxy-wrapped values.
+
+        """
+        self.load_all()
+        return super().values()
 
 
 class ListProxy(list):
-    """List subclass with lazy proxy wrapping of elements."""
+    """List subclass with lazy proxy wrapping of elements.
+
+    Like :class:`DictProxy`, elements are wrapped on first access and stored
+    back in place.
+    """
+
+    __slots__ = ()
 
     def __getitem__(self, key: Any) -> Any:  # type: ignore[invalid-method-override]
         """Return proxy-wrapped element(s) at *key*.
@@ -113,10 +325,15 @@ class ListProxy(list):
             Any: Proxy-wrapped element or list of elements.
 
         """
-        val = list.__getitem__(self, key)
         if isinstance(key, slice):
-            return [_wrap_value(v) for v in val]
-        return _wrap_value(val)
+            return [_wrap_value(v) for v in list.__getitem__(self, key)]
+        val = list.__getitem__(self, key)
+        wrapper = _WRAPPERS.get(val.__class__)
+        if wrapper is None:
+            return val
+        wrapped = wrapper(val)
+        list.__setitem__(self, key, wrapped)
+        return wrapped
 
     def __iter__(self) -> Any:
         """Yield proxy-wrapped elements.
@@ -125,8 +342,12 @@ class ListProxy(list):
             Any: Proxy-wrapped element.
 
         """
-        for item in list.__iter__(self):
-            yield _wrap_value(item)
+        for i, item in enumerate(list.__iter__(self)):
+            wrapper = _WRAPPERS.get(item.__class__)
+            if wrapper is not None:
+                item = wrapper(item)
+                list.__setitem__(self, i, item)
+            yield item
 
 
 # Exact-type dispatch table for `_wrap_value`. orjson only ever produces plain
@@ -150,20 +371,122 @@ def _wrap_value(value: Any) -> Any:
     return value if wrapper is None else wrapper(value)
 
 
-def _make_wrapper(
-    unique_id: str, original_file_path: str, **kwargs: Any
-) -> SimpleNamespace:
-    """Create a lightweight resource wrapper compatible with DbtBouncer* wrappers.
-
-    Returns:
-        SimpleNamespace: Wrapper with unique_id, original_file_path, and resource attrs.
+class ResourceWrapper:
+    """A resource paired with its unique ID and original file path.
 
+    One subclass per resource type exposes the resource under the attribute
+    the matching protocol in :mod:`dbt_bouncer.artifact_types` names (``model``,
+    ``seed``, ``source``...). Wrappers are slotted: a project with 100k tests
+    holds one per test, so they carry no per-instance ``__dict__``.
+    Like ``SimpleNamespace``, wrappers compare equal when their attributes do.
     """
-    return SimpleNamespace(
-        original_file_path=original_file_path,
-        unique_id=unique_id,
-        **kwargs,
-    )
+
+    __slots__ = ("original_file_path", "unique_id")
+
+    resource_attr: ClassVar[str]
+
+    def __init__(self, unique_id: str, original_file_path: str, resource: Any) -> None:
+        """Wrap ``resource`` under the subclass's :attr:`resource_attr`."""
+        self.unique_id = unique_id
+        self.original_file_path = original_file_path
+        setattr(self, self.resource_attr, resource)
+
+    def _fields(self) -> tuple[Any, ...]:
+        return (
+            self.unique_id,
+            self.original_file_path,
+            getattr(self, self.resource_attr),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by type and attribute values.
+
+        Returns:
+            bool: Whether both wrappers hold equal values.
+
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Mirror the ``SimpleNamespace`` repr these wrappers replace.
+
+        Returns:
+            str: The wrapper's repr.
+
+        """
+        return (
+            f"{self.__class__.__name__}(unique_id={self.unique_id!r}, "
+            f"original_file_path={self.original_file_path!r}, "
+            f"{self.resource_attr}={getattr(self, self.resource_attr)!r})"
+        )
+
+
+class CatalogNodeWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.CatalogNodeWrapper`."""
+
+    __slots__ = ("catalog_node",)
+    resource_attr = "catalog_node"
+
+
+class CatalogSourceWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.CatalogSourceWrapper`."""
+
+    __slots__ = ("catalog_source",)
+    resource_attr = "catalog_source"
+
+
+class ModelWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.ModelWrapper`."""
+
+    __slots__ = ("model",)
+    resource_attr = "model"
+
+
+class RunResultWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.RunResultWrapper`."""
+
+    __slots__ = ("run_result",)
+    resource_attr = "run_result"
+
+
+class SeedWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.SeedWrapper`."""
+
+    __slots__ = ("seed",)
+    resource_attr = "seed"
+
+
+class SemanticModelWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.SemanticModelWrapper`."""
+
+    __slots__ = ("semantic_model",)
+    resource_attr = "semantic_model"
+
+
+class SnapshotWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.SnapshotWrapper`."""
+
+    __slots__ = ("snapshot",)
+    resource_attr = "snapshot"
+
+
+class SourceWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.SourceWrapper`."""
+
+    __slots__ = ("source",)
+    resource_attr = "source"
+
+
+class TestWrapper(ResourceWrapper):
+    """Slotted :class:`~dbt_bouncer.artifact_types.TestWrapper`."""
+
+    __test__ = False  # Not a pytest test class despite the name.
+    __slots__ = ("test",)
+    resource_attr = "test"
 
 
 def wrap_dict(data: dict[str, Any]) -> DictProxy:
@@ -182,240 +505,730 @@ class ParsedArtifacts(NamedTuple):
     manifest_obj: SimpleNamespace
     exposures: list[DictProxy]
     macros: list[DictProxy]
-    models: list[SimpleNamespace]
-    seeds: list[SimpleNamespace]
-    semantic_models: list[SimpleNamespace]
-    snapshots: list[SimpleNamespace]
-    sources: list[SimpleNamespace]
-    tests: list[SimpleNamespace]
+    models: list[ModelWrapper]
+    seeds: list[SeedWrapper]
+    semantic_models: list[SemanticModelWrapper]
+    snapshots: list[SnapshotWrapper]
+    sources: list[SourceWrapper]
+    tests: list[TestWrapper]
     unit_tests: list[DictProxy]
-    catalog_nodes: list[SimpleNamespace]
-    catalog_sources: list[SimpleNamespace]
-    run_results: list[SimpleNamespace]
-
-
-def parse_dbt_artifacts(
-    bouncer_config: DbtBouncerConfBase,
-    dbt_artifacts_dir: Path,
-) -> ParsedArtifacts:
-    """Parse all dbt artifacts using orjson + proxy, bypassing Pydantic validation.
+    catalog_nodes: list[CatalogNodeWrapper]
+    catalog_sources: list[CatalogSourceWrapper]
+    run_results: list[RunResultWrapper]
+
+
+# Wrapped resource collections and the wrapper class each is emitted as. Raw
+# entries are ``[unique_id, original_file_path, dict]``.
+_WRAPPED_RESOURCES: dict[str, type[ResourceWrapper]] = {
+    "models": ModelWrapper,
+    "seeds": SeedWrapper,
+    "snapshots": SnapshotWrapper,
+    "tests": TestWrapper,
+    "semantic_models": SemanticModelWrapper,
+    "sources": SourceWrapper,
+    "catalog_nodes": CatalogNodeWrapper,
+    "catalog_sources": CatalogSourceWrapper,
+    "run_results": RunResultWrapper,
+}
+
+# Collections handed to checks as bare DictProxy objects. Raw entries are dicts.
+_PLAIN_RESOURCES: tuple[str, ...] = ("exposures", "macros", "unit_tests")
+
+# Manifest section each project resource collection is filtered from.
+_MANIFEST_SECTIONS: dict[str, str] = {
+    "exposures": "exposures",
+    "macros": "macros",
+    "models": "nodes",
+    "seeds": "nodes",
+    "snapshots": "nodes",
+    "tests": "nodes",
+    "semantic_models": "semantic_models",
+    "sources": "sources",
+    "unit_tests": "unit_tests",
+}
+
+_NODE_RESOURCE_TYPES: dict[str, str] = {
+    "model": "models",
+    "seed": "seeds",
+    "snapshot": "snapshots",
+    "test": "tests",
+}
+
+
+def _checks_configured(bouncer_config: DbtBouncerConfBase, category: str) -> bool:
+    """Whether ``bouncer_config`` has any checks in ``category``.
 
     Returns:
-        ParsedArtifacts: Named tuple of lightweight proxy objects.
-
-    Raises:
-        DbtBouncerArtifactError: If the dbt version is below the minimum supported
-            version, or a required artifact file does not exist.
+        bool: ``True`` if the category's artifact needs to be parsed.
 
     """
-    # --- Manifest ---
-    manifest_path = dbt_artifacts_dir / "manifest.json"
-    if not manifest_path.exists():
-        raise DbtBouncerArtifactError(f"No manifest.json found at {manifest_path}.")
+    return hasattr(bouncer_config, category) and getattr(bouncer_config, category) != []
 
-    manifest_dict = orjson.loads(manifest_path.read_bytes())
 
-    dbt_version = manifest_dict["metadata"]["dbt_version"]
-    if not get_package_version_number(dbt_version) >= get_package_version_number(
-        "1.10.0"
-    ):
-        raise DbtBouncerArtifactError(
-            f"The supplied `manifest.json` was generated with dbt version {dbt_version}, "
-            "this is below the minimum supported version of 1.10.0."
-        )
+def _manifest_sections_needed(bouncer_config: DbtBouncerConfBase) -> frozenset[str]:
+    """Manifest sections the configured check categories read resources from.
 
-    manifest_proxy = DictProxy(manifest_dict)
-    manifest_obj = SimpleNamespace(manifest=manifest_proxy)
+    ``nodes`` and ``sources`` are always needed: besides the manifest checks,
+    they resolve the file paths of catalog entries and run results. Sections not
+    returned here are still available on the manifest, decoded on first access.
 
-    target_package = (
-        bouncer_config.package_name or manifest_dict["metadata"]["project_name"]
-    )
+    Returns:
+        frozenset[str]: Names of the sections to decode up front.
+
+    """
+    needed = {"metadata", "nodes", "sources"}
+    if _checks_configured(bouncer_config, "manifest_checks"):
+        needed.update(_MANIFEST_SECTIONS.values())
+    elif _checks_configured(bouncer_config, "run_results_checks"):
+        needed.update(("exposures", "unit_tests"))
+    return frozenset(needed)
 
-    # Extract resources from manifest
-    project_exposures: list[DictProxy] = [
-        DictProxy(v)
-        for _, v in manifest_dict.get("exposures", {}).items()
-        if v.get("package_name") == target_package
-    ]
 
-    project_macros: list[DictProxy] = [
-        DictProxy(v)
-        for _, v in manifest_dict.get("macros", {}).items()
-        if v.get("package_name") == target_package
-    ]
+def _filter_manifest(
+    manifest_dict: dict[str, Any], target_package: str
+) -> dict[str, list[Any]]:
+    """Select the ``target_package`` resources from a decoded manifest.
 
-    project_models: list[SimpleNamespace] = []
-    project_seeds: list[SimpleNamespace] = []
-    project_snapshots: list[SimpleNamespace] = []
-    project_tests: list[SimpleNamespace] = []
+    Returns:
+        dict[str, list[Any]]: Raw (unwrapped) entries per resource collection.
 
+    """
+    project: dict[str, list[Any]] = {name: [] for name in _NODE_RESOURCE_TYPES.values()}
     for k, v in manifest_dict.get("nodes", {}).items():
         if v.get("package_name") != target_package:
             continue
-        ofp = clean_path_str(v.get("original_file_path", ""))
-        match v.get("resource_type"):
-            case "model":
-                project_models.append(
-                    _make_wrapper(
-                        unique_id=k, original_file_path=ofp, model=DictProxy(v)
-                    )
-                )
-            case "seed":
-                project_seeds.append(
-                    _make_wrapper(
-                        unique_id=k, original_file_path=ofp, seed=DictProxy(v)
-                    )
-                )
-            case "snapshot":
-                project_snapshots.append(
-                    _make_wrapper(
-                        unique_id=k, original_file_path=ofp, snapshot=DictProxy(v)
-                    )
-                )
-            case "test":
-                project_tests.append(
-                    _make_wrapper(
-                        unique_id=k, original_file_path=ofp, test=DictProxy(v)
-                    )
-                )
+        collection = _NODE_RESOURCE_TYPES.get(v.get("resource_type"))
+        if collection is not None:
+            project[collection].append(
+                [k, clean_path_str(v.get("original_file_path", "")), v]
+            )
+
+    for section in ("semantic_models", "sources"):
+        project[section] = [
+            [k, clean_path_str(v.get("original_file_path", "")), v]
+            for k, v in manifest_dict.get(section, {}).items()
+            if v.get("package_name") == target_package
+        ]
+
+    for section in _PLAIN_RESOURCES:
+        project[section] = [
+            v
+            for v in manifest_dict.get(section, {}).values()
+            if v.get("package_name") == target_package
+        ]
+    return project
 
-    project_semantic_models: list[SimpleNamespace] = [
-        _make_wrapper(
-            unique_id=k,
-            original_file_path=clean_path_str(v.get("original_file_path", "")),
-            semantic_model=DictProxy(v),
-        )
-        for k, v in manifest_dict.get("semantic_models", {}).items()
-        if v.get("package_name") == target_package
-    ]
-
-    project_sources: list[SimpleNamespace] = [
-        _make_wrapper(
-            unique_id=k,
-            original_file_path=clean_path_str(v.get("original_file_path", "")),
-            source=DictProxy(v),
-        )
-        for k, v in manifest_dict.get("sources", {}).items()
-        if v.get("package_name") == target_package
-    ]
-
-    # Unit tests
-    project_unit_tests: list[DictProxy] = [
-        DictProxy(v)
-        for _, v in manifest_dict.get("unit_tests", {}).items()
-        if v.get("package_name") == target_package
-    ]
-
-    # --- Catalog ---
-    if (
-        hasattr(bouncer_config, "catalog_checks")
-        and bouncer_config.catalog_checks != []
-    ):
-        catalog_path = dbt_artifacts_dir / "catalog.json"
-        if not catalog_path.exists():
-            raise DbtBouncerArtifactError(f"No catalog.json found at {catalog_path}.")
 
-        catalog_dict = orjson.loads(catalog_path.read_bytes())
-        nodes_dict = manifest_dict.get("nodes", {})
-        sources_dict = manifest_dict.get("sources", {})
+def _filter_catalog(
+    catalog_dict: dict[str, Any], manifest_dict: dict[str, Any], target_package: str
+) -> dict[str, list[Any]]:
+    """Select the ``target_package`` entries from a decoded catalog.
 
-        project_catalog_nodes: list[SimpleNamespace] = [
-            _make_wrapper(
-                unique_id=k,
-                original_file_path=clean_path_str(nodes_dict[k]["original_file_path"])
+    Returns:
+        dict[str, list[Any]]: Raw ``catalog_nodes`` and ``catalog_sources`` entries.
+
+    """
+    nodes_dict = manifest_dict.get("nodes", {})
+    sources_dict = manifest_dict.get("sources", {})
+    return {
+        "catalog_nodes": [
+            [
+                k,
+                clean_path_str(nodes_dict[k]["original_file_path"])
                 if k in nodes_dict
                 else "",
-                catalog_node=DictProxy(v),
-            )
+                v,
+            ]
             for k, v in catalog_dict.get("nodes", {}).items()
             if k.split(".")[-2] == target_package
-        ]
-        project_catalog_sources: list[SimpleNamespace] = [
-            _make_wrapper(
-                unique_id=k,
-                original_file_path=clean_path_str(sources_dict[k]["original_file_path"])
+        ],
+        "catalog_sources": [
+            [
+                k,
+                clean_path_str(sources_dict[k]["original_file_path"])
                 if k in sources_dict
                 else "",
-                catalog_source=DictProxy(v),
-            )
+                v,
+            ]
             for k, v in catalog_dict.get("sources", {}).items()
             if k.split(".")[1] == target_package
-        ]
+        ],
+    }
+
+
+def _filter_run_results(
+    rr_dict: dict[str, Any], manifest_dict: dict[str, Any], target_package: str
+) -> list[Any]:
+    """Select the ``target_package`` results from decoded run results.
+
+    Returns:
+        list[Any]: Raw ``run_results`` entries.
+
+    """
+    nodes_dict = manifest_dict.get("nodes", {})
+    exposures_dict = manifest_dict.get("exposures", {})
+    unit_tests_dict = manifest_dict.get("unit_tests", {})
+
+    run_results: list[Any] = []
+    for r in rr_dict.get("results", []):
+        uid = r.get("unique_id", "")
+        if uid.split(".")[1] != target_package:
+            continue
+        # Resolve original_file_path from manifest
+        if uid in nodes_dict:
+            ofp = clean_path_str(nodes_dict[uid].get("original_file_path", ""))
+        elif uid.startswith("exposure.") and uid in exposures_dict:
+            ofp = clean_path_str(exposures_dict[uid].get("original_file_path", ""))
+        elif uid in unit_tests_dict:
+            ofp = clean_path_str(unit_tests_dict[uid].get("original_file_path", ""))
+        else:
+            ofp = ""
+        run_results.append([uid, ofp, r])
+    return run_results
+
+
+def _wrap_project(project: dict[str, list[Any]]) -> dict[str, list[Any]]:
+    """Wrap raw project entries in the proxies and wrappers checks expect.
+
+    Each proxy also replaces the raw dict in ``project``, so that once the
+    manifest shares the project's entries (see :func:`_share_project_entries`)
+    nothing holds the raw dicts any more and the proxies' memoised children
+    replace, rather than duplicate, the decoded data.
+
+    Returns:
+        dict[str, list[Any]]: Wrapped objects per resource collection.
+
+    """
+    wrapped: dict[str, list[Any]] = {}
+    for name, wrapper in _WRAPPED_RESOURCES.items():
+        entries = project.get(name, [])
+        for entry in entries:
+            entry[2] = DictProxy(entry[2])
+        wrapped[name] = [wrapper(uid, ofp, v) for uid, ofp, v in entries]
+    for name in _PLAIN_RESOURCES:
+        entries = project.get(name, [])
+        entries[:] = [DictProxy(v) for v in entries]
+        wrapped[name] = list(entries)
+    return wrapped
+
+
+def _share_project_entries(
+    section: str, value: dict[str, Any], project: dict[str, list[Any]]
+) -> None:
+    """Point the entries of manifest ``section`` at the project lists' objects."""
+    for name, source_section in _MANIFEST_SECTIONS.items():
+        if source_section != section:
+            continue
+        for entry in project.get(name, []):
+            if name in _WRAPPED_RESOURCES:
+                uid, _, raw = entry
+            else:
+                uid, raw = entry.get("unique_id"), entry
+            if uid in value:
+                value[uid] = raw
+
+
+def _snapshot_manifest(
+    snapshot: ArtifactSnapshot, project: dict[str, list[Any]], manifest_path: Path
+) -> LazySectionProxy:
+    """Build a manifest proxy whose sections decode from ``snapshot`` on access.
+
+    When a resource section is decoded, the entries the project lists already
+    hold are swapped in for their freshly decoded duplicates, so the manifest
+    and the project lists share objects exactly as they do after a full parse.
+    A section the snapshot cannot decode is decoded from ``manifest_path``.
+
+    Returns:
+        LazySectionProxy: The manifest with every section deferred.
+
+    """
+
+    def _loader(section: str) -> Callable[[], Any]:
+        def load() -> Any:
+            try:
+                value = snapshot.decode(f"manifest.{section}")
+            except orjson.JSONDecodeError:
+                logging.debug(
+                    "Artifact snapshot section %s unreadable, decoding manifest.",
+                    section,
+                )
+                value = ArtifactSections(map_artifact(manifest_path)).decode(section)
+            _share_project_entries(section, value, project)
+            return value
+
+        return load
+
+    prefix = "manifest."
+    return LazySectionProxy(
+        {
+            name[len(prefix) :]: _loader(name[len(prefix) :])
+            for name in snapshot.section_names
+            if name.startswith(prefix)
+        }
+    )
+
+
+def _load_artifact(path: Path) -> tuple[mmap.mmap | bytes, Any]:
+    """Map and decode a whole artifact; run on a worker thread.
+
+    Returns:
+        tuple[mmap.mmap | bytes, Any]: The artifact contents and decoded JSON.
+
+    """
+    with span("load_artifact", artifact=path.name):
+        data = map_artifact(path)
+        return data, orjson.loads(memoryview(data))
+
+
+def _decode_manifest(
+    manifest_data: mmap.mmap | bytes,
+    package_name: str | None,
+    needed: frozenset[str],
+    low_memory: bool,
+) -> tuple[DictProxy, dict[str, Any], Callable[[], dict[str, Any]]]:
+    """Decode the ``needed`` manifest sections, deferring the rest.
+
+    Returns:
+        tuple[DictProxy, dict[str, Any], Callable[[], dict[str, Any]]]: The
+        manifest proxy, the decoded ``needed`` sections, and a callable that
+        returns every section in a form :func:`write_snapshot` accepts.
+
+    """
+    full_manifest = (
+        load_package_manifest(manifest_data, package_name) if low_memory else None
+    )
+    if full_manifest is not None:
+        return (
+            DictProxy(full_manifest),
+            {k: v for k, v in full_manifest.items() if k in needed},
+            lambda: full_manifest,
+        )
+
+    sections = ArtifactSections(manifest_data)
+    manifest = LazySectionProxy(
+        {name: partial(sections.decode, name) for name in sections.names}
+    )
+
+    def snapshot_sections() -> dict[str, Any]:
+        # Sections nobody has decoded are copied into the snapshot as-is.
+        return {
+            name: raw
+            if (raw := sections.raw(name)) is not None
+            else manifest.section(name)
+            for name in sections.names
+        }
+
+    return (
+        manifest,
+        {name: manifest.section(name) for name in sections.names if name in needed},
+        snapshot_sections,
+    )
+
+
+# Parsed artifacts kept in memory between runs of a long-lived process (see
+# ``keep_parsed_artifacts``), keyed by what ``parse_dbt_artifacts`` reads. Each
+# value holds the artifacts' ``(size, mtime_ns)`` when they were parsed, the
+# target package and the artifacts themselves. ``None`` keeps nothing.
+_warm_artifacts: (
+    dict[tuple[Any, ...], tuple[tuple[Any, ...], str, ParsedArtifacts]] | None
+) = None
+_WARM_ARTIFACTS_TO_KEEP = 2
+
+# The artifacts a run reads from ``dbt_artifacts_dir``, which ``watch`` polls.
+ARTIFACT_FILES = ("manifest.json", "catalog.json", "run_results.json")
+
+
+def keep_parsed_artifacts() -> None:
+    """Keep parsed artifacts in memory for later runs in this process.
+
+    ``dbt-bouncer serve`` and ``dbt-bouncer watch`` call this once: later calls
+    to :func:`parse_dbt_artifacts` then return the artifacts of an earlier run
+    as long as ``manifest.json`` keeps its size and ``mtime_ns``, parsing only
+    the other artifacts that changed.
+    """
+    global _warm_artifacts
+    if _warm_artifacts is None:
+        _warm_artifacts = {}
+
+
+def _artifact_stats(dbt_artifacts_dir: Path) -> tuple[Any, ...]:
+    """Return the size and ``mtime_ns`` of each artifact in ``dbt_artifacts_dir``.
+
+    Returns:
+        tuple: ``(size, mtime_ns)``, or ``None`` for a missing file, per artifact.
+
+    """
+    stats = []
+    for name in ARTIFACT_FILES:
+        try:
+            st = (dbt_artifacts_dir / name).stat()
+        except OSError:
+            stats.append(None)
+        else:
+            stats.append((st.st_size, st.st_mtime_ns))
+    return tuple(stats)
+
+
+def parse_dbt_artifacts(
+    bouncer_config: DbtBouncerConfBase,
+    dbt_artifacts_dir: Path,
+    low_memory: bool = False,
+) -> ParsedArtifacts:
+    """Parse the dbt artifacts, or reuse those of an earlier run in this process.
+
+    Only after :func:`keep_parsed_artifacts` are parsed artifacts reused, and
+    only while ``manifest.json`` has the size and ``mtime_ns`` it had when they
+    were parsed. If ``catalog.json`` or ``run_results.json`` changed since,
+    just that artifact is parsed again (see :func:`_reparse_artifacts`); see
+    :func:`_parse_dbt_artifacts` for the parsing itself.
+
+    Args:
+        bouncer_config: The validated dbt-bouncer config.
+        dbt_artifacts_dir: Directory containing the dbt artifacts.
+        low_memory: As for :func:`_parse_dbt_artifacts`.
+
+    Returns:
+        ParsedArtifacts: Named tuple of lightweight proxy objects.
+
+    """
+    if _warm_artifacts is None:
+        return _parse_dbt_artifacts(bouncer_config, dbt_artifacts_dir, low_memory)
+
+    key = (
+        str(dbt_artifacts_dir.resolve()),
+        bouncer_config.package_name,
+        _checks_configured(bouncer_config, "catalog_checks"),
+        _checks_configured(bouncer_config, "run_results_checks"),
+        low_memory,
+        _manifest_sections_needed(bouncer_config),
+    )
+    # Taken before parsing, so that a file written during the parse is parsed
+    # again next time.
+    stats = _artifact_stats(dbt_artifacts_dir)
+    warm = _warm_artifacts.pop(key, None)
+    if warm is not None and warm[0][0] == stats[0]:
+        warm_stats, target_package, artifacts = warm
+        changed = {
+            name
+            for name, old, new in zip(ARTIFACT_FILES, warm_stats, stats, strict=True)
+            if old != new
+        }
+        logging.debug("Reusing the parsed artifacts of an earlier run.")
+        if changed:
+            artifacts = _reparse_artifacts(
+                bouncer_config, dbt_artifacts_dir, target_package, artifacts, changed
+            )
+        _log_artifact_summary(
+            bouncer_config=bouncer_config,
+            target_package=target_package,
+            **{
+                f"project_{name}": getattr(artifacts, name)
+                for name in ParsedArtifacts._fields
+                if name != "manifest_obj"
+            },
+        )
     else:
-        project_catalog_nodes = []
-        project_catalog_sources = []
+        artifacts = _parse_dbt_artifacts(bouncer_config, dbt_artifacts_dir, low_memory)
+        target_package = (
+            bouncer_config.package_name
+            or artifacts.manifest_obj.manifest.metadata.project_name
+        )
+    # Most recently used last; the least recently used is dropped.
+    _warm_artifacts[key] = (stats, target_package, artifacts)
+    while len(_warm_artifacts) > _WARM_ARTIFACTS_TO_KEEP:
+        del _warm_artifacts[next(iter(_warm_artifacts))]
+    return artifacts
 
-    # --- Run Results ---
-    if (
-        hasattr(bouncer_config, "run_results_checks")
-        and bouncer_config.run_results_checks != []
+
+def _reparse_artifacts(
+    bouncer_config: DbtBouncerConfBase,
+    dbt_artifacts_dir: Path,
+    target_package: str,
+    artifacts: ParsedArtifacts,
+    changed: set[str],
+) -> ParsedArtifacts:
+    """Parse the ``changed`` catalog and run results again, keeping the manifest.
+
+    The manifest of ``artifacts`` is unchanged, so its resources are kept, and
+    it supplies the file paths the new catalog and run results entries need.
+
+    Args:
+        bouncer_config: The validated dbt-bouncer config.
+        dbt_artifacts_dir: Directory containing the dbt artifacts.
+        target_package: The package ``artifacts`` were filtered to.
+        artifacts: The artifacts parsed earlier.
+        changed: Names of the artifact files that changed since.
+
+    Returns:
+        ParsedArtifacts: ``artifacts`` with the changed collections replaced.
+
+    Raises:
+        DbtBouncerArtifactError: If a changed artifact that checks need no
+            longer exists.
+
+    """
+    manifest = artifacts.manifest_obj.manifest
+    if "catalog.json" in changed and _checks_configured(
+        bouncer_config, "catalog_checks"
+    ):
+        catalog_path = dbt_artifacts_dir / "catalog.json"
+        if not catalog_path.exists():
+            raise DbtBouncerArtifactError(f"No catalog.json found at {catalog_path}.")
+        logging.debug("Parsing catalog.json again.")
+        _, catalog_dict = _load_artifact(catalog_path)
+        with span("filter_artifact", artifact="catalog.json"):
+            catalog = _wrap_project(
+                _filter_catalog(catalog_dict, manifest, target_package)
+            )
+        artifacts = artifacts._replace(
+            catalog_nodes=catalog["catalog_nodes"],
+            catalog_sources=catalog["catalog_sources"],
+        )
+    if "run_results.json" in changed and _checks_configured(
+        bouncer_config, "run_results_checks"
     ):
         rr_path = dbt_artifacts_dir / "run_results.json"
         if not rr_path.exists():
             raise DbtBouncerArtifactError(f"No run_results.json found at {rr_path}.")
+        logging.debug("Parsing run_results.json again.")
+        _, rr_dict = _load_artifact(rr_path)
+        with span("filter_artifact", artifact="run_results.json"):
+            run_results = _wrap_project(
+                {"run_results": _filter_run_results(rr_dict, manifest, target_package)}
+            )
+        artifacts = artifacts._replace(run_results=run_results["run_results"])
+    return artifacts
 
-        rr_dict = orjson.loads(rr_path.read_bytes())
-        nodes_dict = manifest_dict.get("nodes", {})
-        exposures_dict = manifest_dict.get("exposures", {})
-        unit_tests_dict = manifest_dict.get("unit_tests", {})
-
-        project_run_results: list[SimpleNamespace] = []
-        for r in rr_dict.get("results", []):
-            uid = r.get("unique_id", "")
-            if uid.split(".")[1] != target_package:
-                continue
-            # Resolve original_file_path from manifest
-            if uid in nodes_dict:
-                ofp = clean_path_str(nodes_dict[uid].get("original_file_path", ""))
-            elif uid.startswith("exposure.") and uid in exposures_dict:
-                ofp = clean_path_str(exposures_dict[uid].get("original_file_path", ""))
-            elif uid in unit_tests_dict:
-                ofp = clean_path_str(unit_tests_dict[uid].get("original_file_path", ""))
-            else:
-                ofp = ""
-            project_run_results.append(
-                _make_wrapper(
-                    unique_id=uid,
-                    original_file_path=ofp,
-                    run_result=DictProxy(r),
+
+def _parse_dbt_artifacts(
+    bouncer_config: DbtBouncerConfBase,
+    dbt_artifacts_dir: Path,
+    low_memory: bool = False,
+) -> ParsedArtifacts:
+    """Parse all dbt artifacts using orjson + proxy, bypassing Pydantic validation.
+
+    Artifacts are memory-mapped rather than read, and only the manifest sections
+    the configured check categories parse resources from are decoded up front;
+    the rest (``child_map``, ``docs``...) are decoded if and when a check reads
+    them.
+    ``catalog.json`` and ``run_results.json`` are loaded on worker threads
+    while the manifest is decoded.
+
+    Unless ``DBT_BOUNCER_DISABLE_ARTIFACT_CACHE`` is set, the filtered project
+    resources and every manifest section are also written to an on-disk
+    snapshot. Later runs against unchanged artifacts load the project resources
+    from it and decode manifest sections only when a check reads them.
+
+    Args:
+        bouncer_config: The validated dbt-bouncer config.
+        dbt_artifacts_dir: Directory containing the dbt artifacts.
+        low_memory: Reduce resources from packages other than the target
+            package to the fields selectors and lineage checks read while the
+            manifest is decoded, so they are never held in full.
+
+    Returns:
+        ParsedArtifacts: Named tuple of lightweight proxy objects.
+
+    Raises:
+        DbtBouncerArtifactError: If the dbt version is below the minimum supported
+            version, or a required artifact file does not exist.
+
+    """
+    manifest_path = dbt_artifacts_dir / "manifest.json"
+    if not manifest_path.exists():
+        raise DbtBouncerArtifactError(f"No manifest.json found at {manifest_path}.")
+
+    load_catalog = _checks_configured(bouncer_config, "catalog_checks")
+    load_run_results = _checks_configured(bouncer_config, "run_results_checks")
+    needed = _manifest_sections_needed(bouncer_config)
+    artifact_paths = {"manifest.json": manifest_path}
+    if load_catalog:
+        artifact_paths["catalog.json"] = dbt_artifacts_dir / "catalog.json"
+    if load_run_results:
+        artifact_paths["run_results.json"] = dbt_artifacts_dir / "run_results.json"
+
+    cache_key = cache_path = None
+    if artifact_cache_enabled():
+        from dbt_bouncer.version import version
+
+        cache_key = (
+            f"{version()}:{bouncer_config.package_name}:{load_catalog}:"
+            f"{load_run_results}:{low_memory}:{','.join(sorted(needed))}"
+        )
+        cache_path = snapshot_path(dbt_artifacts_dir, cache_key)
+        with span("load_snapshot"):
+            snapshot = load_snapshot(cache_path, cache_key, artifact_paths)
+            try:
+                project = snapshot.decode("project") if snapshot is not None else None
+            except orjson.JSONDecodeError:
+                logging.debug("Artifact snapshot unreadable, reparsing.", exc_info=True)
+                project = None
+            annotate(cache="miss" if project is None else "hit")
+        if snapshot is not None and project is not None:
+            logging.debug("Loaded parsed artifacts from snapshot: %s", cache_path)
+            target_package = project.pop("target_package")
+            return _build_parsed_artifacts(
+                bouncer_config,
+                target_package,
+                SimpleNamespace(
+                    manifest=_snapshot_manifest(snapshot, project, manifest_path)
+                ),
+                project,
+            )
+
+    # catalog.json and run_results.json are loaded on worker threads while the
+    # manifest is decoded here; only their filtering waits on the manifest.
+    with ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="dbt-bouncer-artifacts"
+    ) as pool:
+        pending = {
+            name: pool.submit(_load_artifact, path)
+            for name, path in artifact_paths.items()
+            if name != "manifest.json" and path.exists()
+        }
+
+        # --- Manifest ---
+        with span("load_artifact", artifact="manifest.json"):
+            manifest_data = map_artifact(manifest_path)
+            manifest, manifest_dict, manifest_sections = _decode_manifest(
+                manifest_data, bouncer_config.package_name, needed, low_memory
+            )
+
+        dbt_version = manifest_dict["metadata"]["dbt_version"]
+        if not get_package_version_number(dbt_version) >= get_package_version_number(
+            "1.10.0"
+        ):
+            raise DbtBouncerArtifactError(
+                f"The supplied `manifest.json` was generated with dbt version {dbt_version}, "
+                "this is below the minimum supported version of 1.10.0."
+            )
+
+        target_package = (
+            bouncer_config.package_name or manifest_dict["metadata"]["project_name"]
+        )
+        with span("filter_artifact", artifact="manifest.json"):
+            project = _filter_manifest(manifest_dict, target_package)
+        artifact_data = {"manifest.json": manifest_data}
+
+        # --- Catalog ---
+        if load_catalog:
+            catalog_path = artifact_paths["catalog.json"]
+            if "catalog.json" not in pending:
+                raise DbtBouncerArtifactError(
+                    f"No catalog.json found at {catalog_path}."
+                )
+
+            artifact_data["catalog.json"], catalog_dict = pending[
+                "catalog.json"
+            ].result()
+            with span("filter_artifact", artifact="catalog.json"):
+                project.update(
+                    _filter_catalog(catalog_dict, manifest_dict, target_package)
                 )
+
+        # --- Run Results ---
+        if load_run_results:
+            rr_path = artifact_paths["run_results.json"]
+            if "run_results.json" not in pending:
+                raise DbtBouncerArtifactError(
+                    f"No run_results.json found at {rr_path}."
+                )
+
+            artifact_data["run_results.json"], rr_dict = pending[
+                "run_results.json"
+            ].result()
+            with span("filter_artifact", artifact="run_results.json"):
+                project["run_results"] = _filter_run_results(
+                    rr_dict, manifest_dict, target_package
+                )
+
+    if cache_path is not None and cache_key is not None:
+        with span("write_snapshot"):
+            write_snapshot(
+                cache_path,
+                cache_key,
+                fingerprints={
+                    name: fingerprint_artifact(artifact_paths[name], data)
+                    for name, data in artifact_data.items()
+                },
+                sections={
+                    "project": {"target_package": target_package, **project},
+                    **{f"manifest.{k}": v for k, v in manifest_sections().items()},
+                },
             )
-    else:
-        project_run_results = []
+
+    artifacts = _build_parsed_artifacts(
+        bouncer_config,
+        target_package,
+        SimpleNamespace(manifest=manifest),
+        project,
+    )
+    for section, value in manifest_dict.items():
+        _share_project_entries(section, value, project)
+    return artifacts
+
+
+def load_state_manifest(state_dir: Path) -> LazySectionProxy:
+    """Load the baseline manifest ``state:`` selectors compare against.
+
+    Only the sections a selector reads are ever decoded.
+
+    Args:
+        state_dir: Directory holding the baseline ``manifest.json``, as passed
+            with ``--state`` (the same directory dbt's ``--state`` takes).
+
+    Returns:
+        LazySectionProxy: The baseline manifest.
+
+    Raises:
+        DbtBouncerArtifactError: If ``state_dir`` holds no ``manifest.json``.
+
+    """
+    manifest_path = state_dir / "manifest.json"
+    if not manifest_path.exists():
+        raise DbtBouncerArtifactError(
+            f"No manifest.json found at {manifest_path} (passed with `--state`)."
+        )
+    with span("load_state_manifest"):
+        sections = ArtifactSections(map_artifact(manifest_path))
+    return LazySectionProxy(
+        {name: partial(sections.decode, name) for name in sections.names}
+    )
+
+
+def _build_parsed_artifacts(
+    bouncer_config: DbtBouncerConfBase,
+    target_package: str,
+    manifest_obj: SimpleNamespace,
+    project: dict[str, list[Any]],
+) -> ParsedArtifacts:
+    """Wrap raw project entries, log the summary and assemble the result.
+
+    Returns:
+        ParsedArtifacts: Named tuple of lightweight proxy objects.
+
+    """
+    wrapped = _wrap_project(project)
 
     # Log parsed counts
     _log_artifact_summary(
         bouncer_config=bouncer_config,
         target_package=target_package,
-        project_exposures=project_exposures,
-        project_macros=project_macros,
-        project_models=project_models,
-        project_seeds=project_seeds,
-        project_semantic_models=project_semantic_models,
-        project_snapshots=project_snapshots,
-        project_sources=project_sources,
-        project_tests=project_tests,
-        project_unit_tests=project_unit_tests,
-        project_catalog_nodes=project_catalog_nodes,
-        project_catalog_sources=project_catalog_sources,
-        project_run_results=project_run_results,
+        project_exposures=wrapped["exposures"],
+        project_macros=wrapped["macros"],
+        project_models=wrapped["models"],
+        project_seeds=wrapped["seeds"],
+        project_semantic_models=wrapped["semantic_models"],
+        project_snapshots=wrapped["snapshots"],
+        project_sources=wrapped["sources"],
+        project_tests=wrapped["tests"],
+        project_unit_tests=wrapped["unit_tests"],
+        project_catalog_nodes=wrapped["catalog_nodes"],
+        project_catalog_sources=wrapped["catalog_sources"],
+        project_run_results=wrapped["run_results"],
     )
 
-    return ParsedArtifacts(
-        manifest_obj=manifest_obj,
-        exposures=project_exposures,
-        macros=project_macros,
-        models=project_models,
-        seeds=project_seeds,
-        semantic_models=project_semantic_models,
-        snapshots=project_snapshots,
-        sources=project_sources,
-        tests=project_tests,
-        unit_tests=project_unit_tests,
-        catalog_nodes=project_catalog_nodes,
-        catalog_sources=project_catalog_sources,
-        run_results=project_run_results,
-    )
+    return ParsedArtifacts(manifest_obj=manifest_obj, **wrapped)
 
 
 def _log_artifact_summary(
@@ -450,15 +1263,25 @@ def _log_artifact_summary(
     table.add_column("Category", justify="left", style="bright_white")
     table.add_column("Count", justify="right", style="bold green")
 
-    table.add_row("manifest.json", "Exposures", str(len(project_exposures)))
-    table.add_row("", "Macros", str(len(project_macros)))
-    table.add_row("", "Nodes", str(len(project_models)))
-    table.add_row("", "Seeds", str(len(project_seeds)))
-    table.add_row("", "Semantic Models", str(len(project_semantic_models)))
-    table.add_row("", "Snapshots", str(len(project_snapshots)))
-    table.add_row("", "Sources", str(len(project_sources)))
-    table.add_row("", "Tests", str(len(project_tests)))
-    table.add_row("", "Unit Tests", str(len(project_unit_tests)))
+    # Collections no configured check category needs are never decoded.
+    needed = _manifest_sections_needed(bouncer_config)
+
+    def _count(collection: str, resources: list[Any]) -> str:
+        if _MANIFEST_SECTIONS[collection] not in needed:
+            return "not loaded"
+        return str(len(resources))
+
+    table.add_row("manifest.json", "Exposures", _count("exposures", project_exposures))
+    table.add_row("", "Macros", _count("macros", project_macros))
+    table.add_row("", "Nodes", _count("models", project_models))
+    table.add_row("", "Seeds", _count("seeds", project_seeds))
+    table.add_row(
+        "", "Semantic Models", _count("semantic_models", project_semantic_models)
+    )
+    table.add_row("", "Snapshots", _count("snapshots", project_snapshots))
+    table.add_row("", "Sources", _count("sources", project_sources))
+    table.add_row("", "Tests", _count("tests", project_tests))
+    table.add_row("", "Unit Tests", _count("unit_tests", project_unit_tests))
 
     if (
         hasattr(bouncer_config, "catalog_checks")
@@ -0,0 +1,161 @@
+"""Memory-mapped artifact loading with lazily decoded top-level sections.
+
+Reading ``manifest.json`` into a ``bytes`` object and decoding it whole costs a
+full copy of the file plus every section in it, although most runs only ever
+look at a few: a run of catalog checks needs ``nodes`` and ``sources`` from the
+manifest, never ``macros``, ``docs`` or ``child_map``.
+
+:func:`map_artifact` memory-maps an artifact instead, and
+:class:`ArtifactSections` indexes the byte spans of its top-level sections with
+a single pattern search so each one can be decoded on its own, straight from
+the mapping.
+
+Section boundaries are guessed, not parsed. A boundary guessed wrongly always
+leaves the sections either side of it unbalanced, so decoding one fails; from
+then on every section is served from a full decode of the artifact instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import mmap
+import re
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Top-level manifest sections keyed by unique ID, so their value opens with
+# ``{}`` or a ``"<resource_type>.`` key (or is ``null``).
+_UID_KEYED_SECTIONS = (
+    b"nodes|sources|macros|docs|exposures|metrics|groups|disabled|parent_map|"
+    b"child_map|saved_queries|semantic_models|unit_tests|functions"
+)
+# Top-level manifest sections keyed by something else.
+_OTHER_SECTIONS = b"selectors|group_map"
+
+_FIRST_SECTION = re.compile(rb'\s*\{\s*"metadata"\s*:\s*(?=\{)')
+
+# The closing brace of one top-level object and the key of the next section.
+# Anchoring on the brace keeps this a single fast pass over the file.
+_NEXT_SECTION = re.compile(
+    rb'\}\s*,\s*"(?:(?P<uid_keyed>'
+    + _UID_KEYED_SECTIONS
+    + rb')"\s*:\s*(?=\{\s*(?:\}|"[a-z_]+\.)|null\b)|(?P<other>'
+    + _OTHER_SECTIONS
+    + rb')"\s*:\s*(?=\{|null\b))'
+)
+
+
+def map_artifact(path: Path) -> mmap.mmap | bytes:
+    """Memory-map the artifact at ``path`` read-only.
+
+    The kernel is asked to start reading the whole file straight away, so
+    several artifacts mapped one after another are fetched concurrently. Files
+    that cannot be mapped (empty files, some special filesystems) are read into
+    memory instead.
+
+    Returns:
+        mmap.mmap | bytes: The artifact contents.
+
+    """
+    with path.open("rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return f.read()
+    if hasattr(mmap, "MADV_WILLNEED"):
+        with contextlib.suppress(OSError):
+            data.madvise(mmap.MADV_WILLNEED)
+    return data
+
+
+def index_sections(data: mmap.mmap | bytes) -> dict[str, tuple[int, int]] | None:
+    """Locate the byte span of every top-level section of a manifest.
+
+    Returns:
+        dict[str, tuple[int, int]] | None: ``(start, end)`` per section name,
+        in document order, or ``None`` if ``data`` does not look like a
+        manifest.
+
+    """
+    first = _FIRST_SECTION.match(data)
+    closing = data.rfind(b"}")
+    if first is None or closing == -1 or data[closing + 1 :].strip():
+        return None
+
+    spans: dict[str, tuple[int, int]] = {}
+    name, start = "metadata", first.end()
+    for match in _NEXT_SECTION.finditer(data, start, closing):
+        next_name = (match["uid_keyed"] or match["other"]).decode()
+        if next_name in spans or next_name == name:
+            # A nested dict that happens to share a section's name.
+            continue
+        spans[name] = (start, match.start() + 1)
+        name, start = next_name, match.end()
+    spans[name] = (start, closing)
+    return spans
+
+
+class ArtifactSections:
+    """The top-level sections of a JSON artifact, each decoded on request."""
+
+    def __init__(self, data: mmap.mmap | bytes) -> None:
+        """Index the sections of ``data`` without decoding any of them."""
+        self._data = data
+        self._view = memoryview(data)
+        self._spans = index_sections(data)
+        self._full: dict[str, Any] | None = None
+        if self._spans is None:
+            self._decode_full()
+
+    def _decode_full(self) -> dict[str, Any]:
+        if self._full is None:
+            self._full = orjson.loads(self._view)
+            self._spans = None
+        return self._full
+
+    @property
+    def names(self) -> list[str]:
+        """Names of every top-level section, in document order.
+
+        Returns:
+            list[str]: Section names.
+
+        """
+        return list(self._spans if self._spans is not None else self._decode_full())
+
+    def raw(self, name: str) -> memoryview | None:
+        """Return the undecoded JSON bytes of section ``name``.
+
+        Returns:
+            memoryview | None: A view onto the artifact, or ``None`` once the
+            sections are being served from a full decode.
+
+        """
+        if self._spans is None:
+            return None
+        start, end = self._spans[name]
+        return self._view[start:end]
+
+    def decode(self, name: str) -> Any:
+        """Decode section ``name``.
+
+        Returns:
+            Any: The decoded JSON value.
+
+        """
+        raw = self.raw(name)
+        if raw is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                logging.debug(
+                    "Section %r of the artifact could not be decoded on its own; "
+                    "decoding in full.",
+                    name,
+                )
+        return self._decode_full()[name]
@@ -0,0 +1,273 @@
+"""On-disk snapshot cache for parsed dbt artifacts.
+
+A snapshot is a single file under ``get_cache_dir()`` holding a small JSON
+header followed by independently decodable orjson blobs ("sections"). The
+header records, for every artifact the snapshot was built from, its size,
+``mtime_ns`` and SHA-256 digest. A snapshot is only served when every artifact
+still has the same size and either the same ``mtime_ns`` or, when the
+timestamp moved (fresh CI checkouts, ``touch``), the same content digest.
+
+orjson is already as fast as any serialiser available to us, so the saving
+comes from decoding less: sections are decoded on demand rather than up front.
+Every failure mode degrades to a full parse.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    import mmap
+    from pathlib import Path
+
+_SNAPSHOT_FORMAT_VERSION = 1
+_SNAPSHOT_MAGIC = b"DBTBSNAP"
+_HEADER_LENGTH_BYTES = 8
+_SNAPSHOTS_TO_KEEP = 8
+
+
+def artifact_cache_enabled() -> bool:
+    """Whether the parsed-artifact snapshot cache is active.
+
+    Disabled when the ``DBT_BOUNCER_DISABLE_ARTIFACT_CACHE`` env var is set to
+    a truthy value.
+
+    Returns:
+        bool: ``True`` if snapshots should be read and written.
+
+    """
+    from dbt_bouncer.utils import env_flag
+
+    return not env_flag("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE")
+
+
+def fingerprint_artifact(path: Path, data: bytes | mmap.mmap) -> list[Any]:
+    """Fingerprint an artifact whose bytes have already been read.
+
+    Hashing the bytes the parser already holds keeps the cold path to a single
+    read of each file.
+
+    Returns:
+        list[Any]: ``[size, mtime_ns, sha256_hexdigest]``.
+
+    """
+    st = path.stat()
+    return [len(data), st.st_mtime_ns, hashlib.sha256(data).hexdigest()]
+
+
+def snapshot_path(dbt_artifacts_dir: Path, key: str) -> Path:
+    """Return the snapshot file for ``dbt_artifacts_dir`` under ``key``.
+
+    Returns:
+        Path: Location inside the dbt-bouncer cache directory.
+
+    """
+    from dbt_bouncer.utils import get_cache_dir
+
+    digest = hashlib.sha256(
+        f"{dbt_artifacts_dir.resolve()}\0{key}".encode()
+    ).hexdigest()
+    return get_cache_dir() / f"artifacts_{digest[:16]}.snapshot"
+
+
+def _artifact_unchanged(path: Path, recorded: list[Any]) -> bool:
+    """Whether ``path`` still matches its recorded ``[size, mtime_ns, sha256]``.
+
+    Returns:
+        bool: ``True`` if the artifact can be served from the snapshot.
+
+    """
+    size, mtime_ns, digest = recorded
+    try:
+        st = path.stat()
+        if st.st_size != size:
+            return False
+        if st.st_mtime_ns == mtime_ns:
+            return True
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest() == digest
+    except OSError:
+        return False
+
+
+def _read_header(blob: bytes) -> dict[str, Any] | None:
+    """Parse the snapshot header and rebase section offsets onto ``blob``.
+
+    Returns:
+        dict[str, Any] | None: The header, or ``None`` if ``blob`` is not a
+        complete snapshot.
+
+    """
+    if not blob.startswith(_SNAPSHOT_MAGIC):
+        return None
+    start = len(_SNAPSHOT_MAGIC) + _HEADER_LENGTH_BYTES
+    header_len = int.from_bytes(blob[len(_SNAPSHOT_MAGIC) : start], "little")
+    try:
+        header = orjson.loads(blob[start : start + header_len])
+        sections = {
+            name: [start + header_len + offset, length]
+            for name, (offset, length) in header["sections"].items()
+        }
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+    if any(offset + length > len(blob) for offset, length in sections.values()):
+        return None
+    header["sections"] = sections
+    return header
+
+
+class ArtifactSnapshot:
+    """A validated snapshot whose sections are decoded on request."""
+
+    def __init__(self, blob: bytes, sections: dict[str, list[int]]) -> None:
+        """Hold the raw snapshot bytes and the section offset table."""
+        self._blob = memoryview(blob)
+        self._sections = sections
+
+    @property
+    def section_names(self) -> list[str]:
+        """Names of every section stored in the snapshot.
+
+        Returns:
+            list[str]: Section names in write order.
+
+        """
+        return list(self._sections)
+
+    def decode(self, name: str) -> Any:
+        """Decode section ``name``.
+
+        Returns:
+            Any: The decoded JSON value.
+
+        """
+        offset, length = self._sections[name]
+        return orjson.loads(self._blob[offset : offset + length])
+
+
+def load_snapshot(
+    path: Path, key: str, artifact_paths: dict[str, Path]
+) -> ArtifactSnapshot | None:
+    """Load the snapshot at ``path`` if it is still valid.
+
+    Args:
+        path: Snapshot file, as returned by :func:`snapshot_path`.
+        key: Cache key the snapshot must have been written under.
+        artifact_paths: The artifacts the caller is about to parse, keyed by
+            file name. The snapshot must have been built from exactly these.
+
+    Returns:
+        ArtifactSnapshot | None: The snapshot, or ``None`` if it is missing,
+        corrupt, written by another format/key, or any artifact has changed.
+
+    """
+    try:
+        blob = path.read_bytes()
+    except OSError:
+        return None
+
+    header = _read_header(blob)
+    if header is None:
+        logging.debug("Artifact snapshot unreadable, reparsing.")
+        return None
+
+    if header.get("v") != _SNAPSHOT_FORMAT_VERSION or header.get("key") != key:
+        return None
+
+    recorded = header.get("artifacts", {})
+    if set(recorded) != set(artifact_paths):
+        return None
+    for name, artifact_path in artifact_paths.items():
+        if not _artifact_unchanged(artifact_path, recorded[name]):
+            logging.debug("Artifact %s changed since last snapshot.", name)
+            return None
+
+    return ArtifactSnapshot(blob, header["sections"])
+
+
+def write_snapshot(
+    path: Path,
+    key: str,
+    fingerprints: dict[str, list[Any]],
+    sections: dict[str, Any],
+) -> None:
+    """Serialise ``sections`` to a snapshot at ``path``.
+
+    Never raises: a snapshot that cannot be written only costs the next run
+    a full parse.
+
+    Args:
+        path: Snapshot file, as returned by :func:`snapshot_path`.
+        key: Cache key to record.
+        fingerprints: ``fingerprint_artifact`` output per artifact file name.
+        sections: JSON-serialisable value per section name. ``bytes`` and
+            ``memoryview`` values are taken to be JSON already and written
+            verbatim.
+
+    """
+    try:
+        blobs = {
+            name: value
+            if isinstance(value, (bytes, memoryview))
+            else orjson.dumps(value)
+            for name, value in sections.items()
+        }
+    except (TypeError, orjson.JSONEncodeError):
+        logging.debug("Artifact snapshot serialisation failed.", exc_info=True)
+        return
+
+    offsets: dict[str, list[int]] = {}
+    position = 0
+    for name, data in blobs.items():
+        offsets[name] = [position, len(data)]
+        position += len(data)
+    header = orjson.dumps(
+        {
+            "v": _SNAPSHOT_FORMAT_VERSION,
+            "key": key,
+            "artifacts": fingerprints,
+            "sections": offsets,
+        }
+    )
+
+    from dbt_bouncer.utils import write_atomic
+
+    try:
+        write_atomic(
+            path,
+            _SNAPSHOT_MAGIC,
+            len(header).to_bytes(_HEADER_LENGTH_BYTES, "little"),
+            header,
+            *blobs.values(),
+        )
+    except OSError:
+        logging.debug("Artifact snapshot write failed.", exc_info=True)
+        return
+
+    _prune_stale_snapshots(path)
+
+
+def _prune_stale_snapshots(keep: Path) -> None:
+    """Delete all but the most recently written snapshots next to ``keep``.
+
+    Each artifacts directory and parse configuration gets its own snapshot, so
+    without pruning every CI workspace path would leave one behind for good.
+
+    Args:
+        keep: The freshly-written snapshot, always retained.
+
+    """
+    with contextlib.suppress(OSError):
+        others = sorted(
+            (f for f in keep.parent.glob("artifacts_*.snapshot") if f != keep),
+            key=lambda f: f.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for f in others[_SNAPSHOTS_TO_KEEP - 1 :]:
+            with contextlib.suppress(OSError):
+                f.unlink()
@@ -0,0 +1,246 @@
+"""Package-filtered manifest loading.
+
+``orjson.loads`` on a whole ``manifest.json`` materialises every node, macro and
+source of every installed package, even though only the target package's
+resources are checked. On projects with large dependencies most of that memory
+is thrown away again straight after filtering.
+
+:func:`load_package_manifest` instead walks the resource collections of the raw
+manifest bytes one entry at a time. Entries from the target package are kept
+in full; entries from other packages are reduced to the handful of fields that
+selectors and lineage checks read, so peak memory follows the size of the
+project rather than the size of its dependencies. Everything else in the
+manifest (``metadata``, ``parent_map``, ``child_map``...) is decoded as usual.
+
+Entry boundaries are found with a cheap byte-pattern search and every entry is
+confirmed by decoding it, so a boundary guessed wrongly can never produce a
+wrong manifest: the scan gives up and the caller falls back to a full decode.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from dbt_bouncer.selectors import MANIFEST_COLLECTIONS
+
+if TYPE_CHECKING:
+    import mmap
+
+# Fields kept on resources from other packages: what `Selector` matches on
+# (including `state:modified`), what lineage/macro checks follow across package
+# boundaries, and identity.
+_SKELETON_FIELDS = frozenset(
+    {
+        "access",
+        "checksum",
+        "config",
+        "depends_on",
+        "fqn",
+        "group",
+        "latest_version",
+        "name",
+        "original_file_path",
+        "package_name",
+        "path",
+        "refs",
+        "resource_type",
+        "tags",
+        "unique_id",
+        "unrendered_config",
+        "version",
+    }
+)
+
+_TOP_LEVEL_KEYS = (
+    b"metadata|nodes|sources|macros|docs|exposures|metrics|groups|selectors|"
+    b"disabled|parent_map|child_map|group_map|saved_queries|semantic_models|"
+    b"unit_tests|functions"
+)
+
+# An entry key: a quoted unique ID followed by the opening brace of its value.
+_ENTRY_KEY = re.compile(rb'\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*:\s*\{')
+
+# A closing brace that may end an entry: it is followed either by the next
+# entry's key, or by the end of the collection and then the next top-level key
+# (or the end of the document). Nested dicts can match too; decoding rejects them.
+_ENTRY_END = re.compile(
+    rb'\}(?=\s*(?:,\s*"[a-z_]+\.[^"\\]*"\s*:\s*\{|\}\s*(?:,\s*"(?:'
+    + _TOP_LEVEL_KEYS
+    + rb')"\s*:|\}\s*$)))'
+)
+
+# A closing brace that may end the top-level ``metadata`` object.
+_METADATA_END = re.compile(rb'\}(?=\s*,\s*"(?:' + _TOP_LEVEL_KEYS + rb')"\s*:)')
+
+_COLLECTION_OPEN = re.compile(rb"\s*:\s*\{")
+_COLLECTION_CLOSE = re.compile(rb"\s*\}")
+_ENTRY_SEPARATOR = re.compile(rb"\s*,")
+
+# Stands in for a scanned collection when decoding the rest of the manifest.
+# The key cannot occur in a real manifest, so finding it back at the top level
+# proves the collection's span was identified correctly.
+_PLACEHOLDER_KEY = "\x00dbt_bouncer_collection"
+
+
+class _ScanError(Exception):
+    """The manifest bytes did not have the shape the scanner expects."""
+
+
+def _decode_until(
+    view: memoryview, data: bytes | mmap.mmap, start: int, pattern: re.Pattern[bytes]
+) -> tuple[Any, int]:
+    """Decode the object starting at ``start``, ending at a ``pattern`` match.
+
+    Returns:
+        tuple[Any, int]: The decoded object and the offset just past it.
+
+    Raises:
+        _ScanError: If no candidate end yields a valid object.
+
+    """
+    for match in pattern.finditer(data, start):
+        try:
+            return orjson.loads(view[start : match.end()]), match.end()
+        except orjson.JSONDecodeError:
+            continue
+    raise _ScanError(f"no object end found after offset {start}")
+
+
+def _metadata(view: memoryview, data: bytes | mmap.mmap) -> dict[str, Any]:
+    """Decode just the top-level ``metadata`` object.
+
+    Returns:
+        dict[str, Any]: The manifest metadata.
+
+    Raises:
+        _ScanError: If the manifest does not start with a ``metadata`` object.
+
+    """
+    match = re.match(rb'\s*\{\s*"metadata"\s*:\s*\{', data)
+    if match is None:
+        raise _ScanError("manifest does not start with metadata")
+    value, _ = _decode_until(view, data, match.end() - 1, _METADATA_END)
+    return value
+
+
+def _scan_collection(
+    view: memoryview, data: bytes | mmap.mmap, brace: int, target_package: str
+) -> tuple[dict[str, Any], int]:
+    """Walk the collection whose opening brace is at ``brace``.
+
+    Returns:
+        tuple[dict[str, Any], int]: The filtered collection and the offset just
+        past its closing brace.
+
+    Raises:
+        _ScanError: If the bytes at ``brace`` are not a collection of objects.
+
+    """
+    collection: dict[str, Any] = {}
+    pos = brace + 1
+    while True:
+        match = _ENTRY_KEY.match(data, pos)
+        if match is None:
+            closing = _COLLECTION_CLOSE.match(data, pos)
+            if closing is None:
+                raise _ScanError(f"malformed collection at offset {pos}")
+            return collection, closing.end()
+        key = match.group(1)
+        uid = orjson.loads(b'"' + key + b'"') if b"\\" in key else key.decode()
+        value, pos = _decode_until(view, data, match.end() - 1, _ENTRY_END)
+        if not isinstance(value, dict):
+            raise _ScanError(f"entry {uid} is not an object")
+        if value.get("package_name") != target_package:
+            value = {k: v for k, v in value.items() if k in _SKELETON_FIELDS}
+        collection[uid] = value
+        separator = _ENTRY_SEPARATOR.match(data, pos)
+        if separator is not None:
+            pos = separator.end()
+
+
+def _scan(data: bytes | mmap.mmap, package_name: str | None) -> dict[str, Any]:
+    """Build the package-filtered manifest, raising on anything unexpected.
+
+    Returns:
+        dict[str, Any]: The manifest with foreign resources reduced.
+
+    Raises:
+        _ScanError: If the manifest cannot be scanned safely.
+
+    """
+    view = memoryview(data)
+    target_package = package_name or _metadata(view, data)["project_name"]
+
+    collections: dict[str, dict[str, Any]] = {}
+    spans: list[tuple[int, int, str]] = []
+    for name in MANIFEST_COLLECTIONS:
+        quoted = b'"' + name.encode() + b'"'
+        offset = data.find(quoted)
+        while offset != -1:
+            match = _COLLECTION_OPEN.match(data, offset + len(quoted))
+            offset = data.find(quoted, offset + 1)
+            if match is None:
+                continue
+            brace = match.end() - 1
+            try:
+                collection, end = _scan_collection(view, data, brace, target_package)
+            except _ScanError:
+                continue
+            collections[name] = collection
+            spans.append((brace, end, name))
+            break
+
+    spans.sort()
+    pieces: list[bytes] = []
+    position = 0
+    for brace, end, name in spans:
+        if brace < position:
+            raise _ScanError(f"collection {name} overlaps another collection")
+        pieces.append(data[position:brace])
+        pieces.append(orjson.dumps({_PLACEHOLDER_KEY: name}))
+        position = end
+    pieces.append(data[position:])
+
+    try:
+        manifest = orjson.loads(b"".join(pieces))
+    except orjson.JSONDecodeError as e:
+        raise _ScanError("manifest remainder is not valid JSON") from e
+    for name, collection in collections.items():
+        if manifest.get(name) != {_PLACEHOLDER_KEY: name}:
+            raise _ScanError(f"collection {name} was not found at the top level")
+        manifest[name] = collection
+    return manifest
+
+
+def load_package_manifest(
+    data: bytes | mmap.mmap, package_name: str | None
+) -> dict[str, Any] | None:
+    """Decode ``manifest.json`` bytes, keeping other packages' resources lean.
+
+    Resources in the ``exposures``, ``macros``, ``nodes``, ``semantic_models``,
+    ``sources`` and ``unit_tests`` collections whose ``package_name`` is not the
+    target package keep only the fields selectors and lineage checks use (name,
+    tags, config, fqn, paths, ``depends_on``, ``refs``...). All other manifest
+    sections are returned unchanged.
+
+    Args:
+        data: The raw (or memory-mapped) ``manifest.json`` bytes.
+        package_name: The target package, or ``None`` for the manifest's own
+            ``metadata.project_name``.
+
+    Returns:
+        dict[str, Any] | None: The decoded manifest, or ``None`` if the bytes
+        could not be scanned, in which case the caller should decode in full.
+
+    """
+    try:
+        return _scan(data, package_name)
+    except (_ScanError, KeyError, TypeError) as e:
+        logging.debug(
+            "Package-filtered manifest scan failed (%s); decoding in full.", e
+        )
+        return None
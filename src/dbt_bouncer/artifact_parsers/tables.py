@@ -0,0 +1,156 @@
+"""Column-oriented views of parsed resources.
+
+Checks normally see one resource at a time through its proxy, so a simple
+predicate over every model pays a Python call, several proxy allocations and
+(on failure) an exception per model. A :class:`ResourceTable` instead holds the
+fields such predicates read -- unique ID, name, path, materialization,
+description, tags, meta keys -- as parallel lists, one row per resource, read
+straight from the underlying dicts without wrapping anything. A check can then
+evaluate a whole column in one comprehension and only look at the rows that
+fail.
+
+Tables are built on first use by :meth:`CheckContext.table
+<dbt_bouncer.check_framework.context.CheckContext.table>`, so runs whose checks
+never ask for one do not pay for it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from dbt_bouncer.artifact_parsers.parser import ResourceWrapper
+
+__all__ = ["ResourceTable", "build_resource_table"]
+
+_EMPTY: dict[str, Any] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceTable:
+    """Parallel columns of one resource type, one row per resource.
+
+    Row ``i`` of every column describes ``resources[i]``, the object checks
+    receive for that resource. Missing values are ``None`` (or empty for
+    ``tags`` and ``meta_keys``), matching what the proxies return.
+    """
+
+    resources: list[Any]
+    unique_id: list[str | None]
+    name: list[str | None]
+    path: list[str | None]
+    package_name: list[str | None]
+    materialized: list[str | None]
+    description: list[str]
+    description_length: list[int]
+    tags: list[tuple[str, ...]]
+    meta_keys: list[frozenset[str]]
+
+    row_by_unique_id: dict[str, int] = field(init=False, repr=False)
+    _row_by_id: dict[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index the rows by unique ID."""
+        object.__setattr__(
+            self,
+            "row_by_unique_id",
+            {uid: i for i, uid in enumerate(self.unique_id) if uid is not None},
+        )
+
+    def __len__(self) -> int:
+        """Return the number of rows.
+
+        Returns:
+            int: Number of resources in the table.
+
+        """
+        return len(self.resources)
+
+    def rows(self, resources: list[Any]) -> list[int] | None:
+        """Return the row of each of ``resources``, in order.
+
+        Resources are matched by identity (after unwrapping), so a node that
+        merely shares a unique ID with a row never picks up that row's values.
+
+        Returns:
+            list[int] | None: Row indexes into every column, or ``None`` if any
+            of ``resources`` is not in the table.
+
+        """
+        row_by_id = self._row_by_id
+        if row_by_id is None:
+            row_by_id = {id(node): i for i, node in enumerate(self.resources)}
+            object.__setattr__(self, "_row_by_id", row_by_id)
+        out: list[int] = []
+        for resource in resources:
+            row = row_by_id.get(id(_unwrap(resource)))
+            if row is None:
+                return None
+            out.append(row)
+        return out
+
+
+def _unwrap(resource: Any) -> Any:
+    if isinstance(resource, ResourceWrapper):
+        return getattr(resource, resource.resource_attr)
+    return resource
+
+
+def _field(node: Any, key: str) -> Any:
+    # Read the raw value: dict.get skips DictProxy's wrapping.
+    if isinstance(node, dict):
+        return dict.get(node, key)
+    return getattr(node, key, None)
+
+
+def build_resource_table(resources: list[Any]) -> ResourceTable:
+    """Build the columns of ``resources``.
+
+    ``resources`` may hold the resource nodes themselves or the wrappers the
+    parser emits (``SourceWrapper`` ...); wrappers are unwrapped, so
+    ``resources`` of the table always holds nodes.
+
+    Returns:
+        ResourceTable: One row per resource, in the order given.
+
+    """
+    nodes = [_unwrap(r) for r in resources]
+    unique_id: list[str | None] = []
+    name: list[str | None] = []
+    path: list[str | None] = []
+    package_name: list[str | None] = []
+    materialized: list[str | None] = []
+    description: list[str] = []
+    description_length: list[int] = []
+    tags: list[tuple[str, ...]] = []
+    meta_keys: list[frozenset[str]] = []
+    for node in nodes:
+        unique_id.append(_field(node, "unique_id"))
+        name.append(_field(node, "name"))
+        path.append(_field(node, "original_file_path"))
+        package_name.append(_field(node, "package_name"))
+        config = _field(node, "config") or _EMPTY
+        materialized.append(_field(config, "materialized"))
+        text = _field(node, "description") or ""
+        description.append(text)
+        description_length.append(len(text.strip()))
+        raw_tags = _field(node, "tags") or ()
+        # list.copy: iterating a ListProxy would wrap every tag.
+        tags.append(
+            tuple(list.copy(raw_tags) if isinstance(raw_tags, list) else raw_tags)
+        )
+        meta_keys.append(frozenset(_field(node, "meta") or ()))
+    return ResourceTable(
+        resources=nodes,
+        unique_id=unique_id,
+        name=name,
+        path=path,
+        package_name=package_name,
+        materialized=materialized,
+        description=description,
+        description_length=description_length,
+        tags=tags,
+        meta_keys=meta_keys,
+    )
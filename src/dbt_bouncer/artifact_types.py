@@ -258,7 +258,7 @@ class UnitTestNode(Protocol):
 
 
 # ---------------------------------------------------------------------------
-# Wrapper protocols for SimpleNamespace resource containers
+# Wrapper protocols for resource containers (see artifact_parsers.parser)
 # ---------------------------------------------------------------------------
 
 
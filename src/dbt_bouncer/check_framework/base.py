@@ -10,6 +10,24 @@ from dbt_bouncer.enums import CheckSeverity, Materialization, RuleCode
 from dbt_bouncer.utils import is_description_populated
 
 
+def unwrap_resource(resource: Any, iterate_over_value: str) -> Any:
+    """Return the node a check receives for ``resource``.
+
+    Args:
+        resource: The dbt resource wrapper object (e.g. ``ModelWrapper``), or
+            the node itself for resources that are not wrapped.
+        iterate_over_value: The wrapper attribute holding the node (e.g.
+            "model", "seed").
+
+    Returns:
+        Any: The unwrapped node.
+
+    """
+    if isinstance(resource, dict):
+        return resource.get(iterate_over_value, resource)
+    return getattr(resource, iterate_over_value, resource)
+
+
 class BaseCheck(BaseModel):
     """Base class for all checks."""
 
@@ -85,6 +103,18 @@ class BaseCheck(BaseModel):
     # ``ClassVar`` keeps Pydantic from treating it as a model field.
     iterate_over: ClassVar[str | None] = None
 
+    # Set by ``@check(batch=True)``. Batch checks also get an
+    # ``execute_batch(resources)`` method yielding ``(resource, message)`` for
+    # each failing resource, and the runner hands them every matched resource
+    # in one call instead of binding them one at a time.
+    batch: ClassVar[bool] = False
+
+    # Set by the ``@check`` decorator to whether the check function takes
+    # ``ctx``, i.e. may read resources other than the one it is bound to.
+    # Incremental runs re-execute such checks when the resource's lineage
+    # changes, not just the resource itself.
+    uses_context: ClassVar[bool] = True
+
     def set_context(self, ctx: Any) -> None:
         """Set the execution context for this check instance.
 
@@ -102,11 +132,9 @@ class BaseCheck(BaseModel):
             iterate_over_value: The field name to set (e.g. "model", "seed").
 
         """
-        if isinstance(resource, dict):
-            inner = resource.get(iterate_over_value, resource)
-        else:
-            inner = getattr(resource, iterate_over_value, resource)
-        object.__setattr__(self, iterate_over_value, inner)
+        object.__setattr__(
+            self, iterate_over_value, unwrap_resource(resource, iterate_over_value)
+        )
 
     # Helper methods
     def _is_description_populated(
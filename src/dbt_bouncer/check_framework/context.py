@@ -1,10 +1,18 @@
 """Typed context object for check execution."""
 
-from dataclasses import dataclass, field
-from typing import Any
+from collections.abc import Callable, Hashable
+from dataclasses import InitVar, dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from dbt_bouncer.artifact_parsers.graph import DependencyGraph, build_dependency_graph
+
+if TYPE_CHECKING:
+    from dbt_bouncer.artifact_parsers.tables import ResourceTable
 
 __all__ = ["CheckContext"]
 
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True, slots=True)
 class CheckContext:
@@ -39,6 +47,12 @@ class CheckContext:
     sources_by_unique_id: dict[str, Any] = field(default_factory=dict)
     tests_by_unique_id: dict[str, Any] = field(default_factory=dict)
 
+    # The dependency graph the lineage checks walk. runner.py passes the
+    # manifest's graph, shared with the selectors, as ``dependency_graph``;
+    # without one (as from testing.py) it is built from the resource lists.
+    dependency_graph: InitVar[DependencyGraph | None] = None
+    graph: DependencyGraph = field(init=False, repr=False, compare=False)
+
     # Derived reverse-lookup indexes, computed once in __post_init__ from the
     # resource lists above. Not accepted as constructor args (init=False):
     # they must always be self-derived so they're correct whether CheckContext
@@ -60,18 +74,53 @@ class CheckContext:
         default_factory=dict, init=False, repr=False
     )
 
-    def __post_init__(self) -> None:
-        """Derive reverse-lookup indexes once from the resource lists.
+    # Column-oriented views of the resource lists, built on first use by
+    # `table()`.
+    _tables: dict[str, "ResourceTable"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Per-run values derived from the resources by checks, built on first use
+    # by `derived()`.
+    _derived: dict[Hashable, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self, dependency_graph: DependencyGraph | None) -> None:
+        """Derive the dependency graph and reverse-lookup indexes once from the resource lists.
 
         Storing actual objects (not just unique_ids) in children_by_unique_id
         means downstream checks never need a second models_by_unique_id
         lookup, which matters because that dict is frequently empty in test
         contexts (see the field comment above).
+
+        Args:
+            dependency_graph: The graph to use, or None to build one from the
+                ``depends_on`` of the resources. Data tests are left out of a
+                built graph: no lineage check follows edges to them.
+
         """
+        graph = dependency_graph
+        if graph is None:
+            graph = build_dependency_graph(
+                (uid, getattr(getattr(r, "depends_on", None), "nodes", None))
+                for resources in (
+                    self.models,
+                    self.snapshots,
+                    self.exposures,
+                    self.semantic_models,
+                    self.unit_tests,
+                )
+                for r in resources
+                if (uid := getattr(r, "unique_id", None)) is not None
+            )
+        object.__setattr__(self, "graph", graph)
+
         children: dict[str, list[Any]] = {}
         for m in self.models:
-            nodes = getattr(getattr(m, "depends_on", None), "nodes", None)
-            for upstream_id in set(nodes or []):
+            uid = getattr(m, "unique_id", None)
+            if uid is None:
+                continue
+            for upstream_id in graph.parents(uid):
                 children.setdefault(upstream_id, []).append(m)
         object.__setattr__(self, "children_by_unique_id", children)
 
@@ -107,3 +156,93 @@ class CheckContext:
             key = (node.database, node.schema, node.identifier)
             relations.setdefault(key, []).append(node.unique_id)
         object.__setattr__(self, "sources_by_relation", relations)
+
+    def parents_of(self, resource: Any) -> list[str]:
+        """Return the unique IDs ``resource`` depends on, as recorded in ``graph``.
+
+        A resource that is not in the graph (as when a check is run on its
+        own, e.g. in tests) falls back to its own ``depends_on.nodes``.
+
+        Args:
+            resource: A model, exposure or other resource with a ``unique_id``.
+
+        Returns:
+            list[str]: Its parents.
+
+        """
+        uid = getattr(resource, "unique_id", None)
+        if uid in self.graph.row_by_unique_id:
+            return self.graph.parents(uid)
+        return list(getattr(getattr(resource, "depends_on", None), "nodes", None) or [])
+
+    def table(self, resource_type: str) -> "ResourceTable":
+        """Return the column-oriented view of one resource list.
+
+        Built on first call and reused afterwards.
+
+        Args:
+            resource_type: A resource list field, e.g. ``"models"`` or
+                ``"sources"``.
+
+        Returns:
+            ResourceTable: One row per resource in that list.
+
+        """
+        table = self._tables.get(resource_type)
+        if table is None:
+            from dbt_bouncer.artifact_parsers.tables import build_resource_table
+
+            table = build_resource_table(getattr(self, resource_type))
+            self._tables[resource_type] = table
+        return table
+
+    def derived(self, key: Hashable, build: Callable[[], _T]) -> _T:
+        """Return a value derived from the resources, computing it once per context.
+
+        Lets a check compute something over every resource once per run, e.g.
+        a value per model, instead of once per check call. Concurrent first
+        calls may both run ``build``; either result is kept.
+
+        Args:
+            key: Identifies the value, including any check parameters it
+                depends on.
+            build: Computes the value.
+
+        Returns:
+            The value.
+
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = self._derived[key] = build()
+            return value
+
+    def table_rows(
+        self, resource_type: str, resources: list[Any]
+    ) -> tuple["ResourceTable", list[int]]:
+        """Return a table holding ``resources`` and their rows in it.
+
+        Batch checks receive a filtered subset of one resource list; this maps
+        it onto the cached :meth:`table` of that list. Resources that are not
+        in the context's list (as when a check is run on its own, e.g. in
+        tests) get a table of their own instead.
+
+        Args:
+            resource_type: The resource list ``resources`` come from, e.g.
+                ``"models"``.
+            resources: The resources to look up.
+
+        Returns:
+            tuple[ResourceTable, list[int]]: The table and, for each of
+            ``resources`` in order, its row.
+
+        """
+        table = self.table(resource_type)
+        rows = table.rows(resources)
+        if rows is None:
+            from dbt_bouncer.artifact_parsers.tables import build_resource_table
+
+            table = build_resource_table(resources)
+            rows = list(range(len(resources)))
+        return table, rows
@@ -31,6 +31,19 @@ Example::
     @check
     def check_model_documentation_coverage(ctx, *, min_pct: int = 100):
         ...  # context-only check, no iterate_over
+
+Set-based checks can instead take every matched resource at once with
+``@check(batch=True)``. The resource parameter is then plural, receives the
+list of resources that passed the include/exclude/selector filters, and the
+function yields ``(resource, failure_message)`` for each one that fails::
+
+    @check(batch=True)
+    def check_model_names(models, ctx, *, model_name_pattern: str):
+        compiled = re.compile(model_name_pattern)
+        table, rows = ctx.table_rows("models", models)
+        for row in rows:
+            if not compiled.match(str(table.name[row])):
+                yield table.resources[row], f"`{table.unique_id[row]}` ..."
 """
 
 from __future__ import annotations
@@ -40,7 +53,7 @@ import sys
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, overload
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 from pydantic import Field, create_model
 
@@ -74,15 +87,16 @@ def check(fn: Callable[..., None]) -> type[BaseCheck]: ...
 
 @overload
 def check(
-    fn: None = None, *, code: str | None = None
-) -> Callable[[Callable[..., None]], type[BaseCheck]]: ...
+    fn: None = None, *, code: str | None = None, batch: bool = False
+) -> Callable[[Callable[..., Any]], type[BaseCheck]]: ...
 
 
 def check(
     fn: Callable[..., None] | None = None,
     *,
     code: str | None = None,
-) -> type[BaseCheck] | Callable[[Callable[..., None]], type[BaseCheck]]:
+    batch: bool = False,
+) -> type[BaseCheck] | Callable[[Callable[..., Any]], type[BaseCheck]]:
     """Generate a ``BaseCheck`` subclass from a plain function.
 
     Everything is inferred from the function signature:
@@ -94,7 +108,12 @@ def check(
     - **params** — keyword-only arguments become Pydantic fields.
     - **ctx** — injected when the function declares it.
 
-    Supports ``@check``, ``@check()``, and ``@check(code="MO001")`` usage.
+    With ``batch=True`` the resource parameter is plural (``models``), receives
+    every matched resource at once, and the function yields
+    ``(resource, failure_message)`` pairs instead of calling ``fail()``.
+
+    Supports ``@check``, ``@check()``, ``@check(code="MO001")`` and
+    ``@check(batch=True)`` usage.
 
     Returns:
         The generated ``BaseCheck`` subclass (or a decorator if called with parens).
@@ -102,27 +121,31 @@ def check(
     """
     if fn is None:
         # Called as @check() or @check(code="MO001") — return decorator.
-        def wrapper(f: Callable[..., None]) -> type[BaseCheck]:
-            return _build_check_class(f, code=code)
+        def wrapper(f: Callable[..., Any]) -> type[BaseCheck]:
+            return _build_check_class(f, code=code, batch=batch)
 
         return wrapper
 
     # Called as bare @check — fn is the decorated function.
-    return _build_check_class(fn, code=code)
+    return _build_check_class(fn, code=code, batch=batch)
 
 
 def _build_check_class(
-    fn: Callable[..., None], code: str | None = None
+    fn: Callable[..., Any], code: str | None = None, batch: bool = False
 ) -> type[BaseCheck]:
     """Build a BaseCheck subclass from the decorated function.
 
     Args:
         fn: The decorated check function.
         code: Optional rule code for the check.
+        batch: Whether ``fn`` takes every matched resource at once.
 
     Returns:
         The generated ``BaseCheck`` subclass.
 
+    Raises:
+        TypeError: If a batch check has no plural resource parameter.
+
     """
     # `Callable` has no `__name__` in the type system, but every decorated
     # check is a real function.
@@ -141,6 +164,15 @@ def _build_check_class(
         and p.name not in _RESERVED_PARAMS
     ]
     iterate_over: str | None = positional_names[0] if positional_names else None
+    if batch:
+        # The batch parameter names the list (`models`); the resource type it
+        # iterates over is the singular (`model`).
+        if iterate_over is None or not iterate_over.endswith("s"):
+            raise TypeError(
+                f"Batch check {name!r} must take a plural resource parameter "
+                "(e.g. `models`) as its first argument."
+            )
+        iterate_over = iterate_over[:-1]
 
     # Extract keyword-only params → become Pydantic fields.
     param_names: list[str] = []
@@ -184,6 +216,23 @@ def _build_check_class(
             args.append(self._ctx)
         fn(*args, **kwargs)
 
+    def execute_batch(
+        self: BaseCheck, resources: list[Any]
+    ) -> Iterable[tuple[Any, str]]:
+        kwargs: dict[str, Any] = {p: getattr(self, p) for p in param_names}
+        if wants_ctx:
+            return fn(resources, self._ctx, **kwargs)
+        return fn(resources, **kwargs)
+
+    def execute_one(self: BaseCheck) -> None:
+        # A batch check run against a single bound resource, as the testing
+        # helpers and anything else calling `execute()` directly do.
+        # Unreachable; narrows the type for the checker.
+        if iterate_over is None:  # pragma: no cover
+            raise TypeError(f"Batch check `{name}` has no resource parameter.")
+        for _, message in execute_batch(self, [getattr(self, iterate_over)]):
+            fail(message)
+
     # Convert function name to PascalCase class name.
     class_name = _to_pascal_case(name)
 
@@ -194,7 +243,13 @@ def _build_check_class(
     )
 
     # Attach the execute method and class-level metadata.
-    cls.execute = execute  # ty: ignore[unresolved-attribute]
+    if batch:
+        cls.execute = execute_one  # ty: ignore[unresolved-attribute]
+        cls.execute_batch = execute_batch  # ty: ignore[unresolved-attribute]
+    else:
+        cls.execute = execute  # ty: ignore[unresolved-attribute]
+    cls.batch = batch
+    cls.uses_context = wants_ctx
     # Load-bearing despite the Pydantic `code` field above: Pydantic does not
     # expose field defaults as class attributes, and the registry, `list` CLI
     # and docs generator all read the code off the class via getattr.
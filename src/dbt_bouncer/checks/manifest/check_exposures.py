@@ -112,7 +112,7 @@ def check_exposure_based_on_view(
         else {m.unique_id: m for m in ctx.models}
     )
     non_table_upstream_dependencies = []
-    for node_id in getattr(exposure.depends_on, "nodes", []) or []:
+    for node_id in ctx.parents_of(exposure):
         model_obj = models_by_id.get(node_id)
         if (
             model_obj
@@ -159,7 +159,7 @@ def check_exposure_based_on_non_public_models(exposure, ctx):
         else {m.unique_id: m for m in ctx.models}
     )
     non_public_upstream_dependencies = []
-    for node_id in getattr(exposure.depends_on, "nodes", []) or []:
+    for node_id in ctx.parents_of(exposure):
         model_obj = models_by_id.get(node_id)
         if (
             model_obj
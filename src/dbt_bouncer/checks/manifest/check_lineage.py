@@ -45,7 +45,7 @@ def check_lineage_permitted_upstream_models(
     manifest_obj = ctx.manifest_obj
     upstream_models = [
         x
-        for x in getattr(model.depends_on, "nodes", []) or []
+        for x in ctx.parents_of(model)
         if x.split(".")[0] == "model"
         and x.split(".")[1]
         == (package_name or manifest_obj.manifest.metadata.project_name)
@@ -71,7 +71,7 @@ def check_lineage_permitted_upstream_models(
 
 
 @check(code="LI002")
-def check_lineage_seed_cannot_be_used(model):
+def check_lineage_seed_cannot_be_used(model, ctx):
     """Seed cannot be referenced in models with a path that matches the specified `include` config.
 
     !!! info "Rationale"
@@ -95,18 +95,14 @@ def check_lineage_seed_cannot_be_used(model):
         ```
 
     """
-    if [
-        x
-        for x in getattr(model.depends_on, "nodes", []) or []
-        if x.split(".")[0] == "seed"
-    ]:
+    if any(x.split(".")[0] == "seed" for x in ctx.parents_of(model)):
         fail(
             f"`{get_clean_model_name(model.unique_id)}` references a seed even though this is not permitted."
         )
 
 
 @check(code="LI003")
-def check_lineage_source_cannot_be_used(model):
+def check_lineage_source_cannot_be_used(model, ctx):
     """Sources cannot be referenced in models with a path that matches the specified `include` config.
 
     !!! info "Rationale"
@@ -130,11 +126,7 @@ def check_lineage_source_cannot_be_used(model):
         ```
 
     """
-    if [
-        x
-        for x in getattr(model.depends_on, "nodes", []) or []
-        if x.split(".")[0] == "source"
-    ]:
+    if any(x.split(".")[0] == "source" for x in ctx.parents_of(model)):
         fail(
             f"`{get_clean_model_name(model.unique_id)}` references a source even though this is not permitted."
         )
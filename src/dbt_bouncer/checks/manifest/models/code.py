@@ -1,20 +1,11 @@
 """Checks related to model source code content and structure."""
 
 import re
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    # Runtime uses a function-local ``from sqlglot import exp`` in the four
-    # functions below, so importing sqlglot (~65ms) is deferred until a check
-    # actually walks the AST. This import exists so a type checker still
-    # resolves the ``exp.Select`` / ``exp.Expression`` annotations to their real
-    # types rather than silently degrading them to ``Any``.
-    from sqlglot import exp
 
 from dbt_bouncer.artifact_types import ModelNode
 from dbt_bouncer.check_framework.decorator import check, fail
 from dbt_bouncer.enums import Materialization
-from dbt_bouncer.sql_utils import JINJA_COMMENT_PATTERN, neutralize_jinja, parse_sql
+from dbt_bouncer.sql_utils import JINJA_COMMENT_PATTERN, sql_facts
 from dbt_bouncer.utils import compile_pattern, get_clean_model_name
 
 # Patterns retained for the best-effort regex fallback used when sqlglot cannot
@@ -53,42 +44,6 @@ def _strip_sql_comments(code: str) -> str:
     return code
 
 
-def _constant_join_condition(on_clause: "exp.Expression") -> tuple[bool, str]:
-    """Determine whether a join's ``ON`` condition is a constant.
-
-    A constant condition (``ON TRUE``, ``ON 1``, ``ON 1=1``) constrains nothing,
-    so the join produces a Cartesian product. ``on_clause`` is the condition
-    expression itself, so both operands of a comparison must be inspected -
-    looking only at ``on_clause.this`` would treat ``ON 1 = b.id`` as constant
-    while letting the equivalent ``ON b.id = 1`` through.
-
-    Args:
-        on_clause: The expression held in a join's ``on`` argument.
-
-    Returns:
-        tuple[bool, str]: Whether the condition is constant, and the condition
-        rendered back to SQL for use in the failure message.
-
-    """
-    from sqlglot import exp
-
-    cond_str = on_clause.sql()
-
-    # `ON TRUE` / `ON FALSE` parse to exp.Boolean; a bare `ON 1` to exp.Literal.
-    if isinstance(on_clause, (exp.Boolean, exp.Literal)):
-        return True, cond_str
-
-    # `ON 1 = 1` and `ON 'x' = 'x'`: constant only when *both* operands are
-    # literals. `ON NULL` is an exp.Null rather than a literal and matches no
-    # rows, so it is degenerate rather than Cartesian and is not flagged.
-    if isinstance(on_clause, exp.EQ) and isinstance(
-        on_clause.this, (exp.Literal, exp.Boolean)
-    ):
-        return isinstance(on_clause.expression, (exp.Literal, exp.Boolean)), cond_str
-
-    return False, cond_str
-
-
 def _is_sql_model(model: ModelNode) -> bool:
     """Determine whether a model is a SQL model (non-SQL models are skipped).
 
@@ -99,46 +54,6 @@ def _is_sql_model(model: ModelNode) -> bool:
     return (getattr(model, "language", None) or "sql") == "sql"
 
 
-def _select_uses_star(select: "exp.Select") -> bool:
-    """Determine whether a ``SELECT`` projects a star.
-
-    Returns:
-        ``True`` if any top-level projection is a bare (``*``) or qualified
-        (``t.*``) star, ``False`` otherwise.
-
-    """
-    from sqlglot import exp
-
-    for projection in select.expressions:
-        if isinstance(projection, exp.Star):
-            return True
-        if isinstance(projection, exp.Column) and isinstance(projection.this, exp.Star):
-            return True
-    return False
-
-
-def _hard_coded_tables(statements: "tuple[exp.Expression, ...]") -> list[str]:
-    """Find schema/catalog-qualified table references in parsed SQL.
-
-    Returns:
-        The qualified table references (e.g. ``schema.table``), in first-seen
-        order and de-duplicated.
-
-    """
-    from sqlglot import exp
-
-    seen: set[str] = set()
-    tables: list[str] = []
-    for statement in statements:
-        for table in statement.find_all(exp.Table):
-            if table.args.get("db") or table.args.get("catalog"):
-                rendered = table.sql()
-                if rendered not in seen:
-                    seen.add(rendered)
-                    tables.append(rendered)
-    return tables
-
-
 @check(code="MO007")
 def check_model_code_does_not_contain_regexp_pattern(model, *, regexp_pattern: str):
     """The raw code for a model must not match the specified regexp pattern.
@@ -232,8 +147,8 @@ def check_model_does_not_use_cartesian_join(
     if not _is_sql_model(model):
         return
 
-    parsed = parse_sql(neutralize_jinja(model.raw_code or ""))
-    if parsed is None:
+    facts = sql_facts(model.raw_code or "")
+    if facts is None:
         # Fallback: best-effort regex on Jinja-stripped raw code.
         cleaned = _strip_sql_comments(model.raw_code or "")
         if not allow_explicit_cross_join and _CROSS_JOIN_PATTERN.search(cleaned):
@@ -242,35 +157,23 @@ def check_model_does_not_use_cartesian_join(
             )
         return
 
-    from sqlglot import exp
-
-    for statement in parsed:
-        for join in statement.find_all(exp.Join):
-            is_cross = (join.kind or "").upper() == "CROSS"
-            on_clause = join.args.get("on")
-            using_clause = join.args.get("using")
-            # A `NATURAL JOIN` joins on the columns the two relations share, so
-            # it constrains the join despite carrying no `ON`/`USING` clause.
-            is_natural = (join.args.get("method") or "").upper() == "NATURAL"
-
-            if is_cross:
-                if not allow_explicit_cross_join:
-                    fail(
-                        f"`{get_clean_model_name(model.unique_id)}` uses an explicit `CROSS JOIN`."
-                    )
-                continue
-
-            if not on_clause and not using_clause and not is_natural:
+    for join in facts.joins:
+        if join.is_cross:
+            if not allow_explicit_cross_join:
                 fail(
-                    f"`{get_clean_model_name(model.unique_id)}` uses a `JOIN` without an `ON` or `USING` clause."
+                    f"`{get_clean_model_name(model.unique_id)}` uses an explicit `CROSS JOIN`."
                 )
+            continue
 
-            if on_clause is not None:
-                is_constant, cond_str = _constant_join_condition(on_clause)
-                if is_constant and not allow_explicit_cross_join:
-                    fail(
-                        f"`{get_clean_model_name(model.unique_id)}` uses a `JOIN` with a constant condition (`ON {cond_str}`)."
-                    )
+        if not join.is_constrained:
+            fail(
+                f"`{get_clean_model_name(model.unique_id)}` uses a `JOIN` without an `ON` or `USING` clause."
+            )
+
+        if join.constant_condition is not None and not allow_explicit_cross_join:
+            fail(
+                f"`{get_clean_model_name(model.unique_id)}` uses a `JOIN` with a constant condition (`ON {join.constant_condition}`)."
+            )
 
 
 @check(code="MO008")
@@ -316,8 +219,8 @@ def check_model_does_not_use_select_star(model):
     if not _is_sql_model(model):
         return
 
-    parsed = parse_sql(neutralize_jinja(model.raw_code or ""))
-    if parsed is None:
+    facts = sql_facts(model.raw_code or "")
+    if facts is None:
         # Fallback: best-effort regex on comment-stripped raw code.
         cleaned = _strip_sql_comments(model.raw_code or "")
         if _SELECT_STAR_PATTERN.search(cleaned):
@@ -326,14 +229,10 @@ def check_model_does_not_use_select_star(model):
             )
         return
 
-    from sqlglot import exp
-
-    for statement in parsed:
-        for select in statement.find_all(exp.Select):
-            if _select_uses_star(select):
-                fail(
-                    f"`{get_clean_model_name(model.unique_id)}` uses `SELECT *`; list columns explicitly."
-                )
+    if facts.uses_star:
+        fail(
+            f"`{get_clean_model_name(model.unique_id)}` uses `SELECT *`; list columns explicitly."
+        )
 
 
 @check(code="MO009")
@@ -383,8 +282,8 @@ def check_model_hard_coded_references(model):
     if not _is_sql_model(model):
         return
 
-    parsed = parse_sql(neutralize_jinja(model.raw_code or ""))
-    if parsed is None:
+    facts = sql_facts(model.raw_code or "")
+    if facts is None:
         # Fallback: best-effort regex on Jinja-stripped raw code.
         cleaned = _JINJA_PATTERN.sub("", model.raw_code or "")
         matches = _HARD_CODED_REF_PATTERN.findall(cleaned)
@@ -395,7 +294,7 @@ def check_model_hard_coded_references(model):
             )
         return
 
-    tables = _hard_coded_tables(parsed)
+    tables = list(facts.hard_coded_tables)
     if tables:
         fail(
             f"`{get_clean_model_name(model.unique_id)}` contains hard-coded table "
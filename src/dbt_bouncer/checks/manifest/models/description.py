@@ -85,9 +85,9 @@ def check_model_description_contains_regexp_pattern(model, *, regexp_pattern: st
         )
 
 
-@check(code="MO021")
+@check(code="MO021", batch=True)
 def check_model_description_populated(
-    model, *, min_description_length: Annotated[int, Field(gt=0)] | None = None
+    models, ctx, *, min_description_length: Annotated[int, Field(gt=0)] | None = None
 ):
     """Models must have a populated description.
 
@@ -120,12 +120,18 @@ def check_model_description_populated(
         ```
 
     """
-    if not is_description_populated(
-        model.description or "", min_description_length or 4
-    ):
-        fail(
-            f"`{get_clean_model_name(model.unique_id)}` does not have a populated description."
-        )
+    min_length = min_description_length or 4
+    table, rows = ctx.table_rows("models", models)
+    lengths, descriptions = table.description_length, table.description
+    for row in rows:
+        # The length column settles most rows without touching the text.
+        if lengths[row] < min_length or not is_description_populated(
+            descriptions[row], min_length
+        ):
+            yield (
+                table.resources[row],
+                f"`{get_clean_model_name(table.unique_id[row])}` does not have a populated description.",
+            )
 
 
 @check(code="MO022")
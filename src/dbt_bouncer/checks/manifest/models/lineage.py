@@ -1,5 +1,6 @@
 """Checks related to model upstream dependencies and lineage."""
 
+import math
 from typing import Annotated
 
 from pydantic import Field
@@ -184,11 +185,10 @@ def check_model_does_not_rejoin_upstream_concepts(model, ctx):
     parents = set(getattr(model.depends_on, "nodes", []) or [])
 
     for parent_id in sorted(parents):
-        parent = models_by_id.get(parent_id)
-        if parent is None:
+        if parent_id not in models_by_id:
             continue
 
-        shared_ancestors = set(getattr(parent.depends_on, "nodes", []) or []) & parents
+        shared_ancestors = set(ctx.graph.parents(parent_id)) & parents
         if not shared_ancestors:
             continue
 
@@ -228,13 +228,10 @@ def check_model_has_exposure(model, ctx):
         ```
 
     """
-    models_in_exposures = {
-        node
-        for e in ctx.exposures
-        for node in (getattr(e.depends_on, "nodes", []) or [])
-    }
-
-    if model.unique_id not in models_in_exposures:
+    if not any(
+        child.split(".")[0] == "exposure"
+        for child in ctx.graph.children(model.unique_id)
+    ):
         fail(
             f"`{get_clean_model_name(model.unique_id)}` does not have an associated exposure."
         )
@@ -382,74 +379,81 @@ def check_model_max_chained_views(
         ```
 
     """
-    manifest_obj = ctx.manifest_obj
+    pkg_name = package_name or ctx.manifest_obj.manifest.metadata.project_name
+    chained_views = ctx.derived(
+        ("chained_views", frozenset(materializations_to_include), pkg_name),
+        lambda: _chained_views_upstream(ctx, materializations_to_include, pkg_name),
+    )
+    if chained_views.get(model.unique_id, 0) >= max_chained_views:
+        fail(
+            f"`{get_clean_model_name(model.unique_id)}` has more than {max_chained_views} upstream dependents that are not tables."
+        )
 
+
+def _chained_views_upstream(
+    ctx, materializations: list[str], package_name: str
+) -> dict[str, float]:
+    """Return the longest chain of upstream views of every model, computed in one pass.
+
+    A view is a model of ``package_name`` materialized as one of
+    ``materializations``. Chains are computed parents first, in the
+    topological order of ``ctx.graph``, so each model extends the chains of
+    its parents instead of re-walking them.
+
+    Returns:
+        dict[str, float]: The number of views in the longest chain directly
+        upstream of each model in the context; ``inf`` for a chain through a
+        cycle of views.
+
+    """
+    graph = ctx.graph
     models_by_id = (
         ctx.models_by_unique_id
         if ctx.models_by_unique_id
         else {m.unique_id: m for m in ctx.models}
     )
-
-    def return_upstream_view_models(
-        materializations, max_views, model_unique_ids_to_check, pkg_name, depth=0
-    ):
-        """Recursive function to return model unique_id's of upstream models that are views.
-
-        Returns:
-            list[str]: List of model unique_id's of upstream models that are views.
-
-        """
-        if depth == max_views or model_unique_ids_to_check == []:
-            return model_unique_ids_to_check
-
-        relevant_upstream_models = []
-        for model_id in model_unique_ids_to_check:
-            model_obj = models_by_id.get(model_id)
-            if model_obj is None:
-                continue
-            upstream_nodes = (
-                list(getattr(model_obj.depends_on, "nodes", []) or [])
-                if model_obj.depends_on
-                else []
-            )
-            if upstream_nodes != []:
-                upstream_models = [
-                    m
-                    for m in upstream_nodes
-                    if m.split(".")[0] == "model" and m.split(".")[1] == pkg_name
-                ]
-                for i in upstream_models:
-                    upstream_obj = models_by_id.get(i)
-                    if (
-                        upstream_obj
-                        and upstream_obj.config
-                        and upstream_obj.config.materialized in materializations
-                    ):
-                        relevant_upstream_models.append(i)
-
-        depth += 1
-        return return_upstream_view_models(
-            materializations=materializations,
-            max_views=max_views,
-            model_unique_ids_to_check=relevant_upstream_models,
-            pkg_name=pkg_name,
-            depth=depth,
-        )
-
-    if (
-        len(
-            return_upstream_view_models(
-                materializations=materializations_to_include,
-                max_views=max_chained_views,
-                model_unique_ids_to_check=[model.unique_id],
-                pkg_name=(package_name or manifest_obj.manifest.metadata.project_name),
-            )
-        )
-        != 0
-    ):
-        fail(
-            f"`{get_clean_model_name(model.unique_id)}` has more than {max_chained_views} upstream dependents that are not tables."
+    is_view = bytearray(len(graph))
+    for uid, row in graph.row_by_unique_id.items():
+        resource_type, _, rest = uid.partition(".")
+        model_obj = models_by_id.get(uid)
+        if (
+            resource_type == "model"
+            and rest.partition(".")[0] == package_name
+            and model_obj
+            and model_obj.config
+            and model_obj.config.materialized in materializations
+        ):
+            is_view[row] = 1
+
+    chain_above: dict[int, float] = {}
+    on_path: set[int] = set()
+
+    def _chain_above(row: int) -> float:
+        known = chain_above.get(row)
+        if known is not None:
+            return known
+        if row in on_path:
+            # dbt rejects cyclic graphs, but a cycle of views would make the
+            # chain unbounded.
+            return math.inf
+        on_path.add(row)
+        longest = max(
+            (1 + _chain_above(p) for p in graph.parent_rows_of(row) if is_view[p]),
+            default=0,
         )
+        on_path.discard(row)
+        chain_above[row] = longest
+        return longest
+
+    # In topological order every parent is already known, so each call only
+    # looks at the parents of one model.
+    for row in graph.topological_order:
+        _chain_above(row)
+    return {
+        uid: chain_above[row]
+        for uid in models_by_id
+        if (row := graph.row_by_unique_id.get(uid)) is not None
+    }
 
 
 @check(code="MO034")
@@ -598,8 +602,8 @@ def check_model_min_downstream_models(
     # children_by_unique_id is derived from ctx.models only, so snapshot consumers
     # have to be counted separately or a model feeding only a snapshot reads as dead.
     num_downstream = len(ctx.children_by_unique_id.get(model.unique_id, [])) + sum(
-        model.unique_id in (getattr(s.depends_on, "nodes", []) or [])
-        for s in ctx.snapshots
+        child.split(".")[0] == "snapshot"
+        for child in ctx.graph.children(model.unique_id)
     )
 
     if num_downstream < min_number_of_models:
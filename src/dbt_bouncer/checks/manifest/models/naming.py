@@ -1,11 +1,11 @@
 """Checks related to model naming conventions."""
 
-from dbt_bouncer.check_framework.decorator import check, fail
+from dbt_bouncer.check_framework.decorator import check
 from dbt_bouncer.utils import compile_pattern, get_clean_model_name
 
 
-@check(code="MO038")
-def check_model_names(model, *, model_name_pattern: str):
+@check(code="MO038", batch=True)
+def check_model_names(models, ctx, *, model_name_pattern: str):
     """Models must have a name that matches the supplied regex.
 
     !!! info "Rationale"
@@ -38,8 +38,12 @@ def check_model_names(model, *, model_name_pattern: str):
 
     """
     compiled = compile_pattern(model_name_pattern.strip())
-    if compiled.match(str(model.name)) is None:
-        display_name = get_clean_model_name(model.unique_id)
-        fail(
-            f"`{display_name}` does not match the supplied regex `{model_name_pattern.strip()}`."
-        )
+    table, rows = ctx.table_rows("models", models)
+    names = table.name
+    for row in rows:
+        if compiled.match(str(names[row])) is None:
+            display_name = get_clean_model_name(table.unique_id[row])
+            yield (
+                table.resources[row],
+                f"`{display_name}` does not match the supplied regex `{model_name_pattern.strip()}`.",
+            )
@@ -36,8 +36,8 @@ def check_duplicate_sources(source, ctx):
     def _node(s):
         """Return the SourceNode from either a SourceWrapper or a DictProxy.
 
-        In a live runner ctx.sources contains SourceWrapper objects (SimpleNamespace
-        with a .source attribute). In unit-test helpers ctx.sources items are
+        In a live runner ctx.sources contains SourceWrapper objects (with a
+        .source attribute). In unit-test helpers ctx.sources items are
         DictProxy objects with direct field access. The None-fallback handles both.
 
         Returns:
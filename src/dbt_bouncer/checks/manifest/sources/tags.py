@@ -1,12 +1,12 @@
 """Checks related to source tags."""
 
-from dbt_bouncer.check_framework.decorator import check, fail
+from dbt_bouncer.check_framework.decorator import check
 from dbt_bouncer.enums import Criteria
 
 
-@check(code="SO015")
+@check(code="SO015", batch=True)
 def check_source_has_tags(
-    source, *, criteria: Criteria = Criteria.ALL, tags: list[str]
+    sources, ctx, *, criteria: Criteria = Criteria.ALL, tags: list[str]
 ):
     """Sources must have the specified tags.
 
@@ -37,16 +37,19 @@ def check_source_has_tags(
         ```
 
     """
-    resource_tags = source.tags or []
-    display = f"{source.source_name}.{source.name}"
-
-    match criteria:
-        case Criteria.ANY:
-            if not any(tag in resource_tags for tag in tags):
-                fail(f"`{display}` does not have any of the required tags: {tags}.")
-        case Criteria.ALL:
-            missing_tags = [tag for tag in tags if tag not in resource_tags]
-            if missing_tags:
-                fail(f"`{display}` is missing required tags: {missing_tags}.")
-        case Criteria.ONE if sum(tag in resource_tags for tag in tags) != 1:
-            fail(f"`{display}` must have exactly one of the required tags: {tags}.")
+    table, rows = ctx.table_rows("sources", sources)
+    for row in rows:
+        resource_tags = table.tags[row]
+        match criteria:
+            case Criteria.ANY if not any(tag in resource_tags for tag in tags):
+                problem = f"does not have any of the required tags: {tags}."
+            case Criteria.ALL if missing_tags := [
+                tag for tag in tags if tag not in resource_tags
+            ]:
+                problem = f"is missing required tags: {missing_tags}."
+            case Criteria.ONE if sum(tag in resource_tags for tag in tags) != 1:
+                problem = f"must have exactly one of the required tags: {tags}."
+            case _:
+                continue
+        source = table.resources[row]
+        yield source, f"`{source.source_name}.{source.name}` {problem}"
@@ -0,0 +1,88 @@
+"""Merge command package."""
+
+import logging
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from dbt_bouncer.cli import app
+from dbt_bouncer.enums import ExitCode, OutputFormat
+from dbt_bouncer.exceptions import DbtBouncerArtifactError
+from dbt_bouncer.reporting.logger import configure_console_logging
+
+
+@app.command(name="merge")
+def merge(
+    files: Annotated[
+        list[Path],
+        typer.Argument(
+            help="Output files written by `dbt-bouncer run --shard`.",
+            exists=True,
+            dir_okay=False,
+        ),
+    ],
+    output_file: Annotated[
+        Path | None,
+        typer.Option(help="Location of the file where the merged results are saved."),
+    ] = None,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option(
+            help="Format of the shards' output files, and of the merged file. Choices: csv, json, junit, sarif, tap. Defaults to json.",
+            case_sensitive=False,
+        ),
+    ] = OutputFormat.JSON,
+    output_only_failures: Annotated[
+        bool,
+        typer.Option(
+            help="If passed then only failures will be included in the output file."
+        ),
+    ] = False,
+    show_all_failures: Annotated[
+        bool,
+        typer.Option(
+            help="If passed then all failures will be printed to the console."
+        ),
+    ] = False,
+    verbosity: Annotated[
+        int,
+        typer.Option("-v", "--verbosity", help="Verbosity.", count=True),
+    ] = 0,
+) -> None:
+    """Merge the output files of a sharded run into one report.
+
+    Prints the combined results as `dbt-bouncer run` would have and exits with
+    the code an unsharded run would have returned.
+
+    [bold]Examples:[/bold]
+
+      Merge four JSON shards:
+        [cyan]$ dbt-bouncer merge shard-1.json shard-2.json shard-3.json shard-4.json --output-file results.json[/cyan]
+
+      Merge SARIF shards:
+        [cyan]$ dbt-bouncer merge shard-*.sarif --output-format sarif --output-file results.sarif[/cyan]
+
+    Raises:
+        Exit: With code CHECK_ERRORS if a merged check failed with error severity,
+            or ARTIFACT_ERROR if a file is not an output file of `output_format`.
+
+    """
+    configure_console_logging(verbosity)
+
+    from dbt_bouncer.cli.merge.utils import merge_output_files
+    from dbt_bouncer.reporting.reporter import Reporter
+
+    try:
+        results = merge_output_files(files, output_format.value)
+    except DbtBouncerArtifactError as e:
+        logging.error(str(e))
+        raise typer.Exit(ExitCode.ARTIFACT_ERROR) from e
+
+    exit_code, _ = Reporter(
+        show_all_failures=show_all_failures,
+        output_file=output_file,
+        output_format=output_format.value,
+        output_only_failures=output_only_failures,
+    ).report_results(results)
+    raise typer.Exit(exit_code)
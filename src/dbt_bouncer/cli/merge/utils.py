@@ -0,0 +1,47 @@
+"""Utility functions for the merge CLI subcommand."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from dbt_bouncer.exceptions import DbtBouncerArtifactError
+from dbt_bouncer.reporting.formatters import parse_results
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def merge_output_files(files: list[Path], output_format: str) -> list[dict[str, Any]]:
+    """Read the check results of several `dbt-bouncer run --shard` output files.
+
+    Args:
+        files: The shards' output files.
+        output_format: The format the files were written in.
+
+    Returns:
+        list[dict]: The results of every file, in the order given.
+
+    Raises:
+        DbtBouncerArtifactError: If a file cannot be read or is not a file of
+            check results in `output_format`.
+
+    """
+    results: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for file in files:
+        try:
+            file_results = parse_results(file.read_bytes(), output_format)
+        except (OSError, ValueError) as e:
+            raise DbtBouncerArtifactError(
+                f"Cannot read `{file}` as a {output_format} output file: {e}"
+            ) from e
+        logging.info(f"Read {len(file_results)} check results from `{file}`.")
+        for r in file_results:
+            if r["check_run_id"] in seen:
+                logging.warning(
+                    f"`{r['check_run_id']}` appears in more than one file, were the shards run with different `--shard` counts?"
+                )
+            seen.add(r["check_run_id"])
+        results.extend(file_results)
+    return results
@@ -10,6 +10,7 @@ from dbt_bouncer.cli import app
 from dbt_bouncer.cli.run.utils import detect_config_file_source, run_bouncer
 from dbt_bouncer.enums import ConfigFileName, ExitCode, OutputFormat
 from dbt_bouncer.exceptions import DbtBouncerArtifactError, DbtBouncerConfigError
+from dbt_bouncer.tracing import trace_to
 
 
 @app.command(name="run")
@@ -39,6 +40,27 @@ def run(
             rich_help_panel="Check Selection",
         ),
     ] = False,
+    changed_since: Annotated[
+        str,
+        typer.Option(
+            help="Only check resources defined in files changed since this git ref (e.g. 'origin/main'), including uncommitted changes. Checks that run once for the whole project still run.",
+            rich_help_panel="Check Selection",
+        ),
+    ] = "",
+    include_downstream: Annotated[
+        bool,
+        typer.Option(
+            help="With --changed-since, also check everything downstream of a changed resource.",
+            rich_help_panel="Check Selection",
+        ),
+    ] = False,
+    state: Annotated[
+        Path | None,
+        typer.Option(
+            help="Directory holding a baseline `manifest.json` (e.g. from the main branch) for `state:modified` and `state:new` selectors to compare against.",
+            rich_help_panel="Check Selection",
+        ),
+    ] = None,
     only: Annotated[
         str,
         typer.Option(
@@ -46,6 +68,73 @@ def run(
             rich_help_panel="Check Selection",
         ),
     ] = "",
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            help="Only execute checks whose configuration or resource changed since the previous incremental run, replaying the other outcomes from the dbt-bouncer cache.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j",
+            "--jobs",
+            help="Number of workers to run checks in. Workers share the parsed artifacts, so large projects can use every core of a CI runner. 0 (the default) uses one thread per core on free-threaded Python builds and a single worker otherwise.",
+            min=0,
+            rich_help_panel="Performance",
+        ),
+    ] = 0,
+    low_memory: Annotated[
+        bool,
+        typer.Option(
+            help="Keep only the target package's resources in full while parsing the manifest. Lowers peak memory on projects with large dependencies.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            help="Time each phase of the run and each configured check, and print the slowest checks: calls, total time, p50, p95 and max.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    profile_file: Annotated[
+        Path | None,
+        typer.Option(
+            help="Also write the `--profile` timings to this file as JSON. Implies --profile.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    trace_file: Annotated[
+        Path | None,
+        typer.Option(
+            help="Write a Chrome trace of the run to this file: startup, config validation, artifact loading, check assembly, a sample of check executions and garbage collections. Open it in https://ui.perfetto.dev.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    fail_fast: Annotated[
+        bool,
+        typer.Option(
+            help="Stop at the first check that fails with severity `error`. The same as `--max-failures 1`.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    max_failures: Annotated[
+        int | None,
+        typer.Option(
+            help="Stop once this many checks failed with severity `error`. Checks that failed most often per second of run time in earlier `--profile` runs run first, so failures surface as early as possible.",
+            min=1,
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    shard: Annotated[
+        str,
+        typer.Option(
+            help="Only run shard `i` of `N` of the checks, e.g. `2/4`, to split a run across CI runners. Checks are divided deterministically so each shard takes a similar time, by the check costs recorded by `--profile` runs, or else gets a similar number of check runs; combine the output files with `dbt-bouncer merge`.",
+            rich_help_panel="Performance",
+        ),
+    ] = "",
     output_file: Annotated[
         Path | None,
         typer.Option(
@@ -99,9 +188,31 @@ def run(
       Run manifest checks only with custom config:
         [cyan]$ dbt-bouncer run --only manifest_checks --config-file my-config.yml[/cyan]
 
+      Only check resources changed on this branch:
+        [cyan]$ dbt-bouncer run --changed-since origin/main[/cyan]
+
+      Compare `state:modified` selectors against a production manifest:
+        [cyan]$ dbt-bouncer run --state prod-target/[/cyan]
+
       Save results to JSON file:
         [cyan]$ dbt-bouncer run --output-file results.json --output-format json[/cyan]
 
+      Only re-run checks affected by changes since the last incremental run:
+        [cyan]$ dbt-bouncer run --incremental[/cyan]
+
+      Run checks in 8 worker processes:
+        [cyan]$ dbt-bouncer run --jobs 8[/cyan]
+
+      Find the checks that slow a run down:
+        [cyan]$ dbt-bouncer run --profile[/cyan]
+
+      See where the time of a run goes, in Perfetto:
+        [cyan]$ dbt-bouncer run --trace-file trace.json[/cyan]
+
+      Run the second of four shards, then merge the shards' results:
+        [cyan]$ dbt-bouncer run --shard 2/4 --output-file shard-2.json[/cyan]
+        [cyan]$ dbt-bouncer merge shard-*.json --output-file results.json[/cyan]
+
     Raises:
         Exit: If an invalid output format is provided, the checks fail, the config
             file is missing/invalid, or a required dbt artifact is missing/unsupported.
@@ -110,19 +221,31 @@ def run(
     config_file_source = detect_config_file_source(config_file)
 
     try:
-        exit_code = run_bouncer(
-            check=check,
-            config_file=config_file,
-            create_pr_comment_file=create_pr_comment_file,
-            dry_run=dry_run,
-            only=only,
-            output_file=output_file,
-            output_format=output_format,
-            output_only_failures=output_only_failures,
-            show_all_failures=show_all_failures,
-            verbosity=verbosity,
-            config_file_source=config_file_source,
-        )
+        with trace_to(trace_file):
+            exit_code = run_bouncer(
+                changed_since=changed_since,
+                check=check,
+                config_file=config_file,
+                create_pr_comment_file=create_pr_comment_file,
+                dry_run=dry_run,
+                fail_fast=fail_fast,
+                include_downstream=include_downstream,
+                incremental=incremental,
+                jobs=jobs,
+                low_memory=low_memory,
+                max_failures=max_failures,
+                only=only,
+                output_file=output_file,
+                output_format=output_format,
+                output_only_failures=output_only_failures,
+                profile=profile,
+                profile_file=profile_file,
+                shard=shard,
+                show_all_failures=show_all_failures,
+                state=state,
+                verbosity=verbosity,
+                config_file_source=config_file_source,
+            )
     except DbtBouncerConfigError as e:
         logging.error(str(e))
         raise typer.Exit(ExitCode.CONFIG_ERROR) from e
@@ -14,7 +14,9 @@ from dbt_bouncer.enums import (
     OutputFormat,
 )
 from dbt_bouncer.exceptions import DbtBouncerConfigError
+from dbt_bouncer.profiling import Profiler, profile_phase
 from dbt_bouncer.reporting.logger import configure_console_logging
+from dbt_bouncer.tracing import span
 from dbt_bouncer.version import version as get_version
 
 if TYPE_CHECKING:
@@ -42,6 +44,25 @@ def detect_config_file_source(config_file: Path | None) -> ConfigFileSource:
     )
 
 
+def _parse_shard(shard: str) -> tuple[int, int]:
+    """Parse a `--shard` value of the form `i/N`.
+
+    Returns:
+        tuple[int, int]: The 1-based shard index and the number of shards.
+
+    Raises:
+        DbtBouncerConfigError: If the value is not of the form `i/N` with
+            `1 <= i <= N`.
+
+    """
+    index, _, count = shard.strip().partition("/")
+    if index.isdigit() and count.isdigit() and 1 <= int(index) <= int(count):
+        return int(index), int(count)
+    raise DbtBouncerConfigError(
+        f"`--shard` contains an invalid value (`{shard}`). Expected `i/N` with `1 <= i <= N`, e.g. `1/4`."
+    )
+
+
 def _build_context(
     bouncer_config: DbtBouncerConfBase,
     check_categories: list[str],
@@ -52,40 +73,84 @@ def _build_context(
     output_only_failures: bool,
     dry_run: bool = False,
     show_all_failures: bool = False,
+    low_memory: bool = False,
+    jobs: int = 0,
+    incremental_cache_file: Path | None = None,
+    shard: tuple[int, int] | None = None,
+    state: Path | None = None,
+    changed_files: frozenset[str] | None = None,
+    include_downstream: bool = False,
+    profiler: Profiler | None = None,
+    max_failures: int | None = None,
+    check_stats_file: Path | None = None,
 ) -> BouncerContext:
     """Parse artifacts and build a BouncerContext.
 
+    ``changed_files`` (paths relative to the dbt project) limits the resources
+    checks are matched against to the ones defined in those files, plus
+    everything downstream of them with ``include_downstream``.
+
     Returns:
         BouncerContext: Ready-to-run context.
 
     """
-    from dbt_bouncer.artifact_parsers.parser import parse_dbt_artifacts
+    from dbt_bouncer.artifact_parsers.parser import (
+        load_state_manifest,
+        parse_dbt_artifacts,
+    )
     from dbt_bouncer.context import BouncerContext
 
     artifacts = parse_dbt_artifacts(
-        bouncer_config=bouncer_config, dbt_artifacts_dir=dbt_artifacts_dir
+        bouncer_config=bouncer_config,
+        dbt_artifacts_dir=dbt_artifacts_dir,
+        low_memory=low_memory,
     )
+    state_manifest = load_state_manifest(state) if state is not None else None
+
+    changed_unique_ids = None
+    if changed_files is not None:
+        from dbt_bouncer.git_changes import changed_unique_ids as map_changed_files
+
+        manifest = artifacts.manifest_obj.manifest
+        changed_unique_ids = map_changed_files(
+            manifest,
+            changed_files,
+            package_name=bouncer_config.package_name or manifest.metadata.project_name,
+            include_downstream=include_downstream,
+        )
+        logging.info(
+            f"{len(changed_files)} changed file(s) define "
+            f"{len(changed_unique_ids)} resource(s) to check."
+        )
 
     return BouncerContext.model_construct(
         bouncer_config=bouncer_config,
         catalog_nodes=artifacts.catalog_nodes,
         catalog_sources=artifacts.catalog_sources,
+        changed_unique_ids=changed_unique_ids,
         check_categories=check_categories,
+        check_stats_file=check_stats_file,
         create_pr_comment_file=create_pr_comment_file,
         dry_run=dry_run,
         exposures=artifacts.exposures,
+        incremental_cache_file=incremental_cache_file,
+        jobs=jobs,
         macros=artifacts.macros,
         manifest_obj=artifacts.manifest_obj,
+        max_failures=max_failures,
         models=artifacts.models,
         output_file=output_file,
         output_format=output_format,
         output_only_failures=output_only_failures,
+        profiler=profiler,
         run_results=artifacts.run_results,
         seeds=artifacts.seeds,
         semantic_models=artifacts.semantic_models,
+        shard=shard,
         show_all_failures=show_all_failures,
         snapshots=artifacts.snapshots,
         sources=artifacts.sources,
+        state_manifest=state_manifest,
         tests=artifacts.tests,
         unit_tests=artifacts.unit_tests,
     )
@@ -93,14 +158,25 @@ def _build_context(
 
 def run_bouncer(
     config_file: PurePath | None = None,
+    changed_since: str = "",
     check: str = "",
     create_pr_comment_file: bool = False,
     dry_run: bool = False,
+    fail_fast: bool = False,
+    include_downstream: bool = False,
+    incremental: bool = False,
+    jobs: int = 0,
+    low_memory: bool = False,
+    max_failures: int | None = None,
     only: str = "",
     output_file: Path | None = None,
     output_format: OutputFormat = OutputFormat.JSON,
     output_only_failures: bool = False,
+    profile: bool = False,
+    profile_file: Path | None = None,
+    shard: str = "",
     show_all_failures: bool = False,
+    state: Path | None = None,
     verbosity: int = 0,
     config_file_source: ConfigFileSource | None = None,
 ) -> int:
@@ -108,14 +184,36 @@ def run_bouncer(
 
     Args:
         config_file: Location of the config file (YML, YAML, or TOML).
+        changed_since: Only check resources defined in files changed since this
+            git ref. Context-only checks still run in full.
         check: Limit the checks run to specific check names, comma-separated.
         create_pr_comment_file: Create a `github-comment.md` file.
         dry_run: If True, print which checks would run without executing them.
+        fail_fast: Stop at the first error-severity failure; the same as
+            `max_failures=1`.
+        include_downstream: With `changed_since`, also check everything
+            downstream of a changed resource.
+        incremental: Only execute checks whose configuration or resource
+            changed since the previous incremental run.
+        jobs: Number of workers to run checks in; 0 picks one per core on
+            free-threaded Python builds and a single worker otherwise.
+        low_memory: Keep only the target package's resources in full while
+            parsing the manifest.
+        max_failures: Stop once this many check runs failed with severity
+            `error`, running the checks most likely to fail quickly first.
         only: Limit the checks run to specific categories.
         output_file: Location of the file where check metadata will be saved.
         output_format: Format for the output file, requires output_file (csv, json, junit, sarif, tap).
         output_only_failures: Only failures will be included in the output file.
+        profile: Time each phase of the run and each check, and print the
+            slowest checks.
+        profile_file: Also write the timings to this file as JSON; implies
+            `profile`.
+        shard: Only run shard `i` of `N` of the checks, given as `i/N`; combine
+            the shards' output files with `dbt-bouncer merge`.
         show_all_failures: All failures will be printed to the console.
+        state: Directory holding the baseline `manifest.json` that `state:`
+            selectors compare against.
         verbosity: Verbosity level.
         config_file_source: Source of the config file.
 
@@ -124,7 +222,7 @@ def run_bouncer(
             or more checks failed.
 
     Raises:
-        DbtBouncerConfigError: If `--only` contains an invalid value, or the config
+        DbtBouncerConfigError: If `--only`, `--shard` or `--max-failures` contains an invalid value, or the config
             file is missing, unreadable, or invalid. A required dbt artifact being
             missing or unsupported similarly propagates as `DbtBouncerArtifactError`
             from the artifact loading called here.
@@ -146,6 +244,20 @@ def run_bouncer(
             f"`--only` contains an invalid value (`{x}`). Valid values are `{valid_check_categories}` or any comma-separated combination."
         )
 
+    shard_parsed = _parse_shard(shard) if shard.strip() else None
+    if fail_fast:
+        if max_failures not in (None, 1):
+            raise DbtBouncerConfigError(
+                "`--fail-fast` stops at the first failure, `--max-failures` after "
+                f"{max_failures}: pass only one of them."
+            )
+        max_failures = 1
+    if max_failures is not None and max_failures < 1:
+        raise DbtBouncerConfigError(
+            f"Invalid `--max-failures` value '{max_failures}': expected at least 1."
+        )
+    profiler = Profiler() if profile or profile_file is not None else None
+
     # Using local imports to speed up CLI startup
     from dbt_bouncer.configuration_file.validator import (
         DEPRECATED_CHECK_NAME_ALIASES,
@@ -181,9 +293,10 @@ def run_bouncer(
         config_file=config_file,
         config_file_source=config_file_source,
     )
-    config_file_contents = load_config_file_contents(
-        config_file_path, allow_default_config_file_creation=True
-    )
+    with profile_phase(profiler, "config_validation"), span("load_config"):
+        config_file_contents = load_config_file_contents(
+            config_file_path, allow_default_config_file_creation=True
+        )
 
     # Handle `severity` at the global level
     if config_file_contents.get("severity"):
@@ -215,11 +328,12 @@ def run_bouncer(
 
     from dbt_bouncer.configuration_file.validator import validate_conf
 
-    bouncer_config = validate_conf(
-        check_categories=check_categories,
-        config_file_contents=dict(config_file_contents),
-        custom_checks_dir=Path(custom_checks_dir) if custom_checks_dir else None,
-    )
+    with profile_phase(profiler, "config_validation"), span("validate_conf"):
+        bouncer_config = validate_conf(
+            check_categories=check_categories,
+            config_file_contents=dict(config_file_contents),
+            custom_checks_dir=Path(custom_checks_dir) if custom_checks_dir else None,
+        )
     logging.debug("bouncer_config=%r", bouncer_config)
 
     for category in check_categories:
@@ -265,6 +379,30 @@ def run_bouncer(
         config_file_path.parent / (bouncer_config.dbt_artifacts_dir or "target")
     )
 
+    changed_files = None
+    if changed_since:
+        from dbt_bouncer.git_changes import git_changed_files
+
+        # The artifacts directory sits in the dbt project: `target/` by default.
+        changed_files = git_changed_files(changed_since, dbt_artifacts_dir.parent)
+
+    incremental_cache_file = None
+    if incremental:
+        from dbt_bouncer.incremental import incremental_cache_path
+        from dbt_bouncer.utils import compute_cache_fingerprint
+
+        incremental_cache_file = incremental_cache_path(
+            Path(config_file_path),
+            dbt_artifacts_dir,
+            compute_cache_fingerprint(get_version(), custom_checks_dir),
+        )
+
+    check_stats_file = None
+    if profiler is not None or max_failures is not None or shard_parsed is not None:
+        from dbt_bouncer.profiling import check_stats_path
+
+        check_stats_file = check_stats_path(Path(config_file_path), dbt_artifacts_dir)
+
     from dbt_bouncer.runner import runner
 
     normalized_output_format = (
@@ -273,16 +411,35 @@ def run_bouncer(
         else OutputFormat(output_format.lower()).value
     )
 
-    ctx = _build_context(
-        bouncer_config=bouncer_config,
-        check_categories=check_categories,
-        create_pr_comment_file=create_pr_comment_file,
-        dbt_artifacts_dir=dbt_artifacts_dir,
-        dry_run=dry_run,
-        output_file=output_file,
-        output_format=normalized_output_format,
-        output_only_failures=output_only_failures,
-        show_all_failures=show_all_failures,
-    )
+    with profile_phase(profiler, "parse"), span("parse"):
+        ctx = _build_context(
+            bouncer_config=bouncer_config,
+            check_categories=check_categories,
+            create_pr_comment_file=create_pr_comment_file,
+            dbt_artifacts_dir=dbt_artifacts_dir,
+            dry_run=dry_run,
+            output_file=output_file,
+            output_format=normalized_output_format,
+            output_only_failures=output_only_failures,
+            show_all_failures=show_all_failures,
+            low_memory=low_memory,
+            jobs=jobs,
+            incremental_cache_file=incremental_cache_file,
+            shard=shard_parsed,
+            state=state,
+            changed_files=changed_files,
+            include_downstream=include_downstream,
+            profiler=profiler,
+            max_failures=max_failures,
+            check_stats_file=check_stats_file,
+        )
     results = runner(ctx=ctx)
+
+    if profiler is not None:
+        profiler.print_report()
+        if check_stats_file is not None:
+            profiler.save_check_stats(check_stats_file)
+        if profile_file is not None:
+            logging.info(f"Saving profile to `{profile_file}`.")
+            profiler.write(profile_file)
     return results[0]
@@ -0,0 +1,58 @@
+"""Serve command package."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from dbt_bouncer.cli import app
+from dbt_bouncer.enums import ExitCode
+
+
+@app.command(name="serve")
+def serve(
+    socket_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            help="Unix socket to listen on. Defaults to `DBT_BOUNCER_SOCKET`, or `serve.sock` in the dbt-bouncer cache directory.",
+        ),
+    ] = None,
+) -> None:
+    """Keep dbt-bouncer running in the background for `dbt-bouncer-client`.
+
+    The server keeps the check classes and the last parsed artifacts in memory,
+    re-parsing artifacts only when their files change. `dbt-bouncer-client`
+    takes the same options as `dbt-bouncer run` and hands the run to it, which
+    makes pre-commit hooks and editor integrations answer in milliseconds.
+
+    [bold]Examples:[/bold]
+
+      Start a server, then run checks through it:
+        [cyan]$ dbt-bouncer serve &[/cyan]
+        [cyan]$ dbt-bouncer-client --config-file dbt-bouncer.yml[/cyan]
+
+    Raises:
+        Exit: With code CONFIG_ERROR when another server is listening on the
+            socket, or the platform has no Unix sockets.
+
+    """
+    import logging
+    import socket
+
+    from dbt_bouncer.cli.serve.server import serve as serve_forever
+    from dbt_bouncer.client import default_socket_path
+    from dbt_bouncer.reporting.logger import configure_console_logging
+
+    if not hasattr(socket, "AF_UNIX"):
+        typer.echo("`serve` needs Unix sockets, which this platform lacks.", err=True)
+        raise typer.Exit(ExitCode.CONFIG_ERROR)
+
+    configure_console_logging(0)
+    try:
+        serve_forever(socket_path or default_socket_path())
+    except KeyboardInterrupt:
+        logging.info("Stopped serving.")
+    except OSError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(ExitCode.CONFIG_ERROR) from None
@@ -0,0 +1,189 @@
+"""The ``dbt-bouncer serve`` server: runs checks for ``dbt-bouncer-client``.
+
+The server answers one request at a time, in this process: check classes,
+validated config classes and the last parsed artifacts (see
+``artifact_parsers.parser.keep_parsed_artifacts``) stay in memory between runs,
+so a run only pays for the checks themselves. See ``dbt_bouncer.client`` for
+the protocol.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import logging
+import os
+import socket
+import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from dbt_bouncer.client import (
+    PROTOCOL_VERSION,
+    forwarded_env,
+    read_message,
+    write_message,
+)
+from dbt_bouncer.enums import ExitCode
+
+if TYPE_CHECKING:
+    import threading
+    from collections.abc import Callable, Iterator
+
+
+@contextlib.contextmanager
+def _request_environment(env: dict[str, str]) -> Iterator[None]:
+    """Give this process the forwarded environment of a request for the ``with`` block.
+
+    Forwarded variables the client did not set are unset, so the server's own
+    environment never leaks into a run.
+
+    Yields:
+        None
+
+    """
+    saved = forwarded_env(os.environ)
+    for name in saved:
+        del os.environ[name]
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        for name in forwarded_env(os.environ):
+            del os.environ[name]
+        os.environ.update(saved)
+
+
+def handle_request(request: Any, run: Callable[[list[str]], int]) -> dict[str, Any]:
+    """Run one client request.
+
+    Args:
+        request: The decoded request.
+        run: Runs ``dbt-bouncer run`` with the given arguments and returns its
+            exit code.
+
+    Returns:
+        dict: The response: ``exit_code``, ``stdout`` and ``stderr``, or
+        ``error`` for a request this server cannot answer.
+
+    """
+    if not isinstance(request, dict) or request.get("v") != PROTOCOL_VERSION:
+        return {"error": f"Expected a version {PROTOCOL_VERSION} request."}
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    cwd = Path.cwd()
+    try:
+        os.chdir(request["cwd"])
+        with (
+            _request_environment(request.get("env") or {}),
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            try:
+                exit_code = run(list(request["args"]))
+            except Exception:
+                traceback.print_exc()
+                exit_code = ExitCode.CHECK_ERRORS
+    except OSError as e:
+        return {"error": f"Cannot run in `{request.get('cwd')}`: {e}"}
+    finally:
+        os.chdir(cwd)
+    return {
+        "exit_code": int(exit_code),
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _run_command() -> Callable[[list[str]], int]:
+    """Build the function that runs ``dbt-bouncer run`` inside the server.
+
+    Returns:
+        Callable: Runs the command with the given arguments, exactly as the
+        CLI would, and returns its exit code.
+
+    """
+    import typer
+
+    from dbt_bouncer.main import app
+
+    command = typer.main.get_command(app)
+
+    def run(args: list[str]) -> int:
+        try:
+            command.main(args=["run", *args], prog_name="dbt-bouncer")
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else int(e.code is not None)
+        return ExitCode.SUCCESS
+
+    return run
+
+
+def _bind(socket_path: Path) -> socket.socket:
+    """Listen on ``socket_path``, replacing a socket no server is listening on.
+
+    Returns:
+        socket.socket: The listening socket.
+
+    Raises:
+        OSError: If another server is listening on ``socket_path`` already.
+
+    """
+    if socket_path.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(socket_path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                socket_path.unlink(missing_ok=True)
+            else:
+                raise OSError(
+                    f"A dbt-bouncer server is already listening on `{socket_path}`."
+                )
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    socket_path.chmod(0o600)
+    server.listen()
+    return server
+
+
+def serve(
+    socket_path: Path,
+    max_requests: int | None = None,
+    ready: threading.Event | None = None,
+) -> None:
+    """Answer ``dbt-bouncer-client`` requests on ``socket_path`` until interrupted.
+
+    Args:
+        socket_path: The Unix socket to listen on.
+        max_requests: Stop after answering this many requests; ``None`` serves
+            until interrupted.
+        ready: Set once the socket accepts connections.
+
+    """
+    from dbt_bouncer.artifact_parsers.parser import keep_parsed_artifacts
+    from dbt_bouncer.utils import get_check_objects
+
+    keep_parsed_artifacts()
+    run = _run_command()
+    # Import every check class now rather than during the first request.
+    get_check_objects()
+
+    server = _bind(socket_path)
+    logging.info(f"Serving dbt-bouncer on `{socket_path}`.")
+    if ready is not None:
+        ready.set()
+    answered = 0
+    try:
+        while max_requests is None or answered < max_requests:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    request = read_message(conn)
+                except ValueError:
+                    request = None
+                write_message(conn, handle_request(request, run))
+            answered += 1
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
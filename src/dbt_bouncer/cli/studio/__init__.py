@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 from pathlib import Path
 from typing import Annotated
 
@@ -51,6 +52,13 @@ def studio(
             help="Search checks by name, rule code, or docstring keyword.",
         ),
     ] = None,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            help="Redraw the dashboard whenever the results file or the config file changes, e.g. while `dbt-bouncer watch --output-file` keeps the results file up to date.",
+        ),
+    ] = False,
 ) -> None:
     """Launch the dbt-bouncer Terminal Studio dashboard.
 
@@ -87,10 +95,10 @@ def studio(
     filtered = filter_checks(checks, category=category, search=search)
 
     # Resolve config file if provided or if default exists
-    configured_checks: set[str] = set()
+    resolved_config_file = None
     if config_file is not None:
         if config_file.exists():
-            configured_checks = load_configured_checks(config_file)
+            resolved_config_file = config_file
         else:
             # The user explicitly requested this file, so warn rather than
             # silently ignore it. The dashboard still lists all checks.
@@ -106,15 +114,38 @@ def studio(
         ):
             candidate = Path(default_name.value)
             if candidate.exists():
-                configured_checks = load_configured_checks(candidate)
+                resolved_config_file = candidate
                 break
 
-    results = load_run_results(results_file) if results_file else None
-
-    render_studio_dashboard(
-        filtered,
-        configured_checks=configured_checks,
-        results=results,
-        search_term=search,
-        selected_category=category,
-    )
+    def render() -> int:
+        configured_checks = (
+            load_configured_checks(resolved_config_file)
+            if resolved_config_file is not None
+            else set()
+        )
+        results = load_run_results(results_file) if results_file else None
+
+        render_studio_dashboard(
+            filtered,
+            configured_checks=configured_checks,
+            results=results,
+            search_term=search,
+            selected_category=category,
+        )
+        return ExitCode.SUCCESS
+
+    watched = [p for p in (resolved_config_file, results_file) if p is not None]
+    if not watch or not watched:
+        render()
+        return
+
+    from dbt_bouncer.cli.watch.utils import watch as watch_forever
+
+    console = Console()
+    with contextlib.suppress(KeyboardInterrupt):
+        watch_forever(
+            render,
+            paths=lambda: watched,
+            interval=0.5,
+            clear=console.clear if console.is_terminal else None,
+        )
@@ -0,0 +1,164 @@
+"""Watch command package."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from dbt_bouncer.cli import app
+from dbt_bouncer.enums import ConfigFileName, ExitCode, OutputFormat
+
+
+@app.command(name="watch")
+def watch(
+    config_file: Annotated[
+        Path | None,
+        typer.Option(help="Location of the config file (YML, YAML, or TOML)."),
+    ] = Path(ConfigFileName.DBT_BOUNCER_YML),
+    check: Annotated[
+        str,
+        typer.Option(
+            help="Limit the checks run to specific check names, comma-separated.",
+            rich_help_panel="Check Selection",
+        ),
+    ] = "",
+    only: Annotated[
+        str,
+        typer.Option(
+            help="Limit the checks run to specific categories, comma-separated.",
+            rich_help_panel="Check Selection",
+        ),
+    ] = "",
+    interval: Annotated[
+        float,
+        typer.Option(
+            help="Seconds between checks of the config file and the dbt artifacts for changes.",
+            min=0.05,
+            rich_help_panel="Performance",
+        ),
+    ] = 0.5,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j",
+            "--jobs",
+            help="Number of workers to run checks in, as for `dbt-bouncer run`.",
+            min=0,
+            rich_help_panel="Performance",
+        ),
+    ] = 0,
+    low_memory: Annotated[
+        bool,
+        typer.Option(
+            help="Keep only the target package's resources in full while parsing the manifest.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    output_file: Annotated[
+        Path | None,
+        typer.Option(
+            help="Location of the file where check metadata will be saved after every run, e.g. for `dbt-bouncer studio --watch`.",
+            rich_help_panel="Output Options",
+        ),
+    ] = None,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option(
+            help="Format for the output file (requires --output-file). Choices: csv, json, junit, sarif, tap. Defaults to json.",
+            case_sensitive=False,
+            rich_help_panel="Output Options",
+        ),
+    ] = OutputFormat.JSON,
+    clear: Annotated[
+        bool,
+        typer.Option(
+            help="Clear the terminal before each run, so only the latest results are shown.",
+            rich_help_panel="Display Options",
+        ),
+    ] = True,
+    show_all_failures: Annotated[
+        bool,
+        typer.Option(
+            help="If passed then all failures will be printed to the console.",
+            rich_help_panel="Display Options",
+        ),
+    ] = False,
+    verbosity: Annotated[
+        int,
+        typer.Option(
+            "-v",
+            "--verbosity",
+            help="Verbosity.",
+            count=True,
+            rich_help_panel="Display Options",
+        ),
+    ] = 0,
+) -> None:
+    """Run checks, then re-run them whenever the dbt artifacts or the config file change.
+
+    The process stays up between runs, keeping the check classes and the parsed
+    artifacts in memory: only the artifacts that changed are parsed again, and
+    only the checks whose configuration or resource changed are executed (as
+    with `dbt-bouncer run --incremental`), so results arrive moments after
+    `dbt parse` finishes.
+
+    [bold]Examples:[/bold]
+
+      Re-run checks after every `dbt parse`:
+        [cyan]$ dbt-bouncer watch[/cyan]
+
+      Keep a results file up to date for the studio dashboard:
+        [cyan]$ dbt-bouncer watch --output-file results.json[/cyan]
+        [cyan]$ dbt-bouncer studio --results-file results.json --watch[/cyan]
+
+    """
+    import logging
+
+    from rich.console import Console
+
+    from dbt_bouncer.artifact_parsers.parser import keep_parsed_artifacts
+    from dbt_bouncer.cli.run.utils import detect_config_file_source, run_bouncer
+    from dbt_bouncer.cli.watch.utils import watch as watch_forever
+    from dbt_bouncer.cli.watch.utils import watched_paths
+    from dbt_bouncer.exceptions import DbtBouncerArtifactError, DbtBouncerConfigError
+    from dbt_bouncer.utils import get_check_objects
+
+    config_file_source = detect_config_file_source(config_file)
+
+    def run_once() -> int:
+        try:
+            return run_bouncer(
+                check=check,
+                config_file=config_file,
+                incremental=True,
+                jobs=jobs,
+                low_memory=low_memory,
+                only=only,
+                output_file=output_file,
+                output_format=output_format,
+                show_all_failures=show_all_failures,
+                verbosity=verbosity,
+                config_file_source=config_file_source,
+            )
+        except DbtBouncerConfigError as e:
+            logging.error(str(e))
+            return ExitCode.CONFIG_ERROR
+        except DbtBouncerArtifactError as e:
+            logging.error(str(e))
+            return ExitCode.ARTIFACT_ERROR
+
+    keep_parsed_artifacts()
+    # Import every check class now rather than during the first run.
+    get_check_objects()
+    console = Console()
+    try:
+        watch_forever(
+            run_once,
+            paths=lambda: watched_paths(config_file),
+            interval=interval,
+            clear=console.clear if clear and console.is_terminal else None,
+        )
+    except KeyboardInterrupt:
+        logging.info("Stopped watching.")
@@ -0,0 +1,161 @@
+"""Helpers for the ``dbt-bouncer watch`` command: polling files and re-running checks."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def file_stats(paths: Sequence[Path]) -> tuple[Any, ...]:
+    """Return the size and ``mtime_ns`` of each of ``paths``.
+
+    Returns:
+        tuple: ``(size, mtime_ns)``, or ``None`` for a missing file, per path.
+
+    """
+    stats = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            stats.append(None)
+        else:
+            stats.append((st.st_size, st.st_mtime_ns))
+    return tuple(stats)
+
+
+def wait_for_change(
+    paths: Sequence[Path],
+    previous: tuple[Any, ...],
+    interval: float,
+    sleep: Callable[[float], None] = time.sleep,
+) -> tuple[Any, ...]:
+    """Poll ``paths`` until their stats differ from ``previous``, then settle.
+
+    dbt writes ``manifest.json`` and the other artifacts one after another, so
+    a change only counts once a poll sees nothing change any more: checks never
+    run against half-written artifacts.
+
+    Args:
+        paths: The files to poll.
+        previous: Their ``file_stats`` when last seen.
+        interval: Seconds between polls.
+        sleep: Waits between polls; replaced in tests.
+
+    Returns:
+        tuple: The settled ``file_stats`` of ``paths``.
+
+    """
+    current = previous
+    while current == previous:
+        sleep(interval)
+        current = file_stats(paths)
+    while True:
+        sleep(interval)
+        settled = file_stats(paths)
+        if settled == current:
+            return settled
+        current = settled
+
+
+def watched_paths(config_file: Path | None) -> list[Path]:
+    """Return the files a run reads: the config file and the dbt artifacts.
+
+    Args:
+        config_file: The config file passed with ``--config-file``, or None for
+            the default lookup.
+
+    Returns:
+        list[Path]: The config file, then the artifacts in the
+        ``dbt_artifacts_dir`` it configures. Only the config file if it cannot
+        be loaded, so fixing it triggers the next run.
+
+    """
+    import yaml
+
+    from dbt_bouncer.artifact_parsers.parser import ARTIFACT_FILES
+    from dbt_bouncer.cli.run.utils import detect_config_file_source
+    from dbt_bouncer.cli.utils import resolve_config_path
+    from dbt_bouncer.configuration_file.parser import default_dbt_artifacts_dir
+    from dbt_bouncer.configuration_file.validator import (
+        get_config_file_path,
+        load_config_file_contents,
+    )
+    from dbt_bouncer.exceptions import DbtBouncerConfigError
+
+    resolved = resolve_config_path(config_file)
+    try:
+        config_file_path = Path(
+            get_config_file_path(
+                config_file=resolved,
+                config_file_source=detect_config_file_source(config_file),
+            )
+        )
+    except DbtBouncerConfigError:
+        return [resolved]
+    try:
+        contents = load_config_file_contents(config_file_path)
+    except (DbtBouncerConfigError, OSError, ValueError, yaml.YAMLError):
+        return [config_file_path]
+    if not isinstance(contents, Mapping):
+        return [config_file_path]
+    # As `DbtBouncerConfBase` defaults it and `run_bouncer` resolves it.
+    configured = (
+        contents["dbt_artifacts_dir"]
+        if "dbt_artifacts_dir" in contents
+        else default_dbt_artifacts_dir()
+    )
+    dbt_artifacts_dir = config_file_path.parent / (configured or "target")
+    return [config_file_path, *(dbt_artifacts_dir / name for name in ARTIFACT_FILES)]
+
+
+def watch(
+    run: Callable[[], int],
+    paths: Callable[[], list[Path]],
+    interval: float,
+    clear: Callable[[], None] | None = None,
+    max_runs: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Run ``run``, then run it again whenever one of ``paths()`` changes.
+
+    ``paths`` is called before every run, so editing the config file to read
+    another ``dbt_artifacts_dir`` moves the watch there. The files are stat-ed
+    before the run starts: files written while it runs trigger the next one.
+
+    Args:
+        run: Runs the checks once and returns the exit code.
+        paths: Returns the files to watch.
+        interval: Seconds between polls.
+        clear: Clears the screen before each run, if given.
+        max_runs: Stop after this many runs; ``None`` watches until interrupted.
+        sleep: Waits between polls; replaced in tests.
+
+    Returns:
+        int: The exit code of the last run.
+
+    """
+    runs = 0
+    while True:
+        watched = paths()
+        stats = file_stats(watched)
+        if clear is not None:
+            clear()
+        start = time.perf_counter()
+        exit_code = run()
+        runs += 1
+        logging.info(
+            f"Run {runs} finished at {datetime.now():%H:%M:%S} in "
+            f"{time.perf_counter() - start:.2f}s. Watching {len(watched)} files "
+            "for changes, press Ctrl+C to stop."
+        )
+        if max_runs is not None and runs >= max_runs:
+            return exit_code
+        wait_for_change(watched, stats, interval, sleep=sleep)
@@ -0,0 +1,156 @@
+"""Thin client for a ``dbt-bouncer serve`` process (the ``dbt-bouncer-client`` script).
+
+``dbt-bouncer-client [RUN OPTIONS]`` does what ``dbt-bouncer run [RUN OPTIONS]``
+does, but hands the run to the server listening on the Unix socket at
+``DBT_BOUNCER_SOCKET`` (``~/.cache/dbt-bouncer/serve.sock`` by default), which
+has the check classes and the last parsed artifacts in memory already. The
+client only imports the standard library, so it starts in tens of
+milliseconds. Without a server to answer, the run happens in the client
+process instead, exactly as ``dbt-bouncer run`` would.
+
+A request is one line of JSON: the ``run`` arguments, the working directory and
+the environment variables dbt-bouncer reads. The response is one line of JSON
+too: the exit code and everything the run printed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = [
+    "PROTOCOL_VERSION",
+    "default_socket_path",
+    "forwarded_env",
+    "main",
+    "read_message",
+    "request_run",
+    "write_message",
+]
+
+PROTOCOL_VERSION = 1
+
+# Environment variables a run reads, forwarded with each request. Terminal
+# settings are forwarded so output is formatted for the client's terminal.
+_FORWARDED_ENV_PREFIXES = ("DBT_", "GITHUB_", "LOG_")
+_FORWARDED_ENV_NAMES = frozenset(
+    {"COLUMNS", "CREATE_DBT_BOUNCER_CONFIG_FILE", "FORCE_COLOR", "NO_COLOR", "TERM"}
+)
+
+
+def default_socket_path() -> Path:
+    """Return the socket ``dbt-bouncer serve`` listens on and the client connects to.
+
+    Returns:
+        Path: ``DBT_BOUNCER_SOCKET``, or ``serve.sock`` in the dbt-bouncer
+        cache directory (see ``utils.get_cache_dir``, not imported here to keep
+        the client's start-up fast).
+
+    """
+    configured = os.environ.get("DBT_BOUNCER_SOCKET")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "dbt-bouncer" / "serve.sock"
+
+
+def forwarded_env(environ: Mapping[str, str]) -> dict[str, str]:
+    """Return the variables of ``environ`` that are forwarded with a request.
+
+    Returns:
+        dict[str, str]: The forwarded variables.
+
+    """
+    return {
+        name: value
+        for name, value in environ.items()
+        if name.startswith(_FORWARDED_ENV_PREFIXES) or name in _FORWARDED_ENV_NAMES
+    }
+
+
+def read_message(conn: socket.socket) -> Any:
+    """Read one newline-terminated JSON message from ``conn``.
+
+    Returns:
+        Any: The decoded message, or ``None`` if the peer closed the connection
+        without sending one.
+
+    """
+    chunks = []
+    while True:
+        chunk = conn.recv(1 << 16)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    data = b"".join(chunks)
+    return json.loads(data) if data.strip() else None
+
+
+def write_message(conn: socket.socket, message: Any) -> None:
+    """Send ``message`` to ``conn`` as one newline-terminated line of JSON."""
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def request_run(
+    args: list[str], socket_path: Path | None = None
+) -> dict[str, Any] | None:
+    """Ask the server at ``socket_path`` to run ``dbt-bouncer run`` with ``args``.
+
+    Args:
+        args: The arguments following ``dbt-bouncer run``.
+        socket_path: The server's socket; ``default_socket_path()`` by default.
+
+    Returns:
+        dict | None: ``exit_code``, ``stdout`` and ``stderr`` of the run, or
+        ``None`` if no server is listening.
+
+    """
+    env = forwarded_env(os.environ)
+    if sys.stdout.isatty():
+        # The server writes into a buffer, not a terminal: ask for the colours
+        # and width this terminal would get.
+        env.setdefault("FORCE_COLOR", "1")
+        with contextlib.suppress(OSError):
+            env.setdefault(
+                "COLUMNS", str(os.get_terminal_size(sys.stdout.fileno()).columns)
+            )
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        try:
+            conn.connect(str(socket_path or default_socket_path()))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        write_message(
+            conn,
+            {"v": PROTOCOL_VERSION, "args": args, "cwd": str(Path.cwd()), "env": env},
+        )
+        response = read_message(conn)
+    if not isinstance(response, dict) or "exit_code" not in response:
+        return None
+    return response
+
+
+def main() -> None:
+    """Run ``dbt-bouncer run`` with this process's arguments, on a server if one is up."""
+    args = sys.argv[1:]
+    response = request_run(args)
+    if response is None:
+        from dbt_bouncer.main import app
+
+        app(args=["run", *args], prog_name="dbt-bouncer")
+        return
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["exit_code"])
+
+
+if __name__ == "__main__":
+    main()
@@ -64,6 +64,18 @@ def get_check_types(
     ]
 
 
+def default_dbt_artifacts_dir() -> str:
+    """Return the artifacts directory of a config file that does not set one.
+
+    Returns:
+        str: ``$DBT_PROJECT_DIR/target`` if ``DBT_PROJECT_DIR`` is set, else
+        ``./target``.
+
+    """
+    project_dir = os.getenv("DBT_PROJECT_DIR")
+    return f"{project_dir}/target" if project_dir else "./target"
+
+
 class DbtBouncerConfBase(BaseModel):
     """Base model for the config file contents."""
 
@@ -73,13 +85,7 @@ class DbtBouncerConfBase(BaseModel):
         default=None,
         description="Path to a directory containing custom checks.",
     )
-    dbt_artifacts_dir: str | None = Field(
-        default_factory=lambda: (
-            f"{os.getenv('DBT_PROJECT_DIR')}/target"
-            if os.getenv("DBT_PROJECT_DIR")
-            else "./target"
-        )
-    )
+    dbt_artifacts_dir: str | None = Field(default_factory=default_dbt_artifacts_dir)
     exclude: str | None = Field(
         default=None,
         description="Regexp to match which paths to exclude.",
@@ -16,7 +16,14 @@ from pydantic import RootModel, ValidationError
 
 from dbt_bouncer.enums import CheckCategory, ConfigFileName, ConfigFileSource
 from dbt_bouncer.exceptions import DbtBouncerConfigError
-from dbt_bouncer.utils import compile_pattern, get_check_registry, load_config_from_yaml
+from dbt_bouncer.tracing import annotate
+from dbt_bouncer.utils import (
+    compile_pattern,
+    env_flag,
+    get_check_registry,
+    load_config_from_yaml,
+    write_atomic,
+)
 
 if TYPE_CHECKING:
     from dbt_bouncer.check_framework.base import BaseCheck
@@ -680,11 +687,7 @@ def _conf_cache_enabled() -> bool:
         bool: ``True`` if caching should run.
 
     """
-    return os.environ.get("DBT_BOUNCER_DISABLE_CONF_CACHE", "").lower() not in (
-        "1",
-        "true",
-        "yes",
-    )
+    return not env_flag("DBT_BOUNCER_DISABLE_CONF_CACHE")
 
 
 def _load_cached_conf(
@@ -836,10 +839,7 @@ def _write_cached_conf(cache_path: Path, bouncer_config: "DbtBouncerConfBase") -
         return
 
     try:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = cache_path.with_suffix(cache_path.suffix + ".tmp")
-        tmp.write_bytes(blob)
-        tmp.replace(cache_path)
+        write_atomic(cache_path, blob)
     except OSError:
         logging.debug("Conf cache write failed.", exc_info=True)
 
@@ -915,7 +915,9 @@ def validate_conf(
         )
         if cached is not None:
             logging.debug("Loaded validated conf from cache: %s", cache_path)
+            annotate(cache="hit")
             return cached
+    annotate(cache="miss" if cache_path is not None else "disabled")
 
     if configured_check_names:
         # Fast path: import only modules containing the configured checks.
@@ -14,6 +14,7 @@ from dbt_bouncer.artifact_types import (  # ruff: ignore[typing-only-first-party
     CatalogSourceWrapper,
     ExposureNode,
     MacroNode,
+    ManifestObject,
     ManifestWrapper,
     ModelNode,
     ModelWrapper,
@@ -34,6 +35,9 @@ from dbt_bouncer.artifact_types import (  # ruff: ignore[typing-only-first-party
 from dbt_bouncer.configuration_file.parser import (
     DbtBouncerConfBase,  # ruff: ignore[typing-only-first-party-import] - needed at runtime for Pydantic model_rebuild
 )
+from dbt_bouncer.profiling import (
+    Profiler,  # ruff: ignore[typing-only-first-party-import] - needed at runtime for Pydantic model_rebuild
+)
 
 
 class BouncerContext(BaseModel):
@@ -45,22 +49,30 @@ class BouncerContext(BaseModel):
     bouncer_config: DbtBouncerConfBase
     catalog_nodes: list[CatalogNodeWrapper]
     catalog_sources: list[CatalogSourceWrapper]
+    changed_unique_ids: frozenset[str] | None = None
     check_categories: list[str]
+    check_stats_file: Path | None = None
     create_pr_comment_file: bool
     dry_run: bool
     exposures: list[ExposureNode]
+    incremental_cache_file: Path | None = None
+    jobs: int = 0
     macros: list[MacroNode]
     manifest_obj: ManifestWrapper
+    max_failures: int | None = None
     models: list[ModelWrapper]
     output_file: Path | None
     output_format: str
     output_only_failures: bool
+    profiler: Profiler | None = None
     run_results: list[RunResultWrapper]
     seeds: list[SeedWrapper]
     semantic_models: list[SemanticModelWrapper]
+    shard: tuple[int, int] | None = None
     show_all_failures: bool
     snapshots: list[SnapshotWrapper]
     sources: list[SourceWrapper]
+    state_manifest: ManifestObject | None = None
     tests: list[TestWrapper]
     unit_tests: list[UnitTestNode]
 
@@ -1,34 +1,93 @@
-"""Check execution engine with sequential execution and progress tracking."""
+"""Check execution engine with progress tracking, sequential or across workers."""
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import heapq
 import logging
+import multiprocessing
+import os
+import sys
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn
 
+from dbt_bouncer.check_framework.base import unwrap_resource
 from dbt_bouncer.check_framework.exceptions import DbtBouncerFailedCheckError
 from dbt_bouncer.enums import CheckOutcome, CheckSeverity
+from dbt_bouncer.profiling import DURATION_KEY, check_key
+from dbt_bouncer.tracing import (
+    TRACE_KEY,
+    current_thread,
+    record_check_spans,
+    sample_every,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from dbt_bouncer.profiling import Profiler
     from dbt_bouncer.runner import CheckToRun
 
-__all__ = ["Executor"]
+    # Maps ``(start, end)`` ranges of the checks to their results, in order,
+    # alongside the number of workers doing so.
+    _Workers = tuple[
+        Callable[[list[tuple[int, int]]], Iterator[list[dict[str, Any]]]], int
+    ]
+
+__all__ = ["Executor", "check_run_count", "schedule_checks", "shard_checks"]
 
 
 class Executor:
-    """Orchestrates check execution with progress tracking."""
+    """Orchestrates check execution with progress tracking.
+
+    Args:
+        jobs: Number of workers to run checks in. ``1`` runs every check in
+            this thread; ``0`` uses one thread per CPU on free-threaded Python
+            builds and this thread otherwise.
+        profiler: Records how long each check takes, for ``--profile``.
+        max_failures: Stop once this many check runs failed with severity
+            ``error``, for ``--max-failures``; ``None`` runs every check.
+
+    """
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        profiler: Profiler | None = None,
+        max_failures: int | None = None,
+    ) -> None:
+        """Create an executor running checks in ``jobs`` workers."""
+        self.jobs = jobs
+        self.profiler = profiler
+        self.max_failures = max_failures
 
     # Resolved once per ``run()``. Formatting a per-check debug message costs an
     # f-string and a logging call for every check -- tens of thousands on a large
     # project -- all of it discarded when DEBUG is off, which is the default.
+    # Timing every check costs two clock reads each, so it too only happens when
+    # profiling, or for the checks sampled when tracing.
     _debug_enabled: bool = False
+    _profile_enabled: bool = False
+    _trace_every: int = 0
 
-    def _execute_check(self, check: CheckToRun) -> CheckToRun:
+    def _execute_check(
+        self, check: CheckToRun, instances: dict[int, Any] | None = None
+    ) -> CheckToRun:
         """Execute a single check and return the result.
 
+        Args:
+            check: The entry to execute.
+            instances: This thread's own copies of shared check instances, keyed
+                by ``id()`` of the shared instance, when other threads are
+                executing checks too.
+
         Returns:
             CheckToRun: The check dict with outcome and optional failure_message set.
 
@@ -37,19 +96,26 @@ class Executor:
             logging.debug(f"Running {check['check_run_id']}...")
         # Bind this run's resource onto the shared check instance immediately
         # before executing. Assembly stores the resource alongside the check
-        # rather than pre-copying an instance per resource; sequential execution
-        # makes reusing one instance across its resources safe. Context-only
-        # checks have no resource and are executed as-is.
+        # rather than pre-copying an instance per resource; executing one check
+        # at a time makes reusing one instance across its resources safe. Threads
+        # executing concurrently each bind onto a copy of their own instead.
+        # Context-only checks have no resource and are executed as-is.
+        instance = check["check"]
         resource = check.get("resource")
         if resource is not None:
-            check["check"].set_resource(resource, check["iterate_value"])
+            if instances is not None:
+                own = instances.get(id(instance))
+                if own is None:
+                    own = instances[id(instance)] = instance.model_copy()
+                instance = own
+            instance.set_resource(resource, check["iterate_value"])
         try:
-            check["check"].execute()
+            instance.execute()
             check["outcome"] = CheckOutcome.SUCCESS
         except DbtBouncerFailedCheckError as e:
             failure_message = e.message
-            if check["check"].description:
-                failure_message = f"{check['check'].description} - {failure_message}"
+            if instance.description:
+                failure_message = f"{instance.description} - {failure_message}"
 
             if self._debug_enabled:
                 logging.debug(
@@ -58,24 +124,245 @@ class Executor:
             check["outcome"] = CheckOutcome.FAILED
             check["failure_message"] = failure_message
         except Exception as e:
-            failure_message_full = list(
-                traceback.TracebackException.from_exception(e).format(),
+            check["outcome"] = CheckOutcome.FAILED
+            check["severity"] = CheckSeverity.WARN
+            check["failure_message"] = self._error_message(check, e)
+        return check
+
+    def _error_message(self, check: CheckToRun, e: Exception) -> str:
+        """Describe an unexpected error raised by a check.
+
+        Returns:
+            str: The failure message reported for the check.
+
+        """
+        failure_message_full = list(
+            traceback.TracebackException.from_exception(e).format(),
+        )
+        failure_message = failure_message_full[-1].strip()
+        if self._debug_enabled:
+            logging.debug(
+                f"Check {check['check_run_id']} raised unexpected error:\n{''.join(failure_message_full)}"
             )
-            failure_message = failure_message_full[-1].strip()
-            if self._debug_enabled:
-                logging.debug(
-                    f"Check {check['check_run_id']} raised unexpected error:\n{''.join(failure_message_full)}"
+        return f"`dbt-bouncer` encountered an error ({failure_message}), run with `-v` to see more details or report an issue at https://github.com/godatadriven/dbt-bouncer/issues."
+
+    def _execute_batch(self, check: CheckToRun) -> list[dict[str, Any]]:
+        """Execute a batch check over all of its resources at once.
+
+        Resources the check yields a failure for fail with that message; the
+        rest succeed. Calling ``fail()`` from a batch check fails every resource
+        with its message, and an unexpected error fails every resource as a
+        warning, as it would have for each one run alone.
+
+        Returns:
+            list[dict]: One result dict per resource, in ``check["batch"]`` order.
+
+        Raises:
+            TypeError: If the entry has no resource type, which the runner
+                never builds for a batch check.
+
+        """
+        if self._debug_enabled:
+            logging.debug(f"Running {check['check_run_id']} (batch)...")
+        batch = check["batch"]
+        iterate_value = check["iterate_value"]
+        # Unreachable; narrows the type for the checker.
+        if iterate_value is None:  # pragma: no cover
+            raise TypeError(
+                f"Batch check {check['check_run_id']} has no resource type."
+            )
+        nodes = [unwrap_resource(facts.resource, iterate_value) for facts in batch]
+        severity = check["severity"]
+        description = check["check"].description
+        failures: dict[int, str] = {}
+        batch_failure: str | None = None
+        try:
+            for node, message in check["check"].execute_batch(nodes):
+                failures.setdefault(id(node), message)
+        except DbtBouncerFailedCheckError as e:
+            batch_failure = f"{description} - {e.message}" if description else e.message
+        except Exception as e:
+            batch_failure = self._error_message(check, e)
+            severity = CheckSeverity.WARN
+        else:
+            if description:
+                failures = {k: f"{description} - {v}" for k, v in failures.items()}
+
+        results: list[dict[str, Any]] = []
+        for facts, node in zip(batch, nodes, strict=True):
+            failure_message = (
+                batch_failure if batch_failure is not None else failures.get(id(node))
+            )
+            results.append(
+                {
+                    "check_run_id": f"{check['check_run_id']}:{facts.run_id_suffix}",
+                    "failure_message": failure_message,
+                    "file_path": facts.file_path,
+                    "outcome": CheckOutcome.SUCCESS
+                    if failure_message is None
+                    else CheckOutcome.FAILED,
+                    "severity": severity,
+                    "unique_id": facts.unique_id,
+                }
+            )
+        if self._debug_enabled:
+            logging.debug(
+                f"Check {check['check_run_id']} failed for "
+                f"{sum(r['failure_message'] is not None for r in results)} of "
+                f"{len(results)} resources."
+            )
+        return results
+
+    def _execute_all(
+        self,
+        checks_to_run: list[CheckToRun],
+        advance: Callable[[int], None] | None = None,
+        instances: dict[int, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute ``checks_to_run`` in order, up to ``max_failures`` failures.
+
+        Args:
+            checks_to_run: The entries to execute (mutated in place).
+            advance: Called after each entry with the number of check runs it
+                stood for.
+            instances: Passed on to ``_execute_check``.
+
+        Returns:
+            list[dict]: One result dict per check run, in order; with
+            ``max_failures``, only those of the entries up to the one that
+            brought the failures to it.
+
+        """
+        results: list[dict[str, Any]] = []
+        profile_enabled = self._profile_enabled
+        trace_every = self._trace_every
+        failures_left = self.max_failures
+        for position, check in enumerate(checks_to_run):
+            traced = trace_every and position % trace_every == 0
+            timed = profile_enabled or traced
+            first = len(results)
+            if timed:
+                start = time.perf_counter_ns()
+            if "batch" in check:
+                results.extend(self._execute_batch(check))
+            else:
+                self._execute_check(check, instances)
+                results.append(
+                    {
+                        "check_run_id": check["check_run_id"],
+                        "failure_message": check.get("failure_message"),
+                        "file_path": check.get("file_path"),
+                        "outcome": check["outcome"],
+                        "severity": check["severity"],
+                        "unique_id": check.get("unique_id"),
+                    }
                 )
+            if timed and first < len(results):
+                # Timings travel back with the result, from forked workers too;
+                # the profiler and tracer pop them once the run completes.
+                end = time.perf_counter_ns()
+                if profile_enabled:
+                    results[first][DURATION_KEY] = (end - start) / 1e9
+                if traced:
+                    results[first][TRACE_KEY] = (start, end, current_thread())
+            if advance is not None:
+                advance(check_run_count(check))
+            if failures_left is not None:
+                failures_left -= _error_failures(results, first)
+                if failures_left <= 0:
+                    break
+        return results
 
-            check["outcome"] = CheckOutcome.FAILED
-            check["severity"] = CheckSeverity.WARN
-            check["failure_message"] = (
-                f"`dbt-bouncer` encountered an error ({failure_message}), run with `-v` to see more details or report an issue at https://github.com/godatadriven/dbt-bouncer/issues."
+    def _execute_range(
+        self, checks_to_run: list[CheckToRun], bounds: tuple[int, int]
+    ) -> list[dict[str, Any]]:
+        """Execute one range of ``checks_to_run`` on a worker thread.
+
+        Returns:
+            list[dict]: The results of ``checks_to_run[start:end]``, in order.
+
+        """
+        start, end = bounds
+        return self._execute_all(checks_to_run[start:end], instances={})
+
+    @contextlib.contextmanager
+    def _workers(self, checks_to_run: list[CheckToRun]) -> Iterator[_Workers | None]:
+        """Start the workers that will execute ``checks_to_run``.
+
+        On free-threaded Python builds, where threads run Python code in
+        parallel, the workers are threads of this process: ``jobs`` of them, or
+        one per CPU when ``jobs`` is 0. Otherwise ``jobs`` worker processes are
+        forked once the checks are assembled, so they inherit the parsed
+        artifacts and check instances instead of receiving copies; only the
+        result dicts travel back. Everything allocated so far is frozen first: a
+        worker's garbage collector would otherwise walk the inherited heap,
+        writing to each object's header and so copying every page of it.
+
+        Yields:
+            tuple | None: A function mapping ``(start, end)`` ranges of
+            ``checks_to_run`` to their results, in order, and the number of
+            workers; or ``None`` when checks should run in this thread.
+
+        """
+        free_threaded = _gil_disabled()
+        workers = self.jobs or (_cpu_count() if free_threaded else 1)
+        if workers <= 1 or len(checks_to_run) <= 1:
+            yield None
+            return
+        if free_threaded:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="dbt-bouncer-check"
+            ) as threads:
+                try:
+                    yield (
+                        functools.partial(
+                            threads.map,
+                            functools.partial(self._execute_range, checks_to_run),
+                        ),
+                        workers,
+                    )
+                finally:
+                    # Ranges not started yet are not needed if ``run()``
+                    # stopped early.
+                    threads.shutdown(wait=False, cancel_futures=True)
+            return
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logging.warning(
+                "`--jobs` needs the `fork` start method, which is not available "
+                "on this platform; running checks in a single process."
             )
-        return check
+            yield None
+            return
+
+        global _forked_checks, _forked_debug_enabled, _forked_profile_enabled
+        global _forked_trace_every, _forked_max_failures
+        _forked_checks = checks_to_run
+        _forked_debug_enabled = self._debug_enabled
+        _forked_profile_enabled = self._profile_enabled
+        _forked_trace_every = self._trace_every
+        _forked_max_failures = self.max_failures
+        from dbt_bouncer.utils import gc_frozen
+
+        try:
+            with gc_frozen(), multiprocessing.get_context("fork").Pool(workers) as pool:
+                yield functools.partial(pool.imap, _execute_forked_range), workers
+        finally:
+            _forked_checks = []
 
     def run(self, checks_to_run: list[CheckToRun]) -> list[dict[str, Any]]:
-        """Execute all checks sequentially with progress tracking.
+        """Execute all checks with progress tracking.
+
+        Checks run sequentially unless the executor was created with
+        ``jobs > 1``, or with ``jobs=0`` on a free-threaded Python build, in
+        which case contiguous ranges of ``checks_to_run`` run on worker threads
+        or forked worker processes (see ``_workers``). Results come back in the
+        same order either way.
+
+        With ``max_failures``, execution stops after the entry that brings the
+        number of error-severity failures to it, and only the results up to
+        there are returned: the same ones, however many workers there are.
+        Workers stop a range early too, and ranges not yet started are
+        dropped.
 
         Args:
             checks_to_run: List of CheckToRun dicts (mutated in place during execution).
@@ -89,43 +376,319 @@ class Executor:
             logging.info("No checks to run.")
             return []
 
-        logging.info(f"Assembled {len(checks_to_run)} checks, running...")
+        # A batch entry stands for one check run per resource it holds.
+        total = sum(check_run_count(c) for c in checks_to_run)
+        logging.info(f"Assembled {total} checks, running...")
 
         self._debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        self._profile_enabled = self.profiler is not None
+        self._trace_every = sample_every(len(checks_to_run))
 
         # Checks are CPU-bound pure-Python work (regex matching, proxy attribute
         # access, string ops) that never releases the GIL, so a ThreadPoolExecutor
         # could not run them in parallel -- it only added thread-scheduling and
         # GIL-contention overhead (and multi-second tail-latency spikes on large
         # projects). Executing sequentially is both faster and far more
-        # predictable; see the benchmark suite (``tests/benchmark``).
+        # predictable; see the benchmark suite (``tests/benchmark``). Only
+        # separate processes, or threads on a free-threaded build, run checks
+        # in parallel.
         console = Console()
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            total = len(checks_to_run)
+        # Fork before the progress bar starts its refresh thread: a thread
+        # holding a lock at the moment of the fork leaves it held for good in
+        # the worker.
+        with (
+            self._workers(checks_to_run) as workers,
+            Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+            ) as progress,
+        ):
             task = progress.add_task("Running checks...", total=total)
             # Refresh the bar ~100 times total rather than once per check: at large
             # check counts per-check updates add measurable overhead, and rich only
             # renders a few times a second anyway.
             update_step = max(1, total // 100)
-            for n, check in enumerate(checks_to_run, 1):
-                self._execute_check(check)
-                if n % update_step == 0:
-                    progress.update(task, completed=n)
+            done = next_update = 0
+
+            def advance(n: int) -> None:
+                nonlocal done, next_update
+                done += n
+                if done >= next_update:
+                    progress.update(task, completed=done)
+                    next_update = done + update_step
+
+            if workers is None:
+                results = self._execute_all(checks_to_run, advance)
+            else:
+                map_ranges, n_workers = workers
+                results = []
+                failures_left = self.max_failures
+                ranges = _partition(checks_to_run, n_workers * _CHUNKS_PER_JOB)
+                for (start, end), range_results in zip(
+                    ranges, map_ranges(ranges), strict=True
+                ):
+                    if failures_left is not None:
+                        range_results, failures = _until_failures(
+                            checks_to_run[start:end], range_results, failures_left
+                        )
+                        failures_left -= failures
+                    results.extend(range_results)
+                    advance(sum(check_run_count(c) for c in checks_to_run[start:end]))
+                    if failures_left is not None and failures_left <= 0:
+                        break
             progress.update(task, completed=total)
 
-        return [
-            {
-                "check_run_id": c["check_run_id"],
-                "failure_message": c.get("failure_message"),
-                "file_path": c.get("file_path"),
-                "outcome": c["outcome"],
-                "severity": c["severity"],
-                "unique_id": c.get("unique_id"),
-            }
-            for c in checks_to_run
-        ]
+        if self.max_failures is not None and len(results) < total:
+            logging.info(
+                f"Reached --max-failures {self.max_failures}: ran {len(results)} "
+                f"of {total} checks."
+            )
+
+        if self.profiler is not None:
+            self.profiler.record_results(results)
+        if self._trace_every:
+            record_check_spans(results)
+        return results
+
+
+# Each worker gets several ranges so that one slow range (a check with many
+# failures, or an expensive context-only check) does not leave the others idle.
+_CHUNKS_PER_JOB = 4
+
+# Floor on a check's cost when scheduling, in seconds, so checks too cheap for
+# the clock to measure are not scored infinitely high.
+_MIN_COST = 1e-6
+
+# What forked workers execute: set in the parent immediately before the pool
+# forks, so workers inherit them rather than unpickling copies.
+_forked_checks: list[CheckToRun] = []
+_forked_debug_enabled = False
+_forked_profile_enabled = False
+_forked_trace_every = 0
+_forked_max_failures: int | None = None
+
+
+def _gil_disabled() -> bool:
+    """Return whether this is a free-threaded build running without the GIL.
+
+    Returns:
+        bool: ``True`` if Python threads can run in parallel.
+
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _cpu_count() -> int:
+    """Return the number of CPUs this process may run on.
+
+    Returns:
+        int: At least 1.
+
+    """
+    count = getattr(os, "process_cpu_count", os.cpu_count)()
+    return count or 1
+
+
+def check_run_count(check: CheckToRun) -> int:
+    """Return the number of check runs an entry stands for.
+
+    Returns:
+        int: ``len(check["batch"])`` for a batch entry, else 1.
+
+    """
+    return len(check["batch"]) if "batch" in check else 1
+
+
+def _error_failures(results: list[dict[str, Any]], start: int = 0) -> int:
+    """Count the check runs in ``results[start:]`` that failed with severity ``error``.
+
+    Returns:
+        int: The number of such check runs.
+
+    """
+    return sum(
+        r["outcome"] == CheckOutcome.FAILED and r["severity"] == CheckSeverity.ERROR
+        for r in results[start:]
+    )
+
+
+def _until_failures(
+    checks: list[CheckToRun], results: list[dict[str, Any]], max_failures: int
+) -> tuple[list[dict[str, Any]], int]:
+    """Cut ``results`` after the entry that brings the failures to ``max_failures``.
+
+    Args:
+        checks: The entries ``results`` are the results of, in order.
+        results: Their results; fewer than the entries stand for if the worker
+            executing them stopped early.
+        max_failures: The number of error-severity failures to stop at.
+
+    Returns:
+        tuple[list[dict], int]: The results kept and the error-severity
+        failures among them.
+
+    """
+    failures = end = 0
+    for check in checks:
+        if end >= len(results) or failures >= max_failures:
+            break
+        start, end = end, end + check_run_count(check)
+        failures += _error_failures(results[start:end])
+    return results[:end], failures
+
+
+def schedule_checks(
+    checks_to_run: list[CheckToRun], stats: dict[str, dict[str, float]]
+) -> list[CheckToRun]:
+    """Order ``checks_to_run`` so the checks likely to fail soonest run first.
+
+    Each configured check is scored by the error-severity failures per second
+    its runs produced in ``stats``: its failure rate, smoothed towards 1/2 so a
+    few runs do not decide it, over its average cost. Checks ``stats`` has no
+    runs of get a failure rate of 1/2 and the median cost. The sort is stable,
+    so a check's entries, and checks of equal score, keep their order.
+
+    Args:
+        checks_to_run: The assembled check runs.
+        stats: Per-check statistics, see ``profiling.load_check_stats``.
+
+    Returns:
+        list[CheckToRun]: The same entries, reordered; unchanged without
+        ``stats``.
+
+    """
+    if not stats:
+        return checks_to_run
+    costs = sorted(s["seconds"] / s["runs"] for s in stats.values() if s["runs"] > 0)
+    median_cost = costs[len(costs) // 2] if costs else 0.0
+    scores: dict[str, float] = {}
+
+    def score(check: CheckToRun) -> float:
+        key = check_key(check["check_run_id"])
+        cached = scores.get(key)
+        if cached is None:
+            s = stats.get(key)
+            if s is None or s["runs"] <= 0:
+                rate, cost = 0.5, median_cost
+            else:
+                rate = (s["failures"] + 1) / (s["runs"] + 2)
+                cost = s["seconds"] / s["runs"]
+            cached = scores[key] = rate / max(cost, _MIN_COST)
+        return -cached
+
+    return sorted(checks_to_run, key=score)
+
+
+def _partition(checks_to_run: list[CheckToRun], n: int) -> list[tuple[int, int]]:
+    """Split ``checks_to_run`` into up to ``n`` contiguous ranges of similar weight.
+
+    Ranges are contiguous so each worker runs the entries of a check together,
+    as the sequential executor would, and results concatenate back in order.
+
+    Returns:
+        list[tuple[int, int]]: ``(start, end)`` slice bounds, in order, covering
+        every entry.
+
+    """
+    target = sum(check_run_count(c) for c in checks_to_run) / n
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    weight = 0
+    for i, check in enumerate(checks_to_run[:-1]):
+        weight += check_run_count(check)
+        if weight >= target * (len(ranges) + 1):
+            ranges.append((start, i + 1))
+            start = i + 1
+    ranges.append((start, len(checks_to_run)))
+    return ranges
+
+
+def _costs(
+    checks_to_run: list[CheckToRun], stats: dict[str, dict[str, float]]
+) -> list[float]:
+    """Return the expected cost of each entry of ``checks_to_run``.
+
+    An entry costs its number of check runs times the average seconds per run
+    of its check in ``stats``; checks ``stats`` has no runs of take the median.
+    Without ``stats``, every check run costs 1.
+
+    Returns:
+        list[float]: One cost per entry, in order.
+
+    """
+    if not stats:
+        return [float(check_run_count(c)) for c in checks_to_run]
+    per_run = {
+        key: max(s["seconds"] / s["runs"], _MIN_COST)
+        for key, s in stats.items()
+        if s["runs"] > 0
+    }
+    ordered = sorted(per_run.values())
+    median_cost = ordered[len(ordered) // 2] if ordered else 1.0
+    return [
+        check_run_count(c) * per_run.get(check_key(c["check_run_id"]), median_cost)
+        for c in checks_to_run
+    ]
+
+
+def shard_checks(
+    checks_to_run: list[CheckToRun],
+    index: int,
+    count: int,
+    stats: dict[str, dict[str, float]] | None = None,
+) -> list[CheckToRun]:
+    """Return the entries of ``checks_to_run`` that shard ``index`` of ``count`` runs.
+
+    Entries are dealt out costliest first to the least loaded shard, so every
+    shard ends up with a similar cost: the seconds their checks took in
+    ``stats``, or without it the number of check runs. Ties between entries of
+    equal cost are broken by a hash of their ``check_run_id`` rather than by
+    position, and ties between equally loaded shards by shard number, so every
+    CI node computes the same assignment from the same artifacts, config and
+    statistics.
+
+    Args:
+        checks_to_run: The assembled check runs.
+        index: The shard to return, from 1 to ``count``.
+        count: The number of shards.
+        stats: Per-check statistics, see ``profiling.load_check_stats``.
+
+    Returns:
+        list[CheckToRun]: The shard's entries, in their original order.
+
+    """
+    costs = _costs(checks_to_run, stats or {})
+    order = sorted(
+        range(len(checks_to_run)),
+        key=lambda i: (
+            -costs[i],
+            hashlib.sha256(checks_to_run[i]["check_run_id"].encode()).digest(),
+        ),
+    )
+    loads = [(0.0, shard) for shard in range(1, count + 1)]
+    assigned: list[int] = []
+    for i in order:
+        load, shard = heapq.heappop(loads)
+        if shard == index:
+            assigned.append(i)
+        heapq.heappush(loads, (load + costs[i], shard))
+    return [checks_to_run[i] for i in sorted(assigned)]
+
+
+def _execute_forked_range(bounds: tuple[int, int]) -> list[dict[str, Any]]:
+    """Execute one range of the inherited checks inside a forked worker.
+
+    Returns:
+        list[dict]: The results of ``_forked_checks[start:end]``, in order.
+
+    """
+    start, end = bounds
+    executor = Executor()
+    executor._debug_enabled = _forked_debug_enabled
+    executor._profile_enabled = _forked_profile_enabled
+    executor._trace_every = _forked_trace_every
+    executor.max_failures = _forked_max_failures
+    return executor._execute_all(_forked_checks[start:end])
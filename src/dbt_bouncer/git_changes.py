@@ -0,0 +1,139 @@
+"""Scope a run to the resources changed since a git ref (``--changed-since``).
+
+The files changed between the merge base of the ref and the working tree
+(uncommitted and untracked files included) are mapped to the resources defined
+in them, through each resource's ``original_file_path`` and, for properties set
+in YAML, its ``patch_path``.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess  # ruff: ignore[suspicious-subprocess-import] # nosec B404
+from typing import TYPE_CHECKING, Any
+
+from dbt_bouncer.artifact_parsers.graph import graph_from_manifest
+from dbt_bouncer.exceptions import DbtBouncerConfigError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Manifest collections holding resources that are defined in a project file.
+_FILE_DEFINED_COLLECTIONS = (
+    "exposures",
+    "macros",
+    "nodes",
+    "semantic_models",
+    "sources",
+    "unit_tests",
+)
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    """Run ``git`` with ``args`` in ``cwd`` and return its output.
+
+    Returns:
+        str: Standard output.
+
+    Raises:
+        DbtBouncerConfigError: If git is not installed or the command fails.
+
+    """
+    executable = shutil.which("git")
+    if executable is None:
+        raise DbtBouncerConfigError("`--changed-since` needs `git` to be installed.")
+    # No shell and a fixed argument list; the ref is checked for a leading dash
+    # by the caller so it cannot be read as an option.
+    completed = subprocess.run(  # ruff: ignore[subprocess-without-shell-equals-true] # nosec B603
+        [executable, *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise DbtBouncerConfigError(
+            f"`git {' '.join(args)}` failed: {completed.stderr.strip()}"
+        )
+    return completed.stdout
+
+
+def git_changed_files(ref: str, project_dir: Path) -> frozenset[str]:
+    """Return the files under ``project_dir`` changed since ``ref``.
+
+    Changes are taken relative to the merge base of ``ref`` and ``HEAD``, so
+    commits made on ``ref`` since the branch was created do not count.
+
+    Args:
+        ref: A git ref, e.g. ``origin/main``.
+        project_dir: The dbt project directory.
+
+    Returns:
+        frozenset[str]: Paths relative to ``project_dir``, with ``/`` separators.
+
+    Raises:
+        DbtBouncerConfigError: If ``ref`` is not a valid ref or ``project_dir`` is
+            not inside a git repository.
+
+    """
+    if not ref or ref.startswith("-"):
+        raise DbtBouncerConfigError(
+            f"Invalid `--changed-since` value '{ref}': expected a git ref."
+        )
+    base = _git(["merge-base", ref, "HEAD"], project_dir).strip()
+    changed = _git(["diff", "--name-only", "--relative", base], project_dir)
+    untracked = _git(["ls-files", "--others", "--exclude-standard"], project_dir)
+    return frozenset(
+        line.strip() for line in (changed + untracked).splitlines() if line.strip()
+    )
+
+
+def _resource_paths(resource: Any) -> list[str]:
+    """Return the project files ``resource`` is defined in.
+
+    Returns:
+        list[str]: Its ``original_file_path`` and ``patch_path``, if set.
+
+    """
+    paths = []
+    for attr in ("original_file_path", "patch_path"):
+        path = getattr(resource, attr, None)
+        if path:
+            # ``patch_path`` is prefixed with the package: ``my_project://...``.
+            paths.append(str(path).split("://", 1)[-1].replace("\\", "/"))
+    return paths
+
+
+def changed_unique_ids(
+    manifest: Any,
+    changed_files: frozenset[str],
+    package_name: str,
+    include_downstream: bool = False,
+) -> frozenset[str]:
+    """Map changed files to the unique IDs of the resources defined in them.
+
+    Args:
+        manifest: The parsed manifest.
+        changed_files: Changed paths relative to the project directory.
+        package_name: The package whose files ``changed_files`` belong to.
+            Resources of other packages can share relative paths with it.
+        include_downstream: Also include everything downstream of a changed
+            resource.
+
+    Returns:
+        frozenset[str]: The unique IDs of the changed resources.
+
+    """
+    changed: set[str] = set()
+    for attr in _FILE_DEFINED_COLLECTIONS:
+        collection = getattr(manifest, attr, None)
+        if collection is None or not hasattr(collection, "items"):
+            continue
+        for unique_id, resource in collection.items():
+            if str(getattr(resource, "package_name", package_name)) != package_name:
+                continue
+            if any(path in changed_files for path in _resource_paths(resource)):
+                changed.add(str(unique_id))
+    if include_downstream:
+        changed |= graph_from_manifest(manifest).closure(changed, upstream=False)
+    return frozenset(changed)
@@ -0,0 +1,359 @@
+"""Incremental runs: replay results of checks whose inputs have not changed.
+
+With ``--incremental`` every check run is keyed by a digest of the check's
+configuration and of the resource it ran against, and its outcome is stored
+under ``get_cache_dir()``. The next run only executes the check runs whose key
+it has no stored outcome for, and replays the rest, so output files stay
+complete.
+
+A resource's digest covers its whole manifest (or catalog/run results) entry.
+dbt's own ``checksum`` is part of that entry, but it only covers the resource's
+file: descriptions, tags, columns and config set in YAML are not in it. Checks
+that read the project through ``ctx`` (lineage, test coverage...) also fold in
+the resource's neighbourhood: every node upstream of it and its direct
+children, which include its tests and exposures. Batch checks are keyed as a
+whole, and context-only checks always run.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import itertools
+import logging
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from dbt_bouncer.check_framework.base import unwrap_resource
+from dbt_bouncer.enums import CheckOutcome, CheckSeverity
+from dbt_bouncer.executor import check_run_count
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from dbt_bouncer.runner import CheckToRun
+
+_INCREMENTAL_FORMAT_VERSION = 1
+
+# Manifest collections a ``parent_map``/``child_map`` entry can refer to.
+_LINEAGE_COLLECTIONS = (
+    "nodes",
+    "sources",
+    "exposures",
+    "semantic_models",
+    "metrics",
+    "saved_queries",
+    "unit_tests",
+)
+
+
+def incremental_cache_path(
+    config_file_path: Path, dbt_artifacts_dir: Path, code_fingerprint: str
+) -> Path:
+    """Return the file storing a project's check outcomes between runs.
+
+    Args:
+        config_file_path: The dbt-bouncer config file.
+        dbt_artifacts_dir: The directory the artifacts are read from.
+        code_fingerprint: Digest of the dbt-bouncer version and check code, see
+            ``utils.compute_cache_fingerprint``. Outcomes recorded by other
+            check code are never replayed.
+
+    Returns:
+        Path: Location inside the dbt-bouncer cache directory.
+
+    """
+    from dbt_bouncer.utils import get_cache_dir
+
+    digest = hashlib.sha256(
+        f"{config_file_path.resolve()}\0{dbt_artifacts_dir.resolve()}".encode()
+    ).hexdigest()
+    return get_cache_dir() / f"incremental_{digest[:16]}_{code_fingerprint}.json"
+
+
+class _Fingerprints:
+    """Digests of resources and their lineage, memoised for one run."""
+
+    def __init__(self, manifest: Any) -> None:
+        """Index ``manifest``'s lineage; entries are hashed when first needed."""
+        self._manifest = manifest
+        self._parent_map = getattr(manifest, "parent_map", None) or {}
+        self._child_map = getattr(manifest, "child_map", None) or {}
+        self._configs: dict[int, bytes] = {}
+        self._nodes: dict[int, bytes] = {}
+        self._entries: dict[str, bytes] = {}
+        self._upstream: dict[str, bytes] = {}
+
+    def config(self, check: Any) -> bytes:
+        """Return the digest of a check's configuration.
+
+        ``index`` is left out so that reordering the config file does not
+        invalidate every stored outcome, and so is the bound resource field.
+
+        Returns:
+            bytes: The digest.
+
+        """
+        digest = self._configs.get(id(check))
+        if digest is None:
+            exclude = {"index"}
+            if check.iterate_over is not None:
+                exclude.add(check.iterate_over)
+            # Enum fields hold the plain strings of the config file, which
+            # serialise as-is; pydantic would warn about each of them.
+            dumped = check.model_dump(mode="json", exclude=exclude, warnings=False)
+            digest = hashlib.sha256(
+                orjson.dumps(dumped, option=orjson.OPT_SORT_KEYS)
+            ).digest()
+            self._configs[id(check)] = digest
+        return digest
+
+    def node(self, node: Any) -> bytes:
+        """Return the digest of a resource's artifact entry.
+
+        orjson raises ``TypeError`` for an entry that is not plain JSON data.
+
+        Returns:
+            bytes: The digest.
+
+        """
+        digest = self._nodes.get(id(node))
+        if digest is None:
+            digest = hashlib.sha256(
+                orjson.dumps(node, option=orjson.OPT_SORT_KEYS)
+            ).digest()
+            self._nodes[id(node)] = digest
+        return digest
+
+    def _entry(self, unique_id: str) -> bytes:
+        """Return the digest of the manifest entry for ``unique_id``.
+
+        Returns:
+            bytes: The digest, or an empty digest for IDs the manifest lacks.
+
+        """
+        digest = self._entries.get(unique_id)
+        if digest is None:
+            digest = b""
+            for attr in _LINEAGE_COLLECTIONS:
+                collection = getattr(self._manifest, attr, None)
+                if collection is not None and unique_id in collection:
+                    digest = self.node(dict.get(collection, unique_id))
+                    break
+            self._entries[unique_id] = digest
+        return digest
+
+    def _upstream_digest(self, unique_id: str) -> bytes:
+        """Return a digest of ``unique_id``'s entry and everything upstream of it.
+
+        Returns:
+            bytes: The digest.
+
+        """
+        memo = self._upstream
+        visiting: set[str] = set()
+        stack = [unique_id]
+        while stack:
+            current = stack[-1]
+            if current in memo:
+                stack.pop()
+                continue
+            parents = [str(p) for p in self._parent_map.get(current) or ()]
+            # A parent still being visited would be a cycle, which dbt rejects;
+            # skipping it keeps a malformed manifest from looping forever.
+            pending = [p for p in parents if p not in memo and p not in visiting]
+            if pending:
+                visiting.add(current)
+                stack.extend(pending)
+                continue
+            stack.pop()
+            visiting.discard(current)
+            h = hashlib.sha256(self._entry(current))
+            for parent in sorted(parents):
+                h.update(memo.get(parent, b""))
+            memo[current] = h.digest()
+        return memo[unique_id]
+
+    def lineage(self, unique_id: str) -> bytes:
+        """Return a digest of ``unique_id``'s upstream nodes and direct children.
+
+        Returns:
+            bytes: The digest.
+
+        """
+        h = hashlib.sha256(self._upstream_digest(unique_id))
+        for child in sorted(str(c) for c in self._child_map.get(unique_id) or ()):
+            h.update(self._entry(child))
+        return h.digest()
+
+    def key(self, check: CheckToRun) -> str | None:
+        """Return the key a check run's outcome is stored under.
+
+        Returns:
+            str | None: The key, or ``None`` if the check run must always execute.
+
+        """
+        instance = check["check"]
+        iterate_value = check.get("iterate_value")
+        if iterate_value is None:
+            return None
+        h = hashlib.sha256(self.config(instance))
+        try:
+            if "batch" in check:
+                for facts in check["batch"]:
+                    h.update(self.node(unwrap_resource(facts.resource, iterate_value)))
+                    if instance.uses_context and facts.unique_id is not None:
+                        h.update(self.lineage(str(facts.unique_id)))
+            else:
+                h.update(self.node(unwrap_resource(check["resource"], iterate_value)))
+                unique_id = check.get("unique_id")
+                if instance.uses_context and unique_id is not None:
+                    h.update(self.lineage(str(unique_id)))
+        except TypeError:
+            return None
+        return h.hexdigest()
+
+
+def _replay(check: CheckToRun, stored: list[list[Any]]) -> list[dict[str, Any]]:
+    """Rebuild the results of a check run from its stored outcomes.
+
+    Returns:
+        list[dict]: One result dict per stored outcome, as the executor would
+        have returned them.
+
+    """
+    if "batch" in check:
+        identities = [
+            (
+                f"{check['check_run_id']}:{facts.run_id_suffix}",
+                facts.file_path,
+                facts.unique_id,
+            )
+            for facts in check["batch"]
+        ]
+    else:
+        identities = [
+            (check["check_run_id"], check.get("file_path"), check.get("unique_id"))
+        ]
+    return [
+        {
+            "check_run_id": check_run_id,
+            "failure_message": failure_message,
+            "file_path": file_path,
+            "outcome": CheckOutcome(outcome),
+            "severity": CheckSeverity(severity),
+            "unique_id": unique_id,
+        }
+        for (check_run_id, file_path, unique_id), (
+            outcome,
+            severity,
+            failure_message,
+        ) in zip(identities, stored, strict=True)
+    ]
+
+
+def _load_outcomes(path: Path) -> dict[str, list[list[Any]]]:
+    """Read the outcomes stored by the previous incremental run.
+
+    Returns:
+        dict: Stored outcomes by key; empty if there are none or the file is
+        unreadable.
+
+    """
+    try:
+        stored = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(stored, dict) or stored.get("v") != _INCREMENTAL_FORMAT_VERSION:
+        return {}
+    outcomes = stored.get("outcomes")
+    return outcomes if isinstance(outcomes, dict) else {}
+
+
+def _save_outcomes(path: Path, outcomes: dict[str, list[list[Any]]]) -> None:
+    """Store this run's outcomes for the next incremental run.
+
+    Never raises: outcomes that cannot be stored only cost the next run a full
+    execution. Files left behind by other versions of the check code are
+    removed.
+
+    """
+    from dbt_bouncer.utils import write_atomic
+
+    try:
+        write_atomic(
+            path,
+            orjson.dumps({"v": _INCREMENTAL_FORMAT_VERSION, "outcomes": outcomes}),
+        )
+    except OSError:
+        logging.debug("Incremental outcomes write failed.", exc_info=True)
+        return
+
+    prefix = path.name.rsplit("_", 1)[0]
+    for f in path.parent.glob(f"{prefix}_*.json"):
+        if f != path:
+            with contextlib.suppress(OSError):
+                f.unlink()
+
+
+def run_incremental(
+    checks_to_run: list[CheckToRun],
+    manifest: Any,
+    cache_file: Path,
+    execute: Callable[[list[CheckToRun]], list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Execute the check runs whose inputs changed and replay the rest.
+
+    Args:
+        checks_to_run: The assembled check runs.
+        manifest: The parsed manifest, for lineage lookups.
+        cache_file: Where outcomes are stored, see ``incremental_cache_path``.
+        execute: Executes a list of check runs, e.g. ``Executor.run``.
+
+    Returns:
+        list[dict]: One result dict per check run, in the same order as a full
+        run would return them. If ``execute`` stopped early (``--max-failures``),
+        only the results up to the last check run it executed.
+
+    """
+    fingerprints = _Fingerprints(manifest)
+    previous = _load_outcomes(cache_file)
+
+    keys = [fingerprints.key(check) for check in checks_to_run]
+    replayed: dict[int, list[dict[str, Any]]] = {}
+    to_execute: list[CheckToRun] = []
+    for position, (check, key) in enumerate(zip(checks_to_run, keys, strict=True)):
+        stored = previous.get(key) if key is not None else None
+        if stored is not None and len(stored) == check_run_count(check):
+            replayed[position] = _replay(check, stored)
+        else:
+            to_execute.append(check)
+    logging.info(
+        f"Incremental run: replaying {len(replayed)} of {len(checks_to_run)} "
+        "checks from the previous run."
+    )
+
+    executed = iter(execute(to_execute) if to_execute else [])
+    results: list[dict[str, Any]] = []
+    outcomes: dict[str, list[list[Any]]] = {}
+    for position, (check, key) in enumerate(zip(checks_to_run, keys, strict=True)):
+        check_results = replayed.get(position)
+        if check_results is None:
+            check_results = list(itertools.islice(executed, check_run_count(check)))
+            if len(check_results) < check_run_count(check):
+                # The rest did not run; keep their stored outcomes for next time.
+                outcomes.update(
+                    (k, previous[k]) for k in keys[position:] if k in previous
+                )
+                break
+        results.extend(check_results)
+        if key is not None:
+            outcomes[key] = [
+                [r["outcome"], r["severity"], r.get("failure_message")]
+                for r in check_results
+            ]
+
+    _save_outcomes(cache_file, outcomes)
+    return results
@@ -11,8 +11,11 @@ import dbt_bouncer.cli.explain  # ruff: ignore[unused-import] — triggers @app.
 import dbt_bouncer.cli.init  # ruff: ignore[unused-import] — triggers @app.command registration
 import dbt_bouncer.cli.list  # ruff: ignore[unused-import] — triggers @app.command registration
 import dbt_bouncer.cli.mcp  # ruff: ignore[unused-import] — triggers @app.command registration
+import dbt_bouncer.cli.merge  # ruff: ignore[unused-import] — triggers @app.command registration
+import dbt_bouncer.cli.serve  # ruff: ignore[unused-import] — triggers @app.command registration
 import dbt_bouncer.cli.studio  # ruff: ignore[unused-import] — triggers @app.command registration
 import dbt_bouncer.cli.validate  # ruff: ignore[unused-import] — triggers @app.command registration
+import dbt_bouncer.cli.watch  # ruff: ignore[unused-import] — triggers @app.command registration
 from dbt_bouncer.cli import app
 from dbt_bouncer.cli.run import run
 from dbt_bouncer.enums import ConfigFileName, OutputFormat
@@ -60,6 +63,24 @@ def main_callback(
             help="Limit the checks run to specific check names, comma-separated. Examples: 'check_model_has_unique_test', 'check_model_names,check_source_freshness_populated'."
         ),
     ] = "",
+    changed_since: Annotated[
+        str,
+        typer.Option(
+            help="Only check resources defined in files changed since this git ref (e.g. 'origin/main'), including uncommitted changes. Checks that run once for the whole project still run.",
+        ),
+    ] = "",
+    include_downstream: Annotated[
+        bool,
+        typer.Option(
+            help="With --changed-since, also check everything downstream of a changed resource.",
+        ),
+    ] = False,
+    state: Annotated[
+        Path | None,
+        typer.Option(
+            help="Directory holding a baseline `manifest.json` (e.g. from the main branch) for `state:modified` and `state:new` selectors to compare against.",
+        ),
+    ] = None,
     only: Annotated[
         str,
         typer.Option(
@@ -95,6 +116,64 @@ def main_callback(
             help="If passed then all failures will be printed to the console."
         ),
     ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            help="Only execute checks whose configuration or resource changed since the previous incremental run, replaying the other outcomes from the dbt-bouncer cache.",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j",
+            "--jobs",
+            help="Number of workers to run checks in. Workers share the parsed artifacts, so large projects can use every core of a CI runner. 0 (the default) uses one thread per core on free-threaded Python builds and a single worker otherwise.",
+            min=0,
+        ),
+    ] = 0,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            help="Time each phase of the run and each configured check, and print the slowest checks: calls, total time, p50, p95 and max.",
+        ),
+    ] = False,
+    profile_file: Annotated[
+        Path | None,
+        typer.Option(
+            help="Also write the `--profile` timings to this file as JSON. Implies --profile.",
+        ),
+    ] = None,
+    trace_file: Annotated[
+        Path | None,
+        typer.Option(
+            help="Write a Chrome trace of the run to this file: startup, config validation, artifact loading, check assembly, a sample of check executions and garbage collections. Open it in https://ui.perfetto.dev.",
+        ),
+    ] = None,
+    fail_fast: Annotated[
+        bool,
+        typer.Option(
+            help="Stop at the first check that fails with severity `error`. The same as `--max-failures 1`.",
+        ),
+    ] = False,
+    max_failures: Annotated[
+        int | None,
+        typer.Option(
+            help="Stop once this many checks failed with severity `error`. Checks that failed most often per second of run time in earlier `--profile` runs run first, so failures surface as early as possible.",
+            min=1,
+        ),
+    ] = None,
+    shard: Annotated[
+        str,
+        typer.Option(
+            help="Only run shard `i` of `N` of the checks, e.g. `2/4`, to split a run across CI runners. Checks are divided deterministically so each shard takes a similar time, by the check costs recorded by `--profile` runs, or else gets a similar number of check runs; combine the output files with `dbt-bouncer merge`.",
+        ),
+    ] = "",
+    low_memory: Annotated[
+        bool,
+        typer.Option(
+            help="Keep only the target package's resources in full while parsing the manifest. Lowers peak memory on projects with large dependencies.",
+        ),
+    ] = False,
     verbosity: Annotated[
         int,
         typer.Option("-v", "--verbosity", help="Verbosity.", count=True),
@@ -125,14 +204,26 @@ def main_callback(
     if ctx.invoked_subcommand is None:
         ctx.invoke(
             run,
+            changed_since=changed_since,
             check=check,
             config_file=config_file,
             create_pr_comment_file=create_pr_comment_file,
             dry_run=dry_run,
+            fail_fast=fail_fast,
+            include_downstream=include_downstream,
+            incremental=incremental,
+            jobs=jobs,
+            low_memory=low_memory,
+            max_failures=max_failures,
             only=only,
             output_file=output_file,
             output_format=output_format,
             output_only_failures=output_only_failures,
+            profile=profile,
+            profile_file=profile_file,
+            shard=shard,
             show_all_failures=show_all_failures,
+            state=state,
+            trace_file=trace_file,
             verbosity=verbosity,
         )
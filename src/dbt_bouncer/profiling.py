@@ -0,0 +1,274 @@
+"""Per-check and per-phase timings of a run (``--profile``)."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import orjson
+from rich import box
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from dbt_bouncer.enums import CheckOutcome, CheckSeverity
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+__all__ = [
+    "DURATION_KEY",
+    "Profiler",
+    "check_key",
+    "check_stats_path",
+    "load_check_stats",
+    "profile_phase",
+]
+
+# Key under which ``Executor`` passes a check's duration back with its first
+# result; popped by ``Profiler.record_results`` before anything else sees it.
+DURATION_KEY = "_duration"
+
+# Phases in the order a run goes through them.
+_PHASES = ("config_validation", "parse", "assembly", "execute", "report")
+
+_CHECK_STATS_FORMAT_VERSION = 1
+
+# Weight of the statistics already stored when a ``--profile`` run adds its
+# own, so a check's cost and failure rate follow the project as it changes.
+_CHECK_STATS_DECAY = 0.5
+
+
+class _CheckTimings(TypedDict):
+    """Timings of one configured check, as listed in ``Profiler.summary``."""
+
+    check: str
+    calls: int
+    total: float
+    p50: float
+    p95: float
+    max: float
+
+
+def check_key(check_run_id: str) -> str:
+    """Return the configured check a check run belongs to: its name and index.
+
+    Returns:
+        str: ``check_run_id`` up to its second ``:``.
+
+    """
+    name, _, rest = check_run_id.partition(":")
+    return f"{name}:{rest.partition(':')[0]}"
+
+
+def check_stats_path(config_file_path: Path, dbt_artifacts_dir: Path) -> Path:
+    """Return the file storing a project's per-check statistics between runs.
+
+    Args:
+        config_file_path: The dbt-bouncer config file.
+        dbt_artifacts_dir: The directory the artifacts are read from.
+
+    Returns:
+        Path: Location inside the dbt-bouncer cache directory.
+
+    """
+    from dbt_bouncer.utils import get_cache_dir
+
+    digest = hashlib.sha256(
+        f"{config_file_path.resolve()}\0{dbt_artifacts_dir.resolve()}".encode()
+    ).hexdigest()
+    return get_cache_dir() / f"check_stats_{digest[:16]}.json"
+
+
+def load_check_stats(path: Path) -> dict[str, dict[str, float]]:
+    """Load the per-check statistics stored by earlier ``--profile`` runs.
+
+    Returns:
+        dict: ``runs``, ``failures`` (error-severity) and ``seconds`` per
+        configured check, keyed by check name and index; empty if there are
+        none or the file is unreadable.
+
+    """
+    try:
+        stored = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(stored, dict) or stored.get("v") != _CHECK_STATS_FORMAT_VERSION:
+        return {}
+    checks = stored.get("checks")
+    return checks if isinstance(checks, dict) else {}
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of ``sorted_values``.
+
+    Returns:
+        float: The value below which ``fraction`` of the values fall.
+
+    """
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Profiler:
+    """Collects phase and per-check timings for one run."""
+
+    def __init__(self) -> None:
+        """Start with no timings recorded."""
+        self.phases: dict[str, float] = {}
+        self.durations: dict[str, list[float]] = {}
+        self.runs: dict[str, int] = {}
+        self.failures: dict[str, int] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the wall time spent in the ``with`` block to phase ``name``.
+
+        Yields:
+            None
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def record_results(self, results: list[dict[str, Any]]) -> None:
+        """Move the durations ``Executor`` attached to ``results`` into the profile.
+
+        Durations are grouped by check name and index, i.e. per configured
+        check. A batch check's duration counts as one call. Check runs and
+        error-severity failures are counted per configured check too, for
+        ``save_check_stats``.
+
+        """
+        for r in results:
+            key = check_key(r["check_run_id"])
+            self.runs[key] = self.runs.get(key, 0) + 1
+            if (
+                r["outcome"] == CheckOutcome.FAILED
+                and r["severity"] == CheckSeverity.ERROR
+            ):
+                self.failures[key] = self.failures.get(key, 0) + 1
+            duration = r.pop(DURATION_KEY, None)
+            if duration is not None:
+                self.durations.setdefault(key, []).append(duration)
+
+    def summary(self) -> dict[str, Any]:
+        """Summarise the timings recorded so far.
+
+        Returns:
+            dict: ``phases`` (seconds per phase, in run order) and ``checks`` (per
+            configured check: calls, total, p50, p95 and max seconds), the
+            slowest check first.
+
+        """
+        checks: list[_CheckTimings] = []
+        for key, durations in self.durations.items():
+            ordered = sorted(durations)
+            checks.append(
+                {
+                    "check": key,
+                    "calls": len(ordered),
+                    "total": sum(ordered),
+                    "p50": _percentile(ordered, 0.5),
+                    "p95": _percentile(ordered, 0.95),
+                    "max": ordered[-1],
+                }
+            )
+        checks.sort(key=lambda c: (-c["total"], c["check"]))
+        return {
+            "phases": {p: self.phases[p] for p in _PHASES if p in self.phases},
+            "checks": checks,
+        }
+
+    def print_report(self, top_n: int = 20) -> None:
+        """Print the phase timings and the ``top_n`` slowest checks."""
+        summary = self.summary()
+        console = Console(emoji=False)
+
+        phases = Table(
+            title="[bold cyan]Profile — phases[/bold cyan]",
+            title_justify="left",
+            box=box.ROUNDED,
+            border_style="cyan",
+            header_style="bold cyan",
+        )
+        phases.add_column("Phase", justify="left", style="cyan", no_wrap=True)
+        phases.add_column("Time", justify="right")
+        for name, seconds in summary["phases"].items():
+            phases.add_row(name, f"{seconds:.3f}s")
+        console.print(phases)
+
+        if not summary["checks"]:
+            return
+        checks = Table(
+            title=f"[bold cyan]Profile — slowest {min(top_n, len(summary['checks']))} of {len(summary['checks'])} checks[/bold cyan]",
+            title_justify="left",
+            box=box.ROUNDED,
+            border_style="cyan",
+            header_style="bold cyan",
+        )
+        checks.add_column("Check", justify="left", style="cyan", overflow="ellipsis")
+        for column in ("Calls", "Total", "p50", "p95", "Max"):
+            checks.add_column(column, justify="right", no_wrap=True)
+        for c in summary["checks"][:top_n]:
+            checks.add_row(
+                escape(c["check"]),
+                str(c["calls"]),
+                f"{c['total'] * 1e3:.1f}ms",
+                f"{c['p50'] * 1e3:.2f}ms",
+                f"{c['p95'] * 1e3:.2f}ms",
+                f"{c['max'] * 1e3:.2f}ms",
+            )
+        console.print(checks)
+
+    def write(self, path: Path) -> None:
+        """Write the summary to ``path`` as JSON."""
+        path.write_bytes(orjson.dumps(self.summary(), option=orjson.OPT_INDENT_2))
+
+    def save_check_stats(self, path: Path) -> None:
+        """Fold this run's check costs and failure rates into those stored at ``path``.
+
+        ``--max-failures`` runs read them back to run the checks most likely
+        to fail quickly first. Earlier runs count for ``_CHECK_STATS_DECAY``
+        of their weight, so the statistics follow the project as it changes.
+        Failing to write the file is logged, not raised.
+
+        """
+        stats = load_check_stats(path)
+        for key, runs in self.runs.items():
+            old = stats.get(key, {})
+            stats[key] = {
+                "runs": old.get("runs", 0) * _CHECK_STATS_DECAY + runs,
+                "failures": old.get("failures", 0) * _CHECK_STATS_DECAY
+                + self.failures.get(key, 0),
+                "seconds": old.get("seconds", 0) * _CHECK_STATS_DECAY
+                + sum(self.durations.get(key, ())),
+            }
+        from dbt_bouncer.utils import write_atomic
+
+        try:
+            write_atomic(
+                path, orjson.dumps({"v": _CHECK_STATS_FORMAT_VERSION, "checks": stats})
+            )
+        except OSError:
+            logging.debug("Check statistics write failed.", exc_info=True)
+
+
+def profile_phase(profiler: Profiler | None, name: str) -> AbstractContextManager[None]:
+    """Time phase ``name`` on ``profiler``, if profiling.
+
+    Returns:
+        AbstractContextManager: ``profiler.phase(name)``, or a no-op context
+        when ``profiler`` is ``None``.
+
+    """
+    return profiler.phase(name) if profiler is not None else contextlib.nullcontext()
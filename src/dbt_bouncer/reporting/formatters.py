@@ -207,7 +207,177 @@ def _format_tap(results: list[dict[str, Any]]) -> bytes:
     for i, r in enumerate(results, 1):
         status = "ok" if r["outcome"] != CheckOutcome.FAILED else "not ok"
         lines.append(f"{status} {i} - {r['check_run_id']}")
-        if r["outcome"] == CheckOutcome.FAILED and r.get("failure_message"):
-            for msg_line in r["failure_message"].splitlines():
+        if r["outcome"] == CheckOutcome.FAILED:
+            # A TAP 13 YAML block, so that `dbt-bouncer merge` can tell warnings
+            # from errors.
+            severity = r.get("severity", CheckSeverity.ERROR)
+            lines.extend(["  ---", f"  severity: {severity}", "  ..."])
+            for msg_line in (r.get("failure_message") or "").splitlines():
                 lines.append(f"  # {msg_line}")
     return "\n".join(lines).encode()
+
+
+def parse_results(content: bytes, output_format: str) -> list[dict[str, Any]]:
+    """Read check results back from a file written by ``_format_results``.
+
+    Only what the format records is recovered: JUnit files have no
+    ``unique_id``, TAP files have neither a ``file_path`` nor a ``unique_id``,
+    passing results read from JUnit, SARIF and TAP files get an ``error``
+    severity, and XML parsers read line breaks in JUnit failure messages as
+    spaces. Serialising the results in the same format again gives back the
+    same content, bar those line breaks.
+
+    Args:
+        content: The file's content.
+        output_format: One of "csv", "json", "junit", "sarif", or "tap".
+
+    Returns:
+        list[dict]: The check results, in file order.
+
+    Raises:
+        ValueError: If output_format is not recognised or ``content`` is not a
+            file of that format.
+
+    """
+    match output_format:
+        case "csv":
+            parsed = _parse_csv(content)
+        case "json":
+            parsed = orjson.loads(content)
+            if not isinstance(parsed, list):
+                msg = "Expected a JSON list of check results."
+                raise ValueError(msg)
+        case "junit":
+            parsed = _parse_junit(content)
+        case "sarif":
+            parsed = _parse_sarif(content)
+        case "tap":
+            parsed = _parse_tap(content)
+        case _:
+            msg = f"Unknown output format: {output_format}"
+            raise ValueError(msg)
+    try:
+        return [
+            {
+                "check_run_id": r["check_run_id"],
+                "failure_message": r.get("failure_message") or None,
+                "file_path": r.get("file_path") or None,
+                "outcome": CheckOutcome(r["outcome"]),
+                "severity": CheckSeverity(r.get("severity") or CheckSeverity.ERROR),
+                "unique_id": r.get("unique_id") or None,
+            }
+            for r in parsed
+        ]
+    except (KeyError, TypeError) as e:
+        msg = f"Not a {output_format} file of check results: missing {e}."
+        raise ValueError(msg) from e
+
+
+def _parse_csv(content: bytes) -> list[dict[str, Any]]:
+    """Read check results from a CSV document written by ``_format_csv``.
+
+    Returns:
+        list[dict]: Check results; empty cells are read as ``None``.
+
+    """
+    return list(csv.DictReader(io.StringIO(content.decode())))
+
+
+def _parse_junit(content: bytes) -> list[dict[str, Any]]:
+    """Read check results from a JUnit XML document written by ``_format_junit``.
+
+    Returns:
+        list[dict]: Check results, without ``unique_id``.
+
+    """
+    from junitparser import Failure, JUnitXml, TestSuite
+
+    xml = JUnitXml.fromstring(content)
+    suites = [xml] if isinstance(xml, TestSuite) else list(xml)
+    test_case_cls = _junit_test_case_cls()
+    results = []
+    for suite in suites:
+        for tc in suite.iterchildren(test_case_cls):
+            failure = next((r for r in tc.result if isinstance(r, Failure)), None)
+            results.append(
+                {
+                    "check_run_id": tc.name,
+                    "failure_message": failure.message if failure else None,
+                    "file_path": tc.file,
+                    "outcome": CheckOutcome.FAILED if failure else CheckOutcome.SUCCESS,
+                    "severity": failure.type if failure else None,
+                }
+            )
+    return results
+
+
+def _parse_sarif(content: bytes) -> list[dict[str, Any]]:
+    """Read check results from a SARIF document written by ``_format_sarif``.
+
+    Returns:
+        list[dict]: Check results.
+
+    """
+    results = []
+    for run in orjson.loads(content)["runs"]:
+        for entry in run["results"]:
+            failed = entry["level"] != "none"
+            locations = entry.get("locations") or [{}]
+            logical_locations = entry.get("logicalLocations") or [{}]
+            results.append(
+                {
+                    "check_run_id": entry["ruleId"],
+                    "failure_message": entry["message"]["text"] if failed else None,
+                    "file_path": locations[0]
+                    .get("physicalLocation", {})
+                    .get("artifactLocation", {})
+                    .get("uri"),
+                    "outcome": CheckOutcome.FAILED if failed else CheckOutcome.SUCCESS,
+                    "severity": CheckSeverity.WARN
+                    if entry["level"] == "warning"
+                    else CheckSeverity.ERROR,
+                    "unique_id": logical_locations[0].get("fullyQualifiedName"),
+                }
+            )
+    return results
+
+
+def _parse_tap(content: bytes) -> list[dict[str, Any]]:
+    """Read check results from a TAP document written by ``_format_tap``.
+
+    Returns:
+        list[dict]: Check results, without ``file_path`` or ``unique_id``.
+
+    Raises:
+        ValueError: If a line is neither a test point nor one of its details.
+
+    """
+    results: list[dict[str, Any]] = []
+    for line in content.decode().splitlines():
+        status, _, rest = line.partition(" ")
+        if line.startswith(("ok ", "not ok ")):
+            failed = status == "not"
+            if failed:
+                rest = rest.removeprefix("ok ")
+            _, _, check_run_id = rest.partition(" - ")
+            results.append(
+                {
+                    "check_run_id": check_run_id,
+                    "failure_message": None,
+                    "outcome": CheckOutcome.FAILED if failed else CheckOutcome.SUCCESS,
+                }
+            )
+        elif line.startswith("  severity: ") and results:
+            results[-1]["severity"] = line.removeprefix("  severity: ")
+        elif line.startswith("  # ") and results:
+            message = results[-1]["failure_message"]
+            msg_line = line.removeprefix("  # ")
+            results[-1]["failure_message"] = (
+                msg_line if message is None else f"{message}\n{msg_line}"
+            )
+        elif not (
+            line.startswith(("TAP version", "1..")) or line in {"  ---", "  ..."}
+        ):
+            msg = f"Unexpected line in TAP file: {line!r}"
+            raise ValueError(msg)
+    return results
@@ -79,7 +79,8 @@ class Reporter:
                 iter(iterate_cache.get(c["check"].__class__, {"(none)"})),
                 "(none)",
             )
-            counts[check_name, resource_type] += 1
+            # A batch check's single entry covers every resource it matched.
+            counts[check_name, resource_type] += len(c["batch"]) if "batch" in c else 1
 
         console = Console(emoji=False)
         table = Table(
@@ -98,7 +99,7 @@ class Reporter:
         console.print(table)
         console.print(
             Panel(
-                f"[bold cyan]Dry run complete. {len(checks_to_run)} check(s) would run.[/bold cyan]",
+                f"[bold cyan]Dry run complete. {counts.total()} check(s) would run.[/bold cyan]",
                 border_style="cyan",
             )
         )
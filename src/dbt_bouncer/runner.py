@@ -1,17 +1,17 @@
 """Assemble and run all checks."""
 
+import logging
 import operator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
 
-from dbt_bouncer.executor import Executor
+from dbt_bouncer.check_framework.base import unwrap_resource
+from dbt_bouncer.executor import Executor, schedule_checks, shard_checks
+from dbt_bouncer.profiling import profile_phase
 from dbt_bouncer.reporting.reporter import Reporter
-from dbt_bouncer.utils import (
-    clean_path_str,
-    get_nested_value,
-    object_excluded_by_path,
-    object_in_path,
-)
+from dbt_bouncer.sql_utils import SQL_FACTS_CHECKS, prepare_sql_facts, save_sql_facts
+from dbt_bouncer.tracing import annotate, span
+from dbt_bouncer.utils import PathPatternIndex, clean_path_str, get_nested_value
 
 if TYPE_CHECKING:
     from dbt_bouncer.context import BouncerContext
@@ -40,6 +40,24 @@ class _ResourceFacts:
     cleaned_path: str
 
 
+def _iterate_over(cls: type) -> frozenset[str]:
+    """Return the resource type ``cls`` iterates over, memoised per class.
+
+    Returns:
+        frozenset[str]: The resource type, or an empty set for context-only
+        checks.
+
+    """
+    cached = _CLASS_ITERATE_CACHE.get(cls)
+    if cached is None:
+        # Set by the @check decorator; None for context-only checks.
+        explicit = getattr(cls, "iterate_over", None)
+        cached = _CLASS_ITERATE_CACHE[cls] = (
+            frozenset({explicit}) if explicit is not None else frozenset()
+        )
+    return cached
+
+
 def _pattern_key(pattern: str | list[str] | None) -> Any:
     """Return a hashable cache key for an include/exclude pattern.
 
@@ -111,10 +129,19 @@ class CheckToRun(TypedDict):
 
     ``check`` is a shared check-config instance; ``resource`` and ``iterate_value``
     tell the executor which resource to bind onto it immediately before calling
-    ``execute()``. Because checks run sequentially, one instance can serve all of
-    its resources in turn — no per-resource copy is needed.
+    ``execute()``. Because a thread executes one check at a time, one instance can
+    serve all of its resources in turn — no per-resource copy is needed. When
+    several threads execute checks at once (free-threaded Python builds), each
+    binds onto a copy of the instance of its own, made the first time it needs
+    one.
+
+    A batch check (``@check(batch=True)``) gets a single entry for all of its
+    resources instead: ``batch`` holds the facts of every matched resource, and
+    the executor reports one result per resource, with run IDs
+    ``<check_run_id>:<run_id_suffix>``.
     """
 
+    batch: NotRequired[list["_ResourceFacts"]]
     check: Any
     check_run_id: str
     failure_message: NotRequired[str]
@@ -197,8 +224,17 @@ def _assemble_checks_to_run(ctx: "BouncerContext") -> list[CheckToRun]:
         "unit_tests": ctx.unit_tests,
     }
 
+    from dbt_bouncer.artifact_parsers.graph import graph_from_manifest
     from dbt_bouncer.check_framework.context import CheckContext
 
+    # The manifest's dependency graph, built once for both the lineage checks
+    # and the selectors' graph operators.
+    manifest = getattr(ctx.manifest_obj, "manifest", None)
+    graph = None
+    if manifest is not None:
+        with span("dependency_graph"):
+            graph = graph_from_manifest(manifest)
+
     check_ctx = CheckContext(
         catalog_nodes=ctx.catalog_nodes,
         catalog_sources=ctx.catalog_sources,
@@ -217,6 +253,7 @@ def _assemble_checks_to_run(ctx: "BouncerContext") -> list[CheckToRun]:
         tests=ctx.tests_flat,
         tests_by_unique_id=ctx.tests_by_unique_id,
         unit_tests=ctx.unit_tests,
+        dependency_graph=graph,
     )
 
     # Pre-compute unique_id -> meta lookup for catalog_node/catalog_source
@@ -250,46 +287,100 @@ def _assemble_checks_to_run(ctx: "BouncerContext") -> list[CheckToRun]:
     # ``skip_checks`` is a nested meta lookup.
     resources_with_meta: dict[str, list[_ResourceFacts]] = {}
 
+    # With ``--changed-since`` only the changed resources are matched at all;
+    # context-only checks are unaffected and still see the whole project.
+    changed_unique_ids = ctx.changed_unique_ids
+
     def _resources_for(iterate_value: str) -> list[_ResourceFacts]:
         cached = resources_with_meta.get(iterate_value)
         if cached is not None:
             return cached
-        out: list[_ResourceFacts] = []
-        for resource in resource_map[f"{iterate_value}s"]:
-            d = _get_resource_meta(resource, iterate_value, meta_by_unique_id)
-            file_path = getattr(resource, "original_file_path", None)
-            out.append(
-                _ResourceFacts(
-                    resource=resource,
-                    skip_checks=get_nested_value(d, ["dbt-bouncer", "skip_checks"], []),
-                    run_id_suffix=_run_id_suffix(resource, iterate_value),
-                    file_path=file_path,
-                    unique_id=getattr(resource, "unique_id", None),
-                    cleaned_path=clean_path_str(file_path or ""),
+        with span("resource_facts", resource_type=iterate_value):
+            out: list[_ResourceFacts] = []
+            for resource in resource_map[f"{iterate_value}s"]:
+                if (
+                    changed_unique_ids is not None
+                    and getattr(resource, "unique_id", None) not in changed_unique_ids
+                ):
+                    continue
+                d = _get_resource_meta(resource, iterate_value, meta_by_unique_id)
+                file_path = getattr(resource, "original_file_path", None)
+                out.append(
+                    _ResourceFacts(
+                        resource=resource,
+                        skip_checks=get_nested_value(
+                            d, ["dbt-bouncer", "skip_checks"], []
+                        ),
+                        run_id_suffix=_run_id_suffix(resource, iterate_value),
+                        file_path=file_path,
+                        unique_id=getattr(resource, "unique_id", None),
+                        cleaned_path=clean_path_str(file_path or ""),
+                    )
                 )
-            )
         resources_with_meta[iterate_value] = out
         return out
 
     # Memoised selector resolution. A selector resolves to a static set of
     # unique IDs for the manifest, so checks sharing a selector string reuse
-    # one resolved instance.
+    # one resolved instance, and all selectors share one index of the manifest.
     selectors_by_raw: dict[str, Any] = {}
+    selector_index: Any = None
 
     def _selector_for(raw: str) -> Any:
+        nonlocal selector_index
         cached = selectors_by_raw.get(raw)
         if cached is not None:
             return cached
-        from dbt_bouncer.selectors import Selector
-
-        selector = Selector(raw, ctx.manifest_obj.manifest)
+        from dbt_bouncer.selectors import Selector, SelectorIndex
+
+        if selector_index is None:
+            selector_index = SelectorIndex(ctx.manifest_obj.manifest, graph=graph)
+        with span("selector", selector=raw):
+            selector = Selector(
+                raw,
+                ctx.manifest_obj.manifest,
+                state=ctx.state_manifest,
+                index=selector_index,
+            )
         selectors_by_raw[raw] = selector
         return selector
 
+    # Every include/exclude pattern of the checks iterating over each resource
+    # type, so that one ``PathPatternIndex`` per type answers all of them.
+    patterns_by_iterate_value: dict[str, list[str]] = {}
+    for check in list_of_check_configs:
+        iterate_over_value = _iterate_over(check.__class__)
+        if iterate_over_value:
+            patterns = patterns_by_iterate_value.setdefault(
+                next(iter(iterate_over_value)), []
+            )
+            for pattern in (check.include, check.exclude):
+                if isinstance(pattern, str):
+                    patterns.append(pattern)
+                elif pattern:
+                    patterns.extend(pattern)
+
+    # Per-iterate_value bit mask of the patterns each resource's path matches,
+    # aligned with ``_resources_for``. Every path is matched against all the
+    # patterns of its type in one pass, instead of once per check and pattern.
+    path_masks: dict[str, tuple[PathPatternIndex, list[int]]] = {}
+
+    def _path_masks_for(iterate_value: str) -> tuple[PathPatternIndex, list[int]]:
+        cached = path_masks.get(iterate_value)
+        if cached is not None:
+            return cached
+        with span("path_index", resource_type=iterate_value):
+            index = PathPatternIndex(patterns_by_iterate_value.get(iterate_value, ()))
+            match = index.match
+            masks = [
+                match(facts.cleaned_path) for facts in _resources_for(iterate_value)
+            ]
+        path_masks[iterate_value] = index, masks
+        return index, masks
+
     # Memoised include/exclude/selector filtering. Matching depends only on the
     # check's patterns and the resource, so checks sharing a pattern triple
-    # (very common -- most set none) reuse one filtered list instead of
-    # re-running the regexes per check.
+    # (very common -- most set none) reuse one filtered list.
     path_filtered: dict[tuple[str, Any, Any, Any], list[_ResourceFacts]] = {}
 
     def _path_filtered_for(check: Any, iterate_value: str) -> list[_ResourceFacts]:
@@ -304,38 +395,34 @@ def _assemble_checks_to_run(ctx: "BouncerContext") -> list[CheckToRun]:
         cached = path_filtered.get(key)
         if cached is not None:
             return cached
-        candidates = _resources_for(iterate_value)
-        if include is None and not exclude:
-            # Purely an allocation optimisation, not a correctness guard:
-            # ``object_in_path`` already returns True for a ``None`` include and
-            # ``object_excluded_by_path`` returns False for an absent exclude, so
-            # the comprehension below would produce this same list. Skipping it
-            # avoids copying the list for the common case of a check that filters
-            # on neither.
-            result = candidates
-        else:
-            result = [
-                facts
-                for facts in candidates
-                if object_in_path(include, facts.cleaned_path)
-                and not object_excluded_by_path(exclude, facts.cleaned_path)
-            ]
-        if selector_raw:
-            selector = _selector_for(selector_raw)
-            result = [facts for facts in result if selector.matches(facts.unique_id)]
+        with span("path_filter", resource_type=iterate_value):
+            result = _resources_for(iterate_value)
+            # ``include`` of ``None`` or ``[]`` keeps every resource, as in
+            # ``object_in_path``; a check filtering on neither keeps the shared
+            # list rather than copying it.
+            if include or exclude:
+                index, masks = _path_masks_for(iterate_value)
+                include_bits = index.mask(include)
+                exclude_bits = index.mask(exclude)
+                result = [
+                    facts
+                    for facts, mask in zip(result, masks, strict=True)
+                    if (not include_bits or mask & include_bits)
+                    and not mask & exclude_bits
+                ]
+            if selector_raw:
+                # Selector membership is a set lookup per resource.
+                selector = _selector_for(selector_raw)
+                result = [
+                    facts for facts in result if selector.matches(facts.unique_id)
+                ]
         path_filtered[key] = result
         return result
 
     checks_to_run: list[CheckToRun] = []
     for check in sorted(list_of_check_configs, key=operator.attrgetter("index")):
         cls = check.__class__
-        if cls not in _CLASS_ITERATE_CACHE:
-            # Set by the @check decorator; None for context-only checks.
-            explicit = getattr(cls, "iterate_over", None)
-            _CLASS_ITERATE_CACHE[cls] = (
-                frozenset({explicit}) if explicit is not None else frozenset()
-            )
-        iterate_over_value = _CLASS_ITERATE_CACHE[cls]
+        iterate_over_value = _iterate_over(cls)
         if iterate_over_value:
             iterate_value = next(iter(iterate_over_value))
             # The context is identical for every resource, so set it once on the
@@ -348,15 +435,35 @@ def _assemble_checks_to_run(ctx: "BouncerContext") -> list[CheckToRun]:
             materialization = (
                 check.materialization if iterate_value == "model" else None
             )
+            if cls.batch:
+                matched = [
+                    facts
+                    for facts in _path_filtered_for(check, iterate_value)
+                    if _check_applies_to_resource(
+                        check_name, check_code, materialization, facts
+                    )
+                ]
+                if matched:
+                    checks_to_run.append(
+                        {
+                            "batch": matched,
+                            "check": check,
+                            "check_run_id": f"{check_name}:{check.index}",
+                            "iterate_value": iterate_value,
+                            "severity": severity,
+                        },
+                    )
+                continue
             for facts in _path_filtered_for(check, iterate_value):
                 if not _check_applies_to_resource(
                     check_name, check_code, materialization, facts
                 ):
                     continue
                 # No per-resource copy: the executor binds ``resource`` onto the
-                # shared ``check`` instance immediately before calling execute().
-                # Checks run sequentially, so reusing one instance across all of
-                # its resources is safe (and avoids ~17k+ model_copy calls).
+                # ``check`` instance immediately before calling execute(). A
+                # thread executes one check at a time, so reusing one instance
+                # (per thread) across all of its resources is safe and avoids
+                # ~17k+ model_copy calls.
                 checks_to_run.append(
                     {
                         "check": check,
@@ -384,6 +491,25 @@ def _assemble_checks_to_run(ctx: "BouncerContext") -> list[CheckToRun]:
     return checks_to_run
 
 
+def _sql_to_analyse(checks_to_run: list[CheckToRun]) -> list[str]:
+    """Collect the SQL that the checks in ``checks_to_run`` will analyse.
+
+    Returns:
+        list[str]: The ``raw_code`` of each SQL model a check in
+        ``SQL_FACTS_CHECKS`` runs against, duplicates included.
+
+    """
+    raw_codes = []
+    for c in checks_to_run:
+        resource = c.get("resource")
+        if resource is None or c["check"].name not in SQL_FACTS_CHECKS:
+            continue
+        model = unwrap_resource(resource, "model")
+        if (getattr(model, "language", None) or "sql") == "sql":
+            raw_codes.append(model.raw_code or "")
+    return raw_codes
+
+
 def runner(
     ctx: "BouncerContext",
 ) -> tuple[int, list[Any]]:
@@ -393,7 +519,24 @@ def runner(
         tuple[int, list[Any]]: A tuple containing the exit code and a list of failed checks.
 
     """
-    checks_to_run = _assemble_checks_to_run(ctx)
+    with profile_phase(ctx.profiler, "assembly"), span("assembly"):
+        checks_to_run = _assemble_checks_to_run(ctx)
+    check_stats: dict[str, dict[str, float]] = {}
+    if ctx.check_stats_file is not None:
+        from dbt_bouncer.profiling import load_check_stats
+
+        check_stats = load_check_stats(ctx.check_stats_file)
+    if ctx.shard is not None:
+        index, count = ctx.shard
+        num_checks = len(checks_to_run)
+        checks_to_run = shard_checks(checks_to_run, index, count, check_stats)
+        logging.info(
+            f"Running shard {index}/{count}: {len(checks_to_run)} of {num_checks} checks."
+        )
+    if ctx.max_failures is not None:
+        # Run the checks that fail most per second of run time first, so the
+        # run reaches `--max-failures` as soon as it can.
+        checks_to_run = schedule_checks(checks_to_run, check_stats)
 
     del (
         ctx.models,
@@ -417,7 +560,31 @@ def runner(
             checks_to_run, iterate_cache=_CLASS_ITERATE_CACHE
         )
 
-    executor = Executor()
-    results = executor.run(checks_to_run)
+    executor = Executor(
+        jobs=ctx.jobs, profiler=ctx.profiler, max_failures=ctx.max_failures
+    )
+
+    def execute(checks: list[CheckToRun]) -> list[dict[str, Any]]:
+        # Parsing SQL is the CPU-heavy part of a run: with `--jobs`, do it up
+        # front across processes, whether or not the checks run in parallel.
+        with span("sql_analysis"):
+            derived = prepare_sql_facts(_sql_to_analyse(checks), workers=ctx.jobs)
+            annotate(models=derived)
+        return executor.run(checks)
+
+    with profile_phase(ctx.profiler, "execute"), span("execute"):
+        if ctx.incremental_cache_file is None:
+            results = execute(checks_to_run)
+        else:
+            from dbt_bouncer.incremental import run_incremental
+
+            results = run_incremental(
+                checks_to_run,
+                manifest=getattr(ctx.manifest_obj, "manifest", None),
+                cache_file=ctx.incremental_cache_file,
+                execute=execute,
+            )
+    save_sql_facts()
 
-    return reporter.report_results(results)
+    with profile_phase(ctx.profiler, "report"), span("report"):
+        return reporter.report_results(results)
@@ -12,6 +12,10 @@ node selection:
   the value. List config values (e.g. ``config.tags``) use a membership
   test, and boolean values match case-insensitively.
 - ``package:my_package`` — resources from a package.
+- ``state:new`` — resources absent from the baseline manifest passed with
+  ``--state``; ``state:modified`` — those plus resources whose entry changed
+  (for nodes: their ``checksum`` or ``config``). Graph operators apply as
+  usual, e.g. ``state:modified+``.
 - ``stg_customers`` / ``stg_*`` — glob match on the resource name.
 - ``+orders`` — ``orders`` plus all its ancestors; ``orders+`` — plus all
   its descendants; ``+orders+`` — both. Graph operators can wrap any
@@ -24,22 +28,40 @@ node selection:
 - Space-separated atoms are a union (OR); comma-separated atoms are an
   intersection (AND). Same semantics as dbt.
 
-Not supported (use dbt itself for these): the ``state:``, ``result:``, and
-``test_type:`` methods, and YAML-defined named selectors.
+Not supported (use dbt itself for these): the ``result:`` and ``test_type:``
+methods, ``state:`` methods other than ``new`` and ``modified``, and
+YAML-defined named selectors.
 """
 
 from __future__ import annotations
 
+import bisect
+import os
 import re
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
 from typing import TYPE_CHECKING, Any
 
 from dbt_bouncer.exceptions import DbtBouncerConfigError
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from collections.abc import Set as AbstractSet
 
-_VALID_METHODS = ("fqn", "name", "package", "path", "tag")
+    from dbt_bouncer.artifact_parsers.graph import DependencyGraph
+
+_VALID_METHODS = ("fqn", "name", "package", "path", "state", "tag")
+
+_VALID_STATES = ("modified", "new")
+
+# Characters that make a ``name``/``fqn``/``path`` value a glob pattern.
+_GLOB_CHARS = "*?["
+
+# Entry keys that change on every parse without the resource having changed.
+# Only consulted for resources without a ``checksum``.
+_STATE_VOLATILE_KEYS = frozenset({"created_at"})
+
+# Stands in for a field the baseline entry lacks, so it differs from any value.
+_MISSING = object()
 
 # A leading ``+`` graph operator, optionally prefixed with a hop count
 # (``2+orders``). An empty count means an unbounded walk.
@@ -51,7 +73,7 @@ _DESCENDANT_OP = re.compile(r"\+(\d*)$")
 # Manifest collections that participate in selection, i.e. every collection
 # whose members carry a ``unique_id`` that can appear in ``parent_map``/
 # ``child_map`` or be iterated by a check.
-_MANIFEST_COLLECTIONS = (
+MANIFEST_COLLECTIONS = (
     "exposures",
     "macros",
     "nodes",
@@ -126,22 +148,37 @@ class SelectorAtom:
                 raise DbtBouncerConfigError(
                     f"Invalid selector atom: '{raw}'. Supported methods: {', '.join(_VALID_METHODS)}."
                 )
+            elif method == "state" and value not in _VALID_STATES:
+                raise DbtBouncerConfigError(
+                    f"Invalid selector atom: '{raw}'. Supported states: {', '.join(_VALID_STATES)}."
+                )
             else:
                 self.method, self.value = method, value
         else:
             self.method, self.value = "name", core
 
-    def matches_node(self, unique_id: str, node: Any) -> bool:
+    def matches_node(
+        self, unique_id: str, node: Any, baseline: dict[str, Any] | None = None
+    ) -> bool:
         """Whether a manifest resource matches this atom, ignoring graph operators.
 
         Args:
             unique_id: The resource's unique ID.
             node: The manifest resource object.
+            baseline: Every resource of the baseline manifest keyed by unique
+                ID; only consulted by ``state:`` atoms.
 
         Returns:
             bool: True when the resource matches.
 
         """
+        if self.method == "state":
+            if baseline is None:
+                return False
+            previous = baseline.get(unique_id)
+            if previous is None:
+                return True
+            return self.value == "modified" and _state_modified(node, previous)
         if self.method == "name":
             # Fall back to the last unique-ID segment for resources whose
             # manifest entry carries no ``name`` attribute (e.g. proxy objects
@@ -179,6 +216,57 @@ class SelectorAtom:
         return fnmatch(".".join(str(part) for part in fqn), self.value)
 
 
+def _state_modified(node: Any, previous: Any) -> bool:
+    """Whether a resource changed since the baseline manifest.
+
+    Nodes carrying a ``checksum`` are compared on it and on their config, as
+    dbt's ``state:modified`` does for file contents and configs. Like dbt, the
+    config is compared as written (``unrendered_config``) when both manifests
+    have it, so values rendered per environment, such as a target schema, do
+    not count as changes; otherwise the rendered ``config``. Other resources
+    (sources, exposures, macros...) are compared on every field of their current
+    entry: with ``--low-memory``, entries from other packages only carry a few
+    fields, and the baseline's other fields must not count as changes.
+
+    Args:
+        node: The resource in the current manifest.
+        previous: The same resource in the baseline manifest.
+
+    Returns:
+        bool: True when the resource changed.
+
+    """
+    checksum = getattr(node, "checksum", None)
+    if checksum is not None:
+        if checksum != getattr(previous, "checksum", None):
+            return True
+        unrendered = getattr(node, "unrendered_config", None)
+        previous_unrendered = getattr(previous, "unrendered_config", None)
+        if unrendered is not None and previous_unrendered is not None:
+            return unrendered != previous_unrendered
+        return getattr(node, "config", None) != getattr(previous, "config", None)
+    baseline = _state_entry(previous)
+    return any(
+        baseline.get(key, _MISSING) != value
+        for key, value in _state_entry(node).items()
+    )
+
+
+def _state_entry(node: Any) -> dict[str, Any]:
+    """Return the fields of a resource that ``state:modified`` compares.
+
+    Returns:
+        dict[str, Any]: Every field except the volatile ones.
+
+    """
+    fields = node if isinstance(node, dict) else vars(node)
+    return {
+        key: value
+        for key, value in dict.items(fields)
+        if key not in _STATE_VOLATILE_KEYS
+    }
+
+
 def parse_selector(raw: str) -> list[list[SelectorAtom]]:
     """Parse a selector string into a union of intersections of atoms.
 
@@ -227,44 +315,276 @@ def validate_selector_field(value: str | None) -> str | None:
     return value
 
 
+class _KeyIndex:
+    """Unique IDs keyed by one string property, for exact, prefix and glob lookups."""
+
+    __slots__ = ("_folded", "_folded_keys", "_keys", "ids")
+
+    def __init__(self) -> None:
+        """Start empty; sorted views are built on first use."""
+        self.ids: dict[str, set[str]] = {}
+        self._keys: list[str] | None = None
+        self._folded: dict[str, set[str]] | None = None
+        self._folded_keys: list[str] | None = None
+
+    def add(self, key: str, unique_id: str) -> None:
+        """Index ``unique_id`` under ``key``."""
+        self.ids.setdefault(key, set()).add(unique_id)
+
+    def with_prefix(self, prefix: str) -> Iterator[tuple[str, set[str]]]:
+        """Yield the ``(key, unique IDs)`` pairs whose key starts with ``prefix``.
+
+        Yields:
+            tuple[str, set[str]]: A key and the unique IDs indexed under it.
+
+        """
+        if self._keys is None:
+            self._keys = sorted(self.ids)
+        for i in range(bisect.bisect_left(self._keys, prefix), len(self._keys)):
+            key = self._keys[i]
+            if not key.startswith(prefix):
+                break
+            yield key, self.ids[key]
+
+    def glob(self, pattern: str) -> set[str]:
+        """Return the unique IDs whose key ``fnmatch``-es ``pattern``.
+
+        Only the keys sharing the pattern's literal prefix are tested against
+        it, found by bisecting the sorted keys.
+
+        Returns:
+            set[str]: The matching unique IDs.
+
+        """
+        if self._folded is None:
+            # ``fnmatch`` compares ``os.path.normcase``-d names and patterns.
+            self._folded = {}
+            for key, ids in self.ids.items():
+                self._folded.setdefault(os.path.normcase(key), set()).update(ids)
+            self._folded_keys = sorted(self._folded)
+        pattern = os.path.normcase(pattern)
+        first_glob = min(
+            (i for i in map(pattern.find, _GLOB_CHARS) if i >= 0), default=None
+        )
+        if first_glob is None:
+            return set(self._folded.get(pattern, ()))
+        prefix = pattern[:first_glob]
+        regex = re.compile(translate(pattern))
+        keys = self._folded_keys or []
+        matched: set[str] = set()
+        for i in range(bisect.bisect_left(keys, prefix), len(keys)):
+            key = keys[i]
+            if not key.startswith(prefix):
+                break
+            if regex.match(key):
+                matched |= self._folded[key]
+        return matched
+
+
+class SelectorIndex:
+    """Lookup tables over one manifest's resources, shared by its selectors.
+
+    Each table (by tag, package, ``config`` key, path, name and fqn) is built
+    on the first atom that needs it, and each atom is resolved once, so that
+    many selectors cost one pass over the manifest per method used instead of
+    one per atom. ``state:`` atoms compare against the baseline manifest and
+    still test every resource.
+    """
+
+    def __init__(self, manifest: Any, graph: DependencyGraph | None = None) -> None:
+        """Index the selectable resources of ``manifest``.
+
+        Args:
+            manifest: The parsed ``manifest.json`` object.
+            graph: The manifest's dependency graph, if already built, e.g. for
+                the checks' ``CheckContext``.
+
+        """
+        self.manifest = manifest
+        self.resources = list(Selector._iter_manifest_resources(manifest))
+        self._tables: dict[str, Any] = {}
+        self._resolved: dict[tuple[str, str | None, str], frozenset[str]] = {}
+        self._graph = graph
+
+    @property
+    def graph(self) -> DependencyGraph:
+        """The manifest's dependency graph, built on first use by a graph operator if not given.
+
+        Returns:
+            DependencyGraph: The graph of ``parent_map``.
+
+        """
+        if self._graph is None:
+            from dbt_bouncer.artifact_parsers.graph import graph_from_manifest
+
+            self._graph = graph_from_manifest(self.manifest)
+        return self._graph
+
+    def _table(self, method: str, config_key: str | None = None) -> Any:
+        """Return the lookup table for ``method``, building it on first use.
+
+        Returns:
+            Any: A ``_KeyIndex``, or for ``config`` a pair of dicts mapping the
+            value to unique IDs: as written, and lower-cased for booleans.
+
+        """
+        table_key = f"config.{config_key}" if method == "config" else method
+        table = self._tables.get(table_key)
+        if table is not None:
+            return table
+        if method == "config":
+            table = ({}, {})
+            for uid, node in self.resources:
+                actual = getattr(getattr(node, "config", None), str(config_key), None)
+                if actual is None:
+                    continue
+                if isinstance(actual, bool):
+                    table[1].setdefault(str(actual).lower(), set()).add(uid)
+                elif isinstance(actual, (list, tuple, set)):
+                    for item in actual:
+                        table[0].setdefault(str(item), set()).add(uid)
+                else:
+                    table[0].setdefault(str(actual), set()).add(uid)
+        else:
+            table = _KeyIndex()
+            for uid, node in self.resources:
+                for key in _index_keys(method, uid, node):
+                    table.add(key, uid)
+        self._tables[table_key] = table
+        return table
+
+    def resolve(
+        self, atom: SelectorAtom, baseline: dict[str, Any] | None = None
+    ) -> frozenset[str]:
+        """Return the unique IDs matching ``atom``, ignoring graph operators.
+
+        Args:
+            atom: The selector atom.
+            baseline: Every resource of the baseline manifest keyed by unique
+                ID; only consulted by ``state:`` atoms.
+
+        Returns:
+            frozenset[str]: The same IDs as ``atom.matches_node`` selects.
+
+        """
+        if atom.method == "state":
+            return frozenset(
+                uid
+                for uid, node in self.resources
+                if atom.matches_node(uid, node, baseline)
+            )
+        cache_key = (atom.method, atom.config_key, atom.value)
+        resolved = self._resolved.get(cache_key)
+        if resolved is not None:
+            return resolved
+        value = atom.value
+        table = self._table(atom.method, atom.config_key)
+        if atom.method == "config":
+            resolved = frozenset(
+                table[0].get(value, set()) | table[1].get(value.lower(), set())
+            )
+        elif atom.method in ("tag", "package"):
+            resolved = frozenset(table.ids.get(value, ()))
+        elif atom.method == "path":
+            value = value.rstrip("/")
+            if any(c in value for c in _GLOB_CHARS):
+                resolved = frozenset(table.glob(value) | table.glob(f"{value}/*"))
+            else:
+                resolved = frozenset(
+                    uid
+                    for path, ids in table.with_prefix(value)
+                    if path == value or path.startswith(f"{value}/")
+                    for uid in ids
+                )
+        else:
+            # ``name`` and ``fqn``
+            resolved = frozenset(table.glob(value))
+        self._resolved[cache_key] = resolved
+        return resolved
+
+
+def _index_keys(method: str, unique_id: str, node: Any) -> list[str]:
+    """Return the keys ``node`` is indexed under for ``method``.
+
+    Mirrors the property each method reads in ``SelectorAtom.matches_node``.
+
+    Returns:
+        list[str]: The keys; empty when the resource lacks the property.
+
+    """
+    if method == "name":
+        return [str(getattr(node, "name", None) or unique_id.split(".")[-1])]
+    if method == "tag":
+        return [str(t) for t in getattr(node, "tags", None) or []]
+    if method == "package":
+        return [str(getattr(node, "package_name", ""))]
+    if method == "path":
+        return [str(getattr(node, "original_file_path", "")).replace("\\", "/")]
+    # method == "fqn"
+    fqn = getattr(node, "fqn", None)
+    return [".".join(str(part) for part in fqn)] if fqn else []
+
+
 class Selector:
     """A parsed selector resolved against one manifest.
 
-    Resolution happens once, up front: each atom is evaluated against every
-    selectable manifest resource, graph operators expand the result over
-    ``parent_map``/``child_map``, and the union/intersection structure
+    Resolution happens once, up front: each atom is looked up in a
+    ``SelectorIndex`` of the manifest, graph operators expand the result over
+    its ``DependencyGraph``, and the union/intersection structure
     reduces the atom sets to a single set of unique IDs.
     """
 
-    def __init__(self, raw: str, manifest: Any) -> None:
+    def __init__(
+        self,
+        raw: str,
+        manifest: Any,
+        state: Any = None,
+        index: SelectorIndex | None = None,
+    ) -> None:
         """Parse ``raw`` and resolve it against ``manifest``.
 
         Args:
             raw: The selector string.
             manifest: The parsed ``manifest.json`` object (must expose the
                 resource collections plus ``parent_map``/``child_map``).
+            state: The baseline manifest ``state:`` atoms compare against, as
+                passed with ``--state``.
+            index: An index of ``manifest`` shared with other selectors;
+                one is built for this selector if omitted.
+
+        Raises:
+            DbtBouncerConfigError: If the selector uses a ``state:`` atom and no
+                baseline manifest was given.
 
         """
         self.raw = raw
         groups = parse_selector(raw)
 
-        resources = list(self._iter_manifest_resources(manifest))
-        parent_map = getattr(manifest, "parent_map", None) or {}
-        child_map = getattr(manifest, "child_map", None) or {}
+        baseline: dict[str, Any] | None = None
+        if any(atom.method == "state" for group in groups for atom in group):
+            if state is None:
+                raise DbtBouncerConfigError(
+                    f"Selector '{raw}' uses the `state:` method, which needs a "
+                    "baseline manifest passed with `--state`."
+                )
+            baseline = dict(self._iter_manifest_resources(state))
+
+        if index is None:
+            index = SelectorIndex(manifest)
 
         selected: set[str] = set()
         for group in groups:
-            group_ids: set[str] | None = None
+            group_ids: AbstractSet[str] | None = None
             for atom in group:
-                atom_ids = {
-                    uid for uid, node in resources if atom.matches_node(uid, node)
-                }
+                atom_ids: AbstractSet[str] = index.resolve(atom, baseline)
                 if atom.at:
                     # ``@x`` = x, its descendants, and the ancestors of that
                     # whole set (dbt's "at" operator).
-                    with_descendants = atom_ids | self._closure(atom_ids, child_map)
-                    atom_ids = with_descendants | self._closure(
-                        with_descendants, parent_map
+                    with_descendants = atom_ids | index.graph.closure(
+                        atom_ids, upstream=False
+                    )
+                    atom_ids = with_descendants | index.graph.closure(
+                        with_descendants, upstream=True
                     )
                 else:
                     # Walk both directions from the original matched seed so
@@ -272,12 +592,12 @@ class Selector:
                     # the descendant walk.
                     expanded = set(atom_ids)
                     if atom.ancestors:
-                        expanded |= self._closure(
-                            atom_ids, parent_map, atom.ancestor_degree
+                        expanded |= index.graph.closure(
+                            atom_ids, upstream=True, degree=atom.ancestor_degree
                         )
                     if atom.descendants:
-                        expanded |= self._closure(
-                            atom_ids, child_map, atom.descendant_degree
+                        expanded |= index.graph.closure(
+                            atom_ids, upstream=False, degree=atom.descendant_degree
                         )
                     atom_ids = expanded
                 group_ids = atom_ids if group_ids is None else group_ids & atom_ids
@@ -292,53 +612,13 @@ class Selector:
             tuple[str, Any]: The unique ID and resource object.
 
         """
-        for attr in _MANIFEST_COLLECTIONS:
+        for attr in MANIFEST_COLLECTIONS:
             collection = getattr(manifest, attr, None)
             if collection is None or not hasattr(collection, "items"):
                 continue
             for uid, node in collection.items():
                 yield str(uid), node
 
-    @staticmethod
-    def _closure(
-        seed_ids: set[str], edge_map: Any, degree: int | None = None
-    ) -> set[str]:
-        """Return the transitive closure of ``seed_ids`` over ``edge_map``.
-
-        The walk runs level by level so that ``degree`` can cap it at a fixed
-        number of hops from the seeds.
-
-        Args:
-            seed_ids: The starting unique IDs.
-            edge_map: ``parent_map`` (for ancestors) or ``child_map`` (for
-                descendants).
-            degree: The maximum number of hops to walk, or None for an
-                unbounded walk.
-
-        Returns:
-            set[str]: Every unique ID reached within ``degree`` hops of the
-            seeds, excluding the seeds themselves.
-
-        """
-        reached: set[str] = set()
-        frontier = set(seed_ids)
-        hops = 0
-        while frontier and (degree is None or hops < degree):
-            hops += 1
-            next_frontier: set[str] = set()
-            for uid in frontier:
-                try:
-                    neighbours = edge_map[uid]
-                except (KeyError, TypeError):
-                    continue
-                for neighbour in neighbours or []:
-                    n = str(neighbour)
-                    if n not in reached and n not in seed_ids:
-                        reached.add(n)
-                        next_frontier.add(n)
-            frontier = next_frontier
-        return reached
-
     def matches(self, unique_id: str | None) -> bool:
         """Whether a resource is selected.
 
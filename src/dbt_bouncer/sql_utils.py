@@ -6,18 +6,53 @@ Jinja (``{{ ref(...) }}``, ``{% ... %}``) which is not valid SQL, so
 :func:`neutralize_jinja` replaces those constructs with placeholders before
 parsing. :func:`parse_sql` returns ``None`` when parsing fails, allowing callers
 to fall back to a best-effort approach.
+
+The checks in ``checks.manifest.models.code`` only need a few facts about each
+model's SQL, which :func:`sql_facts` derives and stores on disk under
+``get_cache_dir()``, keyed by a digest of the SQL, the sqlglot version and the
+dialect. A model whose ``raw_code`` is unchanged since an earlier run is then
+never lexed or parsed again.
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import logging
+import multiprocessing
 import re
 from functools import lru_cache
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+import orjson
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
     from jinja2 import Environment
     from sqlglot import exp
 
+_SQL_FACTS_FORMAT_VERSION = 1
+
+# Facts kept on disk: those looked up by the last run, topped up with older
+# ones, so switching between branches does not start from scratch.
+_SQL_FACTS_TO_KEEP = 50_000
+
+# ``prepare_sql_facts`` only forks a worker per this many SQL strings to parse:
+# below that, forking costs more than the parsing it spreads out.
+_SQL_FACTS_PER_WORKER = 100
+
+# Checks in ``checks.manifest.models.code`` that analyse a model's SQL through
+# :func:`sql_facts`, and so benefit from :func:`prepare_sql_facts`.
+SQL_FACTS_CHECKS = frozenset(
+    {
+        "check_model_does_not_use_cartesian_join",
+        "check_model_does_not_use_select_star",
+        "check_model_hard_coded_references",
+    }
+)
+
 # ``JINJA_COMMENT_PATTERN`` stays public so the regex-fallback path in
 # ``checks.manifest.models.code`` can reuse the same definition of a Jinja
 # comment. Jinja in a model's ``raw_code`` is otherwise neutralized structurally
@@ -156,3 +191,400 @@ def parse_sql(
         # catches all parse failures (ParseError, TokenError, ...) while letting
         # genuinely unexpected errors (e.g. MemoryError, RecursionError) surface.
         return None
+
+
+class JoinFacts(NamedTuple):
+    """What the cartesian-join check needs to know about one ``JOIN``."""
+
+    is_cross: bool
+    """Whether it is an explicit ``CROSS JOIN``."""
+    is_constrained: bool
+    """Whether it has an ``ON`` or ``USING`` clause, or is a ``NATURAL JOIN``."""
+    constant_condition: str | None
+    """Its ``ON`` condition rendered back to SQL, if that condition is constant."""
+
+
+class SqlFacts(NamedTuple):
+    """What the SQL-structural checks need to know about a model's SQL."""
+
+    uses_star: bool
+    """Whether any ``SELECT`` projects a bare or qualified star."""
+    hard_coded_tables: tuple[str, ...]
+    """Schema/catalog-qualified table references, in first-seen order."""
+    joins: tuple[JoinFacts, ...]
+    """Every ``JOIN``, in the order sqlglot walks them."""
+
+
+def _constant_join_condition(on_clause: exp.Expression) -> tuple[bool, str]:
+    """Determine whether a join's ``ON`` condition is a constant.
+
+    A constant condition (``ON TRUE``, ``ON 1``, ``ON 1=1``) constrains nothing,
+    so the join produces a Cartesian product. ``on_clause`` is the condition
+    expression itself, so both operands of a comparison must be inspected -
+    looking only at ``on_clause.this`` would treat ``ON 1 = b.id`` as constant
+    while letting the equivalent ``ON b.id = 1`` through.
+
+    Args:
+        on_clause: The expression held in a join's ``on`` argument.
+
+    Returns:
+        tuple[bool, str]: Whether the condition is constant, and the condition
+        rendered back to SQL for use in the failure message.
+
+    """
+    from sqlglot import exp
+
+    cond_str = on_clause.sql()
+
+    # `ON TRUE` / `ON FALSE` parse to exp.Boolean; a bare `ON 1` to exp.Literal.
+    if isinstance(on_clause, (exp.Boolean, exp.Literal)):
+        return True, cond_str
+
+    # `ON 1 = 1` and `ON 'x' = 'x'`: constant only when *both* operands are
+    # literals. `ON NULL` is an exp.Null rather than a literal and matches no
+    # rows, so it is degenerate rather than Cartesian and is not flagged.
+    if isinstance(on_clause, exp.EQ) and isinstance(
+        on_clause.this, (exp.Literal, exp.Boolean)
+    ):
+        return isinstance(on_clause.expression, (exp.Literal, exp.Boolean)), cond_str
+
+    return False, cond_str
+
+
+def _select_uses_star(select: exp.Select) -> bool:
+    """Determine whether a ``SELECT`` projects a star.
+
+    Returns:
+        ``True`` if any top-level projection is a bare (``*``) or qualified
+        (``t.*``) star, ``False`` otherwise.
+
+    """
+    from sqlglot import exp
+
+    for projection in select.expressions:
+        if isinstance(projection, exp.Star):
+            return True
+        if isinstance(projection, exp.Column) and isinstance(projection.this, exp.Star):
+            return True
+    return False
+
+
+def _hard_coded_tables(statements: tuple[exp.Expression, ...]) -> tuple[str, ...]:
+    """Find schema/catalog-qualified table references in parsed SQL.
+
+    Returns:
+        The qualified table references (e.g. ``schema.table``), in first-seen
+        order and de-duplicated.
+
+    """
+    from sqlglot import exp
+
+    seen: set[str] = set()
+    tables: list[str] = []
+    for statement in statements:
+        for table in statement.find_all(exp.Table):
+            if table.args.get("db") or table.args.get("catalog"):
+                rendered = table.sql()
+                if rendered not in seen:
+                    seen.add(rendered)
+                    tables.append(rendered)
+    return tuple(tables)
+
+
+def _join_facts(join: exp.Join) -> JoinFacts:
+    """Summarise one ``JOIN`` for the cartesian-join check.
+
+    Returns:
+        JoinFacts: The join's facts.
+
+    """
+    on_clause = join.args.get("on")
+    # A `NATURAL JOIN` joins on the columns the two relations share, so it
+    # constrains the join despite carrying no `ON`/`USING` clause.
+    is_natural = (join.args.get("method") or "").upper() == "NATURAL"
+    constant_condition = None
+    if on_clause is not None:
+        is_constant, cond_str = _constant_join_condition(on_clause)
+        if is_constant:
+            constant_condition = cond_str
+    return JoinFacts(
+        is_cross=(join.kind or "").upper() == "CROSS",
+        is_constrained=bool(on_clause or join.args.get("using") or is_natural),
+        constant_condition=constant_condition,
+    )
+
+
+def analyse_sql(statements: tuple[exp.Expression, ...]) -> SqlFacts:
+    """Derive the facts the SQL-structural checks need from parsed SQL.
+
+    Returns:
+        SqlFacts: The facts.
+
+    """
+    from sqlglot import exp
+
+    return SqlFacts(
+        uses_star=any(
+            _select_uses_star(select)
+            for statement in statements
+            for select in statement.find_all(exp.Select)
+        ),
+        hard_coded_tables=_hard_coded_tables(statements),
+        joins=tuple(
+            _join_facts(join)
+            for statement in statements
+            for join in statement.find_all(exp.Join)
+        ),
+    )
+
+
+def sql_cache_enabled() -> bool:
+    """Whether SQL facts are read from and written to disk.
+
+    Disabled when the ``DBT_BOUNCER_DISABLE_SQL_CACHE`` env var is set to a
+    truthy value.
+
+    Returns:
+        bool: ``True`` if the on-disk SQL facts should be used.
+
+    """
+    from dbt_bouncer.utils import env_flag
+
+    return not env_flag("DBT_BOUNCER_DISABLE_SQL_CACHE")
+
+
+def sql_facts_path() -> Path:
+    """Return the file storing SQL facts between runs.
+
+    Returns:
+        Path: Location inside the dbt-bouncer cache directory.
+
+    """
+    from dbt_bouncer.utils import get_cache_dir
+
+    return get_cache_dir() / "sql_facts.json"
+
+
+@lru_cache(maxsize=1)
+def _sqlglot_version() -> str:
+    """Return the installed sqlglot version without importing sqlglot.
+
+    Returns:
+        str: The version, or an empty string if it cannot be determined.
+
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("sqlglot")
+    except PackageNotFoundError:
+        return ""
+
+
+def _encode_facts(facts: SqlFacts | None) -> Any:
+    """Return ``facts`` as plain JSON data.
+
+    Returns:
+        Any: ``None`` for SQL that could not be parsed, otherwise a list.
+
+    """
+    if facts is None:
+        return None
+    return [
+        facts.uses_star,
+        list(facts.hard_coded_tables),
+        [list(join) for join in facts.joins],
+    ]
+
+
+def _decode_facts(data: Any) -> SqlFacts | None:
+    """Rebuild the facts ``_encode_facts`` stored.
+
+    Returns:
+        SqlFacts | None: The facts, or ``None`` for unparseable SQL.
+
+    """
+    if data is None:
+        return None
+    uses_star, tables, joins = data
+    return SqlFacts(
+        uses_star=uses_star,
+        hard_coded_tables=tuple(tables),
+        joins=tuple(JoinFacts(*join) for join in joins),
+    )
+
+
+class _SqlFactsStore:
+    """SQL facts read from disk, plus those derived during this process."""
+
+    def __init__(self) -> None:
+        """Start empty; the file is read on the first lookup."""
+        self.loaded = False
+        self.stored: dict[str, Any] = {}
+        self.used: dict[str, Any] = {}
+        self.added = False
+
+    def load(self) -> None:
+        """Read the stored facts, unless the cache is disabled."""
+        self.loaded = True
+        if not sql_cache_enabled():
+            return
+        try:
+            stored = orjson.loads(sql_facts_path().read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return
+        if (
+            isinstance(stored, dict)
+            and stored.get("v") == _SQL_FACTS_FORMAT_VERSION
+            and isinstance(stored.get("facts"), dict)
+        ):
+            self.stored = stored["facts"]
+
+    def save(self) -> None:
+        """Write the facts used by this process, topped up with older ones.
+
+        Does nothing if no facts were derived since the last save. Failing to
+        write the file is logged, not raised.
+
+        """
+        if not self.added or not sql_cache_enabled():
+            return
+        facts = dict(self.used)
+        for key, data in self.stored.items():
+            if len(facts) >= _SQL_FACTS_TO_KEEP:
+                break
+            facts.setdefault(key, data)
+        path = sql_facts_path()
+        from dbt_bouncer.utils import write_atomic
+
+        try:
+            write_atomic(
+                path, orjson.dumps({"v": _SQL_FACTS_FORMAT_VERSION, "facts": facts})
+            )
+        except OSError:
+            logging.debug("SQL facts write failed.", exc_info=True)
+            return
+        self.stored = facts
+        self.added = False
+
+
+_store = _SqlFactsStore()
+
+
+def _facts_key(raw_code: str, dialect: str | None) -> str:
+    """Return the key the facts about ``raw_code`` are stored under.
+
+    Returns:
+        str: A digest of the SQL, the sqlglot version and the dialect.
+
+    """
+    return hashlib.sha256(
+        f"{_sqlglot_version()}\0{dialect or ''}\0{raw_code}".encode()
+    ).hexdigest()[:32]
+
+
+def _derive_facts(raw_code: str, dialect: str | None = None) -> SqlFacts | None:
+    """Neutralize, parse and analyse ``raw_code``.
+
+    Returns:
+        The facts, or ``None`` if sqlglot could not parse the SQL.
+
+    """
+    parsed = parse_sql(neutralize_jinja(raw_code), dialect)
+    return None if parsed is None else analyse_sql(parsed)
+
+
+def _derive_encoded_facts(raw_codes: list[str]) -> list[Any]:
+    """Derive the facts of each of ``raw_codes`` inside a pool worker.
+
+    Returns:
+        list[Any]: The encoded facts, in order.
+
+    """
+    return [_encode_facts(_derive_facts(code)) for code in raw_codes]
+
+
+@lru_cache(maxsize=4096)
+def sql_facts(raw_code: str, dialect: str | None = None) -> SqlFacts | None:
+    """Return the facts the SQL-structural checks need about a model's SQL.
+
+    Facts stored by an earlier run for the same SQL, sqlglot version and
+    dialect, or derived up front by :func:`prepare_sql_facts`, are reused
+    without lexing or parsing anything. Otherwise ``raw_code`` is neutralized
+    and parsed, and the derived facts are kept for :func:`save_sql_facts`.
+
+    Args:
+        raw_code: The model's ``raw_code``, Jinja included.
+        dialect: Optional sqlglot dialect, as for :func:`parse_sql`.
+
+    Returns:
+        The facts, or ``None`` if sqlglot could not parse the SQL.
+
+    """
+    if not _store.loaded:
+        _store.load()
+    key = _facts_key(raw_code, dialect)
+    for known in (_store.used, _store.stored):
+        if key in known:
+            with contextlib.suppress(TypeError, ValueError):
+                facts = _decode_facts(known[key])
+                _store.used[key] = known[key]
+                return facts
+    facts = _derive_facts(raw_code, dialect)
+    _store.used[key] = _encode_facts(facts)
+    _store.added = True
+    return facts
+
+
+def prepare_sql_facts(raw_codes: Iterable[str], workers: int) -> int:
+    """Derive the facts of every SQL in ``raw_codes`` not known yet, in parallel.
+
+    The SQL is split between ``workers`` forked processes, which send the facts
+    back to be kept in this process, where :func:`sql_facts` then finds them.
+    With too little SQL to share out, or no ``fork`` start method, nothing is
+    derived here and :func:`sql_facts` derives facts as checks ask for them.
+
+    Args:
+        raw_codes: Model ``raw_code`` strings, parsed dialect-agnostically.
+        workers: The most processes to use.
+
+    Returns:
+        int: The number of distinct SQL strings whose facts were derived.
+
+    """
+    if not _store.loaded:
+        _store.load()
+    missing: dict[str, str] = {}
+    for raw_code in raw_codes:
+        key = _facts_key(raw_code, None)
+        if key not in _store.used and key not in _store.stored:
+            missing.setdefault(key, raw_code)
+    workers = min(workers, len(missing) // _SQL_FACTS_PER_WORKER)
+    if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return 0
+
+    # Imported before forking, so workers inherit the modules instead of each
+    # importing them.
+    import sqlglot  # ruff: ignore[unused-import]
+
+    _get_jinja_lexer_environment()
+    keys = list(missing)
+    codes = list(missing.values())
+    # A few chunks per worker evens out models that take longer to parse.
+    size = -(-len(codes) // (workers * 4))
+    chunks = [
+        (keys[i : i + size], codes[i : i + size]) for i in range(0, len(codes), size)
+    ]
+    from dbt_bouncer.utils import gc_frozen
+
+    with gc_frozen(), multiprocessing.get_context("fork").Pool(workers) as pool:
+        derived = pool.imap(_derive_encoded_facts, [c for _, c in chunks])
+        for (chunk_keys, _), chunk_facts in zip(chunks, derived, strict=True):
+            _store.used.update(zip(chunk_keys, chunk_facts, strict=True))
+    _store.added = True
+    return len(codes)
+
+
+def save_sql_facts() -> None:
+    """Write the SQL facts derived by this process to disk for later runs."""
+    _store.save()
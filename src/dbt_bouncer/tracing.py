@@ -0,0 +1,252 @@
+"""Chrome trace-event export of a run (``--trace-file``).
+
+While ``trace_to()`` is active, ``span()`` records the time spent in each
+instrumented block as a trace event, on the track of the thread that ran it.
+Garbage collections are recorded too, and a sample of check executions, from
+forked workers as well. The file opens in Perfetto (https://ui.perfetto.dev)
+or ``chrome://tracing``.
+
+Outside ``trace_to()`` every function here returns immediately, so the
+instrumentation costs a global lookup per span.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+__all__ = ["annotate", "span", "trace_to"]
+
+# Key under which ``Executor`` passes a sampled check's timestamps back with its
+# first result; popped by ``record_check_spans`` before anything else sees it.
+TRACE_KEY = "_trace"
+
+# About this many check executions are traced per run, evenly spread, so a
+# large project's trace stays small enough for Perfetto to load quickly.
+_TRACED_CHECKS = 2_000
+
+_active: Tracer | None = None
+
+
+def current_thread() -> tuple[int, int, str]:
+    """Identify the calling thread across processes.
+
+    Returns:
+        tuple[int, int, str]: Its process ID, native thread ID and name.
+
+    """
+    return os.getpid(), threading.get_native_id(), threading.current_thread().name
+
+
+class Tracer:
+    """Collects the trace events of one run."""
+
+    def __init__(self) -> None:
+        """Start a trace whose time origin is when ``dbt_bouncer`` was imported."""
+        import dbt_bouncer
+
+        self.origin_ns = dbt_bouncer._IMPORTED_AT_NS
+        self.events: list[dict[str, Any]] = []
+        self._thread_names: dict[tuple[int, int], str] = {}
+        self._open: threading.local = threading.local()
+        self._gc_start_ns: dict[int, int] = {}
+
+    def add_span(
+        self,
+        name: str,
+        cat: str,
+        start_ns: int,
+        end_ns: int,
+        args: dict[str, Any] | None = None,
+        thread: tuple[int, int, str] | None = None,
+    ) -> None:
+        """Record a complete event on the track of ``thread``.
+
+        Args:
+            name: The event name.
+            cat: The event category.
+            start_ns: Start, on the ``perf_counter_ns`` clock.
+            end_ns: End, on the same clock.
+            args: Shown with the event.
+            thread: ``(pid, native thread id, thread name)`` of the thread that
+                ran the event; the calling thread by default.
+
+        """
+        if thread is None:
+            thread = current_thread()
+        pid, tid, thread_name = thread
+        self._thread_names.setdefault((pid, tid), thread_name)
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (start_ns - self.origin_ns) / 1e3,
+            "dur": (end_ns - start_ns) / 1e3,
+            "pid": pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str, args: dict[str, Any]) -> Iterator[None]:
+        """Record the ``with`` block as a span; ``annotate()`` adds to ``args``.
+
+        Yields:
+            None
+
+        """
+        stack = getattr(self._open, "stack", None)
+        if stack is None:
+            stack = self._open.stack = []
+        stack.append(args)
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self.add_span(name, cat, start_ns, time.perf_counter_ns(), args)
+
+    def annotate(self, **args: Any) -> None:
+        """Add ``args`` to the innermost open span of the calling thread."""
+        stack = getattr(self._open, "stack", None)
+        if stack:
+            stack[-1].update(args)
+
+    def _on_gc(self, phase: str, info: dict[str, Any]) -> None:
+        """Record each garbage collection as a span (a ``gc.callbacks`` hook)."""
+        tid = threading.get_native_id()
+        if phase == "start":
+            self._gc_start_ns[tid] = time.perf_counter_ns()
+            return
+        start_ns = self._gc_start_ns.pop(tid, None)
+        if start_ns is not None:
+            self.add_span(
+                f"gc (generation {info['generation']})",
+                "gc",
+                start_ns,
+                time.perf_counter_ns(),
+                {"collected": info["collected"]},
+            )
+
+    def write(self, path: Path) -> None:
+        """Write the trace to ``path`` in the Chrome trace-event JSON format."""
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread_name},
+            }
+            for (pid, tid), thread_name in self._thread_names.items()
+        ]
+        metadata.extend(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {
+                    "name": "dbt-bouncer"
+                    if pid == os.getpid()
+                    else f"dbt-bouncer worker {pid}"
+                },
+            }
+            for pid in {e["pid"] for e in self.events} | {os.getpid()}
+        )
+        path.write_bytes(
+            orjson.dumps(
+                {"displayTimeUnit": "ms", "traceEvents": metadata + self.events}
+            )
+        )
+
+
+@contextlib.contextmanager
+def trace_to(path: Path | None) -> Iterator[None]:
+    """Trace everything run inside the ``with`` block and write it to ``path``.
+
+    Does nothing if ``path`` is ``None``. The time from importing
+    ``dbt_bouncer`` to entering the block is recorded as ``startup``.
+
+    Yields:
+        None
+
+    """
+    global _active
+    if path is None:
+        yield
+        return
+    tracer = Tracer()
+    tracer.add_span("startup", "cli", tracer.origin_ns, time.perf_counter_ns())
+    _active = tracer
+    gc.callbacks.append(tracer._on_gc)
+    try:
+        with tracer.span("run", "cli", {}):
+            yield
+    finally:
+        gc.callbacks.remove(tracer._on_gc)
+        _active = None
+        tracer.write(path)
+
+
+def span(
+    name: str, cat: str = "dbt-bouncer", **args: Any
+) -> AbstractContextManager[None]:
+    """Record the ``with`` block as a span named ``name``, if tracing.
+
+    Returns:
+        AbstractContextManager: The span, or a no-op context when not tracing.
+
+    """
+    tracer = _active
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.span(name, cat, args)
+
+
+def annotate(**args: Any) -> None:
+    """Add ``args`` to the innermost open span of this thread, if tracing."""
+    tracer = _active
+    if tracer is not None:
+        tracer.annotate(**args)
+
+
+def sample_every(num_checks: int) -> int:
+    """Return how often to trace a check execution, given ``num_checks`` to run.
+
+    Returns:
+        int: Trace every ``n``-th execution, or 0 when not tracing.
+
+    """
+    if _active is None:
+        return 0
+    return max(1, num_checks // _TRACED_CHECKS)
+
+
+def record_check_spans(results: list[dict[str, Any]]) -> None:
+    """Move the sampled check timings ``Executor`` attached to ``results`` into the trace."""
+    tracer = _active
+    for r in results:
+        timing = r.pop(TRACE_KEY, None)
+        if timing is not None and tracer is not None:
+            start_ns, end_ns, thread = timing
+            tracer.add_span(
+                r["check_run_id"],
+                "check",
+                start_ns,
+                end_ns,
+                {"outcome": str(r["outcome"])},
+                thread=tuple(thread),
+            )
@@ -1,6 +1,7 @@
 """Re-usable functions for dbt-bouncer."""
 
 import contextlib
+import gc
 import hashlib
 import importlib
 import importlib.util
@@ -11,7 +12,7 @@ import pkgutil
 import re
 import sys
 import typing
-from collections.abc import Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from functools import lru_cache
 from importlib.metadata import entry_points
 from pathlib import Path
@@ -540,7 +541,7 @@ def _internal_checks_digest() -> bytes:
     return h.digest()
 
 
-def _compute_cache_fingerprint(
+def compute_cache_fingerprint(
     version_str: str, custom_checks_dir: Path | None = None
 ) -> str:
     """Compute a short hash incorporating the version, check files, and entry points.
@@ -628,6 +629,57 @@ def get_cache_dir() -> Path:
     return Path.home() / ".cache" / "dbt-bouncer"
 
 
+def env_flag(name: str) -> bool:
+    """Whether the env var ``name`` is set to a truthy value.
+
+    Used for the ``DBT_BOUNCER_DISABLE_*`` switches of the on-disk caches.
+
+    Returns:
+        bool: ``True`` if it is ``1``, ``true`` or ``yes``, in any case.
+
+    """
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+def write_atomic(path: Path, *chunks: bytes) -> None:
+    """Write ``chunks`` to ``path`` so that readers never see a partial file.
+
+    The bytes go to a temporary file next to ``path``, suffixed with the pid
+    so concurrent runs never interleave writes, which then replaces ``path``.
+    Missing parent directories are created. An ``OSError`` from writing is
+    left to the caller: cache writers log it rather than fail the run.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    tmp.replace(path)
+
+
+@contextlib.contextmanager
+def gc_frozen() -> Iterator[None]:
+    """Freeze every object allocated so far out of cyclic GC for the ``with`` block.
+
+    Used around forking workers: their garbage collectors then leave the heap
+    they inherit alone, instead of writing to each object's header and so
+    copying every page of it. Only a freeze made here is undone, as unfreezing
+    also releases whatever the caller froze.
+
+    Yields:
+        None
+
+    """
+    owns_freeze = not gc.get_freeze_count()
+    gc.freeze()
+    try:
+        yield
+    finally:
+        if owns_freeze:
+            gc.unfreeze()
+
+
 def _get_check_module_map_cached(
     custom_checks_dir: Path | None = None,
 ) -> dict[str, dict[str, str]]:
@@ -651,7 +703,7 @@ def _get_check_module_map_cached(
     from dbt_bouncer.version import version
 
     ver = version()
-    fingerprint = _compute_cache_fingerprint(ver, custom_checks_dir)
+    fingerprint = compute_cache_fingerprint(ver, custom_checks_dir)
     cache_dir = get_cache_dir()
     cache_file = cache_dir / f"check_registry_{ver}_{fingerprint}.json"
 
@@ -1058,3 +1110,191 @@ def object_excluded_by_path(exclude_pattern: str | list[str] | None, path: str)
     if exclude_pattern is None or exclude_pattern == []:
         return False
     return object_in_path(exclude_pattern, path)
+
+
+# Characters with a special meaning in a regex outside of a character class.
+_REGEX_META = frozenset(".^$*+?{}[]|()")
+
+# A numbered backreference or a reference to a named group: these would point
+# at the wrong group once a pattern is embedded in ``PathPatternIndex``'s
+# combined regex.
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _literal_prefix(pattern: str) -> tuple[str, bool] | None:
+    """Return the literal a pattern matches paths by, if it is one.
+
+    ``re.match`` anchors at the start of the path, so a pattern made of literal
+    characters (``^models/marts``, ``models/staging/``, ``^seeds/.*``) matches
+    exactly the paths starting with it, or, with a trailing ``$``, exactly the
+    path itself.
+
+    Returns:
+        tuple[str, bool] | None: The literal and whether the path must equal
+        it, or ``None`` if the pattern needs the regex engine.
+
+    """
+    body = pattern.removeprefix("^")
+    exact = False
+    if body.endswith("$") and not body.endswith("\\$"):
+        body, exact = body[:-1], True
+    elif body.endswith(".*") and not body.endswith("\\.*"):
+        body = body[:-2]
+    literal: list[str] = []
+    chars = iter(body)
+    for char in chars:
+        if char == "\\":
+            escaped = next(chars, "")
+            # ``\d``, ``\b``... are classes and assertions, not characters.
+            if not escaped or escaped.isalnum():
+                return None
+            literal.append(escaped)
+        elif char in _REGEX_META:
+            return None
+        else:
+            literal.append(char)
+    return "".join(literal), exact
+
+
+def _embeddable(pattern: str) -> bool:
+    """Return whether ``pattern`` still compiles inside a lookahead group.
+
+    Global inline flags such as ``(?i)`` only compile at the start of a regex.
+
+    Returns:
+        bool: ``True`` if ``PathPatternIndex`` can combine it with others.
+
+    """
+    try:
+        re.compile(f"(?=({pattern}))")
+    except re.error:
+        return False
+    return True
+
+
+class _DirNode:
+    """A directory in ``PathPatternIndex``'s trie of literal patterns."""
+
+    __slots__ = ("children", "tails")
+
+    def __init__(self) -> None:
+        """Start with no subdirectories and no patterns."""
+        self.children: dict[str, _DirNode] = {}
+        # ``(bit, rest of the literal, exact)`` of the literals in this directory.
+        self.tails: list[tuple[int, str, bool]] = []
+
+
+class PathPatternIndex:
+    """Match paths against many ``include``/``exclude`` patterns at once.
+
+    Matching a path returns a bit mask of every pattern it matches, with
+    ``object_in_path`` semantics for each. Literal patterns, the large majority
+    in practice, are stored in a trie of their directories, so a path only
+    meets the literals along its own directories. The other patterns are
+    combined into a single regex with a named lookahead group per pattern,
+    which tries them all in one call. Patterns that cannot be embedded in it
+    (backreferences, global inline flags) are matched one by one.
+
+    Args:
+        patterns: Every pattern to index; surrounding whitespace is ignored, as
+            by ``object_in_path``.
+
+    Raises:
+        re.error: If a pattern is invalid.
+
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Index ``patterns``."""
+        self.bits: dict[str, int] = {}
+        self._root = _DirNode()
+        self._combined: re.Pattern[str] | None = None
+        self._group_bits: dict[str, int] = {}
+        self._separate: list[tuple[re.Pattern[str], int]] = []
+        combinable: list[tuple[str, int]] = []
+        for raw in patterns:
+            pattern = raw.strip()
+            if pattern in self.bits:
+                continue
+            bit = self.bits[pattern] = 1 << len(self.bits)
+            compiled = compile_pattern(pattern)
+            literal = _literal_prefix(pattern)
+            if literal is not None:
+                self._add_literal(bit, *literal)
+            elif _GROUP_REFERENCE.search(pattern) is None and _embeddable(pattern):
+                combinable.append((pattern, bit))
+            else:
+                self._separate.append((compiled, bit))
+        if combinable:
+            try:
+                self._combined = re.compile(
+                    "".join(
+                        f"(?:(?=(?P<_p{i}>{pattern}))|)"
+                        for i, (pattern, _) in enumerate(combinable)
+                    )
+                )
+                self._group_bits = {
+                    f"_p{i}": bit for i, (_, bit) in enumerate(combinable)
+                }
+            except re.error:
+                self._separate.extend(
+                    (compile_pattern(pattern), bit) for pattern, bit in combinable
+                )
+
+    def _add_literal(self, bit: int, literal: str, exact: bool) -> None:
+        """Store ``literal`` under the trie node of its directory."""
+        node = self._root
+        directory, slash, tail = literal.rpartition("/")
+        if slash:
+            for part in directory.split("/"):
+                node = node.children.setdefault(f"{part}/", _DirNode())
+        node.tails.append((bit, tail, exact))
+
+    def mask(self, patterns: str | list[str] | None) -> int:
+        """Return the bits of ``patterns``, all of which must be indexed.
+
+        Returns:
+            int: The union of their bits; 0 for ``None`` or an empty list.
+
+        """
+        if patterns is None:
+            return 0
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        bits = 0
+        for pattern in patterns:
+            bits |= self.bits[pattern.strip()]
+        return bits
+
+    def match(self, path: str) -> int:
+        """Return the bits of every indexed pattern ``path`` matches.
+
+        Returns:
+            int: A bit mask; see ``mask``.
+
+        """
+        matched = 0
+        node: _DirNode | None = self._root
+        start = 0
+        while node is not None:
+            for bit, tail, exact in node.tails:
+                if path.startswith(tail, start) and (
+                    not exact or len(path) - start == len(tail)
+                ):
+                    matched |= bit
+            end = path.find("/", start) + 1
+            if not end:
+                break
+            node = node.children.get(path[start:end])
+            start = end
+        if self._combined is not None:
+            # Never ``None``: every group is optional, so the regex always
+            # matches the empty string.
+            groups = self._combined.match(path).groupdict()  # ty: ignore[unresolved-attribute]
+            for name, bit in self._group_bits.items():
+                if groups[name] is not None:
+                    matched |= bit
+        for compiled, bit in self._separate:
+            if compiled.match(path) is not None:
+                matched |= bit
+        return matched
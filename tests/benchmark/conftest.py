@@ -13,13 +13,18 @@ import statistics
 import time
 from contextlib import contextmanager, nullcontext, redirect_stderr, redirect_stdout
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Iterator
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import pytest
 import yaml
 from tqdm import tqdm
 
-from .synthetic_manifest import _env_int, _env_model_count, write_artifacts
+from .synthetic_manifest import (
+    _env_int,
+    _env_model_count,
+    build_deep_manifest,
+    write_artifacts,
+)
 
 if TYPE_CHECKING:
     from dbt_bouncer.context import BouncerContext
@@ -370,6 +375,21 @@ def synthetic_artifacts_dir(tmp_path_factory, n_models) -> Path:
     return target
 
 
+@pytest.fixture(scope="session")
+def deep_dag_artifacts(tmp_path_factory):
+    """Parse the deep DAG of views from ``build_deep_manifest`` once per session."""
+    import orjson
+
+    from dbt_bouncer.artifact_parsers.parser import parse_dbt_artifacts
+    from dbt_bouncer.configuration_file.parser import DbtBouncerConfBase
+
+    out_dir = tmp_path_factory.mktemp("deep_dag")
+    (out_dir / "manifest.json").write_bytes(orjson.dumps(build_deep_manifest()))
+    return parse_dbt_artifacts(
+        bouncer_config=DbtBouncerConfBase(), dbt_artifacts_dir=out_dir
+    )
+
+
 @pytest.fixture(scope="session")
 def benchmark_config_contents() -> dict:
     """Return the parsed contents of ``benchmark-config.yml``."""
@@ -538,12 +558,16 @@ def runner_inputs(benchmark_conf, synthetic_artifacts_dir):
 # ``runner_inputs``; only the cheap context wrapper is rebuilt per round.
 @pytest.fixture
 def make_bouncer_context(runner_inputs) -> Callable[[], BouncerContext]:
-    """Return a factory that builds a fresh ``BouncerContext`` (no re-parse)."""
+    """Return a factory that builds a fresh ``BouncerContext`` (no re-parse).
+
+    Pass ``artifacts`` to build it from a separate parse instead of the shared
+    one, e.g. to measure proxies that have never been read before.
+    """
     from dbt_bouncer.context import BouncerContext
 
-    bouncer_config, check_categories, artifacts = runner_inputs
+    bouncer_config, check_categories, parsed = runner_inputs
 
-    def _make() -> BouncerContext:
+    def _make(artifacts: Any = parsed) -> BouncerContext:
         return BouncerContext.model_construct(
             bouncer_config=bouncer_config,
             catalog_nodes=artifacts.catalog_nodes,
@@ -510,6 +510,58 @@ def build_manifest(
     return manifest
 
 
+def build_deep_manifest(
+    n_models: int = 2000,
+    *,
+    fan_in: int = 3,
+    package_name: str = DEFAULT_PACKAGE_NAME,
+) -> dict[str, Any]:
+    """Build a manifest whose models form one deep DAG of views.
+
+    Model ``i`` depends on the ``fan_in`` models before it, so every model is
+    the end of chains of views as long as the DAG is deep. This is the worst
+    case for lineage checks that walk upstream chains.
+
+    Args:
+        n_models: Number of models.
+        fan_in: Number of upstream models of each model.
+        package_name: Package name shared by every resource.
+
+    Returns:
+        A raw manifest dict ready to be JSON-serialised.
+    """
+    pkg = package_name
+    source = _source_node(0, pkg)
+    nodes: dict[str, dict[str, Any]] = {}
+    uids: list[str] = []
+    for i in range(n_models):
+        parents = uids[-fan_in:] or [source["unique_id"]]
+        node = _model_node(i, "intermediate", pkg, parents)
+        nodes[node["unique_id"]] = node
+        uids.append(node["unique_id"])
+
+    parent_map = {uid: list(node["depends_on"]["nodes"]) for uid, node in nodes.items()}
+    parent_map[source["unique_id"]] = []
+    child_map: dict[str, list[str]] = {uid: [] for uid in parent_map}
+    for uid, parents in parent_map.items():
+        for parent in parents:
+            child_map[parent].append(uid)
+
+    return {
+        **_DEFAULT_MANIFEST,
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json",
+            "dbt_version": DEFAULT_DBT_VERSION,
+            "project_name": pkg,
+            "adapter_type": "duckdb",
+        },
+        "nodes": nodes,
+        "sources": {source["unique_id"]: source},
+        "parent_map": parent_map,
+        "child_map": child_map,
+    }
+
+
 def build_catalog(manifest: dict[str, Any]) -> dict[str, Any]:
     """Build a ``catalog.json`` dict matching the manifest's models/seeds/sources."""
     catalog_nodes: dict[str, dict[str, Any]] = {}
@@ -6,23 +6,37 @@ disables itself under xdist — and ``--cov`` — coverage skews timings). Uses
 Bencher (``--adapter python_pytest``) so regressions fail PRs.
 
 Targets:
-- ``test_parse_manifest``  -> parse-time (``parse_dbt_artifacts``).
+- ``test_parse_manifest``  -> parse-time (``parse_dbt_artifacts``), measured cold.
+- ``test_parse_manifest_snapshot`` -> parse-time served from the artifact snapshot.
 - ``test_validate_conf``   -> check-assembly (config discovery + discriminated
   union build + Pydantic validation), measured cold.
 - ``test_check_discovery`` -> check-class discovery only.
 - ``test_runner``          -> full runner: assemble + execute + report.
 - ``test_runner_match``    -> runner sub-phase: match + ``model_copy(deep=True)``.
 - ``test_runner_execute``  -> runner sub-phase: threaded check execution.
+- ``test_executor_mode``   -> execute phase, sequential vs. threads on
+  free-threaded builds.
 - ``test_runner_report``   -> runner sub-phase: result formatting + output.
+- ``test_proxy_child_access`` -> repeated nested attribute reads on models.
+- ``test_runner_proxy_allocations`` -> match + execute over never-read proxies.
+- ``test_resource_wrapper_access`` -> wrapper attribute reads + wrapper memory.
+- ``test_selector_resolution`` -> resolving a selector-heavy config against the
+  manifest.
+- ``test_chained_views_deep_dag`` -> ``check_model_max_chained_views`` over
+  every model of a deep DAG of views.
 - ``test_run_bouncer``     -> full in-process end-to-end run.
 """
 
 from __future__ import annotations
 
+from typing import Any, Callable
+
+import pytest
+
 from dbt_bouncer.artifact_parsers.parser import parse_dbt_artifacts
 from dbt_bouncer.configuration_file.parser import DbtBouncerConfBase
 from dbt_bouncer.configuration_file.validator import validate_conf
-from dbt_bouncer.executor import Executor
+from dbt_bouncer.executor import Executor, _cpu_count, _gil_disabled
 from dbt_bouncer.reporting.reporter import Reporter
 from dbt_bouncer.runner import _assemble_checks_to_run, runner
 from dbt_bouncer.utils import get_check_objects
@@ -46,9 +60,32 @@ def _clear_assembly_caches() -> None:
             fn.cache_clear()
 
 
-def test_parse_manifest(benchmark, synthetic_artifacts_dir):
+def test_parse_manifest(benchmark, monkeypatch, synthetic_artifacts_dir):
     """Benchmark parsing the synthetic manifest into proxy objects."""
+    monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+    config = DbtBouncerConfBase()
+    result = benchmark(
+        parse_dbt_artifacts,
+        bouncer_config=config,
+        dbt_artifacts_dir=synthetic_artifacts_dir,
+    )
+    assert len(result.models) > 0
+
+
+def test_parse_manifest_snapshot(
+    benchmark, monkeypatch, synthetic_artifacts_dir, tmp_path
+):
+    """Benchmark loading the synthetic artifacts from a warm snapshot."""
+    import dbt_bouncer.utils as utils_mod
+
+    monkeypatch.delenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", raising=False)
+    monkeypatch.setattr(utils_mod, "get_cache_dir", lambda: tmp_path)
     config = DbtBouncerConfBase()
+    parse_dbt_artifacts(
+        bouncer_config=config, dbt_artifacts_dir=synthetic_artifacts_dir
+    )
+    assert list(tmp_path.glob("artifacts_*.snapshot"))
+
     result = benchmark(
         parse_dbt_artifacts,
         bouncer_config=config,
@@ -57,6 +94,131 @@ def test_parse_manifest(benchmark, synthetic_artifacts_dir):
     assert len(result.models) > 0
 
 
+def _count_proxy_allocations(fn: Callable[..., Any], *args: Any) -> int:
+    """Call ``fn`` and return how many proxy objects it allocated."""
+    import dbt_bouncer.artifact_parsers.parser as parser_mod
+
+    allocated = 0
+    original = dict(parser_mod._WRAPPERS)
+
+    def counting(cls: type) -> Callable[[Any], Any]:
+        def make(value: Any) -> Any:
+            nonlocal allocated
+            allocated += 1
+            return cls(value)
+
+        return make
+
+    parser_mod._WRAPPERS.update({t: counting(c) for t, c in original.items()})
+    try:
+        fn(*args)
+    finally:
+        parser_mod._WRAPPERS.update(original)
+    return allocated
+
+
+def test_proxy_child_access(benchmark, monkeypatch, synthetic_artifacts_dir):
+    """Benchmark repeated nested attribute reads across every model.
+
+    Forty reads of ``config.meta`` and ``depends_on.nodes`` per model stand in
+    for forty checks reading the same fields. Child proxies are memoised, so
+    only the first read of each allocates; the proxy count of one pass over
+    freshly parsed models is recorded in ``extra_info``.
+    """
+    monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+    config = DbtBouncerConfBase()
+
+    def fresh_models() -> list[Any]:
+        return parse_dbt_artifacts(
+            bouncer_config=config, dbt_artifacts_dir=synthetic_artifacts_dir
+        ).models
+
+    def read_fields(models: list[Any]) -> None:
+        for _ in range(40):
+            for m in models:
+                _ = m.model.config.meta, m.model.depends_on.nodes
+
+    benchmark.extra_info["proxies_allocated"] = _count_proxy_allocations(
+        read_fields, fresh_models()
+    )
+    benchmark.pedantic(
+        read_fields, setup=lambda: ((fresh_models(),), {}), rounds=5, iterations=1
+    )
+
+
+def test_runner_proxy_allocations(
+    benchmark, monkeypatch, runner_inputs, synthetic_artifacts_dir, make_bouncer_context
+):
+    """Benchmark match + execute over artifacts no check has read yet.
+
+    The shared ``runner_inputs`` artifacts are warmed by every earlier round, so
+    each round here parses its own. The proxy count of one match + execute
+    pass is recorded in ``extra_info``.
+    """
+    monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+    bouncer_config = runner_inputs[0]
+
+    def fresh_context() -> Any:
+        return make_bouncer_context(
+            parse_dbt_artifacts(
+                bouncer_config=bouncer_config,
+                dbt_artifacts_dir=synthetic_artifacts_dir,
+            )
+        )
+
+    def match_and_execute(ctx: Any) -> list[dict[str, Any]]:
+        return Executor().run(_assemble_checks_to_run(ctx))
+
+    benchmark.extra_info["proxies_allocated"] = _count_proxy_allocations(
+        match_and_execute, fresh_context()
+    )
+    results = benchmark.pedantic(
+        match_and_execute,
+        setup=lambda: ((fresh_context(),), {}),
+        rounds=3,
+        iterations=1,
+    )
+    assert len(results) > 0
+
+
+def test_resource_wrapper_access(benchmark, runner_inputs):
+    """Benchmark reading the wrapper attributes the match phase reads.
+
+    Each pass reads the unique ID, file path and wrapped resource of every
+    model, seed, snapshot, test, source... wrapper, as
+    ``_assemble_checks_to_run`` does. The memory the wrappers themselves take
+    (excluding the resources they wrap) is recorded in ``extra_info``.
+    """
+    import copy
+    import tracemalloc
+
+    from dbt_bouncer.artifact_parsers.parser import _WRAPPED_RESOURCES
+
+    artifacts = runner_inputs[2]
+    wrappers = [w for name in _WRAPPED_RESOURCES for w in getattr(artifacts, name)]
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        copies = [copy.copy(w) for w in wrappers]
+        wrapper_bytes = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del copies
+    benchmark.extra_info["wrappers"] = len(wrappers)
+    benchmark.extra_info["wrapper_bytes"] = wrapper_bytes
+    benchmark.extra_info["wrapper_bytes_per_resource"] = round(
+        wrapper_bytes / len(wrappers), 1
+    )
+
+    def read_attributes() -> None:
+        for _ in range(20):
+            for w in wrappers:
+                _ = w.unique_id, w.original_file_path, getattr(w, w.resource_attr)
+
+    benchmark(read_attributes)
+
+
 def test_check_discovery(benchmark):
     """Benchmark discovering and importing all check classes (cold)."""
 
@@ -136,6 +298,28 @@ def test_runner_execute(benchmark, make_bouncer_context):
     assert len(results) > 0
 
 
+@pytest.mark.benchmark(group="executor-mode")
+@pytest.mark.parametrize("mode", ["sequential", "threaded"])
+def test_executor_mode(benchmark, make_bouncer_context, mode):
+    """Benchmark the execute phase sequentially and across threads.
+
+    The threaded mode only runs in parallel on free-threaded builds, where
+    ``Executor(jobs=0)`` uses one thread per CPU; elsewhere it is skipped. The
+    thread count is recorded in ``extra_info``.
+    """
+    if mode == "threaded" and not _gil_disabled():
+        pytest.skip("Threads only run checks in parallel without the GIL.")
+    executor = Executor(jobs=0 if mode == "threaded" else 1)
+    benchmark.extra_info["threads"] = _cpu_count() if mode == "threaded" else 1
+
+    def setup():
+        checks_to_run = _assemble_checks_to_run(make_bouncer_context())
+        return (checks_to_run,), {}
+
+    results = benchmark.pedantic(executor.run, setup=setup, rounds=5, iterations=1)
+    assert len(results) > 0
+
+
 def test_runner_report(benchmark, make_bouncer_context):
     """Benchmark the runner's report phase: formatting results and output.
 
@@ -162,6 +346,76 @@ def test_runner_report(benchmark, make_bouncer_context):
     assert exit_code in (0, 1)
 
 
+# Selectors as a config with one ``selector`` per check might use them: every
+# method, in union and intersection, some with graph operators.
+_SELECTORS = [
+    *(f"tag:{tag}" for tag in ("crm", "critical", "example_tag", "payment")),
+    *(f"path:models/{p}" for p in ("staging", "staging/crm", "intermediate")),
+    "path:models/staging/*/stg_crm_*",
+    "path:models/marts/*",
+    *(f"config.materialized:{m}" for m in ("view", "ephemeral", "table")),
+    "config.enabled:true",
+    "config.tags:crm,package:dbt_bouncer_perf",
+    "fqn:dbt_bouncer_perf.staging.*",
+    "fqn:dbt_bouncer_perf.marts.finance.fct_*",
+    *(f"stg_crm_{i}* int_{i}*" for i in range(20)),
+    *(f"fct_{i}*,path:models/marts" for i in range(0, 20, 2)),
+    "stg_payments_1+1",
+    "2+fct_10",
+    "package:dbt_bouncer_perf,tag:crm",
+]
+
+
+def test_selector_resolution(benchmark, runner_inputs):
+    """Benchmark resolving a selector-heavy config against the manifest.
+
+    Builds the shared ``SelectorIndex`` and resolves every selector through it,
+    as ``_assemble_checks_to_run`` does for checks with a ``selector``.
+    """
+    from dbt_bouncer.selectors import Selector, SelectorIndex
+
+    manifest = runner_inputs[2].manifest_obj.manifest
+
+    def resolve_all() -> list[Selector]:
+        index = SelectorIndex(manifest)
+        return [Selector(raw, manifest, index=index) for raw in _SELECTORS]
+
+    selectors = benchmark(resolve_all)
+    assert any(selector._selected_ids for selector in selectors)
+
+
+def test_chained_views_deep_dag(benchmark, deep_dag_artifacts):
+    """Benchmark ``check_model_max_chained_views`` over a deep DAG of views.
+
+    Each round builds a fresh ``CheckContext``, so the per-run chain depths are
+    computed inside the timed call, as in a real run.
+    """
+    from dbt_bouncer.check_framework.context import CheckContext
+    from dbt_bouncer.check_framework.exceptions import DbtBouncerFailedCheckError
+    from dbt_bouncer.testing import _get_check_class
+
+    models = [m.model for m in deep_dag_artifacts.models]
+    check = _get_check_class("check_model_max_chained_views")(
+        name="check_model_max_chained_views", max_chained_views=10
+    )
+
+    def run_all() -> int:
+        check.set_context(
+            CheckContext(manifest_obj=deep_dag_artifacts.manifest_obj, models=models)
+        )
+        failures = 0
+        for model in models:
+            check.set_resource(model, "model")
+            try:
+                check.execute()
+            except DbtBouncerFailedCheckError:
+                failures += 1
+        return failures
+
+    failures = benchmark(run_all)
+    assert failures > 0
+
+
 def test_run_bouncer(benchmark, benchmark_config_file, run_bouncer_phase_decomposition):
     """Benchmark a full in-process run over the synthetic manifest.
 
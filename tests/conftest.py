@@ -52,7 +52,7 @@ def _clear_module_caches():
     when class annotations are patched, models are rebuilt with different
     namespaces, or Python reuses object addresses after garbage collection.
     """
-    from dbt_bouncer import runner, utils
+    from dbt_bouncer import runner, sql_utils, utils
     from dbt_bouncer.checks.manifest import check_macros
 
     def _clear():
@@ -67,6 +67,9 @@ def _clear_module_caches():
         # otherwise be served a stale registry -- and, worse, could leave a
         # deliberately broken one behind for whatever runs next.
         utils.get_check_objects.cache_clear()
+        # SQL facts are memoised in process and read from disk once.
+        sql_utils.sql_facts.cache_clear()
+        sql_utils._store = sql_utils._SqlFactsStore()
 
     _clear()
     yield
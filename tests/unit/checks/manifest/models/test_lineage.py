@@ -517,9 +517,8 @@ class TestCheckModelMaxChainedViews:
         )
 
     def test_passes_when_model_is_absent_from_the_model_list(self):
-        # The recursion looks each unique_id up in the model index and skips any
-        # that is missing, so a model absent from ctx.models has no upstream
-        # chain to walk.
+        # Chains are only computed for the models in ctx.models, so a model
+        # absent from it has no upstream chain.
         check_passes(
             "check_model_max_chained_views",
             materializations_to_include=["ephemeral", "view"],
@@ -603,6 +602,53 @@ class TestCheckModelMaxChainedViews:
             ctx_manifest_obj={},
         )
 
+    @pytest.mark.parametrize(
+        ("max_chained_views", "check_fn"),
+        [
+            pytest.param(5, check_fails, id="longest_branch_exceeds_limit"),
+            pytest.param(6, check_passes, id="longest_branch_within_limit"),
+        ],
+    )
+    def test_longest_of_several_branches_counts(self, max_chained_views, check_fn):
+        # model_0 depends on a short branch (a) and a longer one that rejoins
+        # it (b1 <- b2 <- b3 <- b4 <- a): the longest chain, 5 views, decides.
+        models_list = [
+            _model(
+                "model_0",
+                package=_TEST_PROJECT,
+                materialized="table",
+                nodes=[f"model.{_TEST_PROJECT}.a", f"model.{_TEST_PROJECT}.b1"],
+            ),
+            _chain_model("a", "view"),
+            _chain_model("b1", "view", "b2"),
+            _chain_model("b2", "ephemeral", "b3"),
+            _chain_model("b3", "view", "b4"),
+            _chain_model("b4", "view", "a"),
+        ]
+        check_fn(
+            "check_model_max_chained_views",
+            materializations_to_include=["ephemeral", "view"],
+            max_chained_views=max_chained_views,
+            model=models_list[0],
+            ctx_models=models_list,
+            ctx_manifest_obj={},
+        )
+
+    def test_cycle_of_views_fails(self):
+        models_list = [
+            _chain_model("model_0", "table", "a"),
+            _chain_model("a", "view", "b"),
+            _chain_model("b", "view", "a"),
+        ]
+        check_fails(
+            "check_model_max_chained_views",
+            materializations_to_include=["view"],
+            max_chained_views=5,
+            model=models_list[0],
+            ctx_models=models_list,
+            ctx_manifest_obj={},
+        )
+
     def test_failure_message(self):
         check_fails(
             "check_model_max_chained_views",
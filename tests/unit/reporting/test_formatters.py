@@ -1,12 +1,16 @@
 """Tests for the output formatters, focusing on file-location plumbing."""
 
 import orjson
+import pytest
 
 from dbt_bouncer.enums import CheckOutcome, CheckSeverity
 from dbt_bouncer.reporting.formatters import (
     _format_csv,
     _format_junit,
+    _format_results,
     _format_sarif,
+    _format_tap,
+    parse_results,
 )
 
 
@@ -82,3 +86,67 @@ def test_csv_includes_file_path_and_unique_id_columns():
     assert "unique_id" in header
     assert "models/staging/stg_orders.sql" in csv_text
     assert "model.my_project.stg_orders" in csv_text
+
+
+def test_tap_records_failure_severity():
+    """A failed TAP test point carries its severity in a YAML block."""
+    result = _failed_result(
+        failure_message="Model has no description\nor columns",
+        severity=CheckSeverity.WARN,
+    )
+    tap = _format_tap([result])
+    assert tap.decode().splitlines()[2:] == [
+        "not ok 1 - check_model_description_populated:0:stg_orders",
+        "  ---",
+        "  severity: warn",
+        "  ...",
+        "  # Model has no description",
+        "  # or columns",
+    ]
+    [parsed] = parse_results(tap, "tap")
+    assert parsed["severity"] == CheckSeverity.WARN
+    assert parsed["failure_message"] == result["failure_message"]
+
+
+@pytest.mark.parametrize("output_format", ["csv", "json", "junit", "sarif", "tap"])
+def test_parse_results_reads_back_formatted_results(output_format):
+    """Parsing a formatted file and formatting it again is lossless."""
+    results = [
+        _failed_result(),
+        _failed_result(
+            check_run_id="check_model_names:1:stg_orders",
+            failure_message="Model name does not match",
+            severity=CheckSeverity.WARN,
+        ),
+        _failed_result(
+            check_run_id="check_model_names:1:stg_customers",
+            failure_message=None,
+            outcome=CheckOutcome.SUCCESS,
+        ),
+    ]
+    content = _format_results(results, output_format)
+
+    parsed = parse_results(content, output_format)
+
+    assert _format_results(parsed, output_format) == content
+    assert [(r["outcome"], r["check_run_id"]) for r in parsed] == [
+        (r["outcome"], r["check_run_id"]) for r in results
+    ]
+    assert [r["severity"] for r in parsed[:2]] == [
+        CheckSeverity.ERROR,
+        CheckSeverity.WARN,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("content", "output_format", "match"),
+    [
+        (b"{}", "json", "Expected a JSON list"),
+        (b"[{}]", "json", "missing"),
+        (b"hello", "tap", "Unexpected line"),
+        (b"[]", "yaml", "Unknown output format"),
+    ],
+)
+def test_parse_results_rejects_other_files(content, output_format, match):
+    with pytest.raises(ValueError, match=match):
+        parse_results(content, output_format)
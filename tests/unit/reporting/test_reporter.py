@@ -38,6 +38,27 @@ def test_report_dry_run_returns_zero():
     assert results == []
 
 
+def test_report_dry_run_counts_each_resource_of_a_batch(capsys):
+    """A batch entry counts once per resource it holds."""
+    checks: list[CheckToRun] = [
+        cast(
+            "CheckToRun",
+            {
+                "batch": [object(), object(), object()],
+                "check": _FakeCheck(),
+                "check_run_id": "check_model_names:0",
+                "severity": "error",
+            },
+        ),
+    ]
+    iterate_cache = {_FakeCheck: frozenset({"model"})}
+
+    reporter = Reporter(show_all_failures=False, create_pr_comment_file=False)
+    reporter.report_dry_run(checks, iterate_cache=iterate_cache)
+
+    assert "3 check(s) would run" in capsys.readouterr().out
+
+
 def test_report_results_all_pass():
     """All checks pass -- returns exit code 0."""
     results = [
@@ -0,0 +1,150 @@
+"""Tests for the integer-indexed dependency graph."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from dbt_bouncer.artifact_parsers.graph import (
+    build_dependency_graph,
+    graph_from_manifest,
+)
+from dbt_bouncer.check_framework.context import CheckContext
+
+# source -> stg -> int -> (fct, dim); stg -> dim; fct -> exposure
+_PARENTS = {
+    "model.p.stg": ["source.p.raw.orders"],
+    "model.p.int": ["model.p.stg", "model.p.stg"],
+    "model.p.fct": ["model.p.int"],
+    "model.p.dim": ["model.p.int", "model.p.stg"],
+    "exposure.p.dash": ["model.p.fct"],
+}
+
+
+@pytest.fixture
+def graph():
+    return build_dependency_graph(_PARENTS.items())
+
+
+def test_parents_and_children(graph):
+    assert graph.parents("model.p.dim") == ["model.p.int", "model.p.stg"]
+    assert graph.parents("model.p.int") == ["model.p.stg"]
+    assert graph.parents("source.p.raw.orders") == []
+    assert sorted(graph.children("model.p.stg")) == ["model.p.dim", "model.p.int"]
+    assert graph.children("model.p.missing") == []
+    assert len(graph) == 6
+
+
+def test_topological_order_places_parents_first(graph):
+    position = {
+        graph.unique_ids[row]: i for i, row in enumerate(graph.topological_order)
+    }
+
+    assert sorted(position) == sorted(graph.unique_ids)
+    for uid, parents in _PARENTS.items():
+        for parent in parents:
+            assert position[parent] < position[uid]
+
+
+def test_cycles_are_ordered_last():
+    graph = build_dependency_graph(
+        [("model.p.a", ["model.p.b"]), ("model.p.b", ["model.p.a"]), ("model.p.c", [])]
+    )
+
+    assert [graph.unique_ids[r] for r in graph.topological_order] == [
+        "model.p.c",
+        "model.p.a",
+        "model.p.b",
+    ]
+    assert graph.closure({"model.p.a"}, upstream=True) == {"model.p.b"}
+
+
+@pytest.mark.parametrize(
+    ("seeds", "upstream", "degree", "expected"),
+    [
+        (
+            {"model.p.fct"},
+            True,
+            None,
+            {"model.p.int", "model.p.stg", "source.p.raw.orders"},
+        ),
+        ({"model.p.fct"}, True, 1, {"model.p.int"}),
+        (
+            {"model.p.stg"},
+            False,
+            None,
+            {"model.p.int", "model.p.fct", "model.p.dim", "exposure.p.dash"},
+        ),
+        ({"model.p.stg"}, False, 1, {"model.p.int", "model.p.dim"}),
+        (
+            {"model.p.int", "model.p.dim"},
+            True,
+            None,
+            {"model.p.stg", "source.p.raw.orders"},
+        ),
+        ({"model.p.missing"}, False, None, set()),
+    ],
+)
+def test_closure(graph, seeds, upstream, degree, expected):
+    assert graph.closure(seeds, upstream=upstream, degree=degree) == expected
+
+
+def test_graph_from_manifest_falls_back_to_child_map():
+    child_map = {"model.p.a": ["model.p.b"], "model.p.b": []}
+    from_children = graph_from_manifest(SimpleNamespace(child_map=child_map))
+    from_parents = graph_from_manifest(
+        SimpleNamespace(parent_map={"model.p.a": [], "model.p.b": ["model.p.a"]})
+    )
+
+    for graph in (from_children, from_parents):
+        assert graph.parents("model.p.b") == ["model.p.a"]
+        assert graph.children("model.p.a") == ["model.p.b"]
+
+
+def test_check_context_graph_spans_its_resource_lists():
+    def _resource(uid, nodes):
+        return SimpleNamespace(unique_id=uid, depends_on=SimpleNamespace(nodes=nodes))
+
+    stg = _resource("model.p.stg", ["source.p.raw.orders"])
+    fct = _resource("model.p.fct", ["model.p.stg"])
+    ctx = CheckContext(
+        models=[stg, fct],
+        snapshots=[_resource("snapshot.p.snap", ["model.p.fct"])],
+        exposures=[_resource("exposure.p.dash", ["model.p.fct"])],
+    )
+
+    assert sorted(ctx.graph.children("model.p.fct")) == [
+        "exposure.p.dash",
+        "snapshot.p.snap",
+    ]
+    assert ctx.children_by_unique_id == {
+        "source.p.raw.orders": [stg],
+        "model.p.stg": [fct],
+    }
+
+
+def test_check_context_uses_a_given_graph(graph):
+    stg = SimpleNamespace(unique_id="model.p.stg", depends_on=None)
+    ctx = CheckContext(models=[stg], dependency_graph=graph)
+
+    assert ctx.graph is graph
+    assert ctx.children_by_unique_id == {"source.p.raw.orders": [stg]}
+
+
+def test_check_context_graph_leaves_out_data_tests():
+    test = SimpleNamespace(
+        unique_id="test.p.not_null", depends_on=SimpleNamespace(nodes=["model.p.a"])
+    )
+    ctx = CheckContext(tests=[test])
+
+    assert ctx.graph.children("model.p.a") == []
+    assert ctx.tests_by_depends_on_node == {"model.p.a": [test]}
+
+
+def test_check_context_parents_of_falls_back_to_depends_on(graph):
+    ctx = CheckContext(dependency_graph=graph)
+    elsewhere = SimpleNamespace(
+        unique_id="model.p.other", depends_on=SimpleNamespace(nodes=["seed.p.s"])
+    )
+
+    assert ctx.parents_of(SimpleNamespace(unique_id="model.p.fct")) == ["model.p.int"]
+    assert ctx.parents_of(elsewhere) == ["seed.p.s"]
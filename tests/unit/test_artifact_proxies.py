@@ -0,0 +1,138 @@
+"""Tests for the proxy and wrapper classes in `dbt_bouncer.artifact_parsers.parser`."""
+
+import copy
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from dbt_bouncer import artifact_types
+from dbt_bouncer.artifact_parsers.parser import (
+    _WRAPPED_RESOURCES,
+    DictProxy,
+    ListProxy,
+    ModelWrapper,
+    ProxyStr,
+    SourceWrapper,
+    parse_dbt_artifacts,
+)
+
+
+def _raw() -> dict:
+    return {
+        "config": {"meta": {"owner": "a"}, "tags": ["x", {"y": 1}]},
+        "name": "m",
+        "schema": "s",
+    }
+
+
+class TestChildMemoisation:
+    """Wrapped children are created once and reused."""
+
+    def test_repeated_attribute_access_returns_same_proxy(self):
+        proxy = DictProxy(_raw())
+
+        first = proxy.config.meta
+
+        assert isinstance(first, DictProxy)
+        assert proxy.config.meta is first
+        assert proxy["config"]["meta"] is first
+        assert proxy.get("config") is proxy.config
+
+    def test_underscore_alias_is_memoised_under_real_key(self):
+        proxy = DictProxy(_raw())
+
+        assert proxy.schema_ is proxy.schema
+        assert isinstance(proxy.schema, ProxyStr)
+
+    def test_list_elements_are_memoised(self):
+        tags = DictProxy(_raw()).config.tags
+
+        assert isinstance(tags, ListProxy)
+        assert tags[1] is tags[1]
+        assert list(tags)[1] is tags[1]
+        assert tags[0].value == "x"
+
+    def test_items_and_values_reuse_memoised_children(self):
+        proxy = DictProxy(_raw())
+        config = proxy.config
+
+        assert dict(proxy.items())["config"] is config
+        assert next(iter(proxy.values())) is config
+
+
+class TestMemoisedProxiesStayPlainData:
+    """Memoisation never changes what the data compares or serialises as."""
+
+    def test_equality_with_raw_data(self):
+        proxy = DictProxy(_raw())
+        _ = proxy.config.tags[1].y, proxy.name
+
+        assert proxy == _raw()
+
+    def test_orjson_serialises_memoised_proxies(self):
+        proxy = DictProxy(_raw())
+        _ = proxy.config.meta.owner, list(proxy.config.tags)
+
+        assert orjson.loads(orjson.dumps(proxy)) == _raw()
+
+    def test_raw_input_is_not_mutated(self):
+        raw = _raw()
+        proxy = DictProxy(raw)
+
+        _ = proxy.config.meta
+
+        assert type(raw["config"]) is dict
+
+
+@pytest.fixture(scope="module")
+def artifacts():
+    bouncer_config = MagicMock()
+    bouncer_config.package_name = "dbt_bouncer_test_project"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+        return parse_dbt_artifacts(
+            bouncer_config, Path("tests/fixtures/dbt_112/target")
+        )
+
+
+class TestResourceWrappers:
+    """The slotted per-resource-type wrappers the parser emits."""
+
+    @pytest.mark.parametrize("name", list(_WRAPPED_RESOURCES))
+    def test_parser_emits_slotted_wrappers(self, artifacts, name):
+        wrapper = _WRAPPED_RESOURCES[name]
+        protocol = getattr(artifact_types, wrapper.__name__)
+        items = getattr(artifacts, name)
+
+        assert items
+        for item in items:
+            assert type(item) is wrapper
+            assert isinstance(item, protocol)
+            assert not hasattr(item, "__dict__")
+
+    def test_missing_attribute_raises(self):
+        wrapper = ModelWrapper("model.p.m", "models/m.sql", DictProxy({}))
+
+        assert getattr(wrapper, "source", None) is None
+        with pytest.raises(AttributeError):
+            wrapper.extra = 1
+
+    def test_equality_and_repr(self):
+        model = DictProxy({"name": "m"})
+        wrapper = ModelWrapper("model.p.m", "models/m.sql", model)
+
+        assert wrapper == ModelWrapper("model.p.m", "models/m.sql", {"name": "m"})
+        assert wrapper != ModelWrapper("model.p.n", "models/m.sql", model)
+        assert wrapper != SourceWrapper("model.p.m", "models/m.sql", model)
+        assert repr(wrapper) == (
+            "ModelWrapper(unique_id='model.p.m', "
+            "original_file_path='models/m.sql', model={'name': 'm'})"
+        )
+
+    def test_copy(self):
+        wrapper = ModelWrapper("model.p.m", "models/m.sql", DictProxy({"name": "m"}))
+
+        assert copy.copy(wrapper) == wrapper
+        assert copy.deepcopy(wrapper) == wrapper
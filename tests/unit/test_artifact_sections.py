@@ -0,0 +1,125 @@
+"""Tests for memory-mapped, per-section artifact loading in `dbt_bouncer.artifact_parsers`."""
+
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from dbt_bouncer.artifact_parsers.parser import parse_dbt_artifacts
+from dbt_bouncer.artifact_parsers.sections import (
+    ArtifactSections,
+    index_sections,
+    map_artifact,
+)
+
+
+@pytest.fixture(
+    params=["dbt_110", "dbt_111", "dbt_112", "dbt_20"],
+    ids=["dbt_core_110", "dbt_core_111", "dbt_core_112", "dbt_20"],
+)
+def manifest_path(request) -> Path:
+    return Path(f"tests/fixtures/{request.param}/target/manifest.json")
+
+
+def _loaded(manifest) -> set[str]:
+    return set(dict.keys(manifest))
+
+
+def test_sections_match_full_decode(manifest_path):
+    """Every section decodes on its own to what a full decode yields."""
+    full = orjson.loads(manifest_path.read_bytes())
+
+    sections = ArtifactSections(map_artifact(manifest_path))
+
+    assert index_sections(map_artifact(manifest_path)) is not None
+    assert sections.names == list(full)
+    assert {name: sections.decode(name) for name in sections.names} == full
+
+
+def test_misplaced_boundary_falls_back_to_full_decode(caplog):
+    """A nested dict shaped like a section only costs a full decode."""
+    manifest = {
+        "metadata": {"dbt_version": "1.10.0"},
+        "nodes": {"model.p.a": {"meta": {"x": {}, "macros": {"macro.p.m": {}}}}},
+        "macros": {"macro.p.real": {"name": "real"}},
+    }
+    sections = ArtifactSections(orjson.dumps(manifest))
+
+    with caplog.at_level(logging.DEBUG):
+        assert sections.decode("nodes") == manifest["nodes"]
+
+    assert sections.decode("macros") == manifest["macros"]
+    assert sections.raw("macros") is None
+    assert "could not be decoded on its own" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b'{"nodes": {}, "metadata": {}}', id="metadata_not_first"),
+        pytest.param(b'{"metadata": {}, "nodes": {}} trailing', id="trailing_bytes"),
+    ],
+)
+def test_unindexable_bytes_are_decoded_in_full(data):
+    """Anything that does not look like a manifest is decoded whole."""
+    assert index_sections(data) is None
+
+
+def test_empty_file_is_read_not_mapped(tmp_path):
+    """An empty file cannot be mapped, so its (empty) bytes are returned."""
+    path = tmp_path / "manifest.json"
+    path.write_bytes(b"")
+
+    assert map_artifact(path) == b""
+
+
+class TestParseDecodesOnlyNeededSections:
+    """`parse_dbt_artifacts` decodes just what the configured checks need."""
+
+    @pytest.fixture(autouse=True)
+    def _no_cache(self, monkeypatch):
+        monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+
+    def test_catalog_only_run_skips_macros_and_child_map(self):
+        bouncer_config = MagicMock(spec=["package_name", "catalog_checks"])
+        bouncer_config.package_name = "dbt_bouncer_test_project"
+        bouncer_config.catalog_checks = [MagicMock()]
+
+        artifacts = parse_dbt_artifacts(
+            bouncer_config, Path("tests/fixtures/dbt_112/target")
+        )
+
+        manifest = artifacts.manifest_obj.manifest
+        assert _loaded(manifest) == {"metadata", "nodes", "sources"}
+        assert artifacts.macros == []
+        assert len(artifacts.catalog_nodes) > 0
+        # Skipped sections remain readable on demand.
+        assert "macro.dbt.run_query" in manifest.macros
+        assert "macros" in _loaded(manifest)
+        assert "child_map" not in _loaded(manifest)
+
+    def test_manifest_checks_decode_resource_sections(self):
+        bouncer_config = MagicMock(spec=["package_name", "manifest_checks"])
+        bouncer_config.package_name = "dbt_bouncer_test_project"
+        bouncer_config.manifest_checks = [MagicMock()]
+
+        artifacts = parse_dbt_artifacts(
+            bouncer_config, Path("tests/fixtures/dbt_112/target")
+        )
+
+        loaded = _loaded(artifacts.manifest_obj.manifest)
+        assert {"macros", "exposures", "unit_tests", "semantic_models"} <= loaded
+        assert "child_map" not in loaded
+        assert len(artifacts.macros) > 0
+
+    def test_summary_marks_skipped_collections(self, capsys):
+        bouncer_config = MagicMock(spec=["package_name", "catalog_checks"])
+        bouncer_config.package_name = "dbt_bouncer_test_project"
+        bouncer_config.catalog_checks = [MagicMock()]
+
+        parse_dbt_artifacts(bouncer_config, Path("tests/fixtures/dbt_112/target"))
+
+        out = capsys.readouterr().out
+        assert "not loaded" in out
@@ -0,0 +1,329 @@
+"""Tests for the parsed-artifact snapshot cache in `dbt_bouncer.artifact_parsers`.
+
+A snapshot may only ever stand in for a full parse of identical artifacts, so
+most of these tests change something about the inputs and assert the parser
+notices.
+"""
+
+import logging
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from dbt_bouncer.artifact_parsers.parser import (
+    LazySectionProxy,
+    parse_dbt_artifacts,
+)
+from dbt_bouncer.artifact_parsers.snapshot import (
+    artifact_cache_enabled,
+    write_snapshot,
+)
+
+
+@pytest.fixture
+def artifacts_dir(tmp_path) -> Path:
+    target = tmp_path / "target"
+    shutil.copytree(Path("tests/fixtures/dbt_112/target"), target)
+    return target
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path) -> Path:
+    import dbt_bouncer.utils as utils_mod
+
+    path = tmp_path / "cache"
+    monkeypatch.setattr(utils_mod, "get_cache_dir", lambda: path)
+    monkeypatch.delenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", raising=False)
+    return path
+
+
+def _config(catalog: bool = True, run_results: bool = True) -> MagicMock:
+    bouncer_config = MagicMock()
+    bouncer_config.package_name = "dbt_bouncer_test_project"
+    bouncer_config.catalog_checks = [MagicMock()] if catalog else []
+    bouncer_config.run_results_checks = [MagicMock()] if run_results else []
+    return bouncer_config
+
+
+def _summary(artifacts) -> dict[str, list[str]]:
+    return {
+        name: sorted(
+            getattr(item, "unique_id", None) or item["unique_id"]
+            for item in getattr(artifacts, name)
+        )
+        for name in artifacts._fields
+        if name != "manifest_obj"
+    }
+
+
+def _snapshots(cache_dir: Path) -> list[Path]:
+    return sorted(cache_dir.glob("artifacts_*.snapshot"))
+
+
+def _served_from_snapshot(caplog) -> bool:
+    return "Loaded parsed artifacts from snapshot" in caplog.text
+
+
+@pytest.mark.usefixtures("cache_dir")
+class TestParseWithSnapshot:
+    """End-to-end behaviour of `parse_dbt_artifacts` with the cache enabled."""
+
+    def test_warm_parse_matches_cold_parse(self, artifacts_dir, cache_dir):
+        """A snapshot-served parse yields the same resources as a full parse."""
+        cold = parse_dbt_artifacts(_config(), artifacts_dir)
+        assert len(_snapshots(cache_dir)) == 1
+
+        warm = parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert isinstance(warm.manifest_obj.manifest, LazySectionProxy)
+        assert _summary(warm) == _summary(cold)
+        assert warm.models[0].model == cold.models[0].model
+        assert warm.models[0].original_file_path == cold.models[0].original_file_path
+        assert (
+            warm.manifest_obj.manifest.metadata.project_name
+            == cold.manifest_obj.manifest.metadata.project_name
+        )
+        assert warm.manifest_obj.manifest == cold.manifest_obj.manifest
+
+    def test_manifest_sections_share_project_dicts(self, artifacts_dir):
+        """A lazily decoded section reuses the dicts the project lists hold."""
+        parse_dbt_artifacts(_config(), artifacts_dir)
+        warm = parse_dbt_artifacts(_config(), artifacts_dir)
+
+        model = warm.models[0]
+        nodes = warm.manifest_obj.manifest.nodes
+        assert dict.__getitem__(nodes, model.unique_id)[
+            "depends_on"
+        ] is dict.__getitem__(model.model, "depends_on")
+
+    def test_undecoded_sections_are_served_from_snapshot(self, artifacts_dir):
+        """Sections a cold run never decoded are copied and decode on a warm run."""
+        bouncer_config = MagicMock(spec=["package_name", "catalog_checks"])
+        bouncer_config.package_name = "dbt_bouncer_test_project"
+        bouncer_config.catalog_checks = [MagicMock()]
+        full = orjson.loads((artifacts_dir / "manifest.json").read_bytes())
+
+        parse_dbt_artifacts(bouncer_config, artifacts_dir)
+        warm = parse_dbt_artifacts(bouncer_config, artifacts_dir)
+
+        assert warm.manifest_obj.manifest.child_map == full["child_map"]
+        assert warm.manifest_obj.manifest.macros == full["macros"]
+
+    def test_touched_artifact_with_same_content_is_a_hit(self, artifacts_dir, caplog):
+        """A new mtime alone falls back to the content digest, which still matches."""
+        parse_dbt_artifacts(_config(), artifacts_dir)
+        manifest = artifacts_dir / "manifest.json"
+        st = manifest.stat()
+        os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+
+        with caplog.at_level(logging.DEBUG):
+            parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert _served_from_snapshot(caplog)
+
+    def test_changed_artifact_is_reparsed(self, artifacts_dir, caplog):
+        """Changing an artifact's content invalidates the snapshot."""
+        parse_dbt_artifacts(_config(), artifacts_dir)
+        manifest = artifacts_dir / "manifest.json"
+        data = orjson.loads(manifest.read_bytes())
+        uid = next(
+            k
+            for k, v in data["nodes"].items()
+            if v["resource_type"] == "model"
+            and v["package_name"] == "dbt_bouncer_test_project"
+        )
+        data["nodes"][uid]["description"] = "A different description."
+        manifest.write_bytes(orjson.dumps(data))
+
+        with caplog.at_level(logging.DEBUG):
+            result = parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert not _served_from_snapshot(caplog)
+        model = next(m for m in result.models if m.unique_id == uid)
+        assert model.model.description == "A different description."
+
+    def test_changed_catalog_is_reparsed(self, artifacts_dir, caplog):
+        """Every artifact the snapshot was built from is part of its key."""
+        parse_dbt_artifacts(_config(), artifacts_dir)
+        catalog = artifacts_dir / "catalog.json"
+        catalog.write_bytes(orjson.dumps(orjson.loads(catalog.read_bytes())) + b" ")
+
+        with caplog.at_level(logging.DEBUG):
+            parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert not _served_from_snapshot(caplog)
+
+    def test_config_change_uses_separate_snapshot(
+        self, artifacts_dir, cache_dir, caplog
+    ):
+        """Parses that load different artifacts never share a snapshot."""
+        parse_dbt_artifacts(_config(catalog=False), artifacts_dir)
+        with caplog.at_level(logging.DEBUG):
+            result = parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert not _served_from_snapshot(caplog)
+        assert len(result.catalog_nodes) > 0
+        assert len(_snapshots(cache_dir)) == 2
+
+    def test_missing_catalog_still_raises(self, artifacts_dir):
+        """A snapshot never hides an artifact that has since been deleted."""
+        from dbt_bouncer.exceptions import DbtBouncerArtifactError
+
+        parse_dbt_artifacts(_config(), artifacts_dir)
+        (artifacts_dir / "catalog.json").unlink()
+
+        with pytest.raises(DbtBouncerArtifactError, match=r"No catalog\.json found"):
+            parse_dbt_artifacts(_config(), artifacts_dir)
+
+    def test_corrupt_snapshot_is_reparsed(self, artifacts_dir, cache_dir, caplog):
+        """A truncated snapshot degrades to a full parse and is rewritten."""
+        parse_dbt_artifacts(_config(), artifacts_dir)
+        (snapshot,) = _snapshots(cache_dir)
+        snapshot.write_bytes(snapshot.read_bytes()[:200])
+
+        with caplog.at_level(logging.DEBUG):
+            parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert not _served_from_snapshot(caplog)
+        assert "Artifact snapshot unreadable, reparsing." in caplog.text
+        assert snapshot.stat().st_size > 200
+
+    def test_disabled_cache_writes_nothing(self, artifacts_dir, cache_dir, monkeypatch):
+        """The env var escape hatch skips both reading and writing."""
+        monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+
+        parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert not cache_dir.exists()
+
+
+class TestArtifactCacheEnabled:
+    """Tests for the `DBT_BOUNCER_DISABLE_ARTIFACT_CACHE` escape hatch."""
+
+    @pytest.mark.parametrize("value", ["1", "true", "TRUE", "yes"])
+    def test_truthy_values_disable(self, monkeypatch, value):
+        monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", value)
+        assert artifact_cache_enabled() is False
+
+    @pytest.mark.parametrize("value", ["", "0", "false", "no"])
+    def test_other_values_leave_enabled(self, monkeypatch, value):
+        monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", value)
+        assert artifact_cache_enabled() is True
+
+
+class TestWriteSnapshot:
+    """Tests for `write_snapshot`, which must never raise into the parser."""
+
+    def test_unwritable_path_is_skipped(self, caplog, tmp_path):
+        """An unwritable cache location skips the write rather than raising."""
+        blocked = tmp_path / "blocked"
+        blocked.write_text("not a directory")
+
+        with caplog.at_level(logging.DEBUG):
+            write_snapshot(blocked / "artifacts_x.snapshot", "k", {}, {"s": 1})
+
+        assert "Artifact snapshot write failed." in caplog.text
+
+    def test_stale_snapshots_are_pruned(self, tmp_path):
+        """Only the most recently written snapshots are kept."""
+        for i in range(12):
+            write_snapshot(tmp_path / f"artifacts_{i:02}.snapshot", "k", {}, {"s": i})
+
+        remaining = _snapshots(tmp_path)
+        assert len(remaining) == 8
+        assert tmp_path / "artifacts_11.snapshot" in remaining
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TestLazySectionProxy:
+    """Tests for the deferred-section manifest proxy."""
+
+    def test_keyed_access_loads_only_that_section(self):
+        calls: list[str] = []
+
+        def loader(key):
+            def load():
+                calls.append(key)
+                return {"key": key}
+
+            return load
+
+        proxy = LazySectionProxy({k: loader(k) for k in ("a", "b", "c")})
+
+        assert proxy.b.key == "b"
+        assert proxy["b"]["key"] == "b"
+        assert "c" in proxy
+        assert "missing" not in proxy
+        assert len(proxy) == 3
+        assert calls == ["b"]
+
+    def test_iteration_loads_everything_in_order(self):
+        proxy = LazySectionProxy({k: (lambda k=k: k.upper()) for k in ("a", "b")})
+        assert proxy.b == "B"
+
+        assert list(proxy) == ["a", "b"]
+        assert dict(proxy.items()) == {"a": "A", "b": "B"}
+        assert proxy == {"a": "A", "b": "B"}
+
+
+@pytest.mark.usefixtures("cache_dir")
+class TestKeepParsedArtifacts:
+    """Artifacts kept in memory by a long-lived process (`dbt-bouncer serve`)."""
+
+    @pytest.fixture(autouse=True)
+    def _keep(self, monkeypatch):
+        from dbt_bouncer.artifact_parsers import parser
+
+        monkeypatch.setattr(parser, "_warm_artifacts", None)
+        parser.keep_parsed_artifacts()
+
+    def test_unchanged_artifacts_are_reused(self, artifacts_dir):
+        first = parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert parse_dbt_artifacts(_config(), artifacts_dir) is first
+        assert parse_dbt_artifacts(_config(catalog=False), artifacts_dir) is not first
+
+    def test_touched_artifact_is_reparsed(self, artifacts_dir):
+        first = parse_dbt_artifacts(_config(), artifacts_dir)
+        catalog = artifacts_dir / "catalog.json"
+        st = catalog.stat()
+        os.utime(catalog, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        second = parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert second is not first
+        assert _summary(second) == _summary(first)
+
+    def test_changed_run_results_are_reparsed_alone(self, artifacts_dir):
+        first = parse_dbt_artifacts(_config(), artifacts_dir)
+        run_results = artifacts_dir / "run_results.json"
+        data = orjson.loads(run_results.read_bytes())
+        dropped = data["results"].pop()["unique_id"]
+        run_results.write_bytes(orjson.dumps(data))
+
+        second = parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert second.manifest_obj is first.manifest_obj
+        assert second.models is first.models
+        assert second.catalog_nodes is first.catalog_nodes
+        assert dropped not in _summary(second)["run_results"]
+        assert {r.unique_id: r.original_file_path for r in second.run_results} == {
+            r.unique_id: r.original_file_path
+            for r in first.run_results
+            if r.unique_id != dropped
+        }
+
+    def test_changed_manifest_is_reparsed_in_full(self, artifacts_dir):
+        first = parse_dbt_artifacts(_config(), artifacts_dir)
+        manifest = artifacts_dir / "manifest.json"
+        st = manifest.stat()
+        os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        second = parse_dbt_artifacts(_config(), artifacts_dir)
+
+        assert second.manifest_obj is not first.manifest_obj
+        assert _summary(second) == _summary(first)
@@ -0,0 +1,118 @@
+"""Tests for the package-filtered manifest loader in `dbt_bouncer.artifact_parsers`."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from dbt_bouncer.artifact_parsers.parser import parse_dbt_artifacts
+from dbt_bouncer.artifact_parsers.streaming import (
+    _SKELETON_FIELDS,
+    load_package_manifest,
+)
+from dbt_bouncer.selectors import MANIFEST_COLLECTIONS
+
+
+@pytest.fixture(
+    params=["dbt_110", "dbt_111", "dbt_112", "dbt_20"],
+    ids=["dbt_core_110", "dbt_core_111", "dbt_core_112", "dbt_20"],
+)
+def manifest_bytes(request) -> bytes:
+    return Path(f"tests/fixtures/{request.param}/target/manifest.json").read_bytes()
+
+
+def _expected(full: dict, target_package: str) -> dict:
+    expected = dict(full)
+    for name in MANIFEST_COLLECTIONS:
+        if name in full:
+            expected[name] = {
+                uid: v
+                if v.get("package_name") == target_package
+                else {k: x for k, x in v.items() if k in _SKELETON_FIELDS}
+                for uid, v in full[name].items()
+            }
+    return expected
+
+
+def test_matches_filtered_full_decode(manifest_bytes):
+    """Target-package resources are kept whole and everything else is reduced."""
+    full = orjson.loads(manifest_bytes)
+
+    result = load_package_manifest(manifest_bytes, None)
+
+    assert result == _expected(full, full["metadata"]["project_name"])
+    assert list(result) == list(full)
+
+
+def test_foreign_resources_keep_selector_fields(manifest_bytes):
+    """A foreign macro keeps what selectors and the macro checks read."""
+    result = load_package_manifest(manifest_bytes, None)
+
+    macro = result["macros"]["macro.dbt.run_query"]
+    assert macro["package_name"] == "dbt"
+    assert "depends_on" in macro
+    assert "macro_sql" not in macro
+
+
+def test_explicit_package_name_is_the_target(manifest_bytes):
+    """`package_name` overrides the manifest's own project name."""
+    full = orjson.loads(manifest_bytes)
+
+    result = load_package_manifest(manifest_bytes, "dbt")
+
+    assert result == _expected(full, "dbt")
+
+
+def test_uid_shaped_nested_keys_do_not_split_entries():
+    """A nested dict keyed like a unique ID is not mistaken for an entry boundary."""
+    manifest = {
+        "metadata": {"project_name": "proj", "env": {}},
+        "nodes": {
+            "model.proj.a": {
+                "package_name": "proj",
+                "meta": {"model.proj.b": {"x": {}}, "docs": {}},
+                "config": {"meta": {}},
+            },
+            "model.pkg.c": {"package_name": "pkg", "raw_code": "select '}}'"},
+        },
+        "sources": {},
+        "parent_map": {"model.proj.a": []},
+    }
+    data = orjson.dumps(manifest)
+
+    result = load_package_manifest(data, None)
+
+    assert result == _expected(manifest, "proj")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b'{"metadata": {"project_name": "p"}, "nodes": {', id="truncated"),
+        pytest.param(b'["not", "a", "manifest"]', id="not_an_object"),
+        pytest.param(b'{"nodes": {}}', id="no_metadata"),
+    ],
+)
+def test_unscannable_bytes_return_none(data):
+    """Anything the scanner can't vouch for is left to a full decode."""
+    assert load_package_manifest(data, None) is None
+
+
+def test_parse_dbt_artifacts_low_memory(monkeypatch):
+    """`low_memory` yields the same project resources as a regular parse."""
+    monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+    bouncer_config = MagicMock()
+    bouncer_config.package_name = "dbt_bouncer_test_project"
+    bouncer_config.catalog_checks = [MagicMock()]
+    bouncer_config.run_results_checks = [MagicMock()]
+    artifacts_dir = Path("tests/fixtures/dbt_112/target")
+
+    regular = parse_dbt_artifacts(bouncer_config, artifacts_dir)
+    lean = parse_dbt_artifacts(bouncer_config, artifacts_dir, low_memory=True)
+
+    for name in regular._fields:
+        if name == "manifest_obj":
+            continue
+        assert getattr(lean, name) == getattr(regular, name), name
+    assert "macro_sql" not in lean.manifest_obj.manifest.macros["macro.dbt.run_query"]
@@ -0,0 +1,109 @@
+"""Tests for the column-oriented resource tables in `dbt_bouncer.artifact_parsers`."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from dbt_bouncer.artifact_parsers.parser import (
+    DictProxy,
+    ListProxy,
+    parse_dbt_artifacts,
+    wrap_dict,
+)
+from dbt_bouncer.artifact_parsers.tables import build_resource_table
+from dbt_bouncer.check_framework.context import CheckContext
+
+
+@pytest.fixture(scope="module")
+def artifacts():
+    bouncer_config = MagicMock()
+    bouncer_config.package_name = "dbt_bouncer_test_project"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+        return parse_dbt_artifacts(
+            bouncer_config, Path("tests/fixtures/dbt_112/target")
+        )
+
+
+@pytest.mark.parametrize("name", ["models", "sources", "tests", "macros"])
+def test_columns_match_proxy_reads(artifacts, name):
+    """Every column agrees with what a check reads off the proxy for that row."""
+    table = build_resource_table(getattr(artifacts, name))
+
+    assert len(table) == len(getattr(artifacts, name)) > 0
+    for i, node in enumerate(table.resources):
+        assert isinstance(node, DictProxy)
+        assert table.unique_id[i] == node.unique_id
+        assert table.name[i] == node.name
+        assert table.path[i] == node.original_file_path
+        assert table.materialized[i] == (node.config or {}).get("materialized")
+        assert table.description_length[i] == len((node.description or "").strip())
+        assert table.tags[i] == tuple(node.tags or ())
+        assert table.meta_keys[i] == set(node.meta or {})
+        assert table.row_by_unique_id[node.unique_id] == i
+
+
+def test_building_does_not_wrap_children():
+    """Columns are read from the raw values, leaving the proxies untouched."""
+    model = wrap_dict({"unique_id": "model.p.a", "tags": ["x"], "meta": {"k": 1}})
+
+    table = build_resource_table([model])
+
+    assert table.tags == [("x",)]
+    assert type(dict.__getitem__(model, "tags")) is list
+    assert not isinstance(table.tags[0][0], ListProxy)
+
+
+def test_missing_fields_default_to_empty():
+    table = build_resource_table([wrap_dict({"unique_id": "model.p.a"})])
+
+    assert table.name == [None]
+    assert table.materialized == [None]
+    assert table.description == [""]
+    assert table.description_length == [0]
+    assert table.tags == [()]
+    assert table.meta_keys == [frozenset()]
+
+
+def test_rows_follow_the_given_resources(artifacts):
+    """`rows` maps a filtered resource list back onto table rows, in order."""
+    table = build_resource_table(artifacts.sources)
+    subset = list(reversed(artifacts.sources))
+
+    rows = table.rows(subset)
+
+    assert [table.unique_id[i] for i in rows] == [s.unique_id for s in subset]
+
+
+def test_rows_match_by_identity(artifacts):
+    """A resource that is not one of the table's own objects has no row."""
+    table = build_resource_table(artifacts.models)
+    lookalike = wrap_dict(dict(artifacts.models[0].model))
+
+    assert table.rows([artifacts.models[0]]) == [0]
+    assert table.rows([lookalike]) is None
+
+
+def test_check_context_table_rows_falls_back_to_own_table(artifacts):
+    """Resources from outside the context get a table of their own."""
+    ctx = CheckContext(models=[m.model for m in artifacts.models])
+    outsider = wrap_dict({"name": "other", "unique_id": "model.p.other"})
+
+    table, rows = ctx.table_rows("models", [ctx.models[1]])
+    assert table is ctx.table("models")
+    assert rows == [1]
+
+    table, rows = ctx.table_rows("models", [outsider])
+    assert table.resources == [outsider]
+    assert rows == [0]
+
+
+def test_check_context_builds_each_table_once(artifacts):
+    ctx = CheckContext(models=[m.model for m in artifacts.models])
+
+    table = ctx.table("models")
+
+    assert table.resources == ctx.models
+    assert ctx.table("models") is table
+    assert len(ctx.table("seeds")) == 0
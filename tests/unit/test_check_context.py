@@ -28,6 +28,20 @@ def test_check_context_with_data():
     assert ctx.models == fake_models
 
 
+def test_check_context_derived_values_are_built_once():
+    """CheckContext.derived computes each value once per context."""
+    ctx = CheckContext(manifest_obj=None)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"model.a": 1}
+
+    assert ctx.derived("key", build) is ctx.derived("key", build)
+    assert ctx.derived("other", dict) == {}
+    assert len(calls) == 1
+
+
 def test_check_context_is_frozen():
     """CheckContext is immutable."""
     ctx = CheckContext(manifest_obj=None)
@@ -69,6 +69,22 @@ def check_decorator_resource_and_ctx(model, ctx):
 CheckDecoratorResourceAndCtx = check_decorator_resource_and_ctx
 
 
+@check(batch=True)
+def check_decorator_batch(models, *, min_length: int = 3):
+    """Validate batch check yielding failures for short names.
+
+    Yields:
+        tuple: Each model whose name is too short, with its message.
+
+    """
+    for model in models:
+        if len(model.name) < min_length:
+            yield model, f"Model name `{model.name}` is too short."
+
+
+CheckDecoratorBatch = check_decorator_batch
+
+
 # --- Tests ---
 
 
@@ -175,3 +191,42 @@ class TestFailHelper:
     def test_raises_failed_check_error(self):
         with pytest.raises(DbtBouncerFailedCheckError, match="test message"):
             fail("test message")
+
+
+class TestBatchChecks:
+    def test_iterate_over_is_the_singular_of_the_parameter(self):
+        assert CheckDecoratorBatch.batch is True
+        assert CheckDecoratorBatch.iterate_over == "model"
+        assert CheckDecoratorBasic.batch is False
+
+    def test_execute_batch_yields_failing_resources(self):
+        from dbt_bouncer.artifact_parsers.parser import wrap_dict
+
+        short = wrap_dict({"name": "ab"})
+        models = [wrap_dict({"name": "stg_orders"}), short]
+        instance = CheckDecoratorBatch(name="check_decorator_batch")
+
+        assert list(instance.execute_batch(models)) == [
+            (short, "Model name `ab` is too short.")
+        ]
+
+    def test_execute_runs_the_bound_resource_through_the_batch(self):
+        from dbt_bouncer.artifact_parsers.parser import wrap_dict
+
+        instance = CheckDecoratorBatch(
+            name="check_decorator_batch", model=wrap_dict({"name": "ab"})
+        )
+        with pytest.raises(DbtBouncerFailedCheckError, match="too short"):
+            instance.execute()
+
+        instance = CheckDecoratorBatch(
+            name="check_decorator_batch", model=wrap_dict({"name": "abc"})
+        )
+        instance.execute()
+
+    def test_rejects_singular_resource_parameter(self):
+        def check_singular(model):
+            """Not a batch signature."""
+
+        with pytest.raises(TypeError, match="plural resource parameter"):
+            check(batch=True)(check_singular)
@@ -0,0 +1,80 @@
+"""Unit tests for dbt_bouncer.cli.merge."""
+
+import orjson
+import pytest
+from typer.testing import CliRunner
+
+from dbt_bouncer.enums import CheckOutcome, CheckSeverity, ExitCode
+from dbt_bouncer.main import app
+from dbt_bouncer.reporting.formatters import _format_results
+
+runner = CliRunner()
+
+
+def _result(check_run_id, outcome=CheckOutcome.SUCCESS, severity=CheckSeverity.ERROR):
+    return {
+        "check_run_id": check_run_id,
+        "failure_message": "Failed." if outcome == CheckOutcome.FAILED else None,
+        "file_path": f"models/{check_run_id}.sql",
+        "outcome": outcome,
+        "severity": severity,
+        "unique_id": f"model.my_project.{check_run_id}",
+    }
+
+
+@pytest.fixture
+def write_shards(tmp_path):
+    def write(shards, output_format="json"):
+        files = []
+        for i, results in enumerate(shards, 1):
+            file = tmp_path / f"shard-{i}.{output_format}"
+            file.write_bytes(_format_results(results, output_format))
+            files.append(str(file))
+        return files
+
+    return write
+
+
+class TestMergeCommand:
+    """Tests for the `merge` CLI subcommand."""
+
+    def test_merges_shards_in_order(self, tmp_path, write_shards):
+        """The merged file holds every shard's results, in argument order."""
+        files = write_shards([[_result("a"), _result("b")], [_result("c")]])
+        merged = tmp_path / "merged.json"
+
+        result = runner.invoke(app, ["merge", *files, "--output-file", str(merged)])
+
+        assert result.exit_code == ExitCode.SUCCESS
+        assert [r["check_run_id"] for r in orjson.loads(merged.read_bytes())] == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    @pytest.mark.parametrize("output_format", ["csv", "json", "sarif", "tap"])
+    @pytest.mark.parametrize(
+        ("severity", "exit_code"),
+        [(CheckSeverity.ERROR, ExitCode.CHECK_ERRORS), (CheckSeverity.WARN, 0)],
+    )
+    def test_exit_code_reflects_every_shard(
+        self, write_shards, output_format, severity, exit_code
+    ):
+        """A failure in any one shard decides the exit code, as in a full run."""
+        files = write_shards(
+            [[_result("a")], [_result("b", CheckOutcome.FAILED, severity)]],
+            output_format,
+        )
+
+        result = runner.invoke(app, ["merge", *files, "--output-format", output_format])
+
+        assert result.exit_code == exit_code
+
+    def test_unreadable_file_is_an_artifact_error(self, tmp_path, write_shards):
+        """A file that is not in the given format exits with ARTIFACT_ERROR."""
+        files = write_shards([[_result("a")]])
+        (tmp_path / "other.json").write_text("{}")
+
+        result = runner.invoke(app, ["merge", *files, str(tmp_path / "other.json")])
+
+        assert result.exit_code == ExitCode.ARTIFACT_ERROR
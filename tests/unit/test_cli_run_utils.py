@@ -6,8 +6,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from dbt_bouncer.cli.run.utils import _build_context, detect_config_file_source
+from dbt_bouncer.cli.run.utils import (
+    _build_context,
+    _parse_shard,
+    detect_config_file_source,
+    run_bouncer,
+)
 from dbt_bouncer.enums import ConfigFileName, ConfigFileSource
+from dbt_bouncer.exceptions import DbtBouncerConfigError
 
 
 class TestDetectConfigFileSource:
@@ -107,16 +113,19 @@ class TestBuildContext:
         assert ctx.check_categories == ["manifest_checks"]
         assert ctx.create_pr_comment_file is False
         assert ctx.dry_run is False
+        assert ctx.jobs == 0
         assert ctx.output_format == "json"
         assert ctx.output_only_failures is False
         assert ctx.show_all_failures is False
         mock_parse.assert_called_once_with(
-            bouncer_config=bouncer_config, dbt_artifacts_dir=Path("target")
+            bouncer_config=bouncer_config,
+            dbt_artifacts_dir=Path("target"),
+            low_memory=False,
         )
 
     @patch("dbt_bouncer.artifact_parsers.parser.parse_dbt_artifacts")
     def test_dry_run_passed_through(self, mock_parse: MagicMock):
-        """dry_run flag should be forwarded to the context."""
+        """dry_run and the other run options should be forwarded to the context."""
         mock_parse.return_value = SimpleNamespace(
             catalog_nodes=[],
             catalog_sources=[],
@@ -139,6 +148,7 @@ class TestBuildContext:
             create_pr_comment_file=False,
             dbt_artifacts_dir=Path("target"),
             dry_run=True,
+            jobs=4,
             output_file=Path("out.json"),
             output_format="json",
             output_only_failures=True,
@@ -146,6 +156,35 @@ class TestBuildContext:
         )
 
         assert ctx.dry_run is True
+        assert ctx.jobs == 4
         assert ctx.output_file == Path("out.json")
         assert ctx.output_only_failures is True
         assert ctx.show_all_failures is True
+
+
+class TestParseShard:
+    """Tests for _parse_shard."""
+
+    def test_valid(self):
+        """`i/N` parses to a 1-based index and a count."""
+        assert _parse_shard(" 2/4 ") == (2, 4)
+
+    @pytest.mark.parametrize("shard", ["0/4", "5/4", "2", "2/", "a/b", "-1/4"])
+    def test_invalid_raises(self, shard: str):
+        """Values outside `1 <= i <= N` are config errors."""
+        with pytest.raises(DbtBouncerConfigError, match="--shard"):
+            _parse_shard(shard)
+
+
+class TestMaxFailures:
+    """Tests for the `--fail-fast` and `--max-failures` arguments of run_bouncer."""
+
+    def test_fail_fast_conflicting_with_max_failures_raises(self):
+        """`--fail-fast` is `--max-failures 1`, so any other limit conflicts."""
+        with pytest.raises(DbtBouncerConfigError, match="--fail-fast"):
+            run_bouncer(fail_fast=True, max_failures=2)
+
+    def test_max_failures_below_one_raises(self):
+        """Stopping before any failure would never run a check."""
+        with pytest.raises(DbtBouncerConfigError, match="--max-failures"):
+            run_bouncer(max_failures=0)
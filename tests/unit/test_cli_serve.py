@@ -0,0 +1,143 @@
+"""Unit tests for `dbt-bouncer serve` and `dbt_bouncer.client`."""
+
+import json
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dbt_bouncer import client
+from dbt_bouncer.artifact_parsers import parser
+from dbt_bouncer.cli.serve import server
+from dbt_bouncer.enums import ExitCode
+
+
+def _request(tmp_path, args=(), env=None):
+    return {
+        "v": client.PROTOCOL_VERSION,
+        "args": list(args),
+        "cwd": str(tmp_path),
+        "env": env or {},
+    }
+
+
+class TestHandleRequest:
+    """Tests for how the server runs one request."""
+
+    def test_runs_in_the_client_directory_and_captures_output(self, tmp_path):
+        seen = {}
+
+        def run(args):
+            seen["args"] = args
+            seen["cwd"] = Path.cwd()
+            sys.stdout.write("to stdout\n")
+            sys.stderr.write("to stderr")
+            return ExitCode.CHECK_ERRORS
+
+        cwd = Path.cwd()
+        response = server.handle_request(_request(tmp_path, ["--check", "x"]), run)
+
+        assert response == {
+            "exit_code": 1,
+            "stdout": "to stdout\n",
+            "stderr": "to stderr",
+        }
+        assert seen == {"args": ["--check", "x"], "cwd": tmp_path}
+        assert Path.cwd() == cwd
+
+    def test_forwarded_environment_replaces_the_servers(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DBT_BOUNCER_CONFIG_FILE", "server.yml")
+        monkeypatch.setenv("HOME_ONLY_ON_SERVER", "kept")
+        seen = {}
+
+        def run(_args):
+            seen.update(
+                config=os.environ.get("DBT_BOUNCER_CONFIG_FILE"),
+                log_level=os.environ.get("LOG_LEVEL"),
+                other=os.environ.get("HOME_ONLY_ON_SERVER"),
+            )
+            return 0
+
+        server.handle_request(_request(tmp_path, env={"LOG_LEVEL": "DEBUG"}), run)
+
+        assert seen == {"config": None, "log_level": "DEBUG", "other": "kept"}
+        assert os.environ["DBT_BOUNCER_CONFIG_FILE"] == "server.yml"
+        assert "LOG_LEVEL" not in os.environ
+
+    def test_unexpected_error_is_reported(self, tmp_path):
+        def run(_args):
+            raise RuntimeError("boom")
+
+        response = server.handle_request(_request(tmp_path), run)
+
+        assert response["exit_code"] == ExitCode.CHECK_ERRORS
+        assert "RuntimeError: boom" in response["stderr"]
+
+    @pytest.mark.parametrize("request_", [None, {"v": 0}, {"args": []}])
+    def test_unknown_request_is_refused(self, request_):
+        assert "error" in server.handle_request(request_, lambda _args: 0)
+
+    def test_missing_directory_is_refused(self, tmp_path):
+        response = server.handle_request(
+            _request(tmp_path / "missing"), lambda _args: 0
+        )
+
+        assert "error" in response
+
+
+def test_request_run_without_server(tmp_path):
+    assert client.request_run([], socket_path=tmp_path / "none.sock") is None
+
+
+def test_forwarded_env_keeps_only_what_a_run_reads():
+    assert client.forwarded_env(
+        {"DBT_BOUNCER_CONFIG_FILE": "a", "LOG_FORMAT": "json", "PATH": "/bin"}
+    ) == {"DBT_BOUNCER_CONFIG_FILE": "a", "LOG_FORMAT": "json"}
+
+
+def test_serve_answers_runs_with_warm_artifacts(tmp_path, monkeypatch):
+    # `serve` keeps parsed artifacts for the rest of the process: undo that.
+    monkeypatch.setattr(parser, "_warm_artifacts", None)
+    shutil.copy(Path("dbt_project/target/manifest.json"), tmp_path / "manifest.json")
+    (tmp_path / "dbt-bouncer.yml").write_text(
+        yaml.dump(
+            {
+                "dbt_artifacts_dir": ".",
+                "manifest_checks": [
+                    {"name": "check_model_names", "model_name_pattern": "^stg_"}
+                ],
+            }
+        )
+    )
+    socket_path = tmp_path / "serve.sock"
+    ready = threading.Event()
+    # A daemon, so a failed request cannot leave it blocking the worker's exit.
+    thread = threading.Thread(
+        target=server.serve,
+        args=(socket_path,),
+        kwargs={"max_requests": 2, "ready": ready},
+        daemon=True,
+    )
+    thread.start()
+    try:
+        assert ready.wait(60)
+        monkeypatch.chdir(tmp_path)
+        args = ["--output-file", "results.json"]
+        first = client.request_run(args, socket_path=socket_path)
+        warm = parser._warm_artifacts.copy()
+        second = client.request_run(args, socket_path=socket_path)
+    finally:
+        thread.join(60)
+
+    assert first["exit_code"] == second["exit_code"] == ExitCode.CHECK_ERRORS
+    assert "Assembled" in second["stderr"]
+    assert json.loads((tmp_path / "results.json").read_text())
+    # The second run reused the artifacts the first one parsed.
+    assert [id(a) for _, _, a in warm.values()] == [
+        id(a) for _, _, a in parser._warm_artifacts.values()
+    ]
+    assert not socket_path.exists()
@@ -107,6 +107,48 @@ class TestStudioCommand:
         assert result.exit_code == 0
         assert "2 error" in result.output
 
+    def test_studio_watch_redraws_when_results_change(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """With --watch, the dashboard is redrawn from the updated results file."""
+        from dbt_bouncer.cli.watch import utils as watch_utils
+
+        result_record = {
+            "check_run_id": "check_model_names:0:staging_stg_customers",
+            "outcome": "failed",
+            "severity": "error",
+            "failure_message": "bad name",
+        }
+        results_file = tmp_path / "results.json"
+        results_file.write_text(json.dumps([]))
+        waits = []
+
+        def wait_for_change(paths, *_args, **_kwargs):
+            waits.append(paths)
+            if len(waits) > 1:
+                raise KeyboardInterrupt
+            results_file.write_text(json.dumps([result_record]))
+
+        monkeypatch.setattr(watch_utils, "wait_for_change", wait_for_change)
+
+        result = runner.invoke(
+            app,
+            [
+                "studio",
+                "--results-file",
+                str(results_file),
+                "--search",
+                "check_model_names",
+                "--watch",
+            ],
+            env={"COLUMNS": "160"},
+        )
+
+        assert result.exit_code == 0
+        assert waits == [[results_file]] * 2
+        assert result.output.count("Available & Configured Checks") == 2
+        assert "1 error" in result.output
+
     def test_studio_results_distinguishes_error_and_warn(self, tmp_path: Path):
         """A failed check with warn severity is shown as a warning, not an error."""
         results_file = tmp_path / "results.json"
@@ -0,0 +1,140 @@
+"""Unit tests for `dbt-bouncer watch`."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from dbt_bouncer.artifact_parsers import parser
+from dbt_bouncer.cli.watch import utils
+from dbt_bouncer.enums import ExitCode
+from dbt_bouncer.main import app
+
+
+def _sleep_then(*edits):
+    # A fake `sleep` that applies one of `edits` per call, then none.
+    pending = list(edits)
+    calls = []
+
+    def sleep(seconds):
+        calls.append(seconds)
+        if pending:
+            pending.pop(0)()
+
+    sleep.calls = calls
+    return sleep
+
+
+def test_wait_for_change_waits_for_files_to_settle(tmp_path):
+    manifest, catalog = tmp_path / "manifest.json", tmp_path / "catalog.json"
+    manifest.write_text("{}")
+    paths = [manifest, catalog]
+    before = utils.file_stats(paths)
+    sleep = _sleep_then(
+        lambda: None,
+        lambda: manifest.write_text('{"a": 1}'),
+        lambda: catalog.write_text("{}"),
+    )
+
+    settled = utils.wait_for_change(paths, before, interval=0.1, sleep=sleep)
+
+    assert settled == utils.file_stats(paths)
+    assert None not in settled
+    # Two polls without a change, one for each write, then one to confirm.
+    assert sleep.calls == [0.1] * 4
+
+
+def test_watched_paths_follow_the_configured_artifacts_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / "dbt-bouncer.yml"
+    config.write_text(yaml.dump({"dbt_artifacts_dir": "artifacts"}))
+
+    assert utils.watched_paths(config) == [
+        config,
+        tmp_path / "artifacts" / "manifest.json",
+        tmp_path / "artifacts" / "catalog.json",
+        tmp_path / "artifacts" / "run_results.json",
+    ]
+
+
+def test_watched_paths_default_to_the_dbt_project_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DBT_PROJECT_DIR", str(tmp_path / "proj"))
+    config = tmp_path / "dbt-bouncer.yml"
+    config.write_text(yaml.dump({"manifest_checks": []}))
+
+    assert utils.watched_paths(config)[1:] == [
+        tmp_path / "proj" / "target" / "manifest.json",
+        tmp_path / "proj" / "target" / "catalog.json",
+        tmp_path / "proj" / "target" / "run_results.json",
+    ]
+
+
+@pytest.mark.parametrize("contents", ["manifest_checks: [", ""])
+def test_watched_paths_fall_back_to_the_config_file(tmp_path, contents):
+    config = tmp_path / "bouncer.yml"
+    config.write_text(contents)
+
+    assert utils.watched_paths(config) == [config]
+
+
+def test_watch_reruns_when_a_watched_file_changes(tmp_path):
+    watched = tmp_path / "manifest.json"
+    watched.write_text("{}")
+    exit_codes = iter([ExitCode.CHECK_ERRORS, ExitCode.SUCCESS])
+    runs, clears = [], []
+
+    def run():
+        runs.append(watched.read_text())
+        return next(exit_codes)
+
+    exit_code = utils.watch(
+        run,
+        paths=lambda: [watched],
+        interval=0.1,
+        clear=lambda: clears.append(len(runs)),
+        max_runs=2,
+        sleep=_sleep_then(lambda: watched.write_text('{"fixed": true}')),
+    )
+
+    assert exit_code == ExitCode.SUCCESS
+    assert runs == ["{}", '{"fixed": true}']
+    assert clears == [0, 1]
+
+
+def test_watch_command_runs_incrementally_until_interrupted(tmp_path, monkeypatch):
+    import dbt_bouncer.utils as utils_mod
+
+    # `watch` keeps parsed artifacts for the rest of the process: undo that.
+    monkeypatch.setattr(parser, "_warm_artifacts", None)
+    monkeypatch.setattr(utils_mod, "get_cache_dir", lambda: tmp_path / "cache")
+    shutil.copy(Path("dbt_project/target/manifest.json"), tmp_path / "manifest.json")
+    (tmp_path / "dbt-bouncer.yml").write_text(
+        yaml.dump(
+            {
+                "dbt_artifacts_dir": ".",
+                "manifest_checks": [
+                    {"name": "check_model_names", "model_name_pattern": "^stg_"}
+                ],
+            }
+        )
+    )
+    waits = []
+
+    def interrupt(paths, *_args, **_kwargs):
+        waits.append(paths)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(utils, "wait_for_change", interrupt)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(app, ["watch", "--output-file", "results.json"])
+
+    assert result.exit_code == ExitCode.SUCCESS, result.output
+    assert json.loads((tmp_path / "results.json").read_text())
+    assert waits == [utils.watched_paths(Path("dbt-bouncer.yml"))]
+    assert parser._warm_artifacts
+    assert list((tmp_path / "cache").glob("incremental_*.json"))
@@ -1,8 +1,17 @@
 """Tests for the Executor class."""
 
+import orjson
+import pytest
+
 from dbt_bouncer.enums import CheckOutcome, CheckSeverity
 from dbt_bouncer.executor import Executor
 
+# pytest-xdist runs each test worker with threads of its own; the checks forked
+# here never touch them.
+_ignore_fork_with_threads = pytest.mark.filterwarnings(
+    "ignore:This process .* is multi-threaded:DeprecationWarning"
+)
+
 
 class _PassingCheck:
     """A check that always passes."""
@@ -33,6 +42,62 @@ class _CrashingCheck:
         raise ValueError("unexpected crash")
 
 
+class _BatchCheck:
+    """A batch check failing every resource whose name starts with ``bad``."""
+
+    description = None
+
+    def execute_batch(self, models):
+        for model in models:
+            if model["name"].startswith("bad"):
+                yield model, f"`{model['name']}` is bad."
+
+
+class _FailingBatchCheck(_BatchCheck):
+    """A batch check that calls ``fail()`` instead of yielding."""
+
+    def execute_batch(self, _models):
+        from dbt_bouncer.check_framework.exceptions import DbtBouncerFailedCheckError
+
+        raise DbtBouncerFailedCheckError("No models may exist")
+
+
+class _CrashingBatchCheck(_BatchCheck):
+    """A batch check that raises an unexpected exception."""
+
+    def execute_batch(self, _models):
+        raise ValueError("unexpected crash")
+
+
+def _batch_entry(check, names):
+    """Build a batch entry over one model per name.
+
+    Returns:
+        dict: A ``CheckToRun`` holding a batch of resource facts.
+
+    """
+    from dbt_bouncer.runner import _ResourceFacts
+
+    batch = [
+        _ResourceFacts(
+            resource={"model": {"name": name}},
+            skip_checks=[],
+            run_id_suffix=name,
+            file_path=f"models/{name}.sql",
+            unique_id=f"model.pkg.{name}",
+            cleaned_path=f"models/{name}.sql",
+        )
+        for name in names
+    ]
+    return {
+        "batch": batch,
+        "check": check,
+        "check_run_id": "check_batch:1",
+        "iterate_value": "model",
+        "severity": CheckSeverity.ERROR,
+    }
+
+
 def test_executor_all_pass():
     """All checks pass -- outcomes are SUCCESS."""
     checks = [
@@ -135,3 +200,334 @@ def test_executor_carries_file_path_and_unique_id():
     # Missing keys default to None rather than raising.
     assert results[1]["file_path"] is None
     assert results[1]["unique_id"] is None
+
+
+def test_executor_expands_batch_into_per_resource_results():
+    """A batch entry yields one result per resource, in order, among the rest."""
+    checks = [
+        {
+            "check": _PassingCheck(),
+            "check_run_id": "check_a:0",
+            "severity": CheckSeverity.ERROR,
+        },
+        _batch_entry(_BatchCheck(), ["good", "bad_one"]),
+        {
+            "check": _PassingCheck(),
+            "check_run_id": "check_c:2",
+            "severity": CheckSeverity.ERROR,
+        },
+    ]
+    results = Executor().run(checks)
+
+    assert [r["check_run_id"] for r in results] == [
+        "check_a:0",
+        "check_batch:1:good",
+        "check_batch:1:bad_one",
+        "check_c:2",
+    ]
+    assert results[1]["outcome"] == CheckOutcome.SUCCESS
+    assert results[1]["failure_message"] is None
+    assert results[2]["outcome"] == CheckOutcome.FAILED
+    assert results[2]["failure_message"] == "`bad_one` is bad."
+    assert results[2]["file_path"] == "models/bad_one.sql"
+    assert results[2]["unique_id"] == "model.pkg.bad_one"
+
+
+def test_executor_batch_failure_message_gets_description_prefix():
+    check = _BatchCheck()
+    check.description = "No bad models"
+    results = Executor().run([_batch_entry(check, ["bad"])])
+    assert results[0]["failure_message"] == "No bad models - `bad` is bad."
+
+
+def test_executor_batch_fail_fails_every_resource():
+    results = Executor().run([_batch_entry(_FailingBatchCheck(), ["a", "b"])])
+    assert [r["outcome"] for r in results] == [CheckOutcome.FAILED] * 2
+    assert all(r["failure_message"] == "No models may exist" for r in results)
+    assert all(r["severity"] == CheckSeverity.ERROR for r in results)
+
+
+def test_executor_batch_unexpected_error_downgrades_to_warn():
+    results = Executor().run([_batch_entry(_CrashingBatchCheck(), ["a", "b"])])
+    assert [r["outcome"] for r in results] == [CheckOutcome.FAILED] * 2
+    assert [r["severity"] for r in results] == [CheckSeverity.WARN] * 2
+    assert "unexpected crash" in results[0]["failure_message"]
+
+
+def _mixed_checks():
+    """Build plain, failing, crashing and batch entries.
+
+    Returns:
+        list[dict]: ``CheckToRun`` entries of every kind.
+
+    """
+    checks = []
+    for i in range(12):
+        check = [_PassingCheck, _FailingCheck, _CrashingCheck][i % 3]()
+        checks.append(
+            {
+                "check": check,
+                "check_run_id": f"check_{i}:{i}",
+                "severity": CheckSeverity.ERROR,
+            }
+        )
+    checks.insert(5, _batch_entry(_BatchCheck(), ["good", "bad_one", "bad_two"]))
+    return checks
+
+
+@_ignore_fork_with_threads
+def test_executor_jobs_match_sequential_results():
+    """Forked workers return the sequential results, in the same order."""
+    sequential = Executor().run(_mixed_checks())
+    forked = Executor(jobs=3).run(_mixed_checks())
+
+    assert forked == sequential
+    assert len(forked) == 15
+    assert [r["severity"] for r in forked[:3]] == [
+        CheckSeverity.ERROR,
+        CheckSeverity.ERROR,
+        CheckSeverity.WARN,
+    ]
+
+
+def test_executor_jobs_without_fork_run_in_process(monkeypatch, caplog):
+    monkeypatch.setattr(
+        "dbt_bouncer.executor.multiprocessing.get_all_start_methods",
+        lambda: ["spawn"],
+    )
+    results = Executor(jobs=4).run(_mixed_checks())
+
+    assert len(results) == 15
+    assert "not available on this platform" in caplog.text
+
+
+@_ignore_fork_with_threads
+def test_executor_jobs_leave_gc_unfrozen():
+    import gc
+
+    Executor(jobs=2).run(_mixed_checks())
+    assert gc.get_freeze_count() == 0
+
+
+class _BoundCheck:
+    """A resource check that records the resource bound onto each instance."""
+
+    description = None
+    instances = 0
+
+    def __init__(self):
+        _BoundCheck.instances += 1
+
+    def set_resource(self, resource, _iterate_value):
+        self.model = resource
+
+    def model_copy(self):
+        return _BoundCheck()
+
+    def execute(self):
+        from dbt_bouncer.check_framework.exceptions import DbtBouncerFailedCheckError
+
+        if self.model.startswith("bad"):
+            raise DbtBouncerFailedCheckError(f"`{self.model}` is bad.")
+
+
+def _resource_checks(check, names):
+    return [
+        {
+            "check": check,
+            "check_run_id": f"check_bound:0:{name}",
+            "iterate_value": "model",
+            "resource": name,
+            "severity": CheckSeverity.ERROR,
+        }
+        for name in names
+    ]
+
+
+@pytest.mark.parametrize("jobs", [0, 3])
+def test_executor_threads_when_gil_disabled(monkeypatch, jobs):
+    """Free-threaded builds run ranges on threads, each binding its own copy."""
+    monkeypatch.setattr("dbt_bouncer.executor._gil_disabled", lambda: True)
+    monkeypatch.setattr("dbt_bouncer.executor._cpu_count", lambda: 2)
+    names = [f"{'bad' if i % 4 == 0 else 'good'}_{i}" for i in range(40)]
+    shared = _BoundCheck()
+    _BoundCheck.instances = 0
+
+    threaded = Executor(jobs=jobs).run(
+        [*_mixed_checks(), *_resource_checks(shared, names)]
+    )
+    sequential = Executor().run([*_mixed_checks(), *_resource_checks(shared, names)])
+
+    assert threaded == sequential
+    assert [r["outcome"] for r in threaded[15:]] == [
+        CheckOutcome.FAILED if n.startswith("bad") else CheckOutcome.SUCCESS
+        for n in names
+    ]
+    # One copy per range holding resource entries, never one per resource.
+    assert 0 < _BoundCheck.instances <= (jobs or 2) * 4
+
+
+def test_executor_jobs_zero_is_sequential_with_the_gil(monkeypatch):
+    monkeypatch.setattr("dbt_bouncer.executor._gil_disabled", lambda: False)
+    _BoundCheck.instances = 0
+
+    results = Executor(jobs=0).run(_resource_checks(_BoundCheck(), ["a", "bad"]))
+
+    assert [r["outcome"] for r in results] == [
+        CheckOutcome.SUCCESS,
+        CheckOutcome.FAILED,
+    ]
+    assert _BoundCheck.instances == 1
+
+
+def test_partition_is_contiguous_and_weighted():
+    from dbt_bouncer.executor import _partition
+
+    checks = [
+        {"check": None},
+        _batch_entry(_BatchCheck(), [f"m{i}" for i in range(6)]),
+        {"check": None},
+        {"check": None},
+        {"check": None},
+    ]
+
+    ranges = _partition(checks, 3)
+
+    assert ranges == [(0, 2), (2, 3), (3, 5)]
+    assert _partition(checks[:1], 4) == [(0, 1)]
+
+
+def test_shard_covers_every_entry_once_with_balanced_weight():
+    from dbt_bouncer.executor import check_run_count, shard_checks
+
+    checks = [
+        _batch_entry(_BatchCheck(), [f"m{i}" for i in range(6)]),
+        *({"check": None, "check_run_id": f"check:0:model_{i}"} for i in range(18)),
+    ]
+    checks[0]["check_run_id"] = "check_batch:1"
+
+    shards = [shard_checks(checks, index, 4) for index in range(1, 5)]
+
+    assert sorted(c["check_run_id"] for s in shards for c in s) == sorted(
+        c["check_run_id"] for c in checks
+    )
+    assert [sum(check_run_count(c) for c in s) for s in shards] == [6, 6, 6, 6]
+    # Each shard keeps the assembly order.
+    for s in shards:
+        assert s == [c for c in checks if c in s]
+
+
+def test_shard_does_not_depend_on_assembly_order():
+    from dbt_bouncer.executor import shard_checks
+
+    checks = [{"check": None, "check_run_id": f"check:0:model_{i}"} for i in range(9)]
+
+    assert {c["check_run_id"] for c in shard_checks(checks, 2, 3)} == {
+        c["check_run_id"] for c in shard_checks(checks[::-1], 2, 3)
+    }
+
+
+def test_shard_balances_recorded_check_costs():
+    from dbt_bouncer.executor import shard_checks
+
+    checks = [
+        {"check": None, "check_run_id": "slow:0:model_0"},
+        *({"check": None, "check_run_id": f"fast:1:model_{i}"} for i in range(10)),
+    ]
+    stats = {
+        "slow:0": {"runs": 2, "failures": 0, "seconds": 20.0},
+        "fast:1": {"runs": 10, "failures": 0, "seconds": 10.0},
+    }
+
+    shards = [shard_checks(checks, index, 2, stats) for index in (1, 2)]
+
+    # The slow check alone takes as long as the ten fast ones.
+    assert sorted(len(s) for s in shards) == [1, 10]
+    assert sorted(len(shard_checks(checks, index, 2)) for index in (1, 2)) == [5, 6]
+
+
+@_ignore_fork_with_threads
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_executor_profiler_times_every_entry(jobs):
+    """Each entry is timed once, and no timing is left on the results."""
+    from dbt_bouncer.profiling import Profiler
+
+    profiler = Profiler()
+    results = Executor(jobs=jobs, profiler=profiler).run(_mixed_checks())
+
+    assert results == Executor().run(_mixed_checks())
+    # Twelve single checks and one batch, which counts as one call.
+    assert sorted(profiler.durations) == sorted(
+        [f"check_{i}:{i}" for i in range(12)] + ["check_batch:1"]
+    )
+    assert all(len(d) == 1 for d in profiler.durations.values())
+
+
+@_ignore_fork_with_threads
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_executor_traces_sampled_entries(jobs, tmp_path):
+    """Sampled entries become trace spans, and no timing is left on the results."""
+    from dbt_bouncer import tracing
+
+    path = tmp_path / "trace.json"
+    with tracing.trace_to(path):
+        results = Executor(jobs=jobs).run(_mixed_checks())
+
+    assert results == Executor().run(_mixed_checks())
+    checks = [
+        e
+        for e in orjson.loads(path.read_bytes())["traceEvents"]
+        if e.get("cat") == "check"
+    ]
+    # Few enough entries that every one is traced; a batch is one span.
+    assert len(checks) == 13
+    assert all(e["dur"] >= 0 for e in checks)
+
+
+@_ignore_fork_with_threads
+@pytest.mark.parametrize("jobs", [1, 3])
+@pytest.mark.parametrize(
+    ("max_failures", "expected"),
+    [
+        # check_1 fails.
+        (1, 2),
+        # Then check_4.
+        (2, 5),
+        # A batch entry is executed whole: it adds two failures at once.
+        (3, 8),
+        # Crashes are downgraded to warnings and never count.
+        (100, 15),
+    ],
+)
+def test_executor_max_failures_stops_at_the_same_entry(jobs, max_failures, expected):
+    """Workers stop where the sequential executor would, and return the same results."""
+    results = Executor(jobs=jobs, max_failures=max_failures).run(_mixed_checks())
+
+    assert results == Executor().run(_mixed_checks())[:expected]
+
+
+def test_schedule_runs_checks_failing_most_per_second_first():
+    from dbt_bouncer.executor import schedule_checks
+
+    checks = [
+        {"check_run_id": "check_slow_failing:0:a"},
+        {"check_run_id": "check_passing:1:a"},
+        {"check_run_id": "check_fast_failing:2:a"},
+        {"check_run_id": "check_passing:1:b"},
+        {"check_run_id": "check_new:3"},
+    ]
+    stats = {
+        "check_slow_failing:0": {"runs": 10, "failures": 10, "seconds": 10.0},
+        "check_passing:1": {"runs": 10, "failures": 0, "seconds": 0.01},
+        "check_fast_failing:2": {"runs": 10, "failures": 10, "seconds": 0.01},
+    }
+
+    assert [c["check_run_id"] for c in schedule_checks(checks, stats)] == [
+        "check_fast_failing:2:a",
+        # Without statistics: a failure rate of 1/2 at the median cost.
+        "check_new:3",
+        "check_passing:1:a",
+        "check_passing:1:b",
+        "check_slow_failing:0:a",
+    ]
+    assert schedule_checks(checks, {}) == checks
@@ -0,0 +1,126 @@
+"""Tests for `--changed-since` scoping in `dbt_bouncer.git_changes`."""
+
+import shutil
+import subprocess  # ruff: ignore[suspicious-subprocess-import] - fixed git commands in a temporary repo
+from types import SimpleNamespace
+
+import pytest
+
+from dbt_bouncer.exceptions import DbtBouncerConfigError
+from dbt_bouncer.git_changes import changed_unique_ids, git_changed_files
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def _git(repo, *args):
+    subprocess.run(  # ruff: ignore[subprocess-without-shell-equals-true]
+        [  # ruff: ignore[start-process-with-partial-path]
+            "git",
+            "-c",
+            "user.name=t",
+            "-c",
+            "user.email=t@t",
+            *args,
+        ],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Build a repo with a dbt project in `dbt_project/`, branched off `main`.
+
+    Returns:
+        Path: The dbt project directory.
+
+    """
+    project = tmp_path / "dbt_project"
+    (project / "models").mkdir(parents=True)
+    (project / "models" / "a.sql").write_text("select 1")
+    (project / "models" / "b.sql").write_text("select 2")
+    (project / "models" / "_models.yml").write_text("version: 2")
+    (tmp_path / "README.md").write_text("readme")
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    return project
+
+
+def test_committed_uncommitted_and_untracked_changes(repo):
+    (repo / "models" / "a.sql").write_text("select 10")
+    _git(repo, "commit", "-q", "-am", "change a")
+    (repo / "models" / "_models.yml").write_text("version: 2\nmodels: []")
+    (repo / "models" / "c.sql").write_text("select 3")
+    (repo.parent / "README.md").write_text("outside the project")
+
+    assert git_changed_files("main", repo) == {
+        "models/a.sql",
+        "models/_models.yml",
+        "models/c.sql",
+    }
+
+
+def test_changes_on_the_ref_since_branching_are_ignored(repo):
+    _git(repo, "checkout", "-q", "main")
+    (repo / "models" / "b.sql").write_text("select 20")
+    _git(repo, "commit", "-q", "-am", "change b on main")
+    _git(repo, "checkout", "-q", "feature")
+
+    assert git_changed_files("main", repo) == frozenset()
+
+
+@pytest.mark.parametrize("ref", ["no-such-ref", "--output=x"])
+def test_invalid_ref_raises(repo, ref):
+    with pytest.raises(DbtBouncerConfigError):
+        git_changed_files(ref, repo)
+
+
+def _resource(path, patch_path=None, package="my_project"):
+    return SimpleNamespace(
+        original_file_path=path, package_name=package, patch_path=patch_path
+    )
+
+
+@pytest.fixture
+def manifest():
+    return SimpleNamespace(
+        child_map={
+            "model.my_project.a": ["model.my_project.b"],
+            "model.my_project.b": ["exposure.my_project.dash"],
+            "model.my_project.c": [],
+        },
+        exposures={"exposure.my_project.dash": _resource("models/exposures.yml")},
+        nodes={
+            "model.my_project.a": _resource(
+                "models/a.sql", patch_path="my_project://models/_models.yml"
+            ),
+            "model.my_project.b": _resource("models/b.sql"),
+            "model.my_project.c": _resource("models/c.sql"),
+            "model.other_package.a": _resource("models/a.sql", package="other"),
+        },
+        sources={},
+    )
+
+
+def test_files_map_to_resources_through_both_paths(manifest):
+    assert changed_unique_ids(
+        manifest, frozenset({"models/_models.yml", "models/c.sql"}), "my_project"
+    ) == {"model.my_project.a", "model.my_project.c"}
+
+
+def test_other_packages_are_ignored(manifest):
+    assert changed_unique_ids(manifest, frozenset({"models/a.sql"}), "my_project") == {
+        "model.my_project.a"
+    }
+
+
+def test_include_downstream(manifest):
+    assert changed_unique_ids(
+        manifest,
+        frozenset({"models/a.sql"}),
+        "my_project",
+        include_downstream=True,
+    ) == {"model.my_project.a", "model.my_project.b", "exposure.my_project.dash"}
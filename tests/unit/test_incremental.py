@@ -0,0 +1,230 @@
+"""Tests for incremental runs in `dbt_bouncer.incremental`.
+
+A replayed outcome may only ever stand in for executing the check against
+identical inputs, so most of these tests change something between two runs and
+assert the check is executed again.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from dbt_bouncer.artifact_parsers.parser import ModelWrapper, wrap_dict
+from dbt_bouncer.check_framework.decorator import check, fail
+from dbt_bouncer.enums import CheckOutcome, CheckSeverity
+from dbt_bouncer.executor import Executor
+from dbt_bouncer.incremental import incremental_cache_path, run_incremental
+
+_calls: list[str] = []
+
+
+@check
+def check_model_counted(model, *, suffix: str = ""):
+    """Fail models without a description, recording each execution."""
+    _calls.append(model.unique_id)
+    if not model.description:
+        fail(f"`{model.unique_id}` has no description{suffix}.")
+
+
+@check
+def check_model_counted_with_ctx(model, ctx):  # ruff: ignore[unused-function-argument]
+    """Record each execution of a check that reads the context."""
+    _calls.append(model.unique_id)
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    _calls.clear()
+
+
+def _model(name, description="", depends_on=()):
+    unique_id = f"model.package_a.{name}"
+    return {
+        "checksum": {"name": "sha256", "checksum": name},
+        "depends_on": {"nodes": list(depends_on)},
+        "description": description,
+        "name": name,
+        "original_file_path": f"models/{name}.sql",
+        "unique_id": unique_id,
+    }
+
+
+def _project(nodes):
+    parent_map = {uid: list(node["depends_on"]["nodes"]) for uid, node in nodes.items()}
+    child_map = {uid: [] for uid in nodes}
+    for uid, parents in parent_map.items():
+        for parent in parents:
+            child_map[parent].append(uid)
+    return wrap_dict({"child_map": child_map, "nodes": nodes, "parent_map": parent_map})
+
+
+def _checks(check_instance, manifest):
+    entries = []
+    for uid, node in manifest.nodes.items():
+        entries.append(
+            {
+                "check": check_instance,
+                "check_run_id": f"{check_instance.name}:0:{node.name}",
+                "file_path": node.original_file_path,
+                "iterate_value": "model",
+                "resource": ModelWrapper(uid, node.original_file_path, node),
+                "severity": check_instance.severity,
+                "unique_id": uid,
+            }
+        )
+    return entries
+
+
+def _run(check_instance, nodes, cache_file):
+    manifest = _project(nodes)
+    return run_incremental(
+        _checks(check_instance, manifest),
+        manifest=manifest,
+        cache_file=cache_file,
+        execute=Executor().run,
+    )
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return tmp_path / "incremental.json"
+
+
+def test_unchanged_resources_are_replayed(cache_file):
+    nodes = {
+        "model.package_a.a": _model("a", "Described."),
+        "model.package_a.b": _model("b"),
+    }
+    first = _run(check_model_counted(index=0), nodes, cache_file)
+    assert len(_calls) == 2
+
+    _calls.clear()
+    second = _run(check_model_counted(index=0), nodes, cache_file)
+
+    assert _calls == []
+    assert second == first
+    assert [r["outcome"] for r in second] == [
+        CheckOutcome.SUCCESS,
+        CheckOutcome.FAILED,
+    ]
+    assert second[1]["severity"] == CheckSeverity.ERROR
+    assert second[1]["failure_message"] == "`model.package_a.b` has no description."
+
+
+def test_changed_resource_is_executed_again(cache_file):
+    nodes = {
+        "model.package_a.a": _model("a", "Described."),
+        "model.package_a.b": _model("b"),
+    }
+    _run(check_model_counted(index=0), nodes, cache_file)
+
+    _calls.clear()
+    # A YAML-only change: dbt's checksum stays the same.
+    nodes["model.package_a.b"] = _model("b", "Now described.")
+    results = _run(check_model_counted(index=0), nodes, cache_file)
+
+    assert _calls == ["model.package_a.b"]
+    assert [r["outcome"] for r in results] == [CheckOutcome.SUCCESS] * 2
+
+
+def test_executor_stopping_early_keeps_outcomes_of_the_rest(cache_file):
+    nodes = {f"model.package_a.{n}": _model(n) for n in "abcd"}
+    _run(check_model_counted(index=0), nodes, cache_file)
+
+    # `a` and `c` change, and `--max-failures 1` stops at `a`.
+    for name in "ac":
+        nodes[f"model.package_a.{name}"] = {**_model(name), "tags": ["changed"]}
+    _calls.clear()
+    manifest = _project(nodes)
+    results = run_incremental(
+        _checks(check_model_counted(index=0), manifest),
+        manifest=manifest,
+        cache_file=cache_file,
+        execute=Executor(max_failures=1).run,
+    )
+
+    assert _calls == ["model.package_a.a"]
+    assert [r["check_run_id"] for r in results] == [
+        "check_model_counted:0:a",
+        "check_model_counted:0:b",
+    ]
+
+    # `d` was not reached but is still replayed; only `c` is left to execute.
+    _calls.clear()
+    assert len(_run(check_model_counted(index=0), nodes, cache_file)) == 4
+    assert _calls == ["model.package_a.c"]
+
+
+def test_changed_config_is_executed_again(cache_file):
+    nodes = {"model.package_a.b": _model("b")}
+    _run(check_model_counted(index=0), nodes, cache_file)
+
+    _calls.clear()
+    results = _run(check_model_counted(index=0, suffix="!"), nodes, cache_file)
+
+    assert _calls == ["model.package_a.b"]
+    assert results[0]["failure_message"] == "`model.package_a.b` has no description!."
+
+
+def test_context_checks_follow_lineage(cache_file):
+    nodes = {
+        "model.package_a.a": _model("a"),
+        "model.package_a.b": _model("b", depends_on=["model.package_a.a"]),
+        "model.package_a.c": _model("c"),
+    }
+    _run(check_model_counted_with_ctx(index=0), nodes, cache_file)
+
+    _calls.clear()
+    nodes["model.package_a.a"] = _model("a", "Changed upstream.")
+    _run(check_model_counted_with_ctx(index=0), nodes, cache_file)
+
+    # `b` is downstream of `a`; `c` is unrelated.
+    assert sorted(_calls) == ["model.package_a.a", "model.package_a.b"]
+
+
+def test_context_only_checks_always_run(cache_file):
+    runs = []
+
+    @check
+    def check_project_counted(ctx):
+        runs.append(ctx)
+
+    instance = check_project_counted(index=0)
+    entry = {
+        "check": instance,
+        "check_run_id": "check_project_counted:0",
+        "file_path": None,
+        "severity": instance.severity,
+        "unique_id": None,
+    }
+    manifest = SimpleNamespace()
+    for _ in range(2):
+        results = run_incremental([dict(entry)], manifest, cache_file, Executor().run)
+
+    assert len(runs) == 2
+    assert results[0]["outcome"] == CheckOutcome.SUCCESS
+
+
+def test_corrupt_outcomes_file_runs_everything(cache_file):
+    cache_file.write_bytes(b"not json")
+    nodes = {"model.package_a.a": _model("a", "Described.")}
+
+    _run(check_model_counted(index=0), nodes, cache_file)
+
+    assert _calls == ["model.package_a.a"]
+
+
+def test_incremental_cache_path_drops_other_check_code(monkeypatch, tmp_path):
+    import dbt_bouncer.utils as utils_mod
+
+    monkeypatch.setattr(utils_mod, "get_cache_dir", lambda: tmp_path / "cache")
+    old = incremental_cache_path(tmp_path / "dbt-bouncer.yml", tmp_path, "aaaaaaaa")
+    new = incremental_cache_path(tmp_path / "dbt-bouncer.yml", tmp_path, "bbbbbbbb")
+    assert old != new
+    nodes = {"model.package_a.a": _model("a", "Described.")}
+
+    _run(check_model_counted(index=0), nodes, old)
+    _run(check_model_counted(index=0), nodes, new)
+
+    assert not old.exists()
+    assert new.exists()
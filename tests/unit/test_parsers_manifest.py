@@ -81,3 +81,107 @@ def test_parse_manifest_artifact_table_format(capsys, dbt_artifacts_dir):
     # Verify all counts are numeric
     for category, count in category_lines:
         assert count.isdigit(), f"Count for {category} is not numeric: {count}"
+
+
+def test_catalog_and_run_results_load_off_the_main_thread(monkeypatch):
+    """The side artifacts are decoded on worker threads, not after the manifest."""
+    import threading
+
+    import dbt_bouncer.artifact_parsers.parser as parser_mod
+
+    monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+    threads: dict[str, str] = {}
+    load_artifact = parser_mod._load_artifact
+
+    def _recording_load(path):
+        threads[path.name] = threading.current_thread().name
+        return load_artifact(path)
+
+    monkeypatch.setattr(parser_mod, "_load_artifact", _recording_load)
+    bouncer_config = MagicMock()
+    bouncer_config.package_name = "dbt_bouncer_test_project"
+
+    artifacts = parse_dbt_artifacts(
+        bouncer_config, Path("tests/fixtures/dbt_112/target")
+    )
+
+    assert set(threads) == {"catalog.json", "run_results.json"}
+    assert threading.current_thread().name not in threads.values()
+    assert len(artifacts.catalog_nodes) > 0
+    assert len(artifacts.run_results) > 0
+
+
+def test_old_manifest_is_reported_before_missing_catalog(monkeypatch, tmp_path):
+    """Loading artifacts concurrently keeps the order errors are reported in."""
+    import orjson
+
+    from dbt_bouncer.exceptions import DbtBouncerArtifactError
+
+    monkeypatch.setenv("DBT_BOUNCER_DISABLE_ARTIFACT_CACHE", "1")
+    manifest = orjson.loads(
+        Path("tests/fixtures/dbt_112/target/manifest.json").read_bytes()
+    )
+    manifest["metadata"]["dbt_version"] = "1.9.0"
+    (tmp_path / "manifest.json").write_bytes(orjson.dumps(manifest))
+    bouncer_config = MagicMock()
+    bouncer_config.package_name = "dbt_bouncer_test_project"
+
+    with pytest.raises(DbtBouncerArtifactError, match="minimum supported version"):
+        parse_dbt_artifacts(bouncer_config, tmp_path)
+
+
+def test_state_manifest_selects_nothing_against_itself(dbt_artifacts_dir):
+    """A project compared with its own manifest has nothing new or modified."""
+    from dbt_bouncer.artifact_parsers.parser import load_state_manifest
+    from dbt_bouncer.selectors import Selector
+
+    manifest = load_state_manifest(dbt_artifacts_dir)
+    baseline = load_state_manifest(dbt_artifacts_dir)
+    selector = Selector("state:modified", manifest, state=baseline)
+
+    assert manifest.nodes
+    assert not any(selector.matches(uid) for uid in manifest.nodes)
+
+
+def test_state_manifest_compares_low_memory_skeletons(dbt_artifacts_dir):
+    """Resources from other packages, reduced by `--low-memory`, are not modified."""
+    import orjson
+
+    from dbt_bouncer.artifact_parsers.parser import DictProxy, load_state_manifest
+    from dbt_bouncer.artifact_parsers.streaming import load_package_manifest
+    from dbt_bouncer.selectors import Selector
+
+    data = (dbt_artifacts_dir / "manifest.json").read_bytes()
+    manifest = DictProxy(load_package_manifest(data, None))
+    baseline = load_state_manifest(dbt_artifacts_dir)
+    target_package = manifest.metadata.project_name
+    unique_ids = [
+        uid
+        for collection in ("nodes", "sources", "exposures", "macros")
+        for uid in manifest[collection]
+    ]
+    foreign = [
+        uid
+        for uid in unique_ids
+        if manifest.get("nodes", {}).get(uid, {}).get("package_name")
+        not in (None, target_package)
+    ]
+
+    for raw in ("state:modified", "state:modified+"):
+        selector = Selector(raw, manifest, state=baseline)
+        assert not any(selector.matches(uid) for uid in unique_ids)
+
+    # A foreign node whose file changed is still noticed.
+    changed = orjson.loads(data)
+    changed["nodes"][foreign[0]]["checksum"]["checksum"] = "changed"
+    manifest = DictProxy(load_package_manifest(orjson.dumps(changed), None))
+    selector = Selector("state:modified", manifest, state=baseline)
+    assert [uid for uid in unique_ids if selector.matches(uid)] == [foreign[0]]
+
+
+def test_state_manifest_must_exist(tmp_path):
+    from dbt_bouncer.artifact_parsers.parser import load_state_manifest
+    from dbt_bouncer.exceptions import DbtBouncerArtifactError
+
+    with pytest.raises(DbtBouncerArtifactError, match="--state"):
+        load_state_manifest(tmp_path)
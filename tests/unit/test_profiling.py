@@ -0,0 +1,128 @@
+"""Tests for `--profile` timings in `dbt_bouncer.profiling`."""
+
+import orjson
+import pytest
+
+from dbt_bouncer.profiling import Profiler, _percentile, profile_phase
+
+
+def _result(check_run_id, duration=None):
+    result = {"check_run_id": check_run_id, "outcome": "success"}
+    if duration is not None:
+        result["_duration"] = duration
+    return result
+
+
+def test_record_results_groups_by_check_name_and_index():
+    profiler = Profiler()
+    results = [
+        _result("check_model_names:0:model_a", 0.1),
+        _result("check_model_names:0:model_b", 0.3),
+        _result("check_model_names:1:model_a", 0.2),
+        _result("check_project_name:2", 0.5),
+        # The other resources of a batch carry no duration.
+        _result("check_models_batch:3:model_a", 0.4),
+        _result("check_models_batch:3:model_b"),
+    ]
+
+    profiler.record_results(results)
+
+    assert profiler.durations == {
+        "check_model_names:0": [0.1, 0.3],
+        "check_model_names:1": [0.2],
+        "check_project_name:2": [0.5],
+        "check_models_batch:3": [0.4],
+    }
+    assert all("_duration" not in r for r in results)
+
+
+def test_summary_orders_checks_by_total_time():
+    profiler = Profiler()
+    profiler.durations = {
+        "check_a:0": [0.01 * i for i in range(1, 101)],
+        "check_b:1": [60.0],
+    }
+
+    summary = profiler.summary()
+
+    assert [c["check"] for c in summary["checks"]] == ["check_b:1", "check_a:0"]
+    check_a = summary["checks"][1]
+    assert check_a["calls"] == 100
+    assert check_a["total"] == pytest.approx(50.5)
+    assert check_a["p50"] == pytest.approx(0.5)
+    assert check_a["p95"] == pytest.approx(0.95)
+    assert check_a["max"] == pytest.approx(1.0)
+
+
+def test_percentile_of_a_single_value():
+    assert _percentile([3.0], 0.5) == pytest.approx(3.0)
+    assert _percentile([3.0], 0.95) == pytest.approx(3.0)
+
+
+def test_phases_accumulate_and_keep_run_order():
+    profiler = Profiler()
+    for name in ["execute", "config_validation", "config_validation"]:
+        with profile_phase(profiler, name):
+            pass
+
+    assert list(profiler.summary()["phases"]) == ["config_validation", "execute"]
+
+
+def test_profile_phase_without_profiler_is_a_no_op():
+    with profile_phase(None, "parse"):
+        pass
+
+
+def test_write_and_print_report(tmp_path, capsys):
+    profiler = Profiler()
+    profiler.phases["execute"] = 1.5
+    profiler.durations = {f"check_{i}:{i}": [i / 10] for i in range(30)}
+
+    profiler.write(tmp_path / "profile.json")
+    profiler.print_report(top_n=5)
+
+    written = orjson.loads((tmp_path / "profile.json").read_bytes())
+    assert written["phases"] == {"execute": 1.5}
+    assert len(written["checks"]) == 30
+    out = capsys.readouterr().out
+    assert "slowest 5 of 30 checks" in out
+    assert "check_29:29" in out
+    assert "check_0:0" not in out
+
+
+def test_check_stats_are_saved_and_decay(tmp_path):
+    from dbt_bouncer.profiling import load_check_stats
+
+    path = tmp_path / "cache" / "check_stats.json"
+    for _ in range(2):
+        profiler = Profiler()
+        profiler.record_results(
+            [
+                {**_result("check_a:0:model_a", 0.5), "severity": "error"},
+                {
+                    **_result("check_a:0:model_b", 0.25),
+                    "outcome": "failed",
+                    "severity": "error",
+                },
+                # Warnings do not stop a `--max-failures` run, so do not count.
+                {**_result("check_b:1", 0.1), "outcome": "failed", "severity": "warn"},
+            ]
+        )
+        profiler.save_check_stats(path)
+
+    # The first run counts for half once the second one is added.
+    assert load_check_stats(path) == {
+        "check_a:0": {"runs": 3.0, "failures": 1.5, "seconds": pytest.approx(1.125)},
+        "check_b:1": {"runs": 1.5, "failures": 0.0, "seconds": pytest.approx(0.15)},
+    }
+
+
+def test_load_check_stats_ignores_unreadable_files(tmp_path):
+    from dbt_bouncer.profiling import load_check_stats
+
+    path = tmp_path / "check_stats.json"
+    assert load_check_stats(path) == {}
+    path.write_bytes(b"not json")
+    assert load_check_stats(path) == {}
+    path.write_bytes(orjson.dumps({"v": 0, "checks": {"check_a:0": {}}}))
+    assert load_check_stats(path) == {}
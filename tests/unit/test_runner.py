@@ -119,6 +119,128 @@ def test_decorator_checks_dispatch_per_resource_and_context_only():
     assert context_only_entry["check_run_id"] == "check_context_only_always_passes:1"
 
 
+def test_batch_check_dispatches_once_with_every_matched_resource():
+    """A ``@check(batch=True)`` check gets one entry holding all its resources."""
+    from dbt_bouncer.check_framework.decorator import check
+
+    @check(batch=True)
+    def check_models_always_pass(models):
+        """Pass unconditionally.
+
+        Yields:
+            tuple: Nothing; no model fails.
+
+        """
+        yield from ((model, "") for model in models if False)
+
+    models = [
+        SimpleNamespace(
+            model=wrap_dict(
+                {
+                    "config": {"meta": None},
+                    "name": f"model_{i}",
+                    "original_file_path": f"models/{folder}/model_{i}.sql",
+                    "unique_id": f"model.dbt_bouncer_test_project.model_{i}",
+                },
+            ),
+            original_file_path=f"models/{folder}/model_{i}.sql",
+            unique_id=f"model.dbt_bouncer_test_project.model_{i}",
+        )
+        for i, folder in enumerate(["staging", "marts", "staging"])
+    ]
+    batch_check = check_models_always_pass(index=0, include="^models/staging")
+
+    ctx = BouncerContext.model_construct(
+        **{
+            "bouncer_config": SimpleNamespace(manifest_checks=[batch_check]),
+            "catalog_nodes": [],
+            "catalog_sources": [],
+            "check_categories": ["manifest_checks"],
+            "exposures": [],
+            "macros": [],
+            "manifest_obj": None,
+            "models": models,
+            "run_results": [],
+            "seeds": [],
+            "semantic_models": [],
+            "snapshots": [],
+            "sources": [],
+            "tests": [],
+            "unit_tests": [],
+        }
+    )
+
+    checks_to_run = _assemble_checks_to_run(ctx)
+
+    assert len(checks_to_run) == 1
+    entry = checks_to_run[0]
+    assert entry["check_run_id"] == "check_models_always_pass:0"
+    assert entry["iterate_value"] == "model"
+    assert "resource" not in entry
+    assert [facts.resource for facts in entry["batch"]] == [models[0], models[2]]
+
+
+def test_changed_unique_ids_restrict_resource_checks_only():
+    """With ``--changed-since`` only changed resources are dispatched."""
+    from dbt_bouncer.check_framework.decorator import check
+
+    @check
+    def check_model_always_passes(model) -> None:
+        """Pass unconditionally."""
+
+    @check
+    def check_context_only_always_passes(ctx) -> None:
+        """Pass unconditionally."""
+
+    models = [
+        SimpleNamespace(
+            model=wrap_dict(
+                {
+                    "config": {"meta": None},
+                    "name": f"model_{i}",
+                    "original_file_path": f"models/model_{i}.sql",
+                    "unique_id": f"model.dbt_bouncer_test_project.model_{i}",
+                },
+            ),
+            original_file_path=f"models/model_{i}.sql",
+            unique_id=f"model.dbt_bouncer_test_project.model_{i}",
+        )
+        for i in range(3)
+    ]
+    resource_check = check_model_always_passes(index=0)
+    context_only_check = check_context_only_always_passes(index=1)
+
+    ctx = BouncerContext.model_construct(
+        **{
+            "bouncer_config": SimpleNamespace(
+                manifest_checks=[resource_check, context_only_check],
+            ),
+            "catalog_nodes": [],
+            "catalog_sources": [],
+            "changed_unique_ids": frozenset({"model.dbt_bouncer_test_project.model_1"}),
+            "check_categories": ["manifest_checks"],
+            "exposures": [],
+            "macros": [],
+            "manifest_obj": None,
+            "models": models,
+            "run_results": [],
+            "seeds": [],
+            "semantic_models": [],
+            "snapshots": [],
+            "sources": [],
+            "tests": [],
+            "unit_tests": [],
+        }
+    )
+
+    checks_to_run = _assemble_checks_to_run(ctx)
+
+    assert [c.get("unique_id") for c in checks_to_run] == [
+        "model.dbt_bouncer_test_project.model_1",
+        None,
+    ]
+
+
 def test_runner_coverage(caplog, tmp_path):
     configure_console_logging(verbosity=0)
     ctx = typer.Context(
@@ -5,7 +5,7 @@ from types import SimpleNamespace
 import pytest
 
 from dbt_bouncer.exceptions import DbtBouncerConfigError
-from dbt_bouncer.selectors import Selector, parse_selector
+from dbt_bouncer.selectors import Selector, SelectorIndex, parse_selector
 
 
 def _node(name, tags=None, package="my_project", path=None, fqn=None):
@@ -75,7 +75,8 @@ class TestParseSelector:
             "   ",
             "+",
             "tag:",
-            "state:modified",
+            "result:error",
+            "state:unchanged",
             "config.:table",  # empty config key
             "config.materialized:",  # empty value
         ],
@@ -424,6 +425,196 @@ class TestConfigMethod:
         assert selector.matches("source.my_project.raw.s") is False
 
 
+class TestSelectorIndex:
+    """``SelectorIndex`` lookups select what a scan with ``matches_node`` does."""
+
+    @pytest.fixture
+    def index_manifest(self):
+        """Build a manifest with varied names, paths, tags, packages and configs.
+
+        Returns:
+            SimpleNamespace: The fake manifest.
+
+        """
+        nodes = {}
+        for i, (name, path) in enumerate(
+            [
+                ("stg_orders", "models/staging/stg_orders.sql"),
+                ("stg_customers", "models/staging/crm/stg_customers.sql"),
+                ("Orders", "models/marts/Orders.sql"),
+                ("orders_daily", "models/marts_extra/orders_daily.sql"),
+                ("int_orders", "models\\intermediate\\int_orders.sql"),
+                ("[odd]", "models/odd.sql"),
+            ]
+        ):
+            nodes[f"model.pkg_{i % 2}.{name}"] = SimpleNamespace(
+                config=SimpleNamespace(
+                    enabled=i % 3 != 0,
+                    materialized=["view", "table"][i % 2],
+                    tags=[f"t{i}", "shared"],
+                ),
+                fqn=[f"pkg_{i % 2}", *path.replace("\\", "/").split("/")[1:-1], name],
+                name=name,
+                original_file_path=path,
+                package_name=f"pkg_{i % 2}",
+                tags=["shared", f"t{i % 3}"],
+            )
+        return SimpleNamespace(
+            child_map={},
+            exposures={"exposure.pkg_0.dash": SimpleNamespace(tags=None)},
+            macros={},
+            nodes=nodes,
+            parent_map={},
+            semantic_models={},
+            sources={},
+            unit_tests={},
+        )
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "stg_orders",
+            "stg_*",
+            "*orders*",
+            "Orders",
+            "[[]odd]",
+            "dash",
+            "missing",
+            "tag:shared",
+            "tag:t1",
+            "tag:none",
+            "package:pkg_1",
+            "path:models/staging",
+            "path:models/staging/",
+            "path:models/marts",
+            "path:models/mart*",
+            "path:models/*/stg_*.sql",
+            "path:models/intermediate",
+            "fqn:pkg_0.*",
+            "fqn:*.marts.*",
+            "fqn:pkg_1.staging.crm.stg_customers",
+            "config.materialized:view",
+            "config.enabled:TRUE",
+            "config.tags:shared",
+            "config.tags:t4",
+            "config.missing:x",
+        ],
+    )
+    def test_lookup_matches_scan(self, index_manifest, raw):
+        """Each indexed atom resolves to the resources ``matches_node`` accepts."""
+        (atom,) = parse_selector(raw)[0]
+        resources = list(Selector._iter_manifest_resources(index_manifest))
+
+        assert SelectorIndex(index_manifest).resolve(atom) == {
+            uid for uid, node in resources if atom.matches_node(uid, node)
+        }
+
+    def test_shared_index_resolves_each_atom_once(self, index_manifest):
+        """Selectors sharing an index reuse its resolved atoms."""
+        index = SelectorIndex(index_manifest)
+        first = Selector("tag:shared,package:pkg_0", index_manifest, index=index)
+        second = Selector("tag:shared stg_*", index_manifest, index=index)
+
+        assert index.resolve(parse_selector("tag:shared")[0][0]) is index.resolve(
+            parse_selector("tag:shared")[0][0]
+        )
+        for uid in index_manifest.nodes:
+            assert first.matches(uid) == Selector(
+                "tag:shared,package:pkg_0", index_manifest
+            ).matches(uid)
+            assert second.matches(uid)
+
+
+class TestStateSelection:
+    """Tests for ``state:`` atoms against a baseline manifest."""
+
+    @pytest.fixture
+    def baseline(self, manifest):
+        """Build the baseline: ``orders`` is new and ``stg_orders`` was edited.
+
+        Returns:
+            SimpleNamespace: The fake baseline manifest.
+
+        """
+        for uid, node in manifest.nodes.items():
+            node.checksum = {"name": "sha256", "checksum": uid}
+            node.config = {"materialized": "view"}
+        baseline = SimpleNamespace(
+            exposures=dict(manifest.exposures),
+            nodes={
+                "model.my_project.stg_orders": SimpleNamespace(
+                    **{
+                        **vars(manifest.nodes["model.my_project.stg_orders"]),
+                        "checksum": {"name": "sha256", "checksum": "before"},
+                    }
+                )
+            },
+            sources={
+                uid: SimpleNamespace(**vars(node), created_at=1.0)
+                for uid, node in manifest.sources.items()
+            },
+        )
+        for node in manifest.sources.values():
+            node.created_at = 2.0
+        return baseline
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("state:new", {"model.my_project.orders"}),
+            (
+                "state:modified",
+                {"model.my_project.orders", "model.my_project.stg_orders"},
+            ),
+            (
+                "state:new+",
+                {"model.my_project.orders", "exposure.my_project.dashboard"},
+            ),
+            ("state:modified,tag:staging", {"model.my_project.stg_orders"}),
+        ],
+    )
+    def test_state_selection(self, manifest, baseline, raw, expected):
+        """``state:`` atoms compare checksums and configs, not timestamps."""
+        selector = Selector(raw, manifest, state=baseline)
+
+        all_ids = set(manifest.nodes) | set(manifest.sources) | set(manifest.exposures)
+        assert {uid for uid in all_ids if selector.matches(uid)} == expected
+
+    def test_config_change_is_modified(self, manifest, baseline):
+        """A config-only change (same checksum) counts as modified."""
+        baseline.nodes["model.my_project.stg_orders"].checksum = manifest.nodes[
+            "model.my_project.stg_orders"
+        ].checksum
+        baseline.nodes["model.my_project.stg_orders"].config = {"materialized": "table"}
+        selector = Selector("state:modified", manifest, state=baseline)
+
+        assert selector.matches("model.my_project.stg_orders")
+
+    def test_rendered_only_config_change_is_not_modified(self, manifest, baseline):
+        """Configs are compared as written when both manifests record that."""
+        previous = baseline.nodes["model.my_project.stg_orders"]
+        node = manifest.nodes["model.my_project.stg_orders"]
+        previous.checksum = node.checksum
+        previous.config = {"materialized": "view", "schema": "dbt_ci_123"}
+        node.config = {"materialized": "view", "schema": "dbt_ci_456"}
+        previous.unrendered_config = node.unrendered_config = {
+            "schema": "{{ env_var('DBT_SCHEMA') }}"
+        }
+        selector = Selector("state:modified", manifest, state=baseline)
+
+        assert not selector.matches("model.my_project.stg_orders")
+
+        node.unrendered_config = {"schema": "staging"}
+        assert Selector("state:modified", manifest, state=baseline).matches(
+            "model.my_project.stg_orders"
+        )
+
+    def test_state_without_baseline_raises(self, manifest):
+        """A ``state:`` selector needs ``--state``."""
+        with pytest.raises(DbtBouncerConfigError, match="--state"):
+            Selector("state:modified", manifest)
+
+
 def test_invalid_selector_rejected_at_config_time():
     """A syntactically invalid selector fails config validation."""
     from dbt_bouncer.configuration_file.validator import validate_conf
@@ -435,7 +626,7 @@ def test_invalid_selector_rejected_at_config_time():
                 "manifest_checks": [
                     {
                         "name": "check_model_description_populated",
-                        "selector": "state:modified",
+                        "selector": "result:error",
                     }
                 ]
             },
@@ -451,6 +642,6 @@ def test_invalid_global_selector_rejected_at_config_time():
             check_categories=["manifest_checks"],
             config_file_contents={
                 "manifest_checks": [{"name": "check_model_description_populated"}],
-                "selector": "state:modified",
+                "selector": "result:error",
             },
         )
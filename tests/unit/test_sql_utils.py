@@ -1,6 +1,15 @@
 import pytest
 
-from dbt_bouncer.sql_utils import neutralize_jinja, parse_sql
+from dbt_bouncer import sql_utils
+from dbt_bouncer.sql_utils import (
+    JoinFacts,
+    SqlFacts,
+    neutralize_jinja,
+    parse_sql,
+    prepare_sql_facts,
+    save_sql_facts,
+    sql_facts,
+)
 
 
 @pytest.mark.parametrize(
@@ -116,3 +125,110 @@ def test_neutralize_jinja_unlexable_input_is_returned_unchanged():
     # input is returned unchanged so parse_sql fails and callers fall back.
     code = "SELECT {# unterminated comment"
     assert neutralize_jinja(code) == code
+
+
+_FACTS_SQL = """
+select a.*, b.id
+from {{ ref('a') }} as a
+join analytics.b as b on 1 = 1
+cross join analytics.c
+"""
+
+
+@pytest.fixture
+def sql_facts_file(tmp_path, monkeypatch):
+    path = tmp_path / "sql_facts.json"
+    monkeypatch.setattr(sql_utils, "sql_facts_path", lambda: path)
+    monkeypatch.delenv("DBT_BOUNCER_DISABLE_SQL_CACHE", raising=False)
+    return path
+
+
+def _new_process():
+    # What a later run starts from: nothing memoised in memory.
+    sql_facts.cache_clear()
+    sql_utils._store = sql_utils._SqlFactsStore()
+
+
+@pytest.mark.usefixtures("sql_facts_file")
+def test_sql_facts_derives_check_facts():
+    assert sql_facts(_FACTS_SQL) == SqlFacts(
+        uses_star=True,
+        hard_coded_tables=("analytics.b AS b", "analytics.c"),
+        joins=(
+            JoinFacts(is_cross=False, is_constrained=True, constant_condition="1 = 1"),
+            JoinFacts(is_cross=True, is_constrained=False, constant_condition=None),
+        ),
+    )
+    assert sql_facts("this is (((not sql at all !!!") is None
+
+
+def test_sql_facts_are_reused_without_parsing(sql_facts_file, monkeypatch):
+    expected = sql_facts(_FACTS_SQL)
+    assert sql_facts("this is (((not sql at all !!!") is None
+    save_sql_facts()
+    assert sql_facts_file.exists()
+
+    _new_process()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("SQL was parsed again")
+
+    monkeypatch.setattr(sql_utils, "parse_sql", _fail)
+    monkeypatch.setattr(sql_utils, "neutralize_jinja", _fail)
+    assert sql_facts(_FACTS_SQL) == expected
+    assert sql_facts("this is (((not sql at all !!!") is None
+
+
+@pytest.mark.usefixtures("sql_facts_file")
+def test_sql_facts_are_keyed_by_dialect(monkeypatch):
+    sql_facts("select 1")
+    save_sql_facts()
+    _new_process()
+    parsed = []
+    monkeypatch.setattr(
+        sql_utils, "parse_sql", lambda _code, dialect=None: parsed.append(dialect) or ()
+    )
+
+    sql_facts("select 1", dialect="bigquery")
+
+    assert parsed == ["bigquery"]
+
+
+@pytest.mark.parametrize("content", [b"not json", b'{"v": 0, "facts": {}}'])
+def test_sql_facts_ignore_unusable_file(sql_facts_file, content):
+    sql_facts_file.write_bytes(content)
+
+    assert sql_facts("select * from t").uses_star
+
+
+def test_sql_facts_disabled_by_env_var(sql_facts_file, monkeypatch):
+    monkeypatch.setenv("DBT_BOUNCER_DISABLE_SQL_CACHE", "1")
+
+    sql_facts("select 1")
+    save_sql_facts()
+
+    assert not sql_facts_file.exists()
+
+
+@pytest.mark.usefixtures("sql_facts_file")
+def test_prepare_sql_facts_derives_in_worker_processes(monkeypatch):
+    monkeypatch.setattr(sql_utils, "_SQL_FACTS_PER_WORKER", 2)
+    tables = [f"s.t{i}" for i in range(6)]
+    codes = [_FACTS_SQL.replace("analytics.c", table) for table in tables]
+
+    assert prepare_sql_facts([*codes, codes[0], "not ((( sql"], workers=3) == 7
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("SQL was parsed again")
+
+    monkeypatch.setattr(sql_utils, "parse_sql", _fail)
+    for table, code in zip(tables, codes, strict=True):
+        assert sql_facts(code).hard_coded_tables == ("analytics.b AS b", table)
+    assert sql_facts("not ((( sql") is None
+    assert prepare_sql_facts(codes, workers=3) == 0
+
+
+@pytest.mark.usefixtures("sql_facts_file")
+def test_prepare_sql_facts_leaves_little_sql_to_the_checks():
+    assert prepare_sql_facts(["select 1", "select 2"], workers=8) == 0
+    assert not sql_utils._store.used
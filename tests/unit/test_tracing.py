@@ -0,0 +1,103 @@
+"""Tests for `--trace-file` traces in `dbt_bouncer.tracing`."""
+
+import gc
+import os
+
+import orjson
+
+from dbt_bouncer import tracing
+
+
+def _events(path):
+    return orjson.loads(path.read_bytes())["traceEvents"]
+
+
+def test_nothing_is_recorded_when_not_tracing():
+    with tracing.span("step", detail=1):
+        tracing.annotate(cache="hit")
+
+    assert tracing._active is None
+    assert tracing.sample_every(10_000) == 0
+
+
+def test_trace_to_none_does_nothing(tmp_path):
+    with tracing.trace_to(None):
+        assert tracing._active is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_trace_to_writes_spans(tmp_path):
+    path = tmp_path / "trace.json"
+
+    with tracing.trace_to(path):
+        with tracing.span("outer"), tracing.span("inner", step=1):
+            tracing.annotate(cache="miss")
+        gc.collect()
+
+    assert tracing._active is None
+    events = _events(path)
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert {"startup", "run", "outer", "inner"} <= spans.keys()
+    assert spans["inner"]["args"] == {"step": 1, "cache": "miss"}
+    assert "args" not in spans["outer"]
+    assert spans["outer"]["ts"] <= spans["inner"]["ts"]
+    assert spans["startup"]["ts"] == 0
+    assert any(e["cat"] == "gc" for e in events if e["ph"] == "X")
+    assert {"name": "MainThread"} in [
+        e["args"] for e in events if e["name"] == "thread_name"
+    ]
+
+
+def test_trace_is_written_when_the_run_raises(tmp_path):
+    path = tmp_path / "trace.json"
+
+    try:
+        with tracing.trace_to(path), tracing.span("failing"):
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert "failing" in {e["name"] for e in _events(path)}
+    assert tracing._active is None
+
+
+def test_sample_every_caps_traced_checks(tmp_path):
+    with tracing.trace_to(tmp_path / "trace.json"):
+        assert tracing.sample_every(10) == 1
+        assert tracing.sample_every(10 * tracing._TRACED_CHECKS) == 10
+
+
+def test_record_check_spans_names_worker_processes(tmp_path):
+    path = tmp_path / "trace.json"
+    worker = (os.getpid() + 1, 7, "MainThread")
+    results = [
+        {"check_run_id": "check_a:0:model_a", "outcome": "failed"},
+        {"check_run_id": "check_a:0:model_b", "outcome": "success"},
+    ]
+
+    with tracing.trace_to(path):
+        start = tracing._active.origin_ns
+        results[0]["_trace"] = (start, start + 2_000, worker)
+        tracing.record_check_spans(results)
+
+    assert all("_trace" not in r for r in results)
+    events = _events(path)
+    checks = [e for e in events if e.get("cat") == "check"]
+    assert checks == [
+        {
+            "name": "check_a:0:model_a",
+            "cat": "check",
+            "ph": "X",
+            "ts": 0.0,
+            "dur": 2.0,
+            "pid": worker[0],
+            "tid": 7,
+            "args": {"outcome": "failed"},
+        }
+    ]
+    assert {
+        "name": "process_name",
+        "ph": "M",
+        "pid": worker[0],
+        "args": {"name": f"dbt-bouncer worker {worker[0]}"},
+    } in events
@@ -12,6 +12,7 @@ from dbt_bouncer.exceptions import DbtBouncerConfigError
 from dbt_bouncer.utils import (
     _ESCAPED_SEPARATOR,
     _SEPARATOR,
+    PathPatternIndex,
     create_github_comment_file,
     find_meta_keys_criteria_failure,
     find_missing_meta_keys,
@@ -347,6 +348,67 @@ def test_object_excluded_by_path(exclude_pattern, path, output):
     assert object_excluded_by_path(exclude_pattern, path) == output
 
 
+_INDEXED_PATTERNS = [
+    # Literals, answered by the directory trie.
+    "^models/marts",
+    " models/staging/ ",
+    "^models/stg",
+    "^seeds/.*",
+    "^models/a\\.sql$",
+    "^models\\/marts/$",
+    "^.*",
+    "",
+    # Regexes, combined into one.
+    "^models/(marts|staging)/",
+    ".*_fct\\.sql$",
+    "^models/\\w+/x",
+    "^models/m.rts",
+    "x|models/int",
+    # Matched on their own.
+    "(?i)^MODELS/",
+    "^(a)\\1",
+]
+_INDEXED_PATHS = [
+    "models/marts/fct_orders.sql",
+    "models/marts/",
+    "models/staging/stg_a.sql",
+    "models/stg_x.sql",
+    "seeds/a.csv",
+    "models/a.sql",
+    "models/a.sqlx",
+    "MODELS/x.sql",
+    "models/x/x",
+    "models/int/a.sql",
+    "aa",
+    "",
+]
+
+
+@pytest.mark.parametrize("path", _INDEXED_PATHS)
+def test_path_pattern_index_matches_like_object_in_path(path):
+    index = PathPatternIndex(_INDEXED_PATTERNS)
+    matched = index.match(path)
+
+    assert {
+        pattern for pattern in _INDEXED_PATTERNS if matched & index.mask(pattern)
+    } == {pattern for pattern in _INDEXED_PATTERNS if object_in_path(pattern, path)}
+
+
+def test_path_pattern_index_mask_combines_patterns():
+    index = PathPatternIndex(["^staging", "^marts", " ^staging "])
+
+    assert index.mask(None) == index.mask([]) == 0
+    assert index.mask(["^marts", "^staging"]) == 0b11
+    assert index.match("marts/model_1.sql") == index.mask("^marts")
+
+
+def test_path_pattern_index_raises_on_invalid_pattern():
+    import re
+
+    with pytest.raises(re.error, match="Invalid regex pattern"):
+        PathPatternIndex(["^models/(unclosed"])
+
+
 # --- Tests for _extract_checks_from_module ---
 
 
@@ -743,7 +805,7 @@ def test_compute_cache_fingerprint_changes_when_internal_checks_change():
     import time
     from pathlib import Path
 
-    from dbt_bouncer.utils import _compute_cache_fingerprint, _internal_checks_digest
+    from dbt_bouncer.utils import _internal_checks_digest, compute_cache_fingerprint
 
     checks_dir = Path("src/dbt_bouncer/checks")
     sentinel = next(f for f in checks_dir.glob("**/*.py") if f.is_file())
@@ -751,10 +813,10 @@ def test_compute_cache_fingerprint_changes_when_internal_checks_change():
 
     try:
         _internal_checks_digest.cache_clear()
-        fp_before = _compute_cache_fingerprint("0.0.0")
+        fp_before = compute_cache_fingerprint("0.0.0")
         os.utime(sentinel, (time.time(), time.time() + 5))
         _internal_checks_digest.cache_clear()
-        fp_after = _compute_cache_fingerprint("0.0.0")
+        fp_after = compute_cache_fingerprint("0.0.0")
         assert fp_before != fp_after
     finally:
         os.utime(sentinel, (original_mtime, original_mtime))
@@ -778,3 +840,48 @@ def test_prune_stale_cache_files_keeps_only_active(tmp_path):
     assert unrelated.exists()
     assert not stale_a.exists()
     assert not stale_b.exists()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("1", True), ("TRUE", True), ("yes", True), ("0", False), ("", False)],
+)
+def test_env_flag(monkeypatch, value, expected):
+    from dbt_bouncer.utils import env_flag
+
+    monkeypatch.setenv("DBT_BOUNCER_TEST_FLAG", value)
+
+    assert env_flag("DBT_BOUNCER_TEST_FLAG") is expected
+
+
+def test_write_atomic_replaces_the_file_and_leaves_no_temporary_file(tmp_path):
+    """Chunks are written in order, creating the parent directory."""
+    from dbt_bouncer.utils import write_atomic
+
+    path = tmp_path / "cache" / "stats.json"
+    write_atomic(path, b"old")
+    write_atomic(path, b"{", b"}")
+
+    assert path.read_bytes() == b"{}"
+    assert [p.name for p in path.parent.iterdir()] == ["stats.json"]
+
+
+def test_gc_frozen_only_undoes_its_own_freeze():
+    """A process that froze objects itself keeps them frozen afterwards."""
+    import gc
+
+    from dbt_bouncer.utils import gc_frozen
+
+    assert gc.get_freeze_count() == 0
+    with gc_frozen():
+        assert gc.get_freeze_count() > 0
+    assert gc.get_freeze_count() == 0
+
+    gc.freeze()
+    try:
+        frozen = gc.get_freeze_count()
+        with gc_frozen():
+            pass
+        assert gc.get_freeze_count() == frozen
+    finally:
+        gc.unfreeze()